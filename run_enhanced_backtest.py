@@ -23,8 +23,7 @@ def _try_imports():
 
     def _import_components():
         """Import all required components - DRY helper with bulletproof data import"""
-        import toml
-
+        from bnb_trading.core.config import load_config
         from bnb_trading.core.models import DecisionContext
 
         # RADICAL APPROACH: Skip data module entirely, import fetcher directly
@@ -90,7 +89,7 @@ def _try_imports():
 
         from bnb_trading.signals.decision import decide_long
 
-        return toml, DecisionContext, bnb_data_fetcher, decide_long
+        return load_config, DecisionContext, bnb_data_fetcher, decide_long
 
     # Strategy 1: Try absolute imports (CI with installed package)
     try:
@@ -150,7 +149,7 @@ def _try_imports():
 
 # Try imports using robust strategy
 try:
-    toml, DecisionContext, BNBDataFetcher, decide_long = _try_imports()
+    load_config, DecisionContext, BNBDataFetcher, decide_long = _try_imports()
 except ImportError as e:
     print(f"Import error: {e}")
     print("Please ensure all modules are properly installed and configured.")
@@ -168,8 +167,7 @@ class EnhancedBacktester:
 
     def __init__(self, config_path: str = "config.toml"):
         """Initialize enhanced backtester"""
-        with open(config_path) as f:
-            self.config = toml.load(f)
+        self.config = load_config(config_path)
 
         self.data_fetcher = BNBDataFetcher()
         self.signals_log = []
@@ -9,104 +9,89 @@ Current Performance:
 - LONG Accuracy: 63.3% (49 signals)
 - SHORT Accuracy: 46.2% (13 signals)
 
+Package exports are resolved lazily on first attribute access, so
+``import bnb_trading`` (or reading ``__version__``) does not pull in
+pandas, scipy, talib, ccxt or tqdm.
+
 Author: BNB Trading System Team
 Version: 2.1.0
 """
 
+import importlib
+import logging
+from typing import TYPE_CHECKING, Any
+
 __version__ = "2.1.0"
 __author__ = "BNB Trading System Team"
 
-# Core modules - using new modular structure
-try:
+logger = logging.getLogger(__name__)
+
+# Public export name -> defining submodule (imported on first access)
+_LAZY_EXPORTS: dict[str, str] = {
+    # Core modules
+    "Backtester": ".backtester",
+    "BNBDataFetcher": ".data.fetcher",
+    "DivergenceDetector": ".divergence_detector",
+    "ElliottWaveAnalyzer": ".elliott_wave_analyzer",
+    # Analysis modules
+    "FibonacciAnalyzer": ".fibonacci",
+    "TechnicalIndicators": ".indicators",
+    "TrendAnalyzer": ".trend_analyzer",
+    "WeeklyTailsAnalyzer": ".weekly_tails",
+    # Pipeline architecture
+    "TradingPipeline": ".pipeline.orchestrator",
+    "PipelineRunner": ".pipeline.runners",
+    # Signal generation
+    "SignalGenerator": ".signals.generator",
+    "SmartShortSignalGenerator": ".signals.smart_short.generator",
+}
+
+__all__ = [
+    "BNBDataFetcher",
+    "Backtester",
+    "DivergenceDetector",
+    "ElliottWaveAnalyzer",
+    "FibonacciAnalyzer",
+    "PipelineRunner",
+    "SignalGenerator",
+    "SmartShortSignalGenerator",
+    "TechnicalIndicators",
+    "TradingPipeline",
+    "TrendAnalyzer",
+    "WeeklyTailsAnalyzer",
+]
+
+if TYPE_CHECKING:
     from .backtester import Backtester
-except ImportError:
-    # Backtester will be imported on demand to avoid circular import issues
-    Backtester = None
-
-try:
     from .data.fetcher import BNBDataFetcher
-except ImportError:
-    # BNBDataFetcher will be imported on demand to avoid CI import issues
-    BNBDataFetcher = None
-
-try:
     from .divergence_detector import DivergenceDetector
-except ImportError:
-    DivergenceDetector = None
-
-try:
     from .elliott_wave_analyzer import ElliottWaveAnalyzer
-except ImportError:
-    ElliottWaveAnalyzer = None
-
-# Analysis modules
-try:
     from .fibonacci import FibonacciAnalyzer
-except ImportError:
-    FibonacciAnalyzer = None
-
-try:
     from .indicators import TechnicalIndicators
-except ImportError:
-    TechnicalIndicators = None
-
-# Pipeline architecture
-try:
     from .pipeline.orchestrator import TradingPipeline
-except ImportError:
-    TradingPipeline = None
-
-try:
     from .pipeline.runners import PipelineRunner
-except ImportError:
-    PipelineRunner = None
-
-# Signal generation - using new modular structure
-try:
     from .signals.generator import SignalGenerator
-except ImportError:
-    SignalGenerator = None
-
-try:
     from .signals.smart_short.generator import SmartShortSignalGenerator
-except ImportError:
-    SmartShortSignalGenerator = None
-
-try:
     from .trend_analyzer import TrendAnalyzer
-except ImportError:
-    TrendAnalyzer = None
-
-try:
     from .weekly_tails import WeeklyTailsAnalyzer
-except ImportError:
-    WeeklyTailsAnalyzer = None
-
-# Build __all__ list dynamically based on successful imports
-__all__ = []
-
-# Add modules to __all__ if successfully imported
-if BNBDataFetcher is not None:
-    __all__.append("BNBDataFetcher")
-if Backtester is not None:
-    __all__.append("Backtester")
-if DivergenceDetector is not None:
-    __all__.append("DivergenceDetector")
-if ElliottWaveAnalyzer is not None:
-    __all__.append("ElliottWaveAnalyzer")
-if FibonacciAnalyzer is not None:
-    __all__.append("FibonacciAnalyzer")
-if PipelineRunner is not None:
-    __all__.append("PipelineRunner")
-if SignalGenerator is not None:
-    __all__.append("SignalGenerator")
-if SmartShortSignalGenerator is not None:
-    __all__.append("SmartShortSignalGenerator")
-if TechnicalIndicators is not None:
-    __all__.append("TechnicalIndicators")
-if TradingPipeline is not None:
-    __all__.append("TradingPipeline")
-if TrendAnalyzer is not None:
-    __all__.append("TrendAnalyzer")
-if WeeklyTailsAnalyzer is not None:
-    __all__.append("WeeklyTailsAnalyzer")
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public export on first access and cache it on the package."""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        value = getattr(importlib.import_module(module_path, __name__), name)
+    except ImportError as e:
+        # Same contract as the old eager imports: unavailable exports are None
+        logger.warning(f"{name} not available: {e}")
+        value = None
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,10 @@
+"""
+Order Book Analysis Package
+
+NumPy order book ladders used by ``WhaleTracker`` for deep-book (up to 5000
+levels) whale wall, imbalance and price-impact analysis.
+"""
+
+from .book import MAX_DEPTH_LIMIT, OrderBook
+
+__all__ = ["MAX_DEPTH_LIMIT", "OrderBook"]
@@ -0,0 +1,194 @@
+"""
+Order Book Depth Engine - bids/asks като непрекъснати float масиви
+
+Binance ``/depth`` snapshot (до 5000 нива на страна) се декодира веднъж в
+NumPy ladders; кумулативна дълбочина, whale walls, imbalance и price
+impact кривите са векторни операции върху тях, без Python цикъл по нива.
+Snapshots могат да се зареждат/записват локално за offline анализ.
+"""
+
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from bnb_trading.core.exceptions import DataError
+
+MAX_DEPTH_LIMIT = 5000  # Binance /depth максимум
+
+
+def _ladder(levels: Any) -> tuple[np.ndarray, np.ndarray]:
+    """[[price, qty], ...] (числа или низове) -> (prices, quantities)"""
+    ladder = np.array(levels, dtype=float).reshape(-1, 2)
+    return (
+        np.ascontiguousarray(ladder[:, 0]),
+        np.ascontiguousarray(ladder[:, 1]),
+    )
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class OrderBook:
+    """
+    Order book snapshot като ценови ladders
+
+    Bids са сортирани по намаляваща цена, asks по нарастваща (както ги
+    връща Binance), така че индекс 0 е най-добрата цена на всяка страна.
+    """
+
+    bid_prices: np.ndarray
+    bid_quantities: np.ndarray
+    ask_prices: np.ndarray
+    ask_quantities: np.ndarray
+    last_update_id: int | None = None
+
+    @classmethod
+    def from_depth(cls, data: Mapping[str, Any]) -> "OrderBook":
+        """
+        Декодира Binance /depth отговор
+
+        Args:
+            data: JSON с "bids", "asks" и по избор "lastUpdateId"
+
+        Returns:
+            OrderBook
+
+        Raises:
+            DataError: Ако липсват bids/asks или нивата са невалидни
+        """
+        try:
+            bid_prices, bid_quantities = _ladder(data["bids"])
+            ask_prices, ask_quantities = _ladder(data["asks"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise DataError(f"Invalid order book snapshot: {e}") from e
+        return cls(
+            bid_prices,
+            bid_quantities,
+            ask_prices,
+            ask_quantities,
+            data.get("lastUpdateId"),
+        )
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "OrderBook":
+        """Зарежда snapshot, записан с ``save`` (или суров /depth JSON)."""
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            raise DataError(f"Cannot read order book snapshot {path}: {e}") from e
+        return cls.from_depth(data)
+
+    def save(self, path: str | Path) -> None:
+        """Записва snapshot-а в /depth JSON формат."""
+        data = {
+            "lastUpdateId": self.last_update_id,
+            "bids": np.column_stack([self.bid_prices, self.bid_quantities]).tolist(),
+            "asks": np.column_stack([self.ask_prices, self.ask_quantities]).tolist(),
+        }
+        Path(path).write_text(json.dumps(data), encoding="utf-8")
+
+    @property
+    def mid_price(self) -> float:
+        """Средата между най-добрите bid и ask (NaN при празна страна)."""
+        if self.bid_prices.size == 0 or self.ask_prices.size == 0:
+            return float("nan")
+        return float((self.bid_prices[0] + self.ask_prices[0]) / 2)
+
+    @property
+    def spread_pct(self) -> float:
+        """Bid/ask spread в % от mid цената."""
+        mid = self.mid_price
+        return float((self.ask_prices[0] - self.bid_prices[0]) / mid * 100)
+
+    def _side(self, side: str) -> tuple[np.ndarray, np.ndarray]:
+        if side == "bids":
+            return self.bid_prices, self.bid_quantities
+        if side == "asks":
+            return self.ask_prices, self.ask_quantities
+        raise ValueError(f"side must be 'bids' or 'asks', got {side!r}")
+
+    def cumulative_depth(self, side: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Кумулативна дълбочина от най-добрата цена навътре
+
+        Args:
+            side: "bids" или "asks"
+
+        Returns:
+            Tuple: (кумулативно количество, кумулативен notional) по нива
+        """
+        prices, quantities = self._side(side)
+        return np.cumsum(quantities), np.cumsum(prices * quantities)
+
+    def walls(self, min_quantity: float) -> tuple[np.ndarray, np.ndarray]:
+        """Маски (bids, asks) на нивата с количество >= ``min_quantity``."""
+        return self.bid_quantities >= min_quantity, self.ask_quantities >= min_quantity
+
+    def imbalance(self, depth_pct: float | None = None) -> float:
+        """
+        Bid/ask обемен imbalance в [-1, 1] (положителен = повече купувачи)
+
+        Args:
+            depth_pct: Само нивата в рамките на този % от mid цената
+                (по подразбиране цялата книга)
+
+        Returns:
+            (bid обем - ask обем) / общ обем; 0.0 при празна книга
+        """
+        bid_mask = ask_mask = slice(None)
+        if depth_pct is not None:
+            mid = self.mid_price
+            bid_mask = self.bid_prices >= mid * (1 - depth_pct / 100)
+            ask_mask = self.ask_prices <= mid * (1 + depth_pct / 100)
+        bid_volume = self.bid_quantities[bid_mask].sum()
+        ask_volume = self.ask_quantities[ask_mask].sum()
+        total = bid_volume + ask_volume
+        return float((bid_volume - ask_volume) / total) if total > 0 else 0.0
+
+    def price_impact(self, quantities: Any, side: str = "asks") -> dict[str, Any]:
+        """
+        Price impact крива за market поръчки с дадени размери
+
+        Поръчка за ``q`` BNB изяжда нивата на ``side`` ("asks" за покупка,
+        "bids" за продажба); средната цена идва от кумулативния notional
+        и ``searchsorted`` по кумулативното количество.
+
+        Args:
+            quantities: Размер(и) на поръчката в BNB
+            side: Страната, която поръчката изяжда
+
+        Returns:
+            Dict с масиви: quantity, average_price, worst_price, impact_pct (спрямо
+            най-добрата цена); NaN където книгата не стига
+        """
+        prices, _ = self._side(side)
+        quantities = np.atleast_1d(np.asarray(quantities, dtype=float))
+        if prices.size == 0:
+            missing = np.full(quantities.shape, np.nan)
+            return {
+                "quantity": quantities,
+                "average_price": missing,
+                "worst_price": missing,
+                "impact_pct": missing,
+            }
+        cumulative_qty, cumulative_notional = self.cumulative_depth(side)
+
+        level = np.searchsorted(cumulative_qty, quantities, side="left")
+        fillable = level < prices.size
+        level = np.minimum(level, prices.size - 1)
+        previous = level - 1
+        filled_qty = np.where(previous >= 0, cumulative_qty[previous], 0.0)
+        filled_notional = np.where(previous >= 0, cumulative_notional[previous], 0.0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            notional = filled_notional + (quantities - filled_qty) * prices[level]
+            average_price = np.where(fillable, notional / quantities, np.nan)
+            impact_pct = np.abs(average_price / prices[0] - 1) * 100
+        return {
+            "quantity": quantities,
+            "average_price": average_price,
+            "worst_price": np.where(fillable, prices[level], np.nan),
+            "impact_pct": impact_pct,
+        }
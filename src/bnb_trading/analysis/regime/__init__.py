@@ -0,0 +1,28 @@
+"""
+Market Regime Analysis Package
+
+Vectorized drawdown/regime engine shared by ``TrendAnalyzer`` and the smart
+SHORT ``MarketRegimeDetector``.
+"""
+
+from .engine import (
+    RegimeThresholds,
+    bear_durations,
+    bull_durations,
+    bull_pivots,
+    classify_regimes,
+    drawdown_from_peak,
+    period_change_pct,
+    regime_history,
+)
+
+__all__ = [
+    "RegimeThresholds",
+    "bear_durations",
+    "bull_durations",
+    "bull_pivots",
+    "classify_regimes",
+    "drawdown_from_peak",
+    "period_change_pct",
+    "regime_history",
+]
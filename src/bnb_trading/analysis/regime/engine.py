@@ -0,0 +1,315 @@
+"""
+Drawdown / Market Regime Engine - vectorized over the whole history
+
+Replaces per-bar backward scans with cumulative extrema:
+1. Drawdown from peak via running (cumulative) maximum
+2. Bull-start pivots via reversed cumulative maxima over the lookback
+3. Bull/bear durations and regime labels for every bar at once
+
+Single-bar callers (``TrendAnalyzer``) pass ``ends=[len - 1]``; batch
+callers get the same values for every bar in one pass.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from bnb_trading.core.constants import (
+    REGIME_BEAR,
+    REGIME_CORRECTION,
+    REGIME_MODERATE_BULL,
+    REGIME_NEUTRAL,
+    REGIME_STRONG_BULL,
+    REGIME_UNKNOWN,
+    REGIME_WEAK_BULL,
+)
+
+DRAWDOWN_THRESHOLD = 0.20  # 20% корекция от върха = значим pivot
+MIN_RECOVERY_GAIN = 0.15  # 15% възстановяване потвърждава bull
+MIN_BULL_GAIN_PCT = 15.0  # под 15% общ ръст не е значим bull
+MAX_PIVOT_LOOKBACK = 547  # до 18 месеца назад
+MIN_BULL_BARS = 60  # минимум 2 месеца данни
+MAX_DURATION_MONTHS = 18
+DAYS_PER_MONTH = 30
+
+# Редове на матрицата на прозорците наведнъж (ограничава паметта)
+_CHUNK_ROWS = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class RegimeThresholds:
+    """Regime прагове в проценти (като TrendAnalyzer след * 100)."""
+
+    strong_bull: float = 50.0
+    moderate_bull: float = 25.0
+    weak_bull: float = 10.0
+    bear: float = -10.0
+    medium_days: int = 90
+    long_days: int = 180
+    yearly_days: int = 365
+
+
+def drawdown_from_peak(
+    prices: np.ndarray, peaks: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Drawdown от най-високата стойност досега за всяка свещ
+
+    Args:
+        prices: Цени (напр. Close)
+        peaks: Серия за върха (напр. High или ATH); по подразбиране prices
+
+    Returns:
+        Tuple: (drawdown като дроб, running peak); NaN се пропуска
+    """
+    prices = np.asarray(prices, dtype=float)
+    peaks = prices if peaks is None else np.asarray(peaks, dtype=float)
+    peak = np.fmax.accumulate(peaks)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdown = (peak - prices) / peak
+    return drawdown, peak
+
+
+def period_change_pct(closes: np.ndarray, window: int) -> np.ndarray:
+    """
+    Процентна промяна за последните ``window`` свещи (NaN при по-малко)
+
+    Същата формула като medium/long term анализа: (end - start) / start,
+    0.0 при нулева начална цена.
+    """
+    closes = np.asarray(closes, dtype=float)
+    change = np.full(closes.size, np.nan)
+    if closes.size < window:
+        return change
+
+    start = closes[: closes.size - window + 1]
+    end = closes[window - 1 :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change[window - 1 :] = np.where(start != 0, (end - start) / start * 100, 0.0)
+    return change
+
+
+def bull_pivots(
+    closes: np.ndarray,
+    ends: np.ndarray | None = None,
+    drawdown_threshold: float = DRAWDOWN_THRESHOLD,
+    min_recovery_gain: float = MIN_RECOVERY_GAIN,
+    max_lookback: int = MAX_PIVOT_LOOKBACK,
+) -> np.ndarray:
+    """
+    Начало на bull движението (drawdown pivot) за всяка крайна свещ
+
+    За край ``e`` търси най-близката назад свещ ``i`` с drawdown >=
+    ``drawdown_threshold`` от максимума на closes[i..e] и възстановяване
+    >= ``min_recovery_gain`` до closes[e]. Максимумите са обърнати
+    кумулативни максимуми върху матрица от прозорци, без Python цикъл.
+
+    Args:
+        closes: Close цени
+        ends: Индекси на крайните свещи (по подразбиране всички)
+        drawdown_threshold: Минимален drawdown за pivot
+        min_recovery_gain: Минимално възстановяване от pivot-а
+        max_lookback: Максимален брой свещи назад
+
+    Returns:
+        Индекс на pivot-а за всеки край (самият край ако няма pivot)
+    """
+    closes = np.asarray(closes, dtype=float)
+    ends = np.arange(closes.size) if ends is None else np.asarray(ends, dtype=int)
+    width = max_lookback - 1
+    padded = np.concatenate([np.full(width - 1, np.nan), closes])
+    windows = sliding_window_view(padded, width)  # windows[e] = closes[..e]
+    offsets = np.arange(width)
+
+    pivots = ends.copy()
+    for first_row in range(0, ends.size, _CHUNK_ROWS):
+        block = ends[first_row : first_row + _CHUNK_ROWS]
+        history = windows[block][:, ::-1]  # колона j = свещ e - j
+        rolling_high = np.maximum.accumulate(history, axis=1)
+        with np.errstate(invalid="ignore"):
+            drawdown = (rolling_high - history) / rolling_high
+            recovery = (history[:, :1] - history) / history
+
+        # j от 1 до min(e, width) - 1 (индекс 0 никога не е pivot)
+        in_range = (offsets >= 1) & (offsets <= np.minimum(block, width)[:, None] - 1)
+        hit = (
+            in_range
+            & (drawdown >= drawdown_threshold)
+            & (recovery >= min_recovery_gain)
+        )
+        nearest = hit.argmax(axis=1)
+        found = hit[np.arange(block.size), nearest]
+        pivots[first_row : first_row + block.size] = np.where(
+            found, block - nearest, block
+        )
+    return pivots
+
+
+def bull_durations(
+    closes: np.ndarray, pivots: np.ndarray, ends: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Продължителност на bull движението в месеци за всяка крайна свещ
+
+    Args:
+        closes: Close цени
+        pivots: Резултат от ``bull_pivots`` за същите ``ends``
+        ends: Индекси на крайните свещи (по подразбиране всички)
+
+    Returns:
+        Месеци (0 при < 60 свещи или ръст под 15%, максимум 18)
+    """
+    closes = np.asarray(closes, dtype=float)
+    ends = np.arange(closes.size) if ends is None else np.asarray(ends, dtype=int)
+    pivots = np.asarray(pivots, dtype=int)
+
+    months = np.maximum(1, (ends - pivots) // DAYS_PER_MONTH)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bull_gain = (closes[ends] / closes[pivots] - 1) * 100
+    months = np.where((pivots < ends) & (bull_gain < MIN_BULL_GAIN_PCT), 0, months)
+    months = np.where(ends + 1 < MIN_BULL_BARS, 0, months)
+    return np.minimum(months, MAX_DURATION_MONTHS)
+
+
+def bear_durations(
+    closes: np.ndarray,
+    drawdown_threshold: float = DRAWDOWN_THRESHOLD,
+    max_lookback: int = MAX_PIVOT_LOOKBACK,
+) -> np.ndarray:
+    """
+    Продължителност на bear фазата в месеци за всяка свещ
+
+    Bear фаза: close е поне ``drawdown_threshold`` под максимума от
+    последните ``max_lookback`` свещи; продължителността се брои от този
+    връх (pivot), минимум 1 и максимум 18 месеца.
+
+    Returns:
+        Месеци (0 ако няма значим drawdown)
+    """
+    closes = np.asarray(closes, dtype=float)
+    pad = max_lookback - 1
+    padded = np.concatenate(
+        [np.full(pad, -np.inf), np.where(np.isnan(closes), -np.inf, closes)]
+    )
+    bars = np.arange(closes.size)
+    peak_idx = sliding_window_view(padded, max_lookback).argmax(axis=1) + bars - pad
+    peak = closes[peak_idx]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdown = (peak - closes) / peak
+    months = np.clip((bars - peak_idx) // DAYS_PER_MONTH, 1, MAX_DURATION_MONTHS)
+    return np.where(drawdown >= drawdown_threshold, months, 0)
+
+
+def classify_regimes(
+    long_change: np.ndarray,
+    medium_change: np.ndarray,
+    yearly_change: np.ndarray,
+    thresholds: RegimeThresholds,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Market regime етикети и confidence (правилата на TrendAnalyzer)
+
+    Args:
+        long_change: 6-месечна промяна в %
+        medium_change: 3-месечна промяна в %
+        yearly_change: 12-месечна промяна в %
+        thresholds: Regime прагове в %
+
+    Returns:
+        Tuple: (regime етикети, confidence); UNKNOWN където липсват данни
+    """
+    long_change = np.asarray(long_change, dtype=float)
+    medium_change = np.asarray(medium_change, dtype=float)
+    yearly_change = np.asarray(yearly_change, dtype=float)
+
+    unknown = np.isnan(long_change) | np.isnan(medium_change)
+    strong_bull = (
+        (long_change > thresholds.strong_bull)
+        & (medium_change > thresholds.moderate_bull)
+        & (yearly_change > 60)
+    )
+    moderate_bull = (long_change > thresholds.moderate_bull) & (
+        medium_change > thresholds.weak_bull
+    )
+    weak_bull = (long_change > thresholds.weak_bull) & (
+        medium_change > thresholds.weak_bull / 2
+    )
+    bear = (long_change < thresholds.bear * 2) & (medium_change < thresholds.bear)
+    correction = (long_change > 0) & (medium_change < -10)
+    conditions = [unknown, strong_bull, moderate_bull, weak_bull, bear, correction]
+
+    labels = np.select(
+        conditions,
+        [
+            REGIME_UNKNOWN,
+            REGIME_STRONG_BULL,
+            REGIME_MODERATE_BULL,
+            REGIME_WEAK_BULL,
+            REGIME_BEAR,
+            REGIME_CORRECTION,
+        ],
+        default=REGIME_NEUTRAL,
+    ).astype(object)
+    confidence = np.select(
+        conditions,
+        [
+            0.0,
+            np.minimum(0.9, long_change / 100 + yearly_change / 200),
+            np.minimum(0.8, long_change / 60 + medium_change / 40),
+            0.6,
+            np.minimum(0.9, np.abs(long_change / 50) + np.abs(medium_change / 30)),
+            0.7,
+        ],
+        default=0.5,
+    )
+    return labels, confidence
+
+
+def regime_history(
+    closes: pd.Series, thresholds: RegimeThresholds | None = None
+) -> pd.DataFrame:
+    """
+    Regime, drawdown и bull/bear продължителност за всяка свещ
+
+    Args:
+        closes: Daily Close серия (DatetimeIndex)
+        thresholds: Regime прагове (по подразбиране TrendAnalyzer defaults)
+
+    Returns:
+        DataFrame (индекс като closes) с medium/long/yearly_change_pct,
+        regime, confidence, drawdown, bull_pivot, bull_duration_months и
+        bear_duration_months
+    """
+    thresholds = thresholds or RegimeThresholds()
+    values = closes.to_numpy(dtype=float)
+    bars = np.arange(values.size)
+
+    medium_change = period_change_pct(values, thresholds.medium_days)
+    long_change = period_change_pct(values, thresholds.long_days)
+    yearly_start = values[np.maximum(bars - thresholds.yearly_days + 1, 0)]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        yearly_change = (values / yearly_start - 1) * 100
+
+    regimes, confidence = classify_regimes(
+        long_change, medium_change, yearly_change, thresholds
+    )
+    drawdown, _ = drawdown_from_peak(values)
+    pivots = bull_pivots(values)
+
+    return pd.DataFrame(
+        {
+            "medium_change_pct": medium_change,
+            "long_change_pct": long_change,
+            "yearly_change_pct": yearly_change,
+            "regime": regimes,
+            "confidence": confidence,
+            "drawdown": drawdown,
+            "bull_pivot": pivots,
+            "bull_duration_months": bull_durations(values, pivots),
+            "bear_duration_months": bear_durations(values),
+        },
+        index=closes.index,
+    )
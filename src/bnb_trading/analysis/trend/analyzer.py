@@ -13,8 +13,12 @@ from typing import Any
 import numpy as np
 import pandas as pd
 import talib
+from numpy.lib.stride_tricks import sliding_window_view
 
 from bnb_trading.core.models import ModuleResult, SignalState
+from bnb_trading.data.schema import OHLCV
+
+from .streaks import StreakTracker, max_streaks, rolling_max_streaks
 
 logger = logging.getLogger(__name__)
 
@@ -123,36 +127,224 @@ class PatternTrendAnalyzer:
                 meta={"error": str(e)},
             )
 
+    def streak_tracker(self) -> StreakTracker:
+        """Incremental HH/HL streak tracker for this lookback/window setup."""
+        return StreakTracker(self.lookback_days, self.window_size)
+
+    def history(self, daily_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Trend result for every bar at once (same as ``analyze`` on each prefix).
+
+        Streaks come from one RLE pass over all lookback windows and the EMAs
+        from one talib pass over the full history, so a daily-step backtest
+        pays O(n) once instead of O(n) per bar.
+
+        Args:
+            daily_df: Daily OHLCV data
+
+        Returns:
+            DataFrame (index as daily_df) with status, state, score, contrib,
+            hh_hl_state and ema_state
+        """
+        highs, lows = self._get_price_columns(daily_df)
+        closes = np.nan_to_num(daily_df["Close"].to_numpy(dtype=float), nan=0.0)
+        bars = np.arange(1, len(daily_df) + 1)
+
+        # 1. HH/HL: invalid bars are dropped inside each lookback window
+        valid_prices = (highs > self.zero_threshold) & (lows > self.zero_threshold)
+        streaks = rolling_max_streaks(
+            highs, lows, self.lookback_days, self.window_size, valid_prices
+        )
+        valid_in_window = np.cumsum(valid_prices)
+        valid_in_window[self.lookback_days :] -= valid_in_window[: -self.lookback_days]
+        hh_state, hh_score = self._classify_streak_arrays(streaks)
+        too_few = valid_in_window < self.window_size + self.min_consecutive
+        hh_state[too_few] = "NEUTRAL"
+        hh_score[too_few] = self.score_neutral
+
+        # 2. EMA: talib over the valid closes of the whole history (causal)
+        ema_state, ema_score = self._ema_history(closes)
+
+        # 3. Combine
+        state, score = self._combine_arrays(hh_state, hh_score, ema_state, ema_score)
+        disabled = bars < self.lookback_days + 50
+        state[disabled] = "NEUTRAL"
+        score[disabled] = 0.0
+        hh_state[disabled] = None
+        ema_state[disabled] = None
+
+        return pd.DataFrame(
+            {
+                "status": np.where(disabled, "DISABLED", "OK").astype(object),
+                "state": state,
+                "score": score,
+                "contrib": score * self.weight,
+                "hh_hl_state": hh_state,
+                "ema_state": ema_state,
+            },
+            index=daily_df.index,
+        )
+
+    def _ema_history(self, closes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """EMA state and score for every bar (``_analyze_ema_slope`` per prefix)."""
+        state = np.full(len(closes), "NEUTRAL", dtype=object)
+        score = np.full(len(closes), 0.3)
+        positive = closes > 0
+        valid_closes = closes[positive]
+        if len(valid_closes) < 200:  # Need minimum data for EMA200
+            return state, score
+
+        # Recent EMA window ending at the last valid close of every prefix
+        last = np.cumsum(positive) - 1
+        ready = last >= 199
+        pad = np.zeros(self.ema_recent_window - 1)
+        recent_ema50, recent_ema200 = (
+            sliding_window_view(
+                np.concatenate(
+                    [
+                        pad,
+                        np.nan_to_num(
+                            talib.EMA(valid_closes, timeperiod=period), nan=0.0
+                        ),
+                    ]
+                ),
+                self.ema_recent_window,
+            )[last[ready]]
+            for period in (50, 200)
+        )
+        state[ready], score[ready] = self._classify_ema_arrays(
+            recent_ema50, recent_ema200, closes[ready]
+        )
+        return state, score
+
+    def _classify_streak_arrays(
+        self, streaks: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        HH/HL states and scores for rows of max streaks.
+
+        Args:
+            streaks: Array (n, 4) of max HH/HL/LH/LL streaks
+
+        Returns:
+            Tuple: (state array, score array)
+        """
+        hh, hl, lh, ll = streaks.T
+        up = (hh >= self.min_consecutive) & (hl >= self.min_consecutive)
+        down = ~up & (lh >= self.min_consecutive) & (ll >= self.min_consecutive)
+        # Score based on streak strength and alignment
+        strength = np.where(up, np.minimum(hh, hl), np.minimum(lh, ll))
+        trend_score = np.minimum(
+            self.score_max, self.score_base + strength * self.score_increment
+        )
+        return (
+            np.select([up, down], ["UP", "DOWN"], default="NEUTRAL").astype(object),
+            np.where(up | down, trend_score, self.score_neutral),
+        )
+
+    def _classify_ema_arrays(
+        self,
+        recent_ema50: np.ndarray,
+        recent_ema200: np.ndarray,
+        current_price: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        EMA states and scores for rows of recent EMA50/EMA200 windows.
+
+        Args:
+            recent_ema50: Array (n, ema_recent_window)
+            recent_ema200: Array (n, ema_recent_window)
+            current_price: Close of every row
+
+        Returns:
+            Tuple: (state array, score array)
+        """
+        ema50_slope, ema50, count50 = self._recent_ema_trend(recent_ema50)
+        _, ema200, count200 = self._recent_ema_trend(recent_ema200)
+
+        enough = (
+            (count50 >= self.min_valid_ema)
+            & (count200 >= self.min_valid_ema)
+            & (current_price > self.zero_threshold)
+        )
+        rising = (ema50 > ema200) & (ema50_slope > self.zero_threshold)
+        falling = (ema50 < ema200) & (ema50_slope < -self.zero_threshold)
+        conditions = [
+            enough & rising & (current_price > ema50),
+            enough & rising,
+            enough & falling & (current_price < ema50),
+            enough & falling,
+        ]
+        return (
+            np.select(conditions, ["UP", "UP", "DOWN", "DOWN"], "NEUTRAL").astype(
+                object
+            ),
+            np.select(
+                conditions,
+                [self.score_bull, self.score_bear, self.score_bull, self.score_bear],
+                self.score_neutral,
+            ),
+        )
+
+    def _recent_ema_trend(
+        self, recent: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Slope, current value and count of the EMA values above the threshold per row."""
+        valid = recent > self.zero_threshold
+        count = valid.sum(axis=1)
+        rows = np.arange(len(recent))
+        first = recent[rows, valid.argmax(axis=1)]
+        current = recent[rows, recent.shape[1] - 1 - valid[:, ::-1].argmax(axis=1)]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (current - first) / count, current, count
+
+    def _combine_arrays(
+        self,
+        hh_state: np.ndarray,
+        hh_score: np.ndarray,
+        ema_state: np.ndarray,
+        ema_score: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """``_combine_signals`` for arrays of HH/HL and EMA results."""
+        average = (hh_score + ema_score) / 2
+        hh_directional = hh_state != "NEUTRAL"
+        ema_directional = ema_state != "NEUTRAL"
+        agree = hh_state == ema_state
+        conditions = [
+            agree & hh_directional,  # Bonus for agreement
+            agree,  # Both NEUTRAL
+            hh_directional & ~ema_directional,
+            ema_directional & ~hh_directional,
+        ]
+        state = np.select(
+            conditions, [hh_state, "NEUTRAL", hh_state, ema_state], "NEUTRAL"
+        ).astype(object)
+        score = np.select(
+            conditions,
+            [
+                np.minimum(self.score_max, average + 0.1),
+                0.4,
+                np.maximum(0.4, average * 0.8),
+                np.maximum(0.4, average * 0.8),
+            ],
+            self.score_neutral,  # Opposing signals - stay neutral
+        )
+        return state, score
+
     def _get_price_columns(self, df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
-        """Get High/Low columns with case-insensitive fallback and robust data handling."""
-        # Try exact column names first, then lowercase fallback
-        high_col = None
-        low_col = None
-
-        if "High" in df.columns:
-            high_col = "High"
-        elif "high" in df.columns:
-            high_col = "high"
-
-        if "Low" in df.columns:
-            low_col = "Low"
-        elif "low" in df.columns:
-            low_col = "low"
-
-        if high_col is None or low_col is None:
+        """Get High/Low arrays from the canonical OHLCV schema with robust data handling."""
+        ohlcv = OHLCV.from_frame(df)
+        if ohlcv.high is None or ohlcv.low is None:
             missing = []
-            if high_col is None:
+            if ohlcv.high is None:
                 missing.append("High/high")
-            if low_col is None:
+            if ohlcv.low is None:
                 missing.append("Low/low")
             raise ValueError(f"Missing required columns: {', '.join(missing)}")
 
-        highs = df[high_col].values
-        lows = df[low_col].values
-
         # Replace NaN and infinite values with 0.0
-        highs = np.where(np.isfinite(highs), highs, 0.0)
-        lows = np.where(np.isfinite(lows), lows, 0.0)
+        highs = np.where(np.isfinite(ohlcv.high), ohlcv.high, 0.0)
+        lows = np.where(np.isfinite(ohlcv.low), ohlcv.low, 0.0)
 
         return highs, lows
 
@@ -187,52 +379,19 @@ class PatternTrendAnalyzer:
                 "reason": f"Insufficient data: need {min_required} points (window_size={self.window_size} + min_consecutive={self.min_consecutive}), got {len(highs)}",
             }
 
-        # Track consecutive streaks properly
-        max_hh_streak = 0
-        max_hl_streak = 0
-        max_lh_streak = 0
-        max_ll_streak = 0
-
-        current_hh_streak = 0
-        current_hl_streak = 0
-        current_lh_streak = 0
-        current_ll_streak = 0
-
-        # Compare consecutive windows for more robust detection
-        for i in range(self.window_size, len(highs)):
-            current_high = highs[i]
-            previous_high = highs[i - self.window_size]
-            current_low = lows[i]
-            previous_low = lows[i - self.window_size]
-
-            # Track Higher Highs streak
-            if current_high > previous_high:
-                current_hh_streak += 1
-                max_hh_streak = max(max_hh_streak, current_hh_streak)
-            else:
-                current_hh_streak = 0
-
-            # Track Higher Lows streak
-            if current_low > previous_low:
-                current_hl_streak += 1
-                max_hl_streak = max(max_hl_streak, current_hl_streak)
-            else:
-                current_hl_streak = 0
-
-            # Track Lower Highs streak
-            if current_high < previous_high:
-                current_lh_streak += 1
-                max_lh_streak = max(max_lh_streak, current_lh_streak)
-            else:
-                current_lh_streak = 0
-
-            # Track Lower Lows streak
-            if current_low < previous_low:
-                current_ll_streak += 1
-                max_ll_streak = max(max_ll_streak, current_ll_streak)
-            else:
-                current_ll_streak = 0
-
+        # Max consecutive HH/HL/LH/LL streaks (run-length encoding)
+        streaks = max_streaks(highs, lows, self.window_size)
+        return self._classify_streaks(*streaks, data_points=len(highs))
+
+    def _classify_streaks(
+        self,
+        max_hh_streak: int,
+        max_hl_streak: int,
+        max_lh_streak: int,
+        max_ll_streak: int,
+        data_points: int,
+    ) -> dict[str, Any]:
+        """HH/HL state and score from the maximum streaks."""
         # Determine trend based on CONSECUTIVE patterns (architectural requirement)
         if (
             max_hh_streak >= self.min_consecutive
@@ -264,7 +423,7 @@ class PatternTrendAnalyzer:
             "max_hl_streak": max_hl_streak,
             "max_lh_streak": max_lh_streak,
             "max_ll_streak": max_ll_streak,
-            "data_points": len(highs),
+            "data_points": data_points,
         }
 
     def _analyze_ema_slope(self, df: pd.DataFrame) -> dict[str, Any]:
@@ -290,73 +449,15 @@ class PatternTrendAnalyzer:
             ema50 = np.nan_to_num(ema50, nan=0.0)
             ema200 = np.nan_to_num(ema200, nan=0.0)
 
-            # Get recent non-zero values
-            recent_ema50 = ema50[-self.ema_recent_window :]
-            recent_ema200 = ema200[-self.ema_recent_window :]
-
-            valid_ema50 = recent_ema50[recent_ema50 > self.zero_threshold]
-            valid_ema200 = recent_ema200[recent_ema200 > self.zero_threshold]
-
-            if (
-                len(valid_ema50) < self.min_valid_ema
-                or len(valid_ema200) < self.min_valid_ema
-            ):
-                return {
-                    "state": "NEUTRAL",
-                    "score": self.score_neutral,
-                    "reason": "Insufficient valid EMA data",
-                }
-
-            # Calculate slopes (recent trend in EMAs)
-            ema50_slope = (valid_ema50[-1] - valid_ema50[0]) / len(valid_ema50)
-            ema200_slope = (valid_ema200[-1] - valid_ema200[0]) / len(valid_ema200)
-
             # Robust current price extraction with NaN handling
             current_price = np.nan_to_num(df["Close"].iloc[-1], nan=0.0)
-            if current_price <= self.zero_threshold:
-                return {
-                    "state": "NEUTRAL",
-                    "score": self.score_neutral,
-                    "reason": "Invalid current price",
-                }
-
-            # Enhanced trend determination with architectural precision
-            ema50_current = valid_ema50[-1]
-            ema200_current = valid_ema200[-1]
-
-            if (
-                ema50_current > ema200_current
-                and current_price > ema50_current
-                and ema50_slope > self.zero_threshold
-            ):
-                state: SignalState = "UP"
-                score = self.score_bull
-            elif ema50_current > ema200_current and ema50_slope > self.zero_threshold:
-                state = "UP"
-                score = self.score_bear
-            elif (
-                ema50_current < ema200_current
-                and current_price < ema50_current
-                and ema50_slope < -self.zero_threshold
-            ):
-                state = "DOWN"
-                score = self.score_bull
-            elif ema50_current < ema200_current and ema50_slope < -self.zero_threshold:
-                state = "DOWN"
-                score = self.score_bear
-            else:
-                state = "NEUTRAL"
-                score = self.score_neutral
 
-            return {
-                "state": state,
-                "score": score,
-                "ema50_slope": ema50_slope,
-                "ema200_slope": ema200_slope,
-                "ema50_current": ema50_current,
-                "ema200_current": ema200_current,
-                "valid_data_points": len(valid_closes),
-            }
+            return self._classify_ema(
+                ema50[-self.ema_recent_window :],
+                ema200[-self.ema_recent_window :],
+                current_price,
+                len(valid_closes),
+            )
 
         except Exception as e:
             logger.warning(f"EMA analysis failed: {e}")
@@ -366,6 +467,77 @@ class PatternTrendAnalyzer:
                 "reason": f"EMA error: {e!s}",
             }
 
+    def _classify_ema(
+        self,
+        recent_ema50: np.ndarray,
+        recent_ema200: np.ndarray,
+        current_price: float,
+        valid_data_points: int,
+    ) -> dict[str, Any]:
+        """EMA state and score from the recent EMA50/EMA200 windows."""
+        # Get recent non-zero values
+        valid_ema50 = recent_ema50[recent_ema50 > self.zero_threshold]
+        valid_ema200 = recent_ema200[recent_ema200 > self.zero_threshold]
+
+        if (
+            len(valid_ema50) < self.min_valid_ema
+            or len(valid_ema200) < self.min_valid_ema
+        ):
+            return {
+                "state": "NEUTRAL",
+                "score": self.score_neutral,
+                "reason": "Insufficient valid EMA data",
+            }
+
+        # Calculate slopes (recent trend in EMAs)
+        ema50_slope = (valid_ema50[-1] - valid_ema50[0]) / len(valid_ema50)
+        ema200_slope = (valid_ema200[-1] - valid_ema200[0]) / len(valid_ema200)
+
+        if current_price <= self.zero_threshold:
+            return {
+                "state": "NEUTRAL",
+                "score": self.score_neutral,
+                "reason": "Invalid current price",
+            }
+
+        # Enhanced trend determination with architectural precision
+        ema50_current = valid_ema50[-1]
+        ema200_current = valid_ema200[-1]
+
+        if (
+            ema50_current > ema200_current
+            and current_price > ema50_current
+            and ema50_slope > self.zero_threshold
+        ):
+            state: SignalState = "UP"
+            score = self.score_bull
+        elif ema50_current > ema200_current and ema50_slope > self.zero_threshold:
+            state = "UP"
+            score = self.score_bear
+        elif (
+            ema50_current < ema200_current
+            and current_price < ema50_current
+            and ema50_slope < -self.zero_threshold
+        ):
+            state = "DOWN"
+            score = self.score_bull
+        elif ema50_current < ema200_current and ema50_slope < -self.zero_threshold:
+            state = "DOWN"
+            score = self.score_bear
+        else:
+            state = "NEUTRAL"
+            score = self.score_neutral
+
+        return {
+            "state": state,
+            "score": score,
+            "ema50_slope": ema50_slope,
+            "ema200_slope": ema200_slope,
+            "ema50_current": ema50_current,
+            "ema200_current": ema200_current,
+            "valid_data_points": valid_data_points,
+        }
+
     def _combine_signals(
         self, hh_hl: dict[str, Any], ema: dict[str, Any]
     ) -> tuple[SignalState, float, str]:
@@ -0,0 +1,175 @@
+"""
+HH/HL Streak Engine - run-length encoding instead of per-element counters
+
+Pattern order everywhere: (higher highs, higher lows, lower highs, lower lows),
+each comparing bar ``i`` with bar ``i - window``.
+"""
+
+from collections import deque
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def run_lengths(mask: np.ndarray) -> np.ndarray:
+    """
+    Length of the True run ending at each position (along the last axis).
+
+    Args:
+        mask: Boolean array (1D or 2D)
+
+    Returns:
+        Array of the same shape: 0 for False, otherwise the run length
+    """
+    mask = np.asarray(mask, dtype=bool)
+    positions = np.broadcast_to(np.arange(mask.shape[-1]), mask.shape)
+    last_break = np.maximum.accumulate(np.where(mask, -1, positions), axis=-1)
+    return positions - last_break
+
+
+def _pattern_masks(highs: np.ndarray, lows: np.ndarray, window: int) -> np.ndarray:
+    """HH/HL/LH/LL comparisons of bar i vs i - window, shape (4, n - window)."""
+    current_high, previous_high = highs[window:], highs[:-window]
+    current_low, previous_low = lows[window:], lows[:-window]
+    return np.stack(
+        [
+            current_high > previous_high,
+            current_low > previous_low,
+            current_high < previous_high,
+            current_low < previous_low,
+        ]
+    )
+
+
+def max_streaks(
+    highs: np.ndarray, lows: np.ndarray, window: int
+) -> tuple[int, int, int, int]:
+    """
+    Longest consecutive HH/HL/LH/LL streaks in the arrays.
+
+    Args:
+        highs: High prices
+        lows: Low prices
+        window: Distance between compared bars
+
+    Returns:
+        Tuple: (max_hh, max_hl, max_lh, max_ll)
+    """
+    if len(highs) <= window:
+        return 0, 0, 0, 0
+    longest = run_lengths(_pattern_masks(highs, lows, window)).max(axis=1)
+    return tuple(int(value) for value in longest)
+
+
+def rolling_max_streaks(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    lookback: int,
+    window: int,
+    valid: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    ``max_streaks`` over the last ``lookback`` bars at every position.
+
+    Streaks restart at each window start (as with ``df.tail(lookback)``),
+    so the RLE runs along the rows of a window matrix. Bars outside
+    ``valid`` are dropped from each window before comparing, as the
+    per-window filtering in ``_analyze_hh_hl_patterns`` does.
+
+    Args:
+        highs: High prices
+        lows: Low prices
+        lookback: Bars per window
+        window: Distance between compared (valid) bars
+        valid: Boolean mask of usable bars (default: all)
+
+    Returns:
+        Array (n, 4) of max HH/HL/LH/LL streaks for every bar
+    """
+    highs = np.asarray(highs, dtype=float)
+    lows = np.asarray(lows, dtype=float)
+    valid = np.ones(len(highs), dtype=bool) if valid is None else valid
+    width = lookback - window
+    streaks = np.zeros((len(highs), 4), dtype=int)
+    compressed = int(valid.sum())
+    if width <= 0 or compressed <= window:
+        return streaks
+
+    # Comparison k (valid bars only) belongs to the row of bar t if t - width < k <= t
+    masks = np.zeros((4, compressed + width - 1), dtype=bool)
+    masks[:, width - 1 + window :] = _pattern_masks(highs[valid], lows[valid], window)
+    windows = sliding_window_view(masks, width, axis=1)  # (4, compressed, width)
+
+    # Last valid bar of each window and the first comparison inside it
+    end = np.cumsum(valid)
+    start = np.r_[np.zeros(min(lookback, len(end)), dtype=int), end[:-lookback]]
+    rows = np.flatnonzero(end > 0)
+    last = end[rows] - 1
+    first_column = start[rows] + window - last + width - 1
+    inside = np.arange(width) >= first_column[:, None]  # (rows, width)
+    streaks[rows] = run_lengths(windows[:, last] & inside).max(axis=2).T
+    return streaks
+
+
+class StreakTracker:
+    """
+    Incremental HH/HL/LH/LL streaks, updated one appended bar at a time.
+
+    Keeps only the last ``window`` prices plus the True segments (start, end)
+    of each pattern inside the current window: a new bar extends or opens a
+    segment and expired segments drop off the left. Matches ``max_streaks``
+    over the last ``lookback`` bars.
+    """
+
+    __slots__ = ("_bar", "_highs", "_lows", "_segments", "lookback", "window")
+
+    def __init__(self, lookback: int, window: int) -> None:
+        self.lookback = lookback
+        self.window = window
+        self._highs: deque[float] = deque(maxlen=window)
+        self._lows: deque[float] = deque(maxlen=window)
+        self._segments: tuple[deque[list[int]], ...] = tuple(deque() for _ in range(4))
+        self._bar = -1
+
+    def update(self, high: float, low: float) -> tuple[int, int, int, int]:
+        """
+        Append one bar.
+
+        Args:
+            high: Bar high
+            low: Bar low
+
+        Returns:
+            Tuple: (max_hh, max_hl, max_lh, max_ll) for the current window
+        """
+        self._bar += 1
+        bar = self._bar
+
+        if len(self._highs) == self.window:
+            previous_high, previous_low = self._highs[0], self._lows[0]
+            flags = (
+                high > previous_high,
+                low > previous_low,
+                high < previous_high,
+                low < previous_low,
+            )
+            for segments, flag in zip(self._segments, flags, strict=True):
+                if not flag:
+                    continue
+                if segments and segments[-1][1] == bar - 1:
+                    segments[-1][1] = bar
+                else:
+                    segments.append([bar, bar])
+        self._highs.append(high)
+        self._lows.append(low)
+
+        # First comparison inside the window of the last lookback bars
+        first = max(bar - self.lookback + 1, 0) + self.window
+        longest = []
+        for segments in self._segments:
+            while segments and segments[0][1] < first:
+                segments.popleft()
+            longest.append(
+                max((end - max(start, first) + 1 for start, end in segments), default=0)
+            )
+        return tuple(longest)
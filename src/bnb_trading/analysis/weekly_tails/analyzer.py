@@ -6,43 +6,56 @@ Focus: Simple but accurate, no look-ahead, weekly tails dominant weight
 """
 
 import logging
+from collections.abc import Mapping
 from typing import Any
 
 import numpy as np
 import pandas as pd
 
+from bnb_trading.core.config import WeeklyTailsSettings
+from bnb_trading.data.schema import OHLCV
+
 logger = logging.getLogger(__name__)
 
 
+def _ohlcv_arrays(df: pd.DataFrame | OHLCV) -> np.ndarray:
+    """Open/High/Low/Close/Volume as a float (5, n) array (missing columns are zeros)."""
+    return OHLCV.from_frame(df).values.astype(float, copy=False)
+
+
 class WeeklyTailsAnalyzer:
     """Enhanced Weekly Tails Analyzer for LONG precision ≥85%"""
 
-    def __init__(self, config: dict[str, Any]) -> None:
+    def __init__(self, config: Mapping[str, Any]) -> None:
         """Initialize with configuration"""
-        tails_config = config.get("weekly_tails", {})
-        self.lookback_weeks = tails_config.get("lookback_weeks", 8)
-        self.min_tail_strength = tails_config.get("min_tail_strength", 1.2)
-        self.atr_period = tails_config.get("atr_period", 14)
-        self.volume_ma_period = tails_config.get("vol_sma_period", 20)
+        settings = WeeklyTailsSettings.from_config(config)
+        self.lookback_weeks = settings.lookback_weeks
+        self.min_tail_strength = settings.min_tail_strength
+        self.atr_period = settings.atr_period
+        self.volume_ma_period = settings.vol_sma_period
 
         # New validation parameters
-        self.min_tail_ratio = tails_config.get("min_tail_ratio", 1.0)
-        self.max_body_atr = tails_config.get("max_body_atr", 0.8)
-        self.min_close_pos = tails_config.get("min_close_pos", 0.35)
+        self.min_tail_ratio = settings.min_tail_ratio
+        self.max_body_atr = settings.max_body_atr
+        self.min_close_pos = settings.min_close_pos
 
         logger.info(
             f"Weekly Tails Analyzer initialized - min_tail_strength: {self.min_tail_strength}, "
             f"min_tail_ratio: {self.min_tail_ratio}, max_body_atr: {self.max_body_atr}"
         )
 
-    def calculate_tail_strength(self, df: pd.DataFrame) -> dict[str, Any]:
+    def calculate_tail_strength(self, df: pd.DataFrame | OHLCV) -> dict[str, Any]:
         """
         Calculate enhanced tail strength with ATR normalization
 
         Formula: tail_strength = (lower_wick / body_size) * volume_ratio * (1 / atr_normalized)
 
+        All weeks of the lookback window are evaluated in one array pass
+        (see _window_features); ATR and volume SMA for each week use only
+        the earlier weeks of the window (no look-ahead).
+
         Args:
-            df: DataFrame with OHLCV data (closed candles only!)
+            df: DataFrame or OHLCV series (closed candles only!)
 
         Returns:
             Dict with tail analysis results
@@ -54,15 +67,13 @@ class WeeklyTailsAnalyzer:
                 return self._empty_result("Insufficient closed data")
 
             recent_weeks = closed_df.tail(self.lookback_weeks)
+            features = self._window_features(_ohlcv_arrays(recent_weeks)[:, None, :])
 
-            # Calculate components for each week
-            results = []
-            for i, (date, row) in enumerate(recent_weeks.iterrows()):
-                tail_data = self._analyze_single_week(
-                    row, date, recent_weeks.iloc[: i + 1]
-                )
-                if tail_data:
-                    results.append(tail_data)
+            # One record per qualifying week (LONG or HOLD)
+            results = [
+                self._tail_record(features, 0, k, pd.Timestamp(recent_weeks.index[k]))
+                for k in np.flatnonzero(features["qualifies"][0])
+            ]
 
             # Find strongest LONG tail signal
             long_tails = [
@@ -93,197 +104,202 @@ class WeeklyTailsAnalyzer:
             logger.exception(f"Error calculating tail strength: {e}")
             return self._empty_result(f"Error: {e}")
 
-    def _analyze_single_week(
-        self, row: pd.Series, date: pd.Timestamp, history_df: pd.DataFrame
-    ) -> dict[str, Any] | None:
-        """Analyze single weekly candle for tail strength with correct ATR normalization"""
-        try:
-            # Extract OHLCV
-            open_price = float(row.get("open", row.get("Open", 0)))
-            high_price = float(row.get("high", row.get("High", 0)))
-            low_price = float(row.get("low", row.get("Low", 0)))
-            close_price = float(row.get("close", row.get("Close", 0)))
-            volume = float(row.get("volume", row.get("Volume", 0)))
-
-            if any(
-                x <= 0 for x in [open_price, high_price, low_price, close_price, volume]
-            ):
-                return None
-
-            # Calculate epsilon for division safety
-            epsilon = 1e-8 * close_price
-
-            # Calculate tail metrics with proper definitions
-            body_size = max(abs(close_price - open_price), epsilon)
-            lower_wick = max(min(open_price, close_price) - low_price, 0)
-            upper_wick = max(high_price - max(open_price, close_price), 0)
-
-            # Skip if no meaningful lower wick
-            if lower_wick < 0.01:
-                return None
-
-            # Calculate ATR from previous weeks (no look-ahead)
-            atr_w = self._calculate_atr_shifted(history_df, self.atr_period)
-            if atr_w <= 0:
-                return None
-
-            # Calculate volume SMA from previous weeks (no look-ahead)
-            vol_sma = self._calculate_volume_sma_shifted(
-                history_df, self.volume_ma_period
-            )
-
-            # Enhanced tail strength formula (correct ATR normalization)
-            tail_ratio = lower_wick / max(
-                atr_w, epsilon
-            )  # Bigger wick relative to volatility = better
-            body_control = min(
-                body_size / max(atr_w, epsilon), 1.0
-            )  # Large body reduces validity
-            body_factor = (
-                1.0 - 0.5 * body_control
-            )  # Range 0.5..1.0 (smaller body = higher factor)
-            volume_ratio = np.clip(
-                volume / max(vol_sma, epsilon), 0.5, 2.0
-            )  # Reduce noise
-            vol_factor = volume_ratio  # 0.5..2.0 range
-
-            tail_strength = tail_ratio * body_factor * vol_factor
-
-            # Validation rules for LONG signals
-            min_tail_ratio = getattr(self, "min_tail_ratio", 1.0)
-            max_body_atr = getattr(self, "max_body_atr", 0.8)
-            min_close_pos = getattr(self, "min_close_pos", 0.35)
-
-            # Rule 1: lower_wick / atr_w >= min_tail_ratio
-            if tail_ratio < min_tail_ratio:
-                return None
-
-            # Rule 2: tail_strength >= min_tail_strength
-            if tail_strength < self.min_tail_strength:
-                return None
-
-            # Rule 3: body_size / atr_w <= max_body_atr
-            if (body_size / max(atr_w, epsilon)) > max_body_atr:
-                return None
-
-            # Rule 4: close position validation
-            price_range = max(high_price - low_price, epsilon)
-            close_pos = (close_price - low_price) / price_range
-            if close_pos < min_close_pos:
-                return None
-
-            # Signal classification (prefer bullish candles for LONG)
-            is_bullish = close_price > open_price
-            signal = "LONG" if is_bullish else "HOLD"
-
-            reason = (
-                f"Tail ratio: {tail_ratio:.2f}, strength: {tail_strength:.2f}, "
-                f"close_pos: {close_pos:.2f}, body_factor: {body_factor:.2f}"
-            )
+    def tail_strength_history(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        calculate_tail_strength for every closed week, in one batch
 
-            return {
-                "date": date,
-                "signal": signal,
-                "strength": tail_strength,
-                "tail_ratio": tail_ratio,
-                "body_factor": body_factor,
-                "volume_ratio": volume_ratio,
-                "close_pos": close_pos,
-                "lower_wick": lower_wick,
-                "upper_wick": upper_wick,
-                "body_size": body_size,
-                "atr_w": atr_w,
-                "low": low_price,
-                "high": high_price,
-                "close": close_price,
-                "is_bullish": is_bullish,
-                "reason": reason,
-            }
+        Each row equals calculate_tail_strength(df.loc[:date]) for that
+        week, so a backtest can compute this once for all history and look
+        up / slice by date instead of re-analyzing every week.
 
-        except Exception as e:
-            logger.exception(f"Error analyzing week {date}: {e}")
-            return None
+        Args:
+            df: Weekly OHLCV history
 
-    def _calculate_atr_shifted(self, df: pd.DataFrame, period: int) -> float:
-        """Calculate ATR with proper look-ahead prevention (shifted)"""
-        try:
-            if len(df) < max(2, period // 4):  # Need at least some data
-                return 0.0
+        Returns:
+            DataFrame indexed by analysis date with signal, strength,
+            confidence, price_level and tail_date (empty if too short)
+        """
+        columns = ["signal", "strength", "confidence", "price_level", "tail_date"]
+        if len(df) < self.lookback_weeks:
+            return pd.DataFrame(columns=columns, index=df.index[:0])
 
-            # Handle both column naming conventions
-            high = (
-                df["High"]
-                if "High" in df.columns
-                else df.get("high", pd.Series(dtype=float))
-            )
-            low = (
-                df["Low"]
-                if "Low" in df.columns
-                else df.get("low", pd.Series(dtype=float))
-            )
-            close = (
-                df["Close"]
-                if "Close" in df.columns
-                else df.get("close", pd.Series(dtype=float))
-            )
+        # (weeks, windows, lookback) zero-copy views over the full arrays
+        windows = np.lib.stride_tricks.sliding_window_view(
+            _ohlcv_arrays(df), self.lookback_weeks, axis=1
+        )
+        features = self._window_features(windows)
+
+        long_mask = features["qualifies"] & features["is_bullish"]
+        masked_strength = np.where(long_mask, features["strength"], -np.inf)
+        best = masked_strength.argmax(axis=1)
+        rows = np.arange(len(best))
+        has_long = long_mask[rows, best]
+
+        strength = np.where(has_long, features["strength"][rows, best], 0.0)
+        dates = df.index[self.lookback_weeks - 1 :]
+        return pd.DataFrame(
+            {
+                "signal": np.where(has_long, "LONG", "HOLD"),
+                "strength": strength,
+                "confidence": np.minimum(strength / 5.0, 1.0),
+                "price_level": np.where(has_long, features["low"][rows, best], 0.0),
+                "tail_date": df.index[rows + best].where(has_long),
+            },
+            index=dates,
+        )
 
-            if any(col.empty for col in [high, low, close]):
-                return 0.0
+    def _window_features(self, ohlcv: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        Tail features for stacked lookback windows in one array pass
 
-            # True Range calculation
-            tr1 = high - low
-            tr2 = abs(high - close.shift(1))
-            tr3 = abs(low - close.shift(1))
+        Position k of a window sees only window rows 0..k, exactly like the
+        former per-week loop over ``recent_weeks.iloc[: k + 1]``: ATR is the
+        shifted rolling mean of true range (first window row uses High-Low)
+        and volume SMA the shifted rolling mean of volume, with the same
+        min_periods and fallbacks.
 
-            true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+        Args:
+            ohlcv: Array (5, windows, lookback) of Open/High/Low/Close/Volume
 
-            # Use smaller min_periods for more flexible ATR calculation
-            min_periods = max(2, min(period // 2, len(df) // 2))
-            atr = true_range.rolling(window=period, min_periods=min_periods).mean()
-            atr_shifted = atr.shift(1)  # Use previous ATR value
+        Returns:
+            Dict of (windows, lookback) arrays
+        """
+        open_, high, low, close, volume = ohlcv
+        width = close.shape[1]
+        length = np.arange(1, width + 1)  # prefix length per position
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            epsilon = 1e-8 * close
+            body_size = np.maximum(np.abs(close - open_), epsilon)
+            lower_wick = np.maximum(np.minimum(open_, close) - low, 0.0)
+            upper_wick = np.maximum(high - np.maximum(open_, close), 0.0)
+            price_range = high - low
+
+            true_range = price_range.copy()
+            prev_close = close[:, :-1]
+            true_range[:, 1:] = np.fmax(
+                price_range[:, 1:],
+                np.fmax(
+                    np.abs(high[:, 1:] - prev_close), np.abs(low[:, 1:] - prev_close)
+                ),
+            )
 
-            # Get the last valid ATR value
-            valid_atr = atr_shifted.dropna()
-            if len(valid_atr) > 0:
-                return float(valid_atr.iloc[-1])
-            # Fallback: use simple price range average
-            price_ranges = high - low
-            return float(price_ranges.mean()) if not price_ranges.empty else 0.0
+            atr_w = self._shifted_rolling_mean(
+                true_range,
+                price_range,
+                length,
+                self.atr_period,
+                min_periods=np.maximum(
+                    2, np.minimum(self.atr_period // 2, length // 2)
+                ),
+            )
+            atr_w[:, length < max(2, self.atr_period // 4)] = 0.0
+
+            vol_sma = self._shifted_rolling_mean(
+                volume,
+                volume,
+                length,
+                self.volume_ma_period,
+                min_periods=np.maximum(
+                    2, np.minimum(self.volume_ma_period // 4, length // 2)
+                ),
+            )
+            vol_sma[:, length < 2] = 1.0
+
+            safe_atr = np.maximum(atr_w, epsilon)
+            tail_ratio = lower_wick / safe_atr
+            body_atr = body_size / safe_atr
+            body_factor = 1.0 - 0.5 * np.minimum(body_atr, 1.0)
+            volume_ratio = np.clip(volume / np.maximum(vol_sma, epsilon), 0.5, 2.0)
+            strength = tail_ratio * body_factor * volume_ratio
+            close_pos = (close - low) / np.maximum(price_range, epsilon)
+
+            qualifies = (
+                (open_ > 0)
+                & (high > 0)
+                & (low > 0)
+                & (close > 0)
+                & (volume > 0)
+                & (lower_wick >= 0.01)
+                & (atr_w > 0)
+                & (tail_ratio >= self.min_tail_ratio)
+                & (strength >= self.min_tail_strength)
+                & (body_atr <= self.max_body_atr)
+                & (close_pos >= self.min_close_pos)
+            )
 
-        except Exception as e:
-            logger.exception(f"Error calculating shifted ATR: {e}")
-            return 0.0
+        return {
+            "qualifies": qualifies,
+            "is_bullish": close > open_,
+            "strength": strength,
+            "tail_ratio": tail_ratio,
+            "body_factor": body_factor,
+            "volume_ratio": volume_ratio,
+            "close_pos": close_pos,
+            "lower_wick": lower_wick,
+            "upper_wick": upper_wick,
+            "body_size": body_size,
+            "atr_w": atr_w,
+            "low": low,
+            "high": high,
+            "close": close,
+        }
 
-    def _calculate_volume_sma_shifted(self, df: pd.DataFrame, period: int) -> float:
-        """Calculate volume SMA with proper look-ahead prevention (shifted)"""
-        try:
-            if len(df) < 2:  # Need at least 2 data points
-                return 1.0
+    @staticmethod
+    def _shifted_rolling_mean(
+        values: np.ndarray,
+        fallback_values: np.ndarray,
+        length: np.ndarray,
+        period: int,
+        min_periods: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Previous-bar rolling mean per prefix length, via cumulative sums
 
-            # Handle both column naming conventions
-            volume = (
-                df["Volume"]
-                if "Volume" in df.columns
-                else df.get("volume", pd.Series(dtype=float))
-            )
-            if volume.empty:
-                return 1.0
+        Mean of values[k - count : k] with count = min(period, k); where
+        count < min_periods, the mean of fallback_values[0 : k + 1].
+        """
+        positions = length - 1
+        count = np.minimum(period, positions)
+        zeros = np.zeros((values.shape[0], 1))
+        cum_values = np.concatenate([zeros, np.cumsum(values, axis=1)], axis=1)
+        cum_fallback = np.concatenate(
+            [zeros, np.cumsum(fallback_values, axis=1)], axis=1
+        )
 
-            # Use flexible min_periods
-            min_periods = max(2, min(period // 4, len(df) // 2))
-            vol_sma = volume.rolling(window=period, min_periods=min_periods).mean()
-            vol_sma_shifted = vol_sma.shift(1)  # Use previous SMA value
+        rolling = (cum_values[:, positions] - cum_values[:, positions - count]) / (
+            np.maximum(count, 1)
+        )
+        fallback = cum_fallback[:, length] / length
+        return np.where(count >= min_periods, rolling, fallback)
+
+    def _tail_record(
+        self,
+        features: dict[str, np.ndarray],
+        window: int,
+        position: int,
+        date: pd.Timestamp,
+    ) -> dict[str, Any]:
+        """Build the per-week tail dict for one qualifying window position."""
+        values = {
+            name: float(array[window, position])
+            for name, array in features.items()
+            if name not in ("qualifies", "is_bullish")
+        }
+        is_bullish = bool(features["is_bullish"][window, position])
 
-            # Get the last valid SMA value
-            valid_sma = vol_sma_shifted.dropna()
-            if len(valid_sma) > 0:
-                return float(valid_sma.iloc[-1])
-            # Fallback: use volume mean
-            return float(volume.mean()) if not volume.empty else 1.0
+        reason = (
+            f"Tail ratio: {values['tail_ratio']:.2f}, strength: {values['strength']:.2f}, "
+            f"close_pos: {values['close_pos']:.2f}, body_factor: {values['body_factor']:.2f}"
+        )
 
-        except Exception as e:
-            logger.exception(f"Error calculating shifted volume SMA: {e}")
-            return 1.0
+        return {
+            "date": date,
+            "signal": "LONG" if is_bullish else "HOLD",
+            **values,
+            "is_bullish": is_bullish,
+            "reason": reason,
+        }
 
     def _calculate_atr(self, df: pd.DataFrame, period: int) -> float:
         """Calculate Average True Range"""
@@ -291,22 +307,20 @@ class WeeklyTailsAnalyzer:
             if len(df) < period:
                 return 0.0
 
-            high = df.get("high", df.get("High", pd.Series(dtype=float)))
-            low = df.get("low", df.get("Low", pd.Series(dtype=float)))
-            close = df.get("close", df.get("Close", pd.Series(dtype=float)))
-
-            if any(col.empty for col in [high, low, close]):
+            ohlcv = OHLCV.from_frame(df)
+            high, low, close = ohlcv.high, ohlcv.low, ohlcv.close
+            if high is None or low is None or close is None:
                 return 0.0
 
-            # True Range calculation
-            tr1 = high - low
-            tr2 = abs(high - close.shift(1))
-            tr3 = abs(low - close.shift(1))
-
-            true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-            atr = true_range.rolling(window=period).mean().iloc[-1]
+            # True Range calculation (first bar has no previous close)
+            previous_close = np.r_[np.nan, close[:-1]]
+            true_range = np.fmax(
+                high - low,
+                np.fmax(np.abs(high - previous_close), np.abs(low - previous_close)),
+            )
+            atr = true_range[-period:].mean()
 
-            return float(atr) if not pd.isna(atr) else 0.0
+            return float(atr) if not np.isnan(atr) else 0.0
 
         except Exception as e:
             logger.exception(f"Error calculating ATR: {e}")
@@ -318,18 +332,18 @@ class WeeklyTailsAnalyzer:
             if len(df) < period:
                 return 1.0
 
-            volume = df.get("volume", df.get("Volume", pd.Series(dtype=float)))
-            if volume.empty:
+            volume = OHLCV.from_frame(df).volume
+            if volume is None:
                 return 1.0
 
-            volume_ma = volume.rolling(window=period).mean().iloc[-1]
-            return float(volume_ma) if not pd.isna(volume_ma) else 1.0
+            volume_ma = volume[-period:].mean()
+            return float(volume_ma) if not np.isnan(volume_ma) else 1.0
 
         except Exception as e:
             logger.exception(f"Error calculating volume MA: {e}")
             return 1.0
 
-    def _ensure_closed_candles(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _ensure_closed_candles(self, df: pd.DataFrame | OHLCV) -> pd.DataFrame | OHLCV:
         """Ensure we only use closed candles - no look-ahead"""
         # For backtesting, we already receive historical data
         # So we can use all provided data as it's already "closed" relative to analysis point
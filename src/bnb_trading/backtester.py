@@ -114,8 +114,6 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
-import toml
-from tqdm import tqdm
 
 
 def _try_imports():
@@ -125,6 +123,7 @@ def _try_imports():
     def _import_components():
         """Import all required components - DRY helper"""
         from bnb_trading.analysis.weekly_tails.analyzer import WeeklyTailsAnalyzer
+        from bnb_trading.core.config import load_config
         from bnb_trading.data.fetcher import BNBDataFetcher
         from bnb_trading.fibonacci import FibonacciAnalyzer
         from bnb_trading.indicators import TechnicalIndicators
@@ -136,6 +135,7 @@ def _try_imports():
             TechnicalIndicators,
             SignalGenerator,
             WeeklyTailsAnalyzer,
+            load_config,
         )
 
     # Strategy 1: Try absolute imports (CI with installed package)
@@ -191,6 +191,7 @@ def _try_imports():
     TechnicalIndicators,
     SignalGenerator,
     WeeklyTailsAnalyzer,
+    load_config,
 ) = _try_imports()
 
 # Configure logging
@@ -272,7 +273,11 @@ class Backtester:
         and proper configuration of all analysis modules for accurate results.
     """
 
-    def __init__(self, config_file: str = "config.toml") -> None:
+    def __init__(
+        self,
+        config_file: str = "config.toml",
+        overrides: dict[str, dict] | None = None,
+    ) -> None:
         """
         Initialize the Backtesting Engine with complete system configuration.
 
@@ -288,10 +293,13 @@ class Backtester:
                 - weekly_tails: Weekly tails analysis settings
                 - indicators: Technical indicators parameters
                 - All other module-specific configurations
+            overrides (dict | None): Whole config sections to replace
+                (e.g. {"sentiment": {"enabled": False}}); the shared
+                cached config itself is frozen and never mutated.
 
         Raises:
             FileNotFoundError: If configuration file does not exist
-            ValueError: If configuration is invalid or incomplete
+            ConfigurationError: If configuration is invalid or incomplete
             ImportError: If required analysis modules cannot be imported
 
         Example:
@@ -314,7 +322,9 @@ class Backtester:
                 if os.path.exists(root_config_path):
                     config_path = root_config_path
 
-            self.config = toml.load(config_path)
+            self.config = load_config(config_path)
+            if overrides:
+                self.config = self.config.with_overrides(**overrides)
 
             # Инициализираме компонентите
             self.data_fetcher = BNBDataFetcher(self.config["data"]["symbol"])
@@ -427,6 +437,14 @@ class Backtester:
             short_signals_count = 0
             long_signals_count = 0
 
+            # Масиви веднъж; всяка стъпка получава O(1) view вместо DataFrame копие
+            from .data.schema import OHLCV
+
+            daily_series = OHLCV.from_frame(backtest_daily)
+            weekly_series = OHLCV.from_frame(backtest_weekly)
+
+            from tqdm import tqdm
+
             with tqdm(
                 total=total_weeks,
                 desc="📊 Анализ",
@@ -438,8 +456,8 @@ class Backtester:
                     current_date = backtest_weekly.index[i]
 
                     # Взимаме данните до текущата дата
-                    current_daily = backtest_daily.loc[:current_date]
-                    current_weekly = backtest_weekly.iloc[: i + 1]
+                    current_daily = daily_series.until(current_date)
+                    current_weekly = weekly_series[: i + 1]
 
                     if len(current_daily) < 50 or len(current_weekly) < 4:
                         pbar.update(1)
@@ -1249,13 +1267,14 @@ def main():
         ichimoku_logger.setLevel(logging.CRITICAL)  # Изцяло изключваме
         sentiment_logger.setLevel(logging.CRITICAL)  # Изцяло изключваме
 
-        # Създаваме backtester-а
-        backtester = Backtester()
-
-        # Дезактивираме HTTP модули в конфигурацията за бързина
-        backtester.config["sentiment"] = {"enabled": False}
-        backtester.config["whale_tracker"] = {"enabled": False}
-        backtester.config["ichimoku"] = {"enabled": False}
+        # Създаваме backtester-а с дезактивирани HTTP модули за бързина
+        backtester = Backtester(
+            overrides={
+                "sentiment": {"enabled": False},
+                "whale_tracker": {"enabled": False},
+                "ichimoku": {"enabled": False},
+            }
+        )
 
         print("⚡ Конфигурация: HTTP модули дезактивирани за backtesting")
 
@@ -1,5 +1,6 @@
 """Core domain models and types for BNB Trading System."""
 
+from .config import TradingConfig, load_config
 from .exceptions import AnalysisError, ConfigurationError, DataError
 from .models import (
     AnalysisResult,
@@ -10,6 +11,7 @@ from .models import (
     ValidationPoint,
     ValidationResult,
 )
+from .registry import clear_analyzers, get_analyzer
 from .types import (
     AnalysisData,
     AnalysisModule,
@@ -48,8 +50,12 @@ __all__ = [
     "SystemConfig",
     "TechnicalIndicators",
     "TestResult",
+    "TradingConfig",
     "ValidationMetrics",
     "ValidationPoint",
     "ValidationResult",
     "WeeklyTailsAnalysis",
+    "clear_analyzers",
+    "get_analyzer",
+    "load_config",
 ]
@@ -0,0 +1,245 @@
+"""Typed, frozen configuration for BNB Trading System."""
+
+import hashlib
+import json
+import logging
+import threading
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any
+
+import toml
+
+from .exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+# Resolved path -> (mtime_ns, config); one parse per file version per process
+_CONFIG_CACHE: dict[Path, tuple[int, "TradingConfig"]] = {}
+_CONFIG_LOCK = threading.Lock()
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts/lists to read-only sections/tuples."""
+    if isinstance(value, Mapping):
+        return ConfigSection(value)
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Inverse of _freeze: plain dicts/lists (for TOML/JSON/pickle)."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def config_hash(config: Mapping[str, Any]) -> str:
+    """
+    Stable content hash of a configuration mapping
+
+    Args:
+        config: TradingConfig or plain dict
+
+    Returns:
+        16-char hex digest (same content -> same hash across processes)
+    """
+    if isinstance(config, TradingConfig):
+        return config.content_hash
+    payload = json.dumps(_thaw(config), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class ConfigSection(Mapping[str, Any]):
+    """
+    Read-only config section with both mapping and attribute access.
+
+    ``section["key"]`` / ``section.get("key", default)`` keep working for
+    code written against the raw TOML dict; ``section.key`` is sugar.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        object.__setattr__(
+            self, "_data", {key: _freeze(value) for key, value in data.items()}
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._data[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} has no attribute {name!r}"
+            ) from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (self.to_dict(),)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Mutable deep copy as plain dicts/lists."""
+        return _thaw(self)
+
+
+def _check_range(
+    section: str, name: str, value: float, low: float, high: float | None = None
+) -> None:
+    """Raise ConfigurationError if value is outside [low, high]."""
+    if value < low or (high is not None and value > high):
+        bounds = f"[{low}, {high}]" if high is not None else f">= {low}"
+        raise ConfigurationError(f"[{section}] {name}={value} must be {bounds}")
+
+
+def _settings_from_mapping(cls: type, section: Mapping[str, Any]) -> Any:
+    """Build a settings dataclass from a section, dataclass defaults fill gaps."""
+    values = {f.name: f.type(section[f.name]) for f in fields(cls) if f.name in section}
+    return cls(**values)
+
+
+@dataclass(frozen=True, slots=True)
+class SignalSettings:
+    """[signals] weights and threshold used by decide_long."""
+
+    weekly_tails_weight: float = 0.60
+    fibonacci_weight: float = 0.20
+    trend_weight: float = 0.10
+    volume_weight: float = 0.10
+    confidence_threshold: float = 0.88
+
+    def __post_init__(self) -> None:
+        for f in fields(self):
+            _check_range("signals", f.name, getattr(self, f.name), 0.0, 1.0)
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "SignalSettings":
+        """Precomputed settings for TradingConfig, parsed for plain dicts."""
+        if isinstance(config, TradingConfig):
+            return config.signal_settings
+        return _settings_from_mapping(cls, config.get("signals", {}))
+
+
+@dataclass(frozen=True, slots=True)
+class WeeklyTailsSettings:
+    """[weekly_tails] parameters used by the weekly tails analyzer."""
+
+    lookback_weeks: int = 8
+    min_tail_strength: float = 1.2
+    atr_period: int = 14
+    vol_sma_period: int = 20
+    min_tail_ratio: float = 1.0
+    max_body_atr: float = 0.8
+    min_close_pos: float = 0.35
+
+    def __post_init__(self) -> None:
+        for name in ("lookback_weeks", "atr_period", "vol_sma_period"):
+            _check_range("weekly_tails", name, getattr(self, name), 1)
+        for name in ("min_tail_strength", "min_tail_ratio", "max_body_atr"):
+            _check_range("weekly_tails", name, getattr(self, name), 0.0)
+        _check_range("weekly_tails", "min_close_pos", self.min_close_pos, 0.0, 1.0)
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "WeeklyTailsSettings":
+        """Precomputed settings for TradingConfig, parsed for plain dicts."""
+        if isinstance(config, TradingConfig):
+            return config.weekly_tails_settings
+        return _settings_from_mapping(cls, config.get("weekly_tails", {}))
+
+
+class TradingConfig(ConfigSection):
+    """
+    Frozen, validated configuration (drop-in for the raw ``toml.load`` dict).
+
+    Typed settings for hot-path sections are resolved once at load time,
+    and ``content_hash`` identifies the configuration for cache keys.
+    """
+
+    __slots__ = ("content_hash", "signal_settings", "source", "weekly_tails_settings")
+
+    def __init__(
+        self, data: Mapping[str, Any], source: str | Path | None = None
+    ) -> None:
+        super().__init__(data)
+        try:
+            signal_settings = _settings_from_mapping(
+                SignalSettings, self.get("signals", {})
+            )
+            weekly_tails_settings = _settings_from_mapping(
+                WeeklyTailsSettings, self.get("weekly_tails", {})
+            )
+        except (TypeError, ValueError) as e:
+            raise ConfigurationError(f"Invalid configuration value: {e}") from e
+
+        object.__setattr__(self, "signal_settings", signal_settings)
+        object.__setattr__(self, "weekly_tails_settings", weekly_tails_settings)
+        object.__setattr__(self, "source", str(source) if source else None)
+        object.__setattr__(self, "content_hash", config_hash(self.to_dict()))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (self.to_dict(), self.source)
+
+    def __repr__(self) -> str:
+        return f"TradingConfig(source={self.source!r}, hash={self.content_hash})"
+
+    def with_overrides(self, **sections: Mapping[str, Any]) -> "TradingConfig":
+        """
+        New config with whole top-level sections replaced
+
+        Args:
+            **sections: Section name -> replacement mapping
+
+        Returns:
+            New TradingConfig (the original stays unchanged)
+        """
+        return TradingConfig({**self.to_dict(), **sections}, self.source)
+
+
+def load_config(config_path: str | Path = "config.toml") -> TradingConfig:
+    """
+    Load config.toml once per process (re-parsed only when the file changes)
+
+    Args:
+        config_path: Path to the TOML configuration file
+
+    Returns:
+        Shared, frozen TradingConfig
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ConfigurationError: If the TOML is malformed or values are invalid
+    """
+    path = Path(config_path).resolve()
+    mtime_ns = path.stat().st_mtime_ns
+
+    with _CONFIG_LOCK:
+        cached = _CONFIG_CACHE.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        try:
+            raw = toml.load(path)
+        except toml.TomlDecodeError as e:
+            raise ConfigurationError(f"Invalid TOML in {path}: {e}") from e
+
+        config = TradingConfig(raw, source=path)
+        _CONFIG_CACHE[path] = (mtime_ns, config)
+        logger.debug(f"Config loaded from {path} (hash {config.content_hash})")
+        return config
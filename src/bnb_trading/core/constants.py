@@ -11,6 +11,8 @@ REGIME_MODERATE_BULL = "MODERATE_BULL"
 REGIME_WEAK_BULL = "WEAK_BULL"
 REGIME_NEUTRAL = "NEUTRAL"
 REGIME_BEAR = "BEAR"
+REGIME_CORRECTION = "CORRECTION"
+REGIME_UNKNOWN = "UNKNOWN"
 
 # Timeframes
 TIMEFRAME_1D = "1d"
@@ -1,10 +1,15 @@
 """Core data models for BNB Trading System."""
 
-from collections.abc import Callable
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    import pandas as pd
 
-import pandas as pd
+    from bnb_trading.data.schema import OHLCV
 
 # Module health status types
 Status = Literal["OK", "DEGRADED", "DISABLED", "ERROR"]
@@ -34,9 +39,9 @@ class ModuleResult:
 class DecisionContext:
     """Context for unified decision making - no look-ahead"""
 
-    closed_daily_df: pd.DataFrame  # Last 500 closed daily candles
-    closed_weekly_df: pd.DataFrame  # Last 100 closed weekly candles
-    config: dict[str, Any]  # Configuration from config.toml
+    closed_daily_df: pd.DataFrame | OHLCV  # Last 500 closed daily candles
+    closed_weekly_df: pd.DataFrame | OHLCV  # Last 100 closed weekly candles
+    config: Mapping[str, Any]  # TradingConfig (or raw dict) from config.toml
     timestamp: pd.Timestamp  # Decision timestamp for MTF sync validation
 
 
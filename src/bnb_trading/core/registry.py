@@ -0,0 +1,44 @@
+"""Analyzer registry: one instance per analyzer class and config hash."""
+
+import threading
+from collections.abc import Mapping
+from typing import Any
+
+from .config import config_hash
+
+# (analyzer class, config content hash) -> shared analyzer instance
+_ANALYZERS: dict[tuple[type, str], Any] = {}
+_LOCK = threading.Lock()
+
+
+def get_analyzer[T](analyzer_cls: type[T], config: Mapping[str, Any]) -> T:
+    """
+    Shared analyzer instance for a configuration
+
+    Analyzers only read configuration in ``__init__`` and keep no per-call
+    state on ``self`` (results are returned, inputs are not stored), so one
+    instance per (class, config hash) is safe to reuse across calls and
+    threads.
+
+    Args:
+        analyzer_cls: Analyzer class, constructed as ``analyzer_cls(config)``
+        config: TradingConfig (hash precomputed) or plain dict
+
+    Returns:
+        Cached analyzer instance
+    """
+    key = (analyzer_cls, config_hash(config))
+    analyzer = _ANALYZERS.get(key)
+    if analyzer is None:
+        with _LOCK:
+            analyzer = _ANALYZERS.get(key)
+            if analyzer is None:
+                analyzer = analyzer_cls(config)
+                _ANALYZERS[key] = analyzer
+    return analyzer
+
+
+def clear_analyzers() -> None:
+    """Drop all cached analyzers (e.g. after config reload in tests)."""
+    with _LOCK:
+        _ANALYZERS.clear()
@@ -1,8 +1,11 @@
 """Type definitions for BNB Trading System."""
 
-from typing import Any, Literal, Protocol, TypedDict
+from __future__ import annotations
 
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Signal Types
 SignalType = Literal["LONG", "SHORT", "HOLD"]
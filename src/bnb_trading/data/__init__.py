@@ -2,11 +2,36 @@
 
 from .cache import DataCache
 from .fetcher import BNBDataFetcher
-from .validators import add_ath_analysis, validate_data_quality
+from .gather import MarketSnapshot, gather_market_snapshot
+from .http import FileTransport, HttpClient, get_http_client, set_http_client
+from .journal import SignalJournal
+from .resample import KlineResampler, resample_klines
+from .schema import OHLCV, normalize_ohlcv
+from .store import OHLCVStore
+from .validators import (
+    add_ath_analysis,
+    append_ath_analysis,
+    detect_data_issues,
+    validate_data_quality,
+)
 
 __all__ = [
+    "OHLCV",
     "BNBDataFetcher",
     "DataCache",
+    "FileTransport",
+    "HttpClient",
+    "KlineResampler",
+    "MarketSnapshot",
+    "OHLCVStore",
+    "SignalJournal",
     "add_ath_analysis",
+    "append_ath_analysis",
+    "detect_data_issues",
+    "gather_market_snapshot",
+    "get_http_client",
+    "normalize_ohlcv",
+    "resample_klines",
+    "set_http_client",
     "validate_data_quality",
 ]
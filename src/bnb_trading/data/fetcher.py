@@ -3,8 +3,9 @@
 import logging
 import os
 import sys
+from collections.abc import Mapping
 
-import ccxt
+import numpy as np
 import pandas as pd
 
 # For direct script execution - add src to path
@@ -15,9 +16,115 @@ if __name__ == "__main__":
         sys.path.insert(0, src_dir)
 
 from bnb_trading.core.exceptions import DataError, NetworkError
+from bnb_trading.data.schema import OHLCV_COLUMNS, normalize_ohlcv
 
 logger = logging.getLogger(__name__)
 
+DAY_MS = 24 * 60 * 60 * 1000
+MAX_OHLCV_LIMIT = 1000  # Binance максимум свещи на заявка
+# Ключ в market data -> CCXT timeframe
+TIMEFRAMES = {"daily": "1d", "weekly": "1w"}
+
+
+def ohlcv_limits(lookback_days: int) -> dict[str, int]:
+    """
+    Брой свещи за daily и weekly заявките (Binance limit е max 1000)
+
+    Args:
+        lookback_days: Брой дни за lookback
+
+    Returns:
+        Dict timeframe -> limit ("1d", "1w")
+    """
+    return {
+        "1d": min(lookback_days, 1000),
+        "1w": max(min(lookback_days // 7, 1000), 1),
+    }
+
+
+def ohlcv_to_dataframe(ohlcv_data: list, timeframe: str) -> pd.DataFrame:
+    """
+    Конвертира OHLCV данни в pandas DataFrame
+
+    Args:
+        ohlcv_data: Списък с OHLCV данни от CCXT
+        timeframe: Времеви интервал ('1d' или '1w')
+
+    Returns:
+        DataFrame с канонична схема: Open, High, Low, Close, Volume (float64,
+        Date index)
+
+    Raises:
+        DataError: If no data was received
+    """
+    if not ohlcv_data:
+        raise DataError(f"No OHLCV data received for timeframe {timeframe}")
+
+    df = pd.DataFrame(ohlcv_data, columns=["timestamp", *OHLCV_COLUMNS])
+
+    # Конвертираме timestamp в datetime
+    df["Date"] = pd.to_datetime(df["timestamp"], unit="ms")
+
+    # Премахваме timestamp колоната и пренареждаме
+    df = df[["Date", *OHLCV_COLUMNS]]
+
+    # Задаваме Date като index
+    df.set_index("Date", inplace=True)
+
+    # Конвертираме в numeric типове
+    for col in OHLCV_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+
+    # Премахваме NaN стойности
+    df.dropna(inplace=True)
+
+    logger.info(f"Конвертирани {len(df)} {timeframe} данни")
+    return normalize_ohlcv(df)
+
+
+def ohlcv_since(data: pd.DataFrame) -> int:
+    """``since`` (ms) за live update: open time на последната, още отворена свещ."""
+    return int(data.index[-1].timestamp() * 1000)
+
+
+def append_candles(
+    data: Mapping[str, pd.DataFrame], candles: Mapping[str, list]
+) -> dict[str, pd.DataFrame]:
+    """
+    Добавя новите свещи към вече изтеглени daily/weekly данни
+
+    Свещите от ``ohlcv_since`` нататък заменят последната (още отворена)
+    свещ; ATH колоните и data quality проверката се смятат само за тях.
+
+    Args:
+        data: Резултат от fetch_bnb_data / update_bnb_data
+        candles: "daily"/"weekly" -> OHLCV данни от CCXT след ``ohlcv_since``
+
+    Returns:
+        Dict с обновените daily и weekly DataFrames
+
+    Raises:
+        DataError: If no candles were received
+    """
+    from .validators import append_ath_analysis, detect_data_issues
+
+    updated = {}
+    for key, timeframe in TIMEFRAMES.items():
+        previous = data[key]
+        new = ohlcv_to_dataframe(candles[key], timeframe)
+        if key == "daily":
+            updated[key] = append_ath_analysis(previous, new)
+        else:
+            kept = previous[previous.index < new.index[0]]
+            updated[key] = pd.concat([kept, new])
+
+        start = int(np.searchsorted(updated[key].index, new.index[0]))
+        issues = detect_data_issues(updated[key], start=start)
+        found = {name: rows for name, rows in issues.items() if rows.size}
+        if found:
+            logger.warning(f"Data issues in new {timeframe} candles: {found}")
+    return updated
+
 
 class BNBDataFetcher:
     """
@@ -41,6 +148,9 @@ class BNBDataFetcher:
             NetworkError: If internet connection is unavailable
             DataError: If symbol format is invalid
         """
+        # ccxt is imported on first use - it is the slowest import in the package
+        import ccxt
+
         self.symbol = symbol
         try:
             self.exchange = ccxt.binance(
@@ -64,26 +174,18 @@ class BNBDataFetcher:
             DataError: If data fetching fails
             NetworkError: If API connection fails
         """
+        import ccxt
+
         try:
             # Изчисляваме timestamps
             end_time = self.exchange.milliseconds()
-            start_time = end_time - (lookback_days * 24 * 60 * 60 * 1000)
+            start_time = end_time - lookback_days * DAY_MS
 
             logger.info(f"Извличане на {lookback_days} дни BNB данни...")
 
-            # Извличаме daily данни (Binance limit е max 1000)
-            daily_limit = min(lookback_days, 1000)
-            daily_data = self.exchange.fetch_ohlcv(
-                symbol=self.symbol, timeframe="1d", since=start_time, limit=daily_limit
-            )
-
-            # Извличаме weekly данни (Binance limit е max 1000)
-            weekly_limit = min(lookback_days // 7, 1000)
-            weekly_limit = max(weekly_limit, 1)
-
-            weekly_data = self.exchange.fetch_ohlcv(
-                symbol=self.symbol, timeframe="1w", since=start_time, limit=weekly_limit
-            )
+            # Извличаме daily и weekly данни (на страници до текущия момент)
+            daily_data = self._fetch_ohlcv_pages("1d", start_time, end_time)
+            weekly_data = self._fetch_ohlcv_pages("1w", start_time, end_time)
 
             # Конвертираме в DataFrames
             daily_df = self._convert_to_dataframe(daily_data, "1d")
@@ -107,43 +209,90 @@ class BNBDataFetcher:
         except Exception as e:
             raise DataError(f"Грешка при извличане на данни: {e}") from e
 
-    def _convert_to_dataframe(self, ohlcv_data: list, timeframe: str) -> pd.DataFrame:
+    def _fetch_ohlcv_pages(self, timeframe: str, since: int, until: int) -> list:
         """
-        Конвертира OHLCV данни в pandas DataFrame
+        Всички свещи от ``since`` до ``until`` (ms) на заявки по 1000
+
+        Binance връща най-много 1000 свещи от ``since`` нататък, затова
+        ``since`` се премества след последната получена свещ, докато
+        страниците свършат или стигнат ``until``.
 
         Args:
-            ohlcv_data: Списък с OHLCV данни от CCXT
             timeframe: Времеви интервал ('1d' или '1w')
+            since: Начало в ms
+            until: Край в ms (обикновено exchange.milliseconds())
 
         Returns:
-            DataFrame с колони: Date, Open, High, Low, Close, Volume
+            Списък с OHLCV свещи от CCXT
         """
-        if not ohlcv_data:
-            raise DataError(f"No OHLCV data received for timeframe {timeframe}")
+        candles: list = []
+        while since <= until:
+            page = self.exchange.fetch_ohlcv(
+                symbol=self.symbol,
+                timeframe=timeframe,
+                since=since,
+                limit=MAX_OHLCV_LIMIT,
+            )
+            candles.extend(page)
+            if len(page) < MAX_OHLCV_LIMIT:
+                break
+            since = page[-1][0] + 1
+        return candles
 
-        df = pd.DataFrame(
-            ohlcv_data, columns=["timestamp", "Open", "High", "Low", "Close", "Volume"]
-        )
+    def update_bnb_data(self, data: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+        """
+        Добавя новите свещи към вече изтеглени данни (live update)
+
+        Изтеглят се само свещите от последната известна (още отворена)
+        свещ нататък; ATH колоните и data quality проверката се смятат
+        само за тях.
+
+        Args:
+            data: Резултат от fetch_bnb_data / update_bnb_data
+
+        Returns:
+            Dict с обновените daily и weekly DataFrames
+
+        Raises:
+            DataError: If data fetching fails
+            NetworkError: If API connection fails
+        """
+        import ccxt
 
-        # Конвертираме timestamp в datetime
-        df["Date"] = pd.to_datetime(df["timestamp"], unit="ms")
+        try:
+            candles = {
+                key: self.exchange.fetch_ohlcv(
+                    symbol=self.symbol,
+                    timeframe=timeframe,
+                    since=ohlcv_since(data[key]),
+                )
+                for key, timeframe in TIMEFRAMES.items()
+            }
+            updated = append_candles(data, candles)
 
-        # Премахваме timestamp колоната и пренареждаме
-        df = df[["Date", "Open", "High", "Low", "Close", "Volume"]]
+            logger.info(
+                f"Обновени данни: Daily={len(updated['daily'])}, "
+                f"Weekly={len(updated['weekly'])} редове"
+            )
+            return updated
 
-        # Задаваме Date като index
-        df.set_index("Date", inplace=True)
+        except ccxt.NetworkError as e:
+            raise NetworkError(f"Network error during data update: {e}") from e
+        except Exception as e:
+            raise DataError(f"Грешка при обновяване на данни: {e}") from e
 
-        # Конвертираме в numeric типове
-        numeric_columns = ["Open", "High", "Low", "Close", "Volume"]
-        for col in numeric_columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+    def _convert_to_dataframe(self, ohlcv_data: list, timeframe: str) -> pd.DataFrame:
+        """
+        Конвертира OHLCV данни в pandas DataFrame
 
-        # Премахваме NaN стойности
-        df.dropna(inplace=True)
+        Args:
+            ohlcv_data: Списък с OHLCV данни от CCXT
+            timeframe: Времеви интервал ('1d' или '1w')
 
-        logger.info(f"Конвертирани {len(df)} {timeframe} данни")
-        return df
+        Returns:
+            DataFrame с колони: Date, Open, High, Low, Close, Volume
+        """
+        return ohlcv_to_dataframe(ohlcv_data, timeframe)
 
     def get_latest_price(self) -> float:
         """
@@ -155,6 +304,8 @@ class BNBDataFetcher:
         Raises:
             NetworkError: If price fetch fails
         """
+        import ccxt
+
         try:
             ticker = self.exchange.fetch_ticker(self.symbol)
             return float(ticker["last"])
@@ -0,0 +1,259 @@
+"""Async gathering stage: every live remote read concurrently, under one deadline."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import pandas as pd
+
+from bnb_trading.core.exceptions import DataError, NetworkError
+
+from .fetcher import (
+    DAY_MS,
+    TIMEFRAMES,
+    append_candles,
+    ohlcv_limits,
+    ohlcv_since,
+    ohlcv_to_dataframe,
+)
+from .http import BINANCE_API_URL, HttpClient, Transport, get_http_client
+from .validators import add_ath_analysis
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEADLINE = 15.0  # секунди за целия snapshot
+SNAPSHOT_TTL = 300.0  # primed отговорите остават валидни за целия analysis run
+
+# (url, params, timeout) -> decoded JSON; raises NetworkError / DataError
+AsyncTransport = Callable[[str, Mapping[str, Any], float], Awaitable[Any]]
+
+
+def live_endpoints(symbol: str = "BNB/USDT") -> dict[str, tuple[str, dict[str, Any]]]:
+    """
+    REST reads that ``TradingPipeline.run_analysis`` actually performs
+
+    Only the whale tracker calls a REST endpoint in the live pipeline
+    (Ichimoku works on daily_df, sentiment gets fixed inputs), so only
+    its request is prefetched. Params match the analyzer call exactly, so
+    the primed response is served from the shared HTTP cache.
+
+    Args:
+        symbol: CCXT symbol (напр. "BNB/USDT")
+
+    Returns:
+        Dict name -> (path, params)
+    """
+    pair = symbol.replace("/", "")
+    return {
+        # WhaleTracker.get_whale_activity_summary(7): 6 x 4h candles per day
+        "whale_klines": ("/klines", {"symbol": pair, "interval": "4h", "limit": 42}),
+    }
+
+
+class AiohttpTransport:
+    """Keep-alive aiohttp session for one gathering run (async context manager)."""
+
+    def __init__(self, limit: int = 10) -> None:
+        """
+        Initialize async transport.
+
+        Args:
+            limit: Maximum simultaneous connections
+        """
+        self.limit = limit
+        self._session = None
+
+    async def __aenter__(self) -> "AiohttpTransport":
+        # aiohttp is imported on first use (ccxt.async_support depends on it)
+        import aiohttp
+
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.limit)
+        )
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self._session.close()
+        self._session = None
+
+    async def __call__(
+        self, url: str, params: Mapping[str, Any], timeout: float
+    ) -> Any:
+        import aiohttp
+
+        query = {name: str(value) for name, value in params.items()}
+        try:
+            async with self._session.get(
+                url, params=query, timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                response.raise_for_status()
+                try:
+                    return await response.json(content_type=None)
+                except ValueError as e:
+                    raise DataError(f"Invalid JSON from {url}: {e}") from e
+        except (aiohttp.ClientError, TimeoutError) as e:
+            raise NetworkError(f"GET {url} failed: {e}") from e
+
+
+class ThreadTransport:
+    """Runs a blocking ``Transport`` (e.g. ``FileTransport``) on worker threads."""
+
+    def __init__(self, transport: Transport) -> None:
+        self.transport = transport
+
+    async def __aenter__(self) -> "ThreadTransport":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    async def __call__(
+        self, url: str, params: Mapping[str, Any], timeout: float
+    ) -> Any:
+        return await asyncio.to_thread(self.transport, url, params, timeout)
+
+
+@dataclass(frozen=True, slots=True)
+class MarketSnapshot:
+    """
+    Complete market state for one analysis run
+
+    ``responses`` holds the REST payloads by ``live_endpoints`` name;
+    reads that failed or missed the deadline are listed in ``errors``.
+    """
+
+    daily: pd.DataFrame
+    weekly: pd.DataFrame
+    responses: dict[str, Any] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def complete(self) -> bool:
+        """True when every remote read succeeded in time."""
+        return not self.errors
+
+
+async def _fetch_json(
+    transport: AsyncTransport,
+    client: HttpClient,
+    url: str,
+    params: dict[str, Any],
+    timeout: float,
+) -> Any:
+    """One REST read, stored in the shared HTTP cache for the analyzers."""
+    payload = await transport(url, params, timeout)
+    client.prime(url, params, payload, ttl=SNAPSHOT_TTL)
+    return payload
+
+
+async def gather_market_snapshot(
+    symbol: str = "BNB/USDT",
+    lookback_days: int = 500,
+    deadline: float = DEFAULT_DEADLINE,
+    *,
+    exchange: Any = None,
+    transport: Any = None,
+    client: HttpClient | None = None,
+    base_url: str = BINANCE_API_URL,
+    previous: Mapping[str, pd.DataFrame] | None = None,
+) -> MarketSnapshot:
+    """
+    Issue all live remote reads concurrently and build a market snapshot
+
+    OHLCV goes through ``ccxt.async_support``, REST endpoints through one
+    keep-alive async session; latency is that of the slowest read. With
+    ``previous`` (daily/weekly data of the last run) only the candles from
+    its last, still open one on are fetched and appended (``append_candles``).
+
+    Args:
+        symbol: CCXT symbol
+        lookback_days: Брой дни OHLCV история
+        deadline: Global deadline in seconds for all reads
+        exchange: Async CCXT exchange (default: ccxt.async_support.binance)
+        transport: Async transport (default: AiohttpTransport)
+        client: HTTP client whose cache is primed (default: shared client)
+        base_url: REST API base URL
+        previous: Daily/weekly DataFrames to update instead of a full fetch
+
+    Returns:
+        MarketSnapshot (REST failures are recorded in ``errors``)
+
+    Raises:
+        NetworkError: If daily or weekly OHLCV is unavailable by the deadline
+        DataError: If OHLCV data is empty
+    """
+    started = time.monotonic()
+    client = client or get_http_client()
+    transport = transport or AiohttpTransport()
+    own_exchange = exchange is None
+    if own_exchange:
+        # ccxt is imported on first use - it is the slowest import in the package
+        import ccxt.async_support as ccxt_async
+
+        exchange = ccxt_async.binance(
+            {"enableRateLimit": True, "options": {"defaultType": "spot"}}
+        )
+
+    if previous is None:
+        since = int(time.time() * 1000) - lookback_days * DAY_MS
+        ohlcv_reads = {
+            timeframe: {"since": since, "limit": limit}
+            for timeframe, limit in ohlcv_limits(lookback_days).items()
+        }
+    else:
+        ohlcv_reads = {
+            timeframe: {"since": ohlcv_since(previous[key])}
+            for key, timeframe in TIMEFRAMES.items()
+        }
+    try:
+        async with transport:
+            tasks = {
+                f"ohlcv_{timeframe}": asyncio.ensure_future(
+                    exchange.fetch_ohlcv(symbol=symbol, timeframe=timeframe, **params)
+                )
+                for timeframe, params in ohlcv_reads.items()
+            }
+            for name, (path, params) in live_endpoints(symbol).items():
+                tasks[name] = asyncio.ensure_future(
+                    _fetch_json(transport, client, base_url + path, params, deadline)
+                )
+
+            _, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+    finally:
+        if own_exchange:
+            await exchange.close()
+
+    results: dict[str, Any] = {}
+    errors: dict[str, str] = {}
+    for name, task in tasks.items():
+        if task in pending:
+            errors[name] = f"deadline of {deadline}s exceeded"
+        elif task.exception() is not None:
+            errors[name] = str(task.exception())
+        else:
+            results[name] = task.result()
+
+    missing = [name for name in ("ohlcv_1d", "ohlcv_1w") if name not in results]
+    if missing:
+        details = "; ".join(f"{name}: {errors[name]}" for name in missing)
+        raise NetworkError(f"OHLCV unavailable: {details}")
+
+    candles = {key: results.pop(f"ohlcv_{tf}") for key, tf in TIMEFRAMES.items()}
+    if previous is None:
+        daily = add_ath_analysis(ohlcv_to_dataframe(candles["daily"], "1d"))
+        weekly = ohlcv_to_dataframe(candles["weekly"], "1w")
+    else:
+        updated = append_candles(previous, candles)
+        daily, weekly = updated["daily"], updated["weekly"]
+    elapsed = time.monotonic() - started
+    if errors:
+        logger.warning(f"Snapshot incomplete: {errors}")
+    logger.info(f"Market snapshot: {len(results)} REST reads + OHLCV in {elapsed:.2f}s")
+    return MarketSnapshot(daily, weekly, results, errors, elapsed)
@@ -0,0 +1,279 @@
+"""Shared pooled HTTP client with TTL response cache for REST-calling modules."""
+
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from bnb_trading.core.exceptions import DataError, NetworkError
+
+logger = logging.getLogger(__name__)
+
+BINANCE_API_URL = "https://api.binance.com/api/v3"
+
+# (url, params, timeout) -> decoded JSON; raises NetworkError / DataError
+Transport = Callable[[str, Mapping[str, Any], float], Any]
+
+# URL suffix -> seconds a response stays fresh (first match wins)
+DEFAULT_TTLS: dict[str, float] = {
+    "/ticker/price": 2.0,
+    "/ticker/24hr": 10.0,
+    "/depth": 1.0,
+    "/klines": 30.0,
+}
+
+_CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+class RequestsTransport:
+    """Keep-alive ``requests.Session`` with a connection pool and retries."""
+
+    def __init__(self, pool_maxsize: int = 10, retries: int = 3) -> None:
+        """
+        Initialize pooled transport.
+
+        Args:
+            pool_maxsize: Connections kept alive per host
+            retries: Retries on connection errors and 502/503/504
+        """
+        # requests is imported on first use (keeps cold imports light)
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        self._requests = requests
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=1,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def __call__(self, url: str, params: Mapping[str, Any], timeout: float) -> Any:
+        try:
+            response = self.session.get(url, params=params, timeout=timeout)
+            response.raise_for_status()
+        except self._requests.exceptions.RequestException as e:
+            raise NetworkError(f"GET {url} failed: {e}") from e
+        try:
+            return response.json()
+        except ValueError as e:
+            raise DataError(f"Invalid JSON from {url}: {e}") from e
+
+
+class FileTransport:
+    """
+    Offline stand-in for a REST API: serves JSON files from a directory.
+
+    ``https://api.binance.com/api/v3/ticker/24hr`` is read from
+    ``<directory>/api_v3_ticker_24hr.json`` (query parameters are ignored).
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def path_for(self, url: str) -> Path:
+        """File that answers requests to ``url``."""
+        name = urlsplit(url).path.strip("/").replace("/", "_")
+        return self.directory / f"{name}.json"
+
+    def __call__(self, url: str, params: Mapping[str, Any], timeout: float) -> Any:
+        path = self.path_for(url)
+        try:
+            text = path.read_text(encoding="utf-8")
+        except OSError as e:
+            raise NetworkError(f"No stand-in response for {url}: {e}") from e
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError as e:
+            raise DataError(f"Invalid JSON in {path}: {e}") from e
+
+
+class HttpClient:
+    """
+    JSON GET client shared by all REST-calling modules.
+
+    Responses are cached per URL + params for an endpoint-specific TTL, and
+    concurrent identical requests are coalesced into one transport call.
+    Cached payloads are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        transport: Transport | None = None,
+        ttls: Mapping[str, float] | None = None,
+    ) -> None:
+        """
+        Initialize HTTP client.
+
+        Args:
+            transport: Callable doing the actual GET (default: pooled requests)
+            ttls: URL suffix -> cache TTL in seconds (default: DEFAULT_TTLS)
+        """
+        self._transport = transport
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self._cache: dict[_CacheKey, tuple[float, Any]] = {}
+        self._in_flight: dict[_CacheKey, Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "cache_hits": 0, "coalesced": 0}
+
+    @property
+    def transport(self) -> Transport:
+        """Transport in use (the pooled requests session is built lazily)."""
+        if self._transport is None:
+            with self._lock:
+                if self._transport is None:
+                    self._transport = RequestsTransport()
+        return self._transport
+
+    def ttl_for(self, url: str) -> float:
+        """Cache TTL for a URL (0 = not cached)."""
+        path = urlsplit(url).path
+        return next(
+            (ttl for suffix, ttl in self.ttls.items() if path.endswith(suffix)), 0.0
+        )
+
+    def get_json(
+        self,
+        url: str,
+        params: Mapping[str, Any] | None = None,
+        timeout: float = 10,
+        ttl: float | None = None,
+    ) -> Any:
+        """
+        GET a JSON resource, served from cache while fresh.
+
+        Args:
+            url: Absolute URL
+            params: Query parameters
+            timeout: Request timeout in seconds
+            ttl: Override of the endpoint TTL in seconds (0 disables caching)
+
+        Returns:
+            Decoded JSON payload
+
+        Raises:
+            NetworkError: If the request fails or returns an error status
+            DataError: If the response is not valid JSON
+        """
+        params = dict(params or {})
+        key = self._key(url, params)
+        ttl = self.ttl_for(url) if ttl is None else ttl
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    self.stats["cache_hits"] += 1
+                    return cached[1]
+                del self._cache[key]  # expired
+            pending = self._in_flight.get(key)
+            if pending is None:
+                pending = Future()
+                self._in_flight[key] = pending
+                owner = True
+            else:
+                self.stats["coalesced"] += 1
+                owner = False
+
+        if not owner:
+            return pending.result()
+
+        payload = None
+        error: BaseException | None = None
+        try:
+            payload = self.transport(url, params, timeout)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            # Always release the key, otherwise later callers wait forever
+            with self._lock:
+                if error is None and ttl > 0:
+                    self._cache[key] = (time.monotonic() + ttl, payload)
+                del self._in_flight[key]
+                self.stats["requests"] += 1
+            if error is None:
+                pending.set_result(payload)
+            elif isinstance(error, Exception):
+                pending.set_exception(error)
+            else:  # KeyboardInterrupt etc. belongs to the owner thread only
+                pending.set_exception(NetworkError(f"Request to {url} was interrupted"))
+        return payload
+
+    def prime(
+        self,
+        url: str,
+        params: Mapping[str, Any] | None,
+        payload: Any,
+        ttl: float | None = None,
+    ) -> None:
+        """
+        Store a response fetched elsewhere (e.g. by the async gathering stage).
+
+        Args:
+            url: Absolute URL
+            params: Query parameters the payload answers
+            payload: Decoded JSON payload
+            ttl: Override of the endpoint TTL in seconds
+        """
+        ttl = self.ttl_for(url) if ttl is None else ttl
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._cache[self._key(url, params or {})] = (
+                time.monotonic() + ttl,
+                payload,
+            )
+
+    @staticmethod
+    def _key(url: str, params: Mapping[str, Any]) -> _CacheKey:
+        return url, tuple(sorted((name, str(value)) for name, value in params.items()))
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._cache.clear()
+
+
+# Process-wide shared client ("shared" -> HttpClient), created on first use
+_CLIENT: dict[str, HttpClient] = {}
+_CLIENT_LOCK = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Process-wide shared HTTP client (created on first use)."""
+    client = _CLIENT.get("shared")
+    if client is None:
+        with _CLIENT_LOCK:
+            client = _CLIENT.setdefault("shared", HttpClient())
+    return client
+
+
+def set_http_client(client: HttpClient | None) -> HttpClient | None:
+    """
+    Replace the shared HTTP client (e.g. with a FileTransport in tests).
+
+    Args:
+        client: New shared client (None = recreate lazily with defaults)
+
+    Returns:
+        The previous shared client
+    """
+    with _CLIENT_LOCK:
+        previous = _CLIENT.pop("shared", None)
+        if client is not None:
+            _CLIENT["shared"] = client
+    return previous
@@ -0,0 +1,311 @@
+"""Append-only signal journal (SQLite) for BNB Trading System."""
+
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Column order of the legacy results.csv schema
+RESULT_COLUMNS: list[str] = [
+    "signal_date",
+    "signal_type",
+    "signal_price",
+    "confidence",
+    "priority",
+    "fibonacci_level",
+    "weekly_tail_strength",
+    "reason",
+    "risk_level",
+    "validation_date",
+    "validation_price",
+    "profit_loss",
+    "profit_loss_pct",
+    "success",
+    "failure_reason",
+    "days_to_target",
+    "target_reached",
+]
+
+VALIDATION_COLUMNS: list[str] = [
+    "validation_date",
+    "validation_price",
+    "profit_loss",
+    "profit_loss_pct",
+    "success",
+    "failure_reason",
+    "days_to_target",
+    "target_reached",
+]
+
+_DATE_COLUMNS = ("signal_date", "validation_date")
+_BOOL_COLUMNS = ("success", "target_reached")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS signals (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    signal_date TEXT NOT NULL,
+    signal_type TEXT NOT NULL,
+    signal_price REAL,
+    confidence REAL,
+    priority TEXT,
+    fibonacci_level TEXT,
+    weekly_tail_strength TEXT,
+    reason TEXT,
+    risk_level TEXT,
+    validation_date TEXT,
+    validation_price REAL,
+    profit_loss REAL,
+    profit_loss_pct REAL,
+    success INTEGER,
+    failure_reason TEXT,
+    days_to_target REAL,
+    target_reached INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_signals_date ON signals (signal_date);
+CREATE INDEX IF NOT EXISTS idx_signals_type_date ON signals (signal_type, signal_date);
+"""
+
+# One pass over the signal_date index, grouped for the accuracy report
+_ACCURACY_QUERY = """
+SELECT
+    signal_type,
+    priority,
+    COUNT(*) AS total,
+    COALESCE(SUM(success = 1), 0) AS success,
+    COUNT(profit_loss_pct) AS pnl_count,
+    SUM(profit_loss_pct) AS pnl_sum,
+    COUNT(CASE WHEN success = 1 THEN profit_loss_pct END) AS pnl_success_count,
+    SUM(CASE WHEN success = 1 THEN profit_loss_pct END) AS pnl_success_sum,
+    COUNT(CASE WHEN success = 0 THEN profit_loss_pct END) AS pnl_failure_count,
+    SUM(CASE WHEN success = 0 THEN profit_loss_pct END) AS pnl_failure_sum
+FROM signals INDEXED BY idx_signals_date
+WHERE signal_date >= ? AND validation_date IS NOT NULL
+GROUP BY signal_type, priority
+"""
+
+
+def _to_db_time(value: Any) -> str | None:
+    """Normalize a timestamp to a sortable ISO string (None for NaT/None)."""
+    if value is None or pd.isna(value):
+        return None
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert(None)
+    return ts.strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+
+def _to_db_value(column: str, value: Any) -> Any:
+    """Convert a Python/pandas value to its SQLite representation."""
+    if column in _DATE_COLUMNS:
+        return _to_db_time(value)
+    if value is None:
+        return None
+    if isinstance(value, float) and pd.isna(value):
+        return None
+    if column in _BOOL_COLUMNS:
+        if isinstance(value, str):  # legacy CSV round-trip
+            return int(value.strip().lower() in ("true", "1"))
+        return int(bool(value))
+    if hasattr(value, "item"):  # numpy scalars
+        return value.item()
+    return value
+
+
+class SignalJournal:
+    """
+    Append-only signal journal backed by stdlib sqlite3.
+
+    Signals are inserted one row at a time (no rewrite of history) and
+    looked up through indexes on ``signal_date`` and ``(signal_type,
+    signal_date)``, so write and lookup cost stays flat as the journal
+    grows over years of signals.
+    """
+
+    def __init__(self, db_path: str | Path = "data/signals.sqlite") -> None:
+        """
+        Open (or create) the journal database.
+
+        Args:
+            db_path: Path to the SQLite file, or ":memory:" for tests
+        """
+        self.db_path = str(db_path)
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.row_factory = sqlite3.Row
+        # WAL + NORMAL sync keeps each append to a single cheap log write
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self._conn.close()
+
+    def append(self, record: dict[str, Any]) -> int:
+        """
+        Append one signal record.
+
+        Args:
+            record: Mapping with (a subset of) RESULT_COLUMNS
+
+        Returns:
+            Row id of the new journal entry
+        """
+        columns = [c for c in RESULT_COLUMNS if c in record]
+        values = [_to_db_value(c, record[c]) for c in columns]
+        placeholders = ", ".join("?" for _ in columns)
+        with self._conn:
+            cursor = self._conn.execute(
+                f"INSERT INTO signals ({', '.join(columns)}) VALUES ({placeholders})",
+                values,
+            )
+        return int(cursor.lastrowid)
+
+    def append_many(self, records: list[dict[str, Any]]) -> int:
+        """
+        Append several records in one transaction.
+
+        Args:
+            records: Records with the full RESULT_COLUMNS schema
+
+        Returns:
+            Number of records written
+        """
+        if not records:
+            return 0
+        placeholders = ", ".join("?" for _ in RESULT_COLUMNS)
+        rows = [
+            [_to_db_value(c, record.get(c)) for c in RESULT_COLUMNS]
+            for record in records
+        ]
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT INTO signals ({', '.join(RESULT_COLUMNS)}) "
+                f"VALUES ({placeholders})",
+                rows,
+            )
+        return len(rows)
+
+    def find_by_date(self, signal_date: Any) -> dict[str, Any] | None:
+        """
+        Indexed lookup of the first signal recorded for a signal date.
+
+        Args:
+            signal_date: Signal timestamp
+
+        Returns:
+            Journal row (with ``id``) or None if not found
+        """
+        row = self._conn.execute(
+            "SELECT * FROM signals WHERE signal_date = ? ORDER BY id LIMIT 1",
+            (_to_db_time(signal_date),),
+        ).fetchone()
+        return self._decode_row(row) if row is not None else None
+
+    def record_validation(self, row_id: int, result: dict[str, Any]) -> None:
+        """
+        Store validation outcome for a journal row (in-place, by primary key).
+
+        Args:
+            row_id: Journal row id
+            result: Mapping with VALIDATION_COLUMNS
+        """
+        columns = [c for c in VALIDATION_COLUMNS if c in result]
+        assignments = ", ".join(f"{c} = ?" for c in columns)
+        values = [_to_db_value(c, result[c]) for c in columns]
+        with self._conn:
+            self._conn.execute(
+                f"UPDATE signals SET {assignments} WHERE id = ?", [*values, row_id]
+            )
+
+    def accuracy_breakdown(self, since: Any) -> list[dict[str, Any]]:
+        """
+        Aggregate validated signals since a date, grouped by type and priority.
+
+        Args:
+            since: Earliest signal date to include
+
+        Returns:
+            List of aggregate rows (counts and P&L sums per group)
+        """
+        rows = self._conn.execute(_ACCURACY_QUERY, (_to_db_time(since),)).fetchall()
+        return [dict(row) for row in rows]
+
+    def count(self, validated_only: bool = False) -> int:
+        """Number of journal entries (optionally only validated ones)."""
+        query = "SELECT COUNT(*) FROM signals"
+        if validated_only:
+            query += " WHERE validation_date IS NOT NULL"
+        return int(self._conn.execute(query).fetchone()[0])
+
+    def recent(self, count: int = 20) -> pd.DataFrame:
+        """
+        Latest signals by signal date (newest first).
+
+        Args:
+            count: Number of signals to return
+
+        Returns:
+            DataFrame in the results.csv schema
+        """
+        rows = self._conn.execute(
+            "SELECT * FROM signals ORDER BY signal_date DESC, id DESC LIMIT ?",
+            (count,),
+        ).fetchall()
+        return self._rows_to_frame(rows)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Materialize the whole journal in the results.csv schema."""
+        rows = self._conn.execute("SELECT * FROM signals ORDER BY id").fetchall()
+        return self._rows_to_frame(rows)
+
+    def import_csv(self, csv_path: str | Path) -> int:
+        """
+        One-off import of a legacy results.csv into an empty journal.
+
+        Args:
+            csv_path: Path to the legacy CSV
+
+        Returns:
+            Number of imported records
+        """
+        if self.count() > 0 or not Path(csv_path).exists():
+            return 0
+
+        legacy_df = pd.read_csv(csv_path)
+        for column in _DATE_COLUMNS:
+            if column in legacy_df.columns:
+                legacy_df[column] = pd.to_datetime(legacy_df[column])
+        legacy_df = legacy_df.astype(object).where(pd.notna(legacy_df), None)
+
+        imported = self.append_many(legacy_df.to_dict("records"))
+        logger.info(f"Импортирани {imported} сигнала от {csv_path}")
+        return imported
+
+    def _decode_row(self, row: sqlite3.Row) -> dict[str, Any]:
+        """Convert a SQLite row back to Python/pandas values."""
+        record = dict(row)
+        for column in _DATE_COLUMNS:
+            value = record.get(column)
+            record[column] = pd.Timestamp(value) if value is not None else pd.NaT
+        for column in _BOOL_COLUMNS:
+            value = record.get(column)
+            record[column] = bool(value) if value is not None else None
+        return record
+
+    def _rows_to_frame(self, rows: list[sqlite3.Row]) -> pd.DataFrame:
+        """Build a results.csv-shaped DataFrame from journal rows."""
+        df = pd.DataFrame(
+            [self._decode_row(row) for row in rows],
+            columns=["id", *RESULT_COLUMNS],
+        )
+        df = df.drop(columns="id")
+        for column in _DATE_COLUMNS:
+            df[column] = pd.to_datetime(df[column])
+        return df
@@ -0,0 +1,249 @@
+"""Kline resampling service: fetch the finest timeframe once, derive the rest locally."""
+
+import logging
+from collections.abc import Mapping
+
+import numpy as np
+
+from .http import BINANCE_API_URL, get_http_client
+
+logger = logging.getLogger(__name__)
+
+MINUTE_MS = 60 * 1000
+HOUR_MS = 60 * MINUTE_MS
+DAY_MS = 24 * HOUR_MS
+
+# Binance kline interval -> продължителност в милисекунди
+KLINE_INTERVAL_MS: dict[str, int] = {
+    "1m": MINUTE_MS,
+    "5m": 5 * MINUTE_MS,
+    "15m": 15 * MINUTE_MS,
+    "30m": 30 * MINUTE_MS,
+    "1h": HOUR_MS,
+    "2h": 2 * HOUR_MS,
+    "4h": 4 * HOUR_MS,
+    "6h": 6 * HOUR_MS,
+    "8h": 8 * HOUR_MS,
+    "12h": 12 * HOUR_MS,
+    "1d": DAY_MS,
+    "1w": 7 * DAY_MS,
+}
+MONTH_INTERVAL = "1M"  # календарни месеци (променлива дължина)
+MAX_KLINES_LIMIT = 1000  # Binance /klines максимум на заявка
+
+# Binance седмиците започват в понеделник 00:00 UTC (1970-01-01 е четвъртък)
+WEEK_OFFSET_MS = 4 * DAY_MS
+
+# Колони на декодираните klines
+OPEN_TIME, OPEN, HIGH, LOW, CLOSE, VOLUME = range(6)
+
+
+def decode_klines(klines: list[list]) -> np.ndarray:
+    """
+    Декодира Binance klines в NumPy масив наведнъж
+
+    Args:
+        klines: JSON отговор от /klines (числа като низове)
+
+    Returns:
+        Масив (n, 6): open_time (ms), open, high, low, close, volume
+    """
+    if not klines:
+        return np.empty((0, 6))
+    return np.array([kline[:6] for kline in klines], dtype=float)
+
+
+def candles_from_frame(df) -> np.ndarray:
+    """
+    OHLCV DataFrame (DatetimeIndex, Open/High/Low/Close/Volume) като klines масив
+
+    Args:
+        df: Локални OHLCV данни (напр. daily от fetcher-а)
+
+    Returns:
+        Масив (n, 6) със същите колони като ``decode_klines``
+    """
+    candles = np.empty((len(df), 6))
+    candles[:, OPEN_TIME] = df.index.to_numpy(dtype="datetime64[ms]").astype(np.int64)
+    candles[:, OPEN:] = df[["Open", "High", "Low", "Close", "Volume"]].to_numpy(
+        dtype=float
+    )
+    return candles
+
+
+def interval_span_ms(interval: str) -> int:
+    """Максимална продължителност на interval в ms (месец = 31 дни)"""
+    if interval == MONTH_INTERVAL:
+        return 31 * DAY_MS
+    return KLINE_INTERVAL_MS[interval]
+
+
+def kline_buckets(open_times: np.ndarray, interval: str) -> np.ndarray:
+    """
+    Open time на ``interval`` свещта, съдържаща всеки open time
+
+    Подравняване като Binance: от epoch за интервали до 1d, понеделник за
+    1w и първо число на месеца за 1M.
+
+    Args:
+        open_times: Open times в ms
+        interval: Целеви Binance interval
+
+    Returns:
+        Масив от bucket open times в ms (int64)
+    """
+    open_times = np.asarray(open_times).astype(np.int64)
+    if interval == MONTH_INTERVAL:
+        months = open_times.astype("datetime64[ms]").astype("datetime64[M]")
+        return months.astype("datetime64[ms]").astype(np.int64)
+    length = KLINE_INTERVAL_MS[interval]
+    offset = WEEK_OFFSET_MS if interval == "1w" else 0
+    return (open_times - offset) // length * length + offset
+
+
+def resample_klines(candles: np.ndarray, interval: str | int) -> np.ndarray:
+    """
+    Агрегира декодирани klines към по-дълъг interval локално
+
+    Точна OHLCV агрегация: първи open, max high, min low, последен close и
+    сума на volume. Последната група може да е незавършена, точно като
+    текущата свещ от API-то.
+
+    Args:
+        candles: Резултат от ``decode_klines`` (сортиран по време)
+        interval: Целеви Binance interval или продължителност в ms
+
+    Returns:
+        Масив (m, 6) със същите колони
+    """
+    if len(candles) == 0:
+        return candles
+    if isinstance(interval, str):
+        buckets = kline_buckets(candles[:, OPEN_TIME], interval)
+    else:
+        buckets = candles[:, OPEN_TIME] // interval * interval
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(candles)] - 1
+
+    resampled = np.empty((starts.size, 6))
+    resampled[:, OPEN_TIME] = buckets[starts]
+    resampled[:, OPEN] = candles[starts, OPEN]
+    resampled[:, HIGH] = np.maximum.reduceat(candles[:, HIGH], starts)
+    resampled[:, LOW] = np.minimum.reduceat(candles[:, LOW], starts)
+    resampled[:, CLOSE] = candles[ends, CLOSE]
+    resampled[:, VOLUME] = np.add.reduceat(candles[:, VOLUME], starts)
+    return resampled
+
+
+def kline_plan(timeframes: Mapping[str, int]) -> tuple[str, int]:
+    """
+    Най-краткият interval и колко негови свещи покриват всички timeframes
+
+    Една допълнителна група, за да е пълна най-старата агрегирана свещ.
+
+    Args:
+        timeframes: interval -> брой нужни свещи (напр. {"1d": 30, "1w": 12})
+
+    Returns:
+        Tuple: (base interval, брой base свещи)
+    """
+    base = min(timeframes, key=interval_span_ms)
+    base_ms = interval_span_ms(base)
+    limit = 0
+    for interval, bars in timeframes.items():
+        ratio = -(-interval_span_ms(interval) // base_ms)
+        limit = max(limit, bars * ratio + ratio - 1)
+    return base, limit
+
+
+def derive_timeframes(
+    candles: np.ndarray, base: str, timeframes: Mapping[str, int]
+) -> dict[str, np.ndarray]:
+    """
+    Последните N свещи на всеки timeframe от base свещите
+
+    Args:
+        candles: Декодирани klines на ``base`` interval
+        base: Interval на ``candles``
+        timeframes: interval -> брой свещи
+
+    Returns:
+        Dict interval -> масив (до N, 6)
+    """
+    return {
+        interval: (candles if interval == base else resample_klines(candles, interval))[
+            -bars:
+        ]
+        for interval, bars in timeframes.items()
+    }
+
+
+class KlineResampler:
+    """
+    Multi-timeframe klines from a single /klines request
+
+    The finest requested interval is fetched once (or taken from local
+    candles) and every coarser timeframe is aggregated from it, so all
+    modules see the same candles.
+    """
+
+    def __init__(
+        self,
+        symbol: str = "BNBUSDT",
+        base_url: str = BINANCE_API_URL,
+        timeout: float = 10,
+    ) -> None:
+        """
+        Initialize resampler.
+
+        Args:
+            symbol: Binance symbol (без "/")
+            base_url: REST API base URL
+            timeout: Request timeout in seconds
+        """
+        self.symbol = symbol.replace("/", "")
+        self.base_url = base_url
+        self.timeout = timeout
+
+    def fetch(self, interval: str, limit: int) -> np.ndarray:
+        """
+        Една /klines заявка през споделения HTTP клиент
+
+        Raises:
+            NetworkError: If the request fails
+            DataError: If the response is not valid JSON
+        """
+        if limit > MAX_KLINES_LIMIT:
+            logger.warning(
+                f"{limit} {interval} klines requested, capped at {MAX_KLINES_LIMIT}"
+            )
+            limit = MAX_KLINES_LIMIT
+        klines = get_http_client().get_json(
+            f"{self.base_url}/klines",
+            params={"symbol": self.symbol, "interval": interval, "limit": limit},
+            timeout=self.timeout,
+        )
+        return decode_klines(klines)
+
+    def timeframes(
+        self, timeframes: Mapping[str, int], candles: np.ndarray | None = None
+    ) -> dict[str, np.ndarray]:
+        """
+        Свещи за всички timeframes от една заявка
+
+        Args:
+            timeframes: interval -> брой свещи (напр. {"1h": 24, "1d": 24})
+            candles: Локални свещи на най-краткия interval (напр. от
+                ``candles_from_frame``); изтеглят се при None
+
+        Returns:
+            Dict interval -> масив (до N, 6)
+
+        Raises:
+            NetworkError: If the request fails
+            DataError: If the response is not valid JSON
+        """
+        base, limit = kline_plan(timeframes)
+        if candles is None:
+            candles = self.fetch(base, limit)
+        return derive_timeframes(candles, base, timeframes)
@@ -0,0 +1,194 @@
+"""
+Canonical OHLCV schema - enforced once when data enters the system
+
+Column names are resolved a single time at ingest (``normalize_ohlcv``);
+analyzers then read contiguous arrays through ``OHLCV`` instead of
+``"close" if "close" in df.columns else "Close"`` in every hot path.
+``OHLCV`` doubles as the compact array-backed series backtests slice per step.
+"""
+
+import numpy as np
+import pandas as pd
+
+from bnb_trading.core.exceptions import DataError
+
+# Канонични имена на колоните (както ги връща fetcher-а)
+OHLCV_COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+_CANONICAL = {name.lower(): name for name in OHLCV_COLUMNS}
+
+# Маркер в df.attrs: схемата вече е приложена (pandas го пренася при slicing)
+SCHEMA_ATTR = "ohlcv_schema"
+
+
+def normalize_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Прилага каноничната OHLCV схема към DataFrame
+
+    Колоните open/OPEN/... стават Open/High/Low/Close/Volume, стойностите са
+    float64. Вече нормализирани DataFrame-и се връщат без копие.
+
+    Args:
+        df: OHLCV данни с произволен регистър на имената
+
+    Returns:
+        DataFrame с канонични колони (останалите колони се запазват)
+
+    Raises:
+        DataError: If a column exists in more than one casing
+    """
+    if df.attrs.get(SCHEMA_ATTR):
+        return df
+
+    renames = {}
+    for column in df.columns:
+        canonical = _CANONICAL.get(str(column).lower())
+        if canonical is not None and column != canonical:
+            if canonical in df.columns:
+                raise DataError(f"Duplicate OHLCV column: {column!r} and {canonical!r}")
+            renames[column] = canonical
+
+    normalized = df.rename(columns=renames)
+    present = [name for name in OHLCV_COLUMNS if name in normalized.columns]
+    stale = [name for name in present if normalized[name].dtype != np.float64]
+    if stale:
+        normalized = normalized.astype(dict.fromkeys(stale, np.float64))
+    normalized.attrs[SCHEMA_ATTR] = True
+    return normalized
+
+
+class OHLCV:
+    """
+    Compact OHLCV series backed by one contiguous (5, n) NumPy block
+
+    Rows of ``values`` are Open/High/Low/Close/Volume; ``open`` ... ``volume``
+    are views of those rows (``None`` when the source has no such column,
+    the block row is then zeros). ``index`` holds the timestamps as a NumPy
+    array. Prefix and window slices (``series[:i]``, ``until``, ``tail``)
+    are O(1) views sharing the block, so a backtest converts its history
+    once and hands each step a view instead of a DataFrame copy.
+    """
+
+    __slots__ = (
+        "_present",
+        "close",
+        "high",
+        "index",
+        "low",
+        "open",
+        "values",
+        "volume",
+    )
+
+    def __init__(
+        self,
+        index: np.ndarray,
+        values: np.ndarray,
+        present: tuple[bool, ...] = (True,) * len(OHLCV_COLUMNS),
+    ) -> None:
+        """
+        Initialize series from an existing block (no copy).
+
+        Args:
+            index: Timestamps, shape (n,)
+            values: Open/High/Low/Close/Volume rows, shape (5, n)
+            present: Which columns exist in the source data
+        """
+        self.index = index
+        self.values = values
+        self._present = present
+        self.open, self.high, self.low, self.close, self.volume = (
+            row if exists else None for row, exists in zip(values, present, strict=True)
+        )
+
+    @classmethod
+    def from_frame(
+        cls, df: "pd.DataFrame | OHLCV", dtype: np.dtype | type | None = None
+    ) -> "OHLCV":
+        """
+        Series for a DataFrame (normalized first if it did not pass ingest)
+
+        Args:
+            df: OHLCV DataFrame or an existing OHLCV series (returned as is)
+            dtype: Block dtype - np.float32 halves memory for long histories
+                (default: float64, or the dtype of an existing series)
+
+        Returns:
+            OHLCV backed by one contiguous block
+        """
+        if isinstance(df, OHLCV):
+            return df if dtype is None else df.astype(dtype)
+
+        df = normalize_ohlcv(df)
+        present = tuple(name in df.columns for name in OHLCV_COLUMNS)
+        values = np.zeros((len(OHLCV_COLUMNS), len(df)), dtype=dtype or np.float64)
+        for row, name in enumerate(OHLCV_COLUMNS):
+            if present[row]:
+                values[row] = df[name].to_numpy()
+        return cls(df.index.to_numpy(), values, present)
+
+    def astype(self, dtype: np.dtype | type) -> "OHLCV":
+        """Copy of the series with another block dtype (self if it matches)."""
+        if self.values.dtype == dtype:
+            return self
+        return OHLCV(self.index, self.values.astype(dtype), self._present)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getitem__(self, key: slice) -> "OHLCV":
+        """Positional slice as a view (``series[:i + 1]``, ``series[a:b]``)."""
+        if not isinstance(key, slice):
+            raise TypeError(f"OHLCV supports slice indexing only, got {key!r}")
+        return OHLCV(self.index[key], self.values[:, key], self._present)
+
+    @property
+    def empty(self) -> bool:
+        """True when the series has no bars (as DataFrame.empty)."""
+        return len(self.index) == 0
+
+    def prefix(self, stop: int) -> "OHLCV":
+        """First ``stop`` bars (view)."""
+        return self[:stop]
+
+    def window(self, start: int, stop: int) -> "OHLCV":
+        """Bars ``start`` to ``stop`` (view)."""
+        return self[start:stop]
+
+    def tail(self, n: int) -> "OHLCV":
+        """Last ``n`` bars (view, as DataFrame.tail)."""
+        return self[max(len(self) - n, 0) :]
+
+    def until(self, timestamp: pd.Timestamp) -> "OHLCV":
+        """
+        Bars up to and including ``timestamp`` (view, as ``df.loc[:timestamp]``).
+
+        Args:
+            timestamp: Last timestamp to include (index must be sorted)
+        """
+        stop = np.searchsorted(self.index, np.datetime64(timestamp), side="right")
+        return self[:stop]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Canonical float64 DataFrame with the present columns."""
+        df = pd.DataFrame(
+            {
+                name: row
+                for name, row, exists in zip(
+                    OHLCV_COLUMNS, self.values, self._present, strict=True
+                )
+                if exists
+            },
+            index=pd.DatetimeIndex(self.index, name="Date"),
+        )
+        return normalize_ohlcv(df)
+
+    def require(self, *names: str) -> None:
+        """
+        Raise DataError if any of the named columns is missing.
+
+        Args:
+            names: Lowercase column names ("close", "volume", ...)
+        """
+        missing = [name for name in names if getattr(self, name) is None]
+        if missing:
+            raise DataError(f"Missing OHLCV columns: {', '.join(missing)}")
@@ -0,0 +1,100 @@
+"""Local OHLCV store: NumPy files opened memory-mapped by backtest workers."""
+
+import logging
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from bnb_trading.core.exceptions import DataError
+
+from .schema import OHLCV
+
+logger = logging.getLogger(__name__)
+
+
+class OHLCVStore:
+    """
+    OHLCV series persisted as ``.npy`` files in one directory
+
+    ``<name>.values.npy`` holds the (5, n) float block and
+    ``<name>.index.npy`` the datetime64 timestamps. ``load`` maps them
+    read-only, so every process that opens the same history shares the
+    physical pages instead of unpickling its own copy; memory per worker
+    does not grow with the history length.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """
+        Initialize store.
+
+        Args:
+            directory: Directory of the .npy files (created on first save)
+        """
+        self.directory = Path(directory)
+
+    def paths_for(self, name: str) -> tuple[Path, Path]:
+        """Files of one series: (values, index)."""
+        return (
+            self.directory / f"{name}.values.npy",
+            self.directory / f"{name}.index.npy",
+        )
+
+    def __contains__(self, name: str) -> bool:
+        return all(path.exists() for path in self.paths_for(name))
+
+    def save(self, name: str, data: pd.DataFrame | OHLCV) -> None:
+        """
+        Записва OHLCV серия (файловете се подменят атомарно)
+
+        Args:
+            name: Име на серията (напр. "BNBUSDT_1d")
+            data: OHLCV DataFrame или серия с всички пет колони
+
+        Raises:
+            DataError: If a column is missing or the index is not datetime64
+        """
+        series = OHLCV.from_frame(data)
+        series.require("open", "high", "low", "close", "volume")
+        if series.index.dtype.kind != "M":
+            raise DataError(
+                f"OHLCV store needs a naive datetime index, got {series.index.dtype}"
+            )
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for path, array in zip(
+            self.paths_for(name), (series.values, series.index), strict=True
+        ):
+            partial = path.with_suffix(".partial")
+            with open(partial, "wb") as f:
+                np.save(f, np.ascontiguousarray(array))
+            partial.replace(path)
+        logger.info(f"Stored {len(series)} {name} bars in {self.directory}")
+
+    def load(self, name: str, mmap: bool = True) -> OHLCV:
+        """
+        Отваря серия от store-а
+
+        Args:
+            name: Име на серията
+            mmap: Read-only memory map (False = зарежда копие в паметта)
+
+        Returns:
+            OHLCV серия върху файловете
+
+        Raises:
+            DataError: If the series is not in the store or is corrupt
+        """
+        values_path, index_path = self.paths_for(name)
+        mode = "r" if mmap else None
+        try:
+            values = np.load(values_path, mmap_mode=mode)
+            index = np.load(index_path, mmap_mode=mode)
+        except (OSError, ValueError) as e:
+            raise DataError(f"Cannot open {name} in {self.directory}: {e}") from e
+        if values.shape != (5, len(index)):
+            raise DataError(
+                f"Corrupt {name} in {self.directory}: "
+                f"values {values.shape}, index {index.shape}"
+            )
+        return OHLCV(index, values)
@@ -1,6 +1,7 @@
 """Data validation functions for BNB Trading System."""
 
 import logging
+from collections import deque
 from typing import Any
 
 import numpy as np
@@ -8,9 +9,95 @@ import pandas as pd
 
 from bnb_trading.core.exceptions import DataError
 
+from .schema import OHLCV
+
 logger = logging.getLogger(__name__)
 
 
+# Rolling ATH прозорец (дни) и минимум свещи за валидна стойност
+ATH_WINDOW = 180
+ATH_MIN_PERIODS = 30
+NEAR_ATH_PCT = 10.0  # < 10% до ATH = близо (по-релакс за SHORT)
+
+# Data quality: контекст за инкременталната проверка и прагове
+ISSUE_CONTEXT = 100  # предишни свещи за типичен интервал и MAD
+GAP_TOLERANCE = 1.5  # gap = разстояние > 1.5 x типичния интервал
+OUTLIER_MAD_MULTIPLIER = 10.0
+
+ATH_COLUMNS = (
+    "ATH",
+    "ATH_Distance_Pct",
+    "Near_ATH",
+    "ATH_Proximity_Score",
+    "ATH_Trend",
+)
+
+
+def _ath_columns(
+    high: np.ndarray, close: np.ndarray, ath: np.ndarray
+) -> dict[str, np.ndarray]:
+    """ATH колоните от rolling ATH (общо за пълния и инкременталния път)"""
+    distance = (ath - close) / ath * 100
+    return {
+        "ATH": ath,
+        # Разстоянието до ATH в проценти
+        "ATH_Distance_Pct": distance,
+        "Near_ATH": distance < NEAR_ATH_PCT,
+        # ATH Proximity Score (по-висок = по-близо до ATH), 0.0 до 1.0
+        "ATH_Proximity_Score": np.where(
+            distance < NEAR_ATH_PCT, 1.0 - distance / NEAR_ATH_PCT, 0.0
+        ),
+        # ATH Trend - дали сме в ATH режим
+        "ATH_Trend": ath == high,
+    }
+
+
+def rolling_max(
+    values: np.ndarray,
+    window: int,
+    min_periods: int = 1,
+    start: int = 0,
+) -> np.ndarray:
+    """
+    Rolling max на ``values[start:]`` с монотонна опашка (deque)
+
+    Всяка позиция вижда предходните ``window`` стойности, NaN се
+    пропускат, точно като ``Series.rolling(window, min_periods).max()``.
+    Обхождат се само ``window - 1`` стойности преди ``start`` плюс новите
+    - цената не зависи от дължината на историята.
+
+    Args:
+        values: Масив със стойности (напр. High)
+        window: Размер на прозореца
+        min_periods: Минимум не-NaN стойности за резултат
+        start: Първата позиция, за която се смята резултат
+
+    Returns:
+        Масив с дължина ``len(values) - start`` (NaN под min_periods)
+    """
+    first = max(start - window + 1, 0)
+    valid_count = np.cumsum(~np.isnan(values[first:]))
+    result = np.full(len(values) - start, np.nan)
+    candidates: deque[int] = deque()  # позиции с намаляващи стойности
+
+    for i in range(first, len(values)):
+        value = values[i]
+        if not np.isnan(value):
+            while candidates and values[candidates[-1]] <= value:
+                candidates.pop()
+            candidates.append(i)
+        while candidates and candidates[0] <= i - window:
+            candidates.popleft()
+        if i < start:
+            continue
+
+        dropped = i - window - first
+        count = valid_count[i - first] - (valid_count[dropped] if dropped >= 0 else 0)
+        if count >= min_periods and candidates:
+            result[i - start] = values[candidates[0]]
+    return result
+
+
 def add_ath_analysis(df: pd.DataFrame) -> pd.DataFrame:
     """
     Добавя ATH (All Time High) анализ към DataFrame
@@ -27,35 +114,67 @@ def add_ath_analysis(df: pd.DataFrame) -> pd.DataFrame:
 
         # 🔥 НОВА ЛОГИКА: Rolling ATH от последните 180 дни за историческа точност
         # Това позволява SHORT сигнали в текущия пазарен контекст
-        df["ATH"] = df["High"].rolling(window=180, min_periods=30).max()
+        ath = df["High"].rolling(window=ATH_WINDOW, min_periods=ATH_MIN_PERIODS).max()
+        for name, values in _ath_columns(
+            df["High"].to_numpy(), df["Close"].to_numpy(), ath.to_numpy()
+        ).items():
+            df[name] = values
 
-        # Изчисляваме разстоянието до ATH в проценти
-        df["ATH_Distance_Pct"] = ((df["ATH"] - df["Close"]) / df["ATH"]) * 100
+        _log_ath(df)
+        return df
 
-        # Определяме дали цената е близо до ATH (< 10% - по-релакс за SHORT)
-        df["Near_ATH"] = df["ATH_Distance_Pct"] < 10.0
+    except Exception as e:
+        logger.exception(f"Грешка при ATH анализ: {e}")
+        return df
 
-        # ATH Proximity Score (по-висок = по-близо до ATH)
-        df["ATH_Proximity_Score"] = np.where(
-            df["ATH_Distance_Pct"] < 10.0,
-            1.0 - (df["ATH_Distance_Pct"] / 10.0),  # 0.0 до 1.0
-            0.0,
-        )
 
-        # ATH Trend - дали сме в ATH режим
-        df["ATH_Trend"] = df["ATH"] == df["High"]
+def append_ath_analysis(enriched: pd.DataFrame, candles: pd.DataFrame) -> pd.DataFrame:
+    """
+    Инкрементален ATH анализ: смята само новите свещи
 
-        logger.info(
-            f"ROLLING ATH анализ добавен (180 дни). Текуща ATH: ${df['ATH'].iloc[-1]:.2f}"
-        )
-        logger.info(f"Разстояние до ATH: {df['ATH_Distance_Pct'].iloc[-1]:.2f}%")
-        logger.info(f"Близо до ATH: {df['Near_ATH'].iloc[-1]}")
+    Редовете на ``enriched`` от първата нова дата нататък се заменят
+    (напр. текущата, още отворена свещ). ATH на новите редове идва от
+    rolling max с monotonic deque върху последните ATH_WINDOW - 1 свещи,
+    така че цената на update-а не зависи от дължината на историята.
+    Резултатът е идентичен с ``add_ath_analysis`` върху целия DataFrame.
 
-        return df
+    Args:
+        enriched: Предишният резултат от add_ath_analysis / append_ath_analysis
+        candles: Нови OHLCV свещи (сортирани по време)
 
-    except Exception as e:
-        logger.exception(f"Грешка при ATH анализ: {e}")
-        return df
+    Returns:
+        DataFrame с ATH колони за всички редове
+    """
+    if candles.empty:
+        return enriched
+    if enriched.empty or not set(ATH_COLUMNS).issubset(enriched.columns):
+        return add_ath_analysis(pd.concat([enriched, candles]))
+
+    kept = enriched[enriched.index < candles.index[0]]
+    context = kept["High"].to_numpy()[-(ATH_WINDOW - 1) :]
+    high = np.concatenate([context, candles["High"].to_numpy(dtype=float)])
+    ath = rolling_max(high, ATH_WINDOW, ATH_MIN_PERIODS, start=len(context))
+
+    appended = candles.copy()
+    for name, values in _ath_columns(
+        appended["High"].to_numpy(), appended["Close"].to_numpy(), ath
+    ).items():
+        appended[name] = values
+
+    df = pd.concat([kept, appended])
+    df.attrs = enriched.attrs
+    _log_ath(df)
+    return df
+
+
+def _log_ath(df: pd.DataFrame) -> None:
+    """Логва текущото ATH състояние (последния ред)"""
+    logger.info(
+        f"ROLLING ATH анализ добавен ({ATH_WINDOW} дни). "
+        f"Текуща ATH: ${df['ATH'].iloc[-1]:.2f}"
+    )
+    logger.info(f"Разстояние до ATH: {df['ATH_Distance_Pct'].iloc[-1]:.2f}%")
+    logger.info(f"Близо до ATH: {df['Near_ATH'].iloc[-1]}")
 
 
 def add_bnb_burn_columns(df: pd.DataFrame, config: dict) -> pd.DataFrame:
@@ -134,6 +253,78 @@ def add_bnb_burn_columns(df: pd.DataFrame, config: dict) -> pd.DataFrame:
         return df
 
 
+def detect_data_issues(df: pd.DataFrame, start: int = 0) -> dict[str, np.ndarray]:
+    """
+    Векторно откриване на проблеми в OHLCV данни
+
+    Проверяват се само редовете от ``start`` нататък (до ISSUE_CONTEXT
+    предишни реда служат за контекст), така че след update е достатъчно
+    ``detect_data_issues(df, start=len(previous))``.
+
+    Args:
+        df: OHLCV DataFrame (канонични колони, DatetimeIndex)
+        start: Първата позиция за проверка
+
+    Returns:
+        Dict с масиви от позиции (iloc) в df:
+            - missing: NaN в OHLCV колоните
+            - duplicates: повторени timestamps (второто и следващите)
+            - gaps: разстояние до предишната свещ над типичния интервал
+            - invalid: High < Low или Open/Close извън [Low, High]
+            - outliers: |log return| над OUTLIER_MAD_MULTIPLIER * MAD
+
+    Raises:
+        DataError: If an Open/High/Low/Close column is missing
+    """
+    first = max(start - ISSUE_CONTEXT, 0)
+    window = df.iloc[first:]
+    ohlcv = OHLCV.from_frame(window)
+    ohlcv.require("open", "high", "low", "close")
+    offset = start - first
+
+    def positions(mask: np.ndarray) -> np.ndarray:
+        return np.flatnonzero(mask[offset:]) + start
+
+    columns = [
+        values
+        for values in (ohlcv.open, ohlcv.high, ohlcv.low, ohlcv.close, ohlcv.volume)
+        if values is not None
+    ]
+    missing = np.isnan(np.vstack(columns)).any(axis=0)
+
+    times = window.index.to_numpy()
+    step = np.diff(times)
+    positive = step[step > np.zeros((), dtype=step.dtype)]
+    gaps = np.zeros(len(window), dtype=bool)
+    if positive.size:
+        gaps[1:] = step > np.median(positive) * GAP_TOLERANCE
+
+    with np.errstate(invalid="ignore"):
+        invalid = (
+            (ohlcv.high < ohlcv.low)
+            | (np.fmin(ohlcv.open, ohlcv.close) < ohlcv.low)
+            | (np.fmax(ohlcv.open, ohlcv.close) > ohlcv.high)
+        )
+
+    outliers = np.zeros(len(window), dtype=bool)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.diff(np.log(ohlcv.close))
+    finite = returns[np.isfinite(returns)]
+    if finite.size:
+        deviation = np.abs(returns - np.median(finite))
+        mad = np.median(np.abs(finite - np.median(finite)))
+        if mad > 0:
+            outliers[1:] = deviation > OUTLIER_MAD_MULTIPLIER * mad
+
+    return {
+        "missing": positions(missing),
+        "duplicates": positions(window.index.duplicated()),
+        "gaps": positions(gaps),
+        "invalid": positions(invalid),
+        "outliers": positions(outliers),
+    }
+
+
 def validate_data_quality(df: pd.DataFrame) -> dict[str, Any]:
     """
     Валидира качеството на данните
@@ -156,6 +347,8 @@ def validate_data_quality(df: pd.DataFrame) -> dict[str, Any]:
     avg_price = df["Close"].mean()
     price_volatility = price_range / avg_price
 
+    issues = detect_data_issues(df)
+
     quality_report = {
         "total_rows": total_rows,
         "missing_data": missing_data,
@@ -168,6 +361,9 @@ def validate_data_quality(df: pd.DataFrame) -> dict[str, Any]:
             if total_rows > 0
             else 0
         ),
+        "gaps": len(issues["gaps"]),
+        "outliers": len(issues["outliers"]),
+        "issues": issues,
     }
 
     logger.info(f"Качество на данните: {quality_report['data_quality_score']:.2%}")
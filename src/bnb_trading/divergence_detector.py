@@ -104,14 +104,23 @@ DATE: 2024-01-01
 """
 
 import logging
+from collections import deque
 from typing import Any
 
 import numpy as np
 import pandas as pd
-from scipy.signal import find_peaks
+
+from .data.schema import OHLCV, normalize_ohlcv
 
 logger = logging.getLogger(__name__)
 
+# Индикатор -> (име в reason, ключ за пика, ключ за дъното)
+_DIVERGENCE_LABELS: dict[str, tuple[str, str, str]] = {
+    "rsi": ("RSI", "rsi_peak", "rsi_trough"),
+    "macd": ("MACD", "macd_peak", "macd_trough"),
+    "volume": ("обемът", "volume_peak", "volume_trough"),
+}
+
 
 class DivergenceDetector:
     """
@@ -233,6 +242,9 @@ class DivergenceDetector:
             Dict с откритите divergence  # noqa: RUF001
         """
         try:
+            # Каноничната OHLCV схема веднъж (helpers четат масивите директно)
+            price_data = normalize_ohlcv(price_data)
+
             # PHASE 1: Analyze market regime for trend-strength filtering
             market_regime = (
                 self._analyze_market_regime(price_data)
@@ -249,11 +261,20 @@ class DivergenceDetector:
                 "trend_filter_applied": self.trend_filter_enabled,
             }
 
+            # Пиковете на цената се търсят веднъж за всички индикатори
+            price_extrema = (
+                self._window_extrema(self._recent_closes(price_data))
+                if len(price_data) >= self.lookback_periods
+                else None
+            )
+
             # 1. RSI Divergence
             if "rsi" in indicators_data:
                 rsi_values = indicators_data["rsi"].get("rsi_values", [])
                 if len(rsi_values) > 0:
-                    raw_rsi_div = self._detect_rsi_divergence(price_data, rsi_values)
+                    raw_rsi_div = self._detect_rsi_divergence(
+                        price_data, rsi_values, price_extrema
+                    )
                     divergences["rsi_divergence"] = (
                         self._apply_trend_filter(raw_rsi_div, market_regime, "rsi")
                         if self.trend_filter_enabled
@@ -264,7 +285,9 @@ class DivergenceDetector:
             if "macd" in indicators_data:
                 macd_values = indicators_data["macd"].get("macd_values", [])
                 if len(macd_values) > 0:
-                    raw_macd_div = self._detect_macd_divergence(price_data, macd_values)
+                    raw_macd_div = self._detect_macd_divergence(
+                        price_data, macd_values, price_extrema
+                    )
                     divergences["macd_divergence"] = (
                         self._apply_trend_filter(raw_macd_div, market_regime, "macd")
                         if self.trend_filter_enabled
@@ -272,14 +295,9 @@ class DivergenceDetector:
                     )
 
             # 3. Price vs Volume Divergence
-            vol_col = (
-                "volume"
-                if "volume" in price_data.columns
-                else ("Volume" if "Volume" in price_data.columns else None)
-            )
-            if vol_col:
+            if OHLCV.from_frame(price_data).volume is not None:
                 divergences["price_volume_divergence"] = (
-                    self._detect_price_volume_divergence(price_data)
+                    self._detect_price_volume_divergence(price_data, price_extrema)
                 )
 
             # 4. Определяме overall divergence
@@ -293,8 +311,15 @@ class DivergenceDetector:
             logger.exception(f"Грешка при откриване на divergence: {e}")
             return {"error": f"Грешка: {e}"}
 
+    def tracker(self) -> "DivergenceTracker":
+        """Нов стрийминг divergence tracker (константна цена на свещ)."""
+        return DivergenceTracker(self)
+
     def _detect_rsi_divergence(
-        self, price_data: pd.DataFrame, rsi_values: list[float]
+        self,
+        price_data: pd.DataFrame,
+        rsi_values: list[float],
+        price_extrema: tuple | None = None,
     ) -> dict:
         """Открива RSI divergence"""
         try:
@@ -304,56 +329,22 @@ class DivergenceDetector:
             ):
                 return {"type": "NONE", "confidence": 0, "reason": "Недостатъчно данни"}
 
-            # Извличаме последните lookback_periods данни
-            recent_prices = (
-                price_data["close"].tail(self.lookback_periods).values
-                if "close" in price_data.columns
-                else price_data["Close"].tail(self.lookback_periods).values
+            return self._window_divergence(
+                self._recent_closes(price_data),
+                rsi_values[-self.lookback_periods :],
+                "rsi",
+                price_extrema,
             )
-            recent_rsi = rsi_values[-self.lookback_periods :]
-
-            # Намираме пикове в цената
-            price_peaks = self._find_peaks(recent_prices, "high")
-            price_troughs = self._find_peaks(recent_prices, "low")
-
-            # Намираме пикове в RSI
-            rsi_peaks = self._find_peaks(recent_rsi, "high")
-            rsi_troughs = self._find_peaks(recent_rsi, "low")
-
-            # Проверяваме за bearish divergence (цена нов връх, RSI по-нисък връх)
-            bearish_div = self._check_bearish_divergence(
-                price_peaks, rsi_peaks, recent_prices, recent_rsi, "rsi"
-            )
-
-            # Проверяваме за bullish divergence (цена ново дъно, RSI по-високо дъно)
-            bullish_div = self._check_bullish_divergence(
-                price_troughs, rsi_troughs, recent_prices, recent_rsi, "rsi"
-            )
-
-            if bearish_div["detected"]:
-                return {
-                    "type": "BEARISH",
-                    "confidence": bearish_div["confidence"],
-                    "reason": "Цена прави нов връх, но RSI не (bearish divergence)",
-                    "price_peak": bearish_div["price_peak"],
-                    "rsi_peak": bearish_div["rsi_peak"],
-                }
-            if bullish_div["detected"]:
-                return {
-                    "type": "BULLISH",
-                    "confidence": bullish_div["confidence"],
-                    "reason": "Цена прави ново дъно, но RSI не (bullish divergence)",
-                    "price_trough": bullish_div["price_trough"],
-                    "rsi_trough": bullish_div["rsi_trough"],
-                }
-            return {"type": "NONE", "confidence": 0, "reason": "Няма divergence"}
 
         except Exception as e:
             logger.exception(f"Грешка при RSI divergence анализ: {e}")
             return {"type": "NONE", "confidence": 0, "reason": f"Грешка: {e}"}
 
     def _detect_macd_divergence(
-        self, price_data: pd.DataFrame, macd_values: list[float]
+        self,
+        price_data: pd.DataFrame,
+        macd_values: list[float],
+        price_extrema: tuple | None = None,
     ) -> dict:
         """Открива MACD divergence"""
         try:
@@ -363,113 +354,105 @@ class DivergenceDetector:
             ):
                 return {"type": "NONE", "confidence": 0, "reason": "Недостатъчно данни"}
 
-            # Извличаме последните lookback_periods данни
-            recent_prices = (
-                price_data["close"].tail(self.lookback_periods).values
-                if "close" in price_data.columns
-                else price_data["Close"].tail(self.lookback_periods).values
-            )
-            recent_macd = macd_values[-self.lookback_periods :]
-
-            # Намираме пикове в цената
-            price_peaks = self._find_peaks(recent_prices, "high")
-            price_troughs = self._find_peaks(recent_prices, "low")
-
-            # Намираме пикове в MACD
-            macd_peaks = self._find_peaks(recent_macd, "high")
-            macd_troughs = self._find_peaks(recent_macd, "low")
-
-            # Проверяваме за bearish divergence
-            bearish_div = self._check_bearish_divergence(
-                price_peaks, macd_peaks, recent_prices, recent_macd, "macd"
-            )
-
-            # Проверяваме за bullish divergence
-            bullish_div = self._check_bullish_divergence(
-                price_troughs, macd_troughs, recent_prices, recent_macd, "macd"
+            return self._window_divergence(
+                self._recent_closes(price_data),
+                macd_values[-self.lookback_periods :],
+                "macd",
+                price_extrema,
             )
 
-            if bearish_div["detected"]:
-                return {
-                    "type": "BEARISH",
-                    "confidence": bearish_div["confidence"],
-                    "reason": "Цена прави нов връх, но MACD не (bearish divergence)",
-                    "price_peak": bearish_div["price_peak"],
-                    "macd_peak": bearish_div["macd_peak"],
-                }
-            if bullish_div["detected"]:
-                return {
-                    "type": "BULLISH",
-                    "confidence": bullish_div["confidence"],
-                    "reason": "Цена прави ново дъно, но MACD не (bullish divergence)",
-                    "price_trough": bullish_div["price_trough"],
-                    "macd_trough": bullish_div.get(
-                        "macd_trough", bullish_div.get("indicator_trough")
-                    ),
-                }
-            return {"type": "NONE", "confidence": 0, "reason": "Няма divergence"}
-
         except Exception as e:
             logger.exception(f"Грешка при MACD divergence анализ: {e}")
             return {"type": "NONE", "confidence": 0, "reason": f"Грешка: {e}"}
 
-    def _detect_price_volume_divergence(self, price_data: pd.DataFrame) -> dict:
+    def _detect_price_volume_divergence(
+        self, price_data: pd.DataFrame, price_extrema: tuple | None = None
+    ) -> dict:
         """Открива divergence между цената и обема"""
         try:
             if len(price_data) < self.lookback_periods:
                 return {"type": "NONE", "confidence": 0, "reason": "Недостатъчно данни"}
 
-            # Извличаме последните lookback_periods данни
-            recent_prices = (
-                price_data["close"].tail(self.lookback_periods).values
-                if "close" in price_data.columns
-                else price_data["Close"].tail(self.lookback_periods).values
+            return self._window_divergence(
+                self._recent_closes(price_data),
+                OHLCV.from_frame(price_data).volume[-self.lookback_periods :],
+                "volume",
+                price_extrema,
             )
-            recent_volumes = price_data["volume"].tail(self.lookback_periods).values
 
-            # Намираме пикове в цената
-            price_peaks = self._find_peaks(recent_prices, "high")
-            price_troughs = self._find_peaks(recent_prices, "low")
+        except Exception as e:
+            logger.exception(f"Грешка при Price-Volume divergence анализ: {e}")
+            return {"type": "NONE", "confidence": 0, "reason": f"Грешка: {e}"}
 
-            # Намираме пикове в обема
-            volume_peaks = self._find_peaks(recent_volumes, "high")
-            volume_troughs = self._find_peaks(recent_volumes, "low")
+    def _recent_closes(self, price_data: pd.DataFrame) -> np.ndarray:
+        """Close цените от последните lookback_periods свещи"""
+        return OHLCV.from_frame(price_data).close[-self.lookback_periods :]
 
-            # Проверяваме за bearish divergence (цена нов връх, обем по-нисък)
-            bearish_div = self._check_bearish_divergence(
-                price_peaks, volume_peaks, recent_prices, recent_volumes
-            )
+    def _window_extrema(self, values: np.ndarray) -> tuple[list, list]:
+        """Пикове и дъна на прозорец (споделят се между индикаторите)"""
+        return self._find_peaks(values, "high"), self._find_peaks(values, "low")
 
-            # Проверяваме за bullish divergence (цена ново дъно, обем по-висок)
-            bullish_div = self._check_bullish_divergence(
-                price_troughs, volume_troughs, recent_prices, recent_volumes
-            )
+    def _window_divergence(
+        self,
+        recent_prices: np.ndarray,
+        recent_values: np.ndarray,
+        indicator: str,
+        price_extrema: tuple | None = None,
+    ) -> dict:
+        """
+        Divergence между цената и един индикатор за вече изрязан прозорец
 
-            if bearish_div["detected"]:
-                return {
-                    "type": "BEARISH",
-                    "confidence": bearish_div["confidence"],
-                    "reason": "Цена прави нов връх, но обемът не (bearish divergence)",
-                    "price_peak": bearish_div["price_peak"],
-                    "volume_peak": bearish_div["indicator_peak"],
-                }
-            if bullish_div["detected"]:
-                return {
-                    "type": "BULLISH",
-                    "confidence": bullish_div["confidence"],
-                    "reason": "Цена прави ново дъно, но обемът не (bullish divergence)",
-                    "price_trough": bullish_div["price_trough"],
-                    "volume_trough": bullish_div["indicator_trough"],
-                }
-            return {"type": "NONE", "confidence": 0, "reason": "Няма divergence"}
+        Args:
+            recent_prices: Close цени за последните lookback_periods свещи
+            recent_values: Стойности на индикатора за същите свещи
+            indicator: "rsi", "macd" или "volume"
+            price_extrema: Кеширани (пикове, дъна) на цената, ако вече са
+                изчислени за този прозорец
 
-        except Exception as e:
-            logger.exception(f"Грешка при Price-Volume divergence анализ: {e}")
-            return {"type": "NONE", "confidence": 0, "reason": f"Грешка: {e}"}
+        Returns:
+            Divergence резултат (type, confidence, reason, пик/дъно)
+        """
+        name, peak_key, trough_key = _DIVERGENCE_LABELS[indicator]
+        price_peaks, price_troughs = price_extrema or self._window_extrema(
+            recent_prices
+        )
+        indicator_peaks, indicator_troughs = self._window_extrema(recent_values)
+
+        # Bearish: цена нов връх, индикаторът по-нисък връх
+        bearish_div = self._check_bearish_divergence(
+            price_peaks, indicator_peaks, recent_prices, recent_values, indicator
+        )
+        if bearish_div["detected"]:
+            return {
+                "type": "BEARISH",
+                "confidence": bearish_div["confidence"],
+                "reason": f"Цена прави нов връх, но {name} не (bearish divergence)",
+                "price_peak": bearish_div["price_peak"],
+                peak_key: bearish_div.get(peak_key, bearish_div.get("indicator_peak")),
+            }
+
+        # Bullish: цена ново дъно, индикаторът по-високо дъно
+        bullish_div = self._check_bullish_divergence(
+            price_troughs, indicator_troughs, recent_prices, recent_values, indicator
+        )
+        if bullish_div["detected"]:
+            return {
+                "type": "BULLISH",
+                "confidence": bullish_div["confidence"],
+                "reason": f"Цена прави ново дъно, но {name} не (bullish divergence)",
+                "price_trough": bullish_div["price_trough"],
+                trough_key: bullish_div.get(
+                    trough_key, bullish_div.get("indicator_trough")
+                ),
+            }
+        return {"type": "NONE", "confidence": 0, "reason": "Няма divergence"}
 
     def _find_peaks(self, data: np.ndarray, peak_type: str) -> list[tuple[int, float]]:
         """Намира пикове в данните използвайки scipy.signal.find_peaks"""
         try:
+            # scipy се импортира при първо ползване (бавен import)
+            from scipy.signal import find_peaks
+
             # Конвертираме в numpy array ако не е
             if not isinstance(data, np.ndarray):
                 data = np.array(data)
@@ -699,30 +682,32 @@ class DivergenceDetector:
             if len(price_data) < self.lookback_periods:
                 return "NEUTRAL"
 
-            close_col = "close" if "close" in price_data.columns else "Close"
-            recent_prices = price_data[close_col].tail(self.lookback_periods)
-
-            # Calculate trend strength over lookback period
-            price_change = (
-                recent_prices.iloc[-1] - recent_prices.iloc[0]
-            ) / recent_prices.iloc[0]
-
-            # Calculate volatility (standard deviation)
-            price_volatility = recent_prices.pct_change().std()
-
-            # Determine market regime
-            if price_change >= self.bull_market_threshold:
-                if price_volatility > 0.05:  # High volatility bull market
-                    return "VOLATILE_BULL"
-                return "STRONG_BULL"
-            if price_change <= self.bear_market_threshold:
-                return "BEAR"
-            return "NEUTRAL"
+            return self._regime_from_closes(self._recent_closes(price_data))
 
         except Exception as e:
             logger.exception(f"Error analyzing market regime: {e}")
             return "NEUTRAL"
 
+    def _regime_from_closes(self, recent_prices: np.ndarray) -> str:
+        """Market regime from the closes of the last lookback window"""
+        recent_prices = np.asarray(recent_prices, dtype=float)
+
+        # Calculate trend strength over lookback period
+        price_change = (recent_prices[-1] - recent_prices[0]) / recent_prices[0]
+
+        # Calculate volatility (sample std of the returns)
+        returns = recent_prices[1:] / recent_prices[:-1] - 1
+        price_volatility = np.std(returns, ddof=1) if returns.size > 1 else np.nan
+
+        # Determine market regime
+        if price_change >= self.bull_market_threshold:
+            if price_volatility > 0.05:  # High volatility bull market
+                return "VOLATILE_BULL"
+            return "STRONG_BULL"
+        if price_change <= self.bear_market_threshold:
+            return "BEAR"
+        return "NEUTRAL"
+
     def _apply_trend_filter(
         self, divergence_result: dict, market_regime: str, divergence_type: str
     ) -> dict:
@@ -815,6 +800,113 @@ class DivergenceDetector:
             return divergence_result
 
 
+class DivergenceTracker:
+    """
+    Стрийминг divergence детектор за daemon/backtest режим
+
+    Пази само последните ``lookback_periods`` стойности на close и
+    индикаторите в ring буфери, така че всяка нова свещ струва
+    O(lookback) независимо от дължината на историята. Пиковете зависят от
+    прозореца (prominence и distance се мерят в него), затова се търсят
+    наново върху буфера, но веднъж на свещ - пиковете на цената се
+    споделят между RSI, MACD и обема. Резултатът съвпада с
+    ``detect_all_divergences`` за същия префикс.
+    """
+
+    __slots__ = ("_closes", "_indicators", "detector")
+
+    def __init__(self, detector: DivergenceDetector) -> None:
+        self.detector = detector
+        lookback = detector.lookback_periods
+        self._closes: deque[float] = deque(maxlen=lookback)
+        self._indicators: dict[str, deque[float]] = {
+            indicator: deque(maxlen=lookback) for indicator in _DIVERGENCE_LABELS
+        }
+
+    def update(
+        self,
+        close: float,
+        rsi: float | None = None,
+        macd: float | None = None,
+        volume: float | None = None,
+    ) -> dict:
+        """
+        Добавя една свещ и връща divergence анализа за нея
+
+        Индикатор, подаден веднъж, трябва да се подава на всяка следваща
+        свещ (подравнен с close); ``None`` означава, че не се анализира.
+
+        Args:
+            close: Close цена
+            rsi: RSI стойност
+            macd: MACD стойност
+            volume: Обем
+
+        Returns:
+            Dict със същата структура като ``detect_all_divergences``
+        """
+        detector = self.detector
+        try:
+            self._closes.append(close)
+            for indicator, value in (("rsi", rsi), ("macd", macd), ("volume", volume)):
+                if value is not None:
+                    self._indicators[indicator].append(value)
+
+            ready = len(self._closes) == detector.lookback_periods
+            closes = np.fromiter(self._closes, dtype=float) if ready else None
+            market_regime = (
+                detector._regime_from_closes(closes)
+                if detector.trend_filter_enabled and ready
+                else "NEUTRAL"
+            )
+            divergences = {
+                "rsi_divergence": None,
+                "macd_divergence": None,
+                "price_volume_divergence": None,
+                "overall_divergence": "NONE",
+                "market_regime": market_regime,
+                "trend_filter_applied": detector.trend_filter_enabled,
+            }
+            price_extrema = detector._window_extrema(closes) if ready else None
+
+            for key, indicator in (
+                ("rsi_divergence", "rsi"),
+                ("macd_divergence", "macd"),
+                ("price_volume_divergence", "volume"),
+            ):
+                window = self._indicators[indicator]
+                if not window:
+                    continue
+                if ready and len(window) == detector.lookback_periods:
+                    result = detector._window_divergence(
+                        closes,
+                        np.fromiter(window, dtype=float),
+                        indicator,
+                        price_extrema,
+                    )
+                else:
+                    result = {
+                        "type": "NONE",
+                        "confidence": 0,
+                        "reason": "Недостатъчно данни",
+                    }
+                # Обемът не минава през trend filter (като detect_all_divergences)
+                if indicator != "volume" and detector.trend_filter_enabled:
+                    result = detector._apply_trend_filter(
+                        result, market_regime, indicator
+                    )
+                divergences[key] = result
+
+            divergences["overall_divergence"] = detector._determine_overall_divergence(
+                divergences
+            )
+            return divergences
+
+        except Exception as e:
+            logger.exception(f"Грешка при стрийминг divergence анализ: {e}")
+            return {"error": f"Грешка: {e}"}
+
+
 if __name__ == "__main__":
     print("Divergence Detector модул за BNB Trading System")
     print("Използвайте main.py за пълен анализ")
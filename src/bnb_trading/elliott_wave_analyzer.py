@@ -137,6 +137,8 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
+from .data.schema import OHLCV
+
 # Import TrendAnalyzer for momentum confirmation
 try:
     from trend_analyzer import TrendAnalyzer
@@ -348,8 +350,7 @@ class ElliottWaveAnalyzer:
         """Анализира конкретен timeframe"""
         try:
             # Извличаме цените
-            price_column = "close" if "close" in df.columns else "Close"
-            price_series = pd.Series(df[price_column])
+            price_series = pd.Series(OHLCV.from_frame(df).close, index=df.index)
 
             # Нормализираме NaN стойности
             price_series = price_series.ffill().bfill()
@@ -69,11 +69,16 @@ DATE: 2024-01-01
 """
 
 import logging
+import math
+from collections import deque
 from typing import Any
 
+import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 from .core.models import ModuleResult
+from .data.schema import OHLCV
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -193,16 +198,14 @@ class FibonacciAnalyzer:
         try:
             # Използваме последните N периоди за търсене на swing points
             lookback_data = df.tail(self.swing_lookback)
+            highs = lookback_data["High"].to_numpy(dtype=float)
+            lows = lookback_data["Low"].to_numpy(dtype=float)
 
-            # Намираме swing high (локален максимум)
-            swing_high_idx = lookback_data["High"].idxmax()
-            swing_high_price = lookback_data.loc[swing_high_idx, "High"]
-            swing_high_pos = lookback_data.index.get_loc(swing_high_idx)
-
-            # Намираме swing low (локален минимум)
-            swing_low_idx = lookback_data["Low"].idxmin()
-            swing_low_price = lookback_data.loc[swing_low_idx, "Low"]
-            swing_low_pos = lookback_data.index.get_loc(swing_low_idx)
+            # Swing high/low (първо срещане, като idxmax/idxmin)
+            swing_high_pos = int(np.nanargmax(highs))
+            swing_high_price = highs[swing_high_pos]
+            swing_low_pos = int(np.nanargmin(lows))
+            swing_low_price = lows[swing_low_pos]
 
             # Проверяваме дали swing е достатъчно голям
             swing_size = abs(swing_high_price - swing_low_price) / swing_low_price
@@ -265,6 +268,201 @@ class FibonacciAnalyzer:
             logger.exception(f"Грешка при изчисляване на Fibonacci нива: {e}")
             return {}
 
+    def swing_tracker(self) -> "SwingTracker":
+        """Нов стрийминг swing tracker с прозорец ``swing_lookback``."""
+        return SwingTracker(self.swing_lookback)
+
+    def swing_history(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Batch swing points и Fibonacci нива за всяка свещ в историята
+
+        Ред ``i`` съвпада с ``find_swing_points(df.iloc[: i + 1])`` и
+        ``calculate_fibonacci_levels`` за този swing, без цикъл по свещи.
+
+        Args:
+            df: DataFrame с OHLCV данни
+
+        Returns:
+            DataFrame (индекс като df) с swing_high, swing_low, high_pos,
+            low_pos (позиция в lookback прозореца), swing_size, valid и
+            колони ``fib_<level>`` (NaN където swing е под минимума)
+        """
+        highs = df["High"].to_numpy(dtype=float)
+        lows = df["Low"].to_numpy(dtype=float)
+        high_idx, low_idx = _rolling_extremes(highs, lows, self.swing_lookback)
+
+        swing_high = highs[high_idx]
+        swing_low = lows[low_idx]
+        window_start = np.maximum(np.arange(len(df)) - self.swing_lookback + 1, 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            swing_size = np.abs(swing_high - swing_low) / swing_low
+        valid = swing_size >= self.min_swing_size
+
+        levels = self.fibonacci_level_matrix(swing_high, swing_low)
+        levels[~valid] = np.nan
+
+        history = pd.DataFrame(
+            {
+                "swing_high": swing_high,
+                "swing_low": swing_low,
+                "high_pos": high_idx - window_start,
+                "low_pos": low_idx - window_start,
+                "swing_size": swing_size,
+                "valid": valid,
+            },
+            index=df.index,
+        )
+        for column, level in enumerate(self.fib_levels):
+            history[f"fib_{level}"] = levels[:, column]
+        return history
+
+    def fibonacci_level_matrix(
+        self, swing_high: np.ndarray, swing_low: np.ndarray
+    ) -> np.ndarray:
+        """
+        Fibonacci retracement нива за масиви от swing points
+
+        Args:
+            swing_high: Swing high цени, shape (n,)
+            swing_low: Swing low цени, shape (n,)
+
+        Returns:
+            Масив (n, len(fib_levels)) в реда на ``self.fib_levels``
+        """
+        swing_high = np.asarray(swing_high, dtype=float)
+        swing_low = np.asarray(swing_low, dtype=float)
+        ratios = np.asarray(self.fib_levels)
+
+        levels = swing_low[:, None] + ratios * (swing_high - swing_low)[:, None]
+        # 0% и 100% са точно swing low/high (както calculate_fibonacci_levels)
+        levels[:, ratios == 0.0] = swing_low[:, None]
+        levels[:, ratios == 1.0] = swing_high[:, None]
+        return levels
+
+    def current_score(self, daily_df: pd.DataFrame | OHLCV) -> float | None:
+        """
+        Fibonacci score за последната затворена свещ без логове по нива
+
+        Използва се от decide_long на всяка backtest стъпка; score-ът е
+        същият като в ``analyze`` (``_calculate_fib_score``).
+
+        Args:
+            daily_df: Daily OHLCV данни или OHLCV серия (само затворени свещи)
+
+        Returns:
+            Score 0.0-1.0 или None ако swing е под ``min_swing_size``
+        """
+        lookback_data = OHLCV.from_frame(daily_df.tail(self.swing_lookback))
+        swing_high = float(np.nanmax(lookback_data.high))
+        swing_low = float(np.nanmin(lookback_data.low))
+        if not swing_low > 0:
+            return None
+        if abs(swing_high - swing_low) / swing_low < self.min_swing_size:
+            return None
+
+        levels = self.fibonacci_level_matrix(
+            np.array([swing_high]), np.array([swing_low])
+        )
+        current_price = float(lookback_data.close[-1])
+        proximity = self.proximity_matrix([current_price], levels)
+        return float(self._fib_score_array(proximity)[0])
+
+    def proximity_matrix(
+        self,
+        prices: np.ndarray,
+        levels: np.ndarray,
+        ratios: list[float] | None = None,
+    ) -> dict[str, np.ndarray]:
+        """
+        Близост на много цени до техните Fibonacci нива наведнъж
+
+        Същата логика като ``check_fib_proximity``, но за масиви: ред ``i``
+        сравнява ``prices[i]`` с нивата ``levels[i]`` (напр. swing-а на
+        всяка свещ от ``swing_history``).
+
+        Args:
+            prices: Цени, shape (n,)
+            levels: Цени на нивата, shape (n, k) или (k,) за общи нива
+            ratios: Fibonacci съотношенията на колоните (default: fib_levels)
+
+        Returns:
+            Dict с NumPy масиви:
+                - distance, distance_percentage: (n, k) разстояния
+                - active: (n, k) маска за нива в proximity_threshold
+                - nearest_index / closest_active_index: колона или -1
+                - nearest_level, nearest_distance, nearest_percentage: (n,)
+                  (NaN ако няма нива)
+        """
+        prices = np.atleast_1d(np.asarray(prices, dtype=float))
+        ratios_arr = np.asarray(self.fib_levels if ratios is None else ratios)
+        levels = np.broadcast_to(
+            np.asarray(levels, dtype=float), (prices.size, ratios_arr.size)
+        )
+        rows = np.arange(prices.size)
+
+        distance = np.abs(prices[:, None] - levels)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            distance_pct = distance / prices[:, None]
+        active = distance_pct <= self.proximity_threshold
+
+        # Първото най-близко ниво (както строгото < в check_fib_proximity)
+        masked = np.where(np.isnan(distance), np.inf, distance)
+        nearest = masked.argmin(axis=1)
+        has_nearest = np.isfinite(masked[rows, nearest])
+        nearest = np.where(has_nearest, nearest, -1)
+
+        # Най-близкото активно ниво (първото при стабилно сортиране)
+        closest_active = np.where(active, distance_pct, np.inf).argmin(axis=1)
+        closest_active = np.where(active.any(axis=1), closest_active, -1)
+
+        return {
+            "distance": distance,
+            "distance_percentage": distance_pct,
+            "active": active,
+            "nearest_index": nearest,
+            "nearest_level": np.where(has_nearest, ratios_arr[nearest], np.nan),
+            "nearest_distance": np.where(has_nearest, distance[rows, nearest], np.nan),
+            "nearest_percentage": np.where(
+                has_nearest, distance_pct[rows, nearest], np.nan
+            ),
+            "closest_active_index": closest_active,
+            "closest_active_level": np.where(
+                closest_active >= 0, ratios_arr[closest_active], np.nan
+            ),
+            "closest_active_percentage": np.where(
+                closest_active >= 0, distance_pct[rows, closest_active], np.nan
+            ),
+        }
+
+    def proximity_history(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Историческа Fibonacci близост и score за всяка свещ
+
+        Args:
+            df: DataFrame с OHLCV данни
+
+        Returns:
+            DataFrame (индекс като df) с nearest_level, nearest_percentage,
+            active_levels (брой активни нива) и score (като ``analyze``;
+            NaN където swing е под минимума)
+        """
+        history = self.swing_history(df)
+        levels = history[[f"fib_{level}" for level in self.fib_levels]].to_numpy()
+        proximity = self.proximity_matrix(df["Close"].to_numpy(dtype=float), levels)
+
+        scores = self._fib_score_array(proximity)
+        scores[~history["valid"].to_numpy()] = np.nan
+
+        return pd.DataFrame(
+            {
+                "nearest_level": proximity["nearest_level"],
+                "nearest_percentage": proximity["nearest_percentage"],
+                "active_levels": proximity["active"].sum(axis=1),
+                "score": scores,
+            },
+            index=df.index,
+        )
+
     def check_fib_proximity(
         self, current_price: float, fib_levels: dict[float, float]
     ) -> dict[str, Any]:
@@ -279,44 +477,42 @@ class FibonacciAnalyzer:
             Dict с информация за близостта до Fibonacci нива
         """
         try:
-            proximity_info = {
-                "nearest_level": None,
-                "nearest_distance": float("inf"),
-                "nearest_percentage": None,
-                "active_levels": [],
-                "key_level_proximity": {},
-            }
-
-            for level, price in fib_levels.items():
-                # Изчисляваме разстоянието до нивото
-                distance = abs(current_price - price)
-                distance_percentage = distance / current_price
-
-                # Проверяваме дали сме в близост до нивото
-                if distance_percentage <= self.proximity_threshold:
-                    proximity_info["active_levels"].append(
-                        {
-                            "level": level,
-                            "price": price,
-                            "distance": distance,
-                            "distance_percentage": distance_percentage,
-                        }
-                    )
-
-                # Намираме най-близкото ниво
-                if distance < proximity_info["nearest_distance"]:
-                    proximity_info["nearest_distance"] = distance
-                    proximity_info["nearest_level"] = level
-                    proximity_info["nearest_percentage"] = distance_percentage
+            ratios = list(fib_levels)
+            prices = np.fromiter(fib_levels.values(), dtype=float, count=len(ratios))
+            proximity = self.proximity_matrix([current_price], prices, ratios)
+            distances = proximity["distance"][0].tolist()
+            distance_pcts = proximity["distance_percentage"][0].tolist()
+            is_active = proximity["active"][0].tolist()
+            nearest = int(proximity["nearest_index"][0])
 
+            proximity_info = {
+                "nearest_level": ratios[nearest] if nearest >= 0 else None,
+                "nearest_distance": distances[nearest]
+                if nearest >= 0
+                else float("inf"),
+                "nearest_percentage": distance_pcts[nearest] if nearest >= 0 else None,
+                "active_levels": [
+                    {
+                        "level": level,
+                        "price": fib_levels[level],
+                        "distance": distances[i],
+                        "distance_percentage": distance_pcts[i],
+                    }
+                    for i, level in enumerate(ratios)
+                    if is_active[i]
+                ],
                 # Специална проверка за ключовите нива (38.2% и 61.8%)
-                if level in self.key_levels:
-                    proximity_info["key_level_proximity"][level] = {
-                        "price": price,
-                        "distance": distance,
-                        "distance_percentage": distance_percentage,
-                        "is_active": distance_percentage <= self.proximity_threshold,
+                "key_level_proximity": {
+                    level: {
+                        "price": fib_levels[level],
+                        "distance": distances[i],
+                        "distance_percentage": distance_pcts[i],
+                        "is_active": is_active[i],
                     }
+                    for i, level in enumerate(ratios)
+                    if level in self.key_levels
+                },
+            }
 
             # Сортираме активните нива по близост
             proximity_info["active_levels"].sort(key=lambda x: x["distance_percentage"])
@@ -328,9 +524,9 @@ class FibonacciAnalyzer:
             logger.info(f"Разстояние: {proximity_info['nearest_percentage']:.2%}")
 
             if proximity_info["active_levels"]:
-                logger.info("Активни Fibonacci нива:")
+                logger.debug("Активни Fibonacci нива:")
                 for level_info in proximity_info["active_levels"]:
-                    logger.info(
+                    logger.debug(
                         f"  {level_info['level'] * 100:5.1f}%: ${
                             level_info['price']:,.2f} (±{
                             level_info['distance_percentage']:.2%})"
@@ -773,6 +969,25 @@ class FibonacciAnalyzer:
                 reason=f"Fibonacci analysis error: {e}",
             )
 
+    def _fib_score_array(self, proximity: dict[str, np.ndarray]) -> np.ndarray:
+        """Vectorized _calculate_fib_score over proximity_matrix rows."""
+        level = proximity["closest_active_level"]
+        distance_pct = proximity["closest_active_percentage"]
+        is_key = np.isin(level, self.key_levels)
+        return np.select(
+            [
+                np.isnan(level),
+                level == 0.618,
+                is_key & (distance_pct <= 0.01),
+                is_key & (distance_pct <= 0.02),
+                is_key,
+                np.isin(level, [0.236, 0.786]),
+                level == 0.5,
+            ],
+            [0.3, 0.7, 0.8, 0.6, 0.5, 0.4, 0.3],
+            default=0.2,
+        )
+
     def _calculate_fib_score(self, proximity_info: dict[str, Any]) -> float:
         """
         Calculate Fibonacci score based on proximity to important levels.
@@ -823,6 +1038,83 @@ class FibonacciAnalyzer:
             return 0.2
 
 
+class SwingTracker:
+    """
+    Стрийминг swing high/low за walk-forward режим
+
+    Monotonic deques пазят кандидатите за rolling max(High)/min(Low) с
+    номерата на свещите им, така че всяка нова свещ струва amortized O(1)
+    вместо ново сканиране на ``window`` свещи. Резултатът съвпада с
+    ``FibonacciAnalyzer.find_swing_points`` за същия префикс (без
+    проверката за ``min_swing_size``).
+    """
+
+    __slots__ = ("_count", "_highs", "_lows", "window")
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self._highs: deque[tuple[int, float]] = deque()
+        self._lows: deque[tuple[int, float]] = deque()
+        self._count = 0
+
+    def update(self, high: float, low: float) -> tuple[float, float, int, int]:
+        """
+        Добавя нова свещ
+
+        Args:
+            high: High на свещта
+            low: Low на свещта
+
+        Returns:
+            Tuple: (swing_high, swing_low, high_pos, low_pos), позициите са в
+            lookback прозореца както при find_swing_points
+        """
+        bar = self._count
+        self._count += 1
+        window_start = max(bar - self.window + 1, 0)
+
+        # Строго < / >: при равни стойности остава първото срещане
+        if not math.isnan(high):  # NaN се пропуска като в idxmax
+            while self._highs and self._highs[-1][1] < high:
+                self._highs.pop()
+            self._highs.append((bar, high))
+        if not math.isnan(low):
+            while self._lows and self._lows[-1][1] > low:
+                self._lows.pop()
+            self._lows.append((bar, low))
+
+        while self._highs and self._highs[0][0] < window_start:
+            self._highs.popleft()
+        while self._lows and self._lows[0][0] < window_start:
+            self._lows.popleft()
+
+        high_bar, swing_high = self._highs[0]
+        low_bar, swing_low = self._lows[0]
+        return swing_high, swing_low, high_bar - window_start, low_bar - window_start
+
+
+def _rolling_extremes(
+    highs: np.ndarray, lows: np.ndarray, window: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Абсолютни позиции на rolling max(High)/min(Low) за всяка свещ
+
+    Първите ``window - 1`` прозореца са по-къси (като ``df.tail`` на префикс);
+    при равни стойности печели първото срещане, NaN се пропуска.
+    """
+    pad = window - 1
+    padded_highs = np.concatenate(
+        [np.full(pad, -np.inf), np.where(np.isnan(highs), -np.inf, highs)]
+    )
+    padded_lows = np.concatenate(
+        [np.full(pad, np.inf), np.where(np.isnan(lows), np.inf, lows)]
+    )
+    offset = np.arange(len(highs)) - pad
+    high_idx = sliding_window_view(padded_highs, window).argmax(axis=1) + offset
+    low_idx = sliding_window_view(padded_lows, window).argmin(axis=1) + offset
+    return high_idx, low_idx
+
+
 if __name__ == "__main__":
     # Тест на Fibonacci модула
     print("Fibonacci модул за BNB Trading System")
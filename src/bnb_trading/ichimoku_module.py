@@ -78,7 +78,7 @@ EXAMPLE USAGE:
     ...     print("Bullish Ichimoku signal detected")
 
 DEPENDENCIES:
-    - requests: HTTP API communication with Binance
+    - data.http: Shared pooled HTTP client for Binance
     - datetime/timedelta: Date and time manipulation
     - typing: Type hints for better code documentation
 
@@ -121,7 +121,9 @@ import logging
 from datetime import datetime
 from typing import Any
 
-import requests
+from .core.exceptions import DataError, NetworkError
+from .data.http import get_http_client
+from .data.resample import KlineResampler, candles_from_frame, kline_plan
 
 logger = logging.getLogger(__name__)
 
@@ -252,18 +254,41 @@ class IchimokuAnalyzer:
                 "limit": min(limit, 1000),
             }
 
-            response = requests.get(
+            return get_http_client().get_json(
                 f"{self.base_url}/klines", params=params, timeout=self.timeout
             )
-            if response.status_code == 200:
-                return response.json()
-            logger.warning("Binance klines non-200: %s", response.status_code)
+        except NetworkError as e:
+            logger.warning(f"Binance klines request failed: {e}")
             return []
 
         except Exception:
             logger.exception("Error fetching klines")
             return []
 
+    def fetch_timeframes(
+        self, timeframes: dict[str, int], daily_df=None
+    ) -> dict[str, list]:
+        """Fetch several timeframes with one request, resampled locally
+
+        Args:
+            timeframes: Interval -> number of candles (e.g. {"1d": 180, "1w": 52})
+            daily_df: Local daily OHLCV data, used instead of a request when
+                the finest timeframe is "1d"
+
+        Returns:
+            Interval -> klines rows (empty dict on failure)
+        """
+        resampler = KlineResampler(self.symbol, self.base_url, self.timeout)
+        candles = None
+        if daily_df is not None and kline_plan(timeframes)[0] == "1d":
+            candles = candles_from_frame(daily_df)
+        try:
+            frames = resampler.timeframes(timeframes, candles)
+        except (NetworkError, DataError) as e:
+            logger.warning(f"Binance klines request failed: {e}")
+            return {}
+        return {interval: rows.tolist() for interval, rows in frames.items()}
+
     def process_klines_data(self, klines: list) -> dict:
         """Process klines into OHLC data"""
         if not klines:
@@ -558,17 +583,15 @@ class IchimokuAnalyzer:
     def get_current_price(self) -> float | None:
         """Get current BNB price"""
         try:
-            response = requests.get(
+            ticker = get_http_client().get_json(
                 f"{self.base_url}/ticker/price",
                 params={"symbol": self.symbol},
                 timeout=self.timeout,
             )
-            if response.status_code == 200:
-                return float(response.json()["price"])
+            return float(ticker["price"])
         except Exception:
             logger.exception("Ticker fetch failed")
             return None
-        return None
 
     def display_ichimoku_analysis(self, interval: str = "1d", limit: int = 100):
         """Display complete Ichimoku analysis"""
@@ -681,8 +704,12 @@ class IchimokuAnalyzer:
 
         return signals
 
-    def multi_period_ichimoku_analysis(self):
-        """Analyze Ichimoku across different time periods - 3, 6, 12 months"""
+    def multi_period_ichimoku_analysis(self, daily_df=None):
+        """Analyze Ichimoku across different time periods - 3, 6, 12 months
+
+        Args:
+            daily_df: Local daily OHLCV data (fetched from Binance if None)
+        """
         print("\n📅 MULTI-PERIOD ICHIMOKU ANALYSIS")
         print("=" * 60)
 
@@ -701,13 +728,17 @@ class IchimokuAnalyzer:
         ]
 
         results = {}
+        timeframes: dict[str, int] = {}
+        for _, interval, limit in periods:
+            timeframes[interval] = max(timeframes.get(interval, 0), limit)
+        frames = self.fetch_timeframes(timeframes, daily_df)
 
         for period_name, interval, limit in periods:
             print(f"\n📊 {period_name} ({interval}):")
             print("-" * 40)
 
-            # Fetch data
-            klines = self.fetch_ichimoku_data(interval, limit)
+            # Slice the shared data
+            klines = frames.get(interval, [])[-limit:]
             if not klines:
                 print(f"❌ Failed to fetch {interval} data")
                 continue
@@ -830,8 +861,12 @@ class IchimokuAnalyzer:
         print("\n" + "=" * 60)
         return results
 
-    def multi_timeframe_ichimoku(self):
-        """Analyze Ichimoku across multiple timeframes"""
+    def multi_timeframe_ichimoku(self, daily_df=None):
+        """Analyze Ichimoku across multiple timeframes
+
+        Args:
+            daily_df: Local daily OHLCV data (fetched from Binance if None)
+        """
         print("\n⏰ MULTI-TIMEFRAME ICHIMOKU ANALYSIS")
         print("=" * 60)
 
@@ -842,13 +877,16 @@ class IchimokuAnalyzer:
         ]
 
         results = {}
+        frames = self.fetch_timeframes(
+            {interval: limit for interval, limit, _ in timeframes}, daily_df
+        )
 
         for interval, limit, description in timeframes:
             print(f"\n📊 {description} ({interval}):")
             print("-" * 30)
 
             # Get data
-            klines = self.fetch_ichimoku_data(interval, limit)
+            klines = frames.get(interval, [])[-limit:]
             if not klines:
                 print(f"❌ Failed to fetch {interval} data")
                 continue
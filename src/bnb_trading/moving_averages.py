@@ -117,6 +117,7 @@ import numpy as np
 import pandas as pd
 
 from bnb_trading.core.models import ModuleResult
+from bnb_trading.data.schema import OHLCV
 
 logger = logging.getLogger(__name__)
 
@@ -251,11 +252,8 @@ class MovingAveragesAnalyzer:
                     "error": f"Недостатъчно данни. Нужни са поне {self.slow_period} периода"
                 }
 
-            closes = (
-                price_data["close"].values
-                if "close" in price_data.columns
-                else price_data["Close"].values
-            )
+            ohlcv = OHLCV.from_frame(price_data)
+            closes = ohlcv.close
 
             # Изчисляваме EMA
             fast_ema = self._calculate_ema(closes, self.fast_period)
@@ -263,8 +261,8 @@ class MovingAveragesAnalyzer:
 
             # Изчисляваме volume confirmation
             volume_confirmed = False
-            if self.volume_confirmation and "volume" in price_data.columns:
-                volume_confirmed = self._check_volume_confirmation(price_data)
+            if self.volume_confirmation and ohlcv.volume is not None:
+                volume_confirmed = self._check_volume_confirmation(ohlcv.volume)
 
             return {
                 "fast_ema": fast_ema,
@@ -403,22 +401,17 @@ class MovingAveragesAnalyzer:
             logger.exception(f"Грешка при откриване на crossover: {e}")
             return {"signal": "NONE", "confidence": 0, "reason": f"Грешка: {e}"}
 
-    def _check_volume_confirmation(self, price_data: pd.DataFrame) -> bool:
+    def _check_volume_confirmation(self, volumes: np.ndarray) -> bool:
         """
         Проверява volume confirmation
 
         Args:
-            price_data: DataFrame с OHLCV данни
+            volumes: Volume масив (OHLCV.volume)
 
         Returns:
             bool: True ако volume потвърждава сигнала
         """
         try:
-            if "volume" not in price_data.columns:
-                return False
-
-            volumes = price_data["volume"].values
-
             if len(volumes) < self.volume_lookback:
                 return False
 
@@ -616,18 +609,10 @@ class MovingAveragesAnalyzer:
                 )
 
             # Get current price
-            current_price = (
-                price_data["close"].iloc[-1]
-                if "close" in price_data.columns
-                else price_data["Close"].iloc[-1]
-            )
+            closes = OHLCV.from_frame(price_data).close
+            current_price = closes[-1]
 
             # Calculate EMAs
-            closes = (
-                price_data["close"].values
-                if "close" in price_data.columns
-                else price_data["Close"].values
-            )
             ema50 = self._calculate_ema(closes, 50)
             ema200 = self._calculate_ema(closes, 200)
 
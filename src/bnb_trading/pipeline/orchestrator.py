@@ -1,12 +1,12 @@
 """Main pipeline orchestration for BNB Trading System."""
 
+import asyncio
 import logging
 import os
 import sys
 from typing import Any
 
 import pandas as pd
-import toml
 
 # For direct script execution - add src to path
 if __name__ == "__main__":
@@ -16,8 +16,15 @@ if __name__ == "__main__":
         sys.path.insert(0, src_dir)
 
 # Use absolute imports for package structure
+from bnb_trading.core.config import load_config
 from bnb_trading.core.exceptions import AnalysisError
+from bnb_trading.core.registry import get_analyzer
 from bnb_trading.data.fetcher import BNBDataFetcher
+from bnb_trading.data.gather import (
+    DEFAULT_DEADLINE,
+    MarketSnapshot,
+    gather_market_snapshot,
+)
 from bnb_trading.signals.generator import SignalGenerator
 
 logger = logging.getLogger(__name__)
@@ -42,29 +49,79 @@ class TradingPipeline:
                 config_path = root_config_path
                 self.config_path = root_config_path
 
-        self.config = toml.load(config_path)
+        self.config = load_config(config_path)
 
         # Initialize core components
         self.data_fetcher = BNBDataFetcher(self.config["data"]["symbol"])
         self.signal_generator = SignalGenerator(self.config)
+        # Последните daily/weekly данни - следващите run-ове добавят само новите свещи
+        self.market_data: dict[str, pd.DataFrame] | None = None
 
         logger.info("🚀 Trading Pipeline initialized")
 
-    def run_analysis(self) -> dict[str, Any]:
+    def gather_snapshot(self) -> MarketSnapshot:
+        """
+        Fetch all live market data concurrently under one deadline.
+
+        REST responses are primed into the shared HTTP cache, so the
+        analyzers in ``run_analysis`` do not repeat the requests. After the
+        first run only the new OHLCV candles are fetched, concurrently with
+        the REST reads and under the same deadline.
+
+        Returns:
+            MarketSnapshot with daily/weekly OHLCV and REST payloads
+        """
+        data_config = self.config["data"]
+        logger.info("📡 Gathering live market snapshot...")
+        snapshot = asyncio.run(
+            gather_market_snapshot(
+                symbol=data_config["symbol"],
+                lookback_days=data_config["lookback_days"],
+                deadline=data_config.get("gather_deadline_seconds", DEFAULT_DEADLINE),
+                previous=self.market_data,
+            )
+        )
+        self.market_data = {"daily": snapshot.daily, "weekly": snapshot.weekly}
+        return snapshot
+
+    def load_market_data(self) -> dict[str, pd.DataFrame]:
+        """
+        Daily/weekly данни за анализа
+
+        Първият run изтегля цялата история; следващите добавят само новите
+        свещи (update_bnb_data), така ATH обогатяването и data quality
+        проверките струват константно време за live update.
+
+        Returns:
+            Dict с "daily" и "weekly" DataFrames
+        """
+        if self.market_data is None:
+            lookback_days = self.config["data"]["lookback_days"]
+            self.market_data = self.data_fetcher.fetch_bnb_data(lookback_days)
+        else:
+            self.market_data = self.data_fetcher.update_bnb_data(self.market_data)
+        return self.market_data
+
+    def run_analysis(self, snapshot: MarketSnapshot | None = None) -> dict[str, Any]:
         """
         Execute complete trading analysis pipeline.
 
+        Args:
+            snapshot: Pre-gathered market data (fetched sequentially if None)
+
         Returns:
             Complete analysis results with signal and metadata
         """
         try:
             # Step 1: Fetch data
-            logger.info("📊 Fetching market data...")
-            lookback_days = self.config["data"]["lookback_days"]
-            data = self.data_fetcher.fetch_bnb_data(lookback_days)
-
-            daily_df = data["daily"]
-            weekly_df = data["weekly"]
+            if snapshot is None:
+                logger.info("📊 Fetching market data...")
+                data = self.load_market_data()
+                daily_df = data["daily"]
+                weekly_df = data["weekly"]
+            else:
+                daily_df = snapshot.daily
+                weekly_df = snapshot.weekly
 
             # Debug breakpoint as per REc.md plan
             logger.debug(
@@ -161,7 +218,7 @@ class TradingPipeline:
 
             # 1. 📐 Fibonacci Analysis (35% weight - PRIMARY)
             try:
-                fib_analyzer = FibonacciAnalyzer(self.config)
+                fib_analyzer = get_analyzer(FibonacciAnalyzer, self.config)
                 fib_result = fib_analyzer.analyze_fibonacci_trend(daily_df)
                 # Extract the signal part for combiner compatibility
                 fib_signal = fib_result.get("fibonacci_signal", {})
@@ -176,7 +233,7 @@ class TradingPipeline:
 
             # 2. 🔍 Weekly Tails Analysis (40% weight - DOMINANT)
             try:
-                tails_analyzer = WeeklyTailsAnalyzer(self.config)
+                tails_analyzer = get_analyzer(WeeklyTailsAnalyzer, self.config)
                 tails_result = tails_analyzer.analyze_weekly_tails_trend(weekly_df)
                 # Extract the signal part for combiner compatibility
                 analyses["weekly_tails"] = tails_result.get(
@@ -189,7 +246,7 @@ class TradingPipeline:
 
             # 3. 📊 Technical Indicators (RSI, MACD, BB)
             try:
-                tech_indicators = TechnicalIndicators(self.config)
+                tech_indicators = get_analyzer(TechnicalIndicators, self.config)
                 tech_indicators.calculate_indicators(daily_df)
                 rsi_signals = tech_indicators.get_rsi_signals(daily_df)
                 macd_signals = tech_indicators.get_macd_signals(daily_df)
@@ -209,7 +266,7 @@ class TradingPipeline:
 
             # 4. 🎯 Optimal Levels Analysis (Entry/Exit zones)
             try:
-                levels_analyzer = OptimalLevelsAnalyzer(self.config)
+                levels_analyzer = get_analyzer(OptimalLevelsAnalyzer, self.config)
                 levels_result = levels_analyzer.analyze_optimal_levels(
                     daily_df, weekly_df
                 )
@@ -221,7 +278,7 @@ class TradingPipeline:
 
             # 5. 🌊 Elliott Wave Analysis
             try:
-                elliott_analyzer = ElliottWaveAnalyzer(self.config)
+                elliott_analyzer = get_analyzer(ElliottWaveAnalyzer, self.config)
                 elliott_result = elliott_analyzer.analyze_elliott_wave(
                     daily_df, weekly_df
                 )
@@ -233,7 +290,7 @@ class TradingPipeline:
 
             # 6. 🐋 Whale Activity Tracking
             try:
-                whale_tracker = WhaleTracker(self.config)
+                whale_tracker = get_analyzer(WhaleTracker, self.config)
                 whale_result = whale_tracker.get_whale_activity_summary(
                     7
                 )  # Last 7 days
@@ -245,7 +302,7 @@ class TradingPipeline:
 
             # 7. 🏮 Ichimoku Cloud Analysis
             try:
-                ichimoku_analyzer = IchimokuAnalyzer(self.config)
+                ichimoku_analyzer = get_analyzer(IchimokuAnalyzer, self.config)
                 ichimoku_data = ichimoku_analyzer.calculate_all_ichimoku_lines(daily_df)
                 ichimoku_signals = ichimoku_analyzer.analyze_ichimoku_signals(
                     ichimoku_data
@@ -258,7 +315,7 @@ class TradingPipeline:
 
             # 8. 📈 Trend Analysis
             try:
-                trend_analyzer = TrendAnalyzer(self.config)
+                trend_analyzer = get_analyzer(TrendAnalyzer, self.config)
                 trend_result = trend_analyzer.analyze_trend(daily_df, weekly_df)
                 analyses["trend"] = trend_result
                 logger.info("✅ Trend analysis completed")
@@ -268,7 +325,7 @@ class TradingPipeline:
 
             # 9. 📊 Moving Averages Analysis
             try:
-                ma_analyzer = MovingAveragesAnalyzer(self.config)
+                ma_analyzer = get_analyzer(MovingAveragesAnalyzer, self.config)
                 ma_result = ma_analyzer.analyze_moving_averages(daily_df)
                 analyses["moving_averages"] = ma_result
                 logger.info("✅ Moving averages analysis completed")
@@ -280,7 +337,7 @@ class TradingPipeline:
             try:
                 from bnb_trading.sentiment_module import SentimentAnalyzer
 
-                sentiment_analyzer = SentimentAnalyzer(self.config)
+                sentiment_analyzer = get_analyzer(SentimentAnalyzer, self.config)
                 # Get dummy sentiment data for now
                 fear_greed = 50.0  # Neutral
                 social = {"sentiment": "NEUTRAL", "confidence": 0.5}
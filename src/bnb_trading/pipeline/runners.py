@@ -32,8 +32,9 @@ class PipelineRunner:
         try:
             logger.info("🔴 LIVE: Starting real-time analysis...")
 
-            # Use the existing pipeline.run_analysis() method
-            results = self.pipeline.run_analysis()
+            # All remote reads at once, then analysis on the snapshot
+            snapshot = self.pipeline.gather_snapshot()
+            results = self.pipeline.run_analysis(snapshot)
 
             logger.info("🔴 LIVE: Analysis completed successfully")
             return results
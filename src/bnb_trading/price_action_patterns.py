@@ -138,14 +138,99 @@ DATE: 2024-01-01
 """
 
 import logging
+from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
 import pandas as pd
 
+from .data.schema import OHLCV
+
 logger = logging.getLogger(__name__)
 
 
+def _local_extrema(data: np.ndarray, peak_type: str) -> list[tuple[int, float]]:
+    """Локални пикове ("high") или дъна ("low") спрямо двата съседа"""
+    data = np.asarray(data, dtype=float)
+    if data.size < 3:
+        return []
+    middle, before, after = data[1:-1], data[:-2], data[2:]
+    if peak_type == "high":
+        mask = (middle > before) & (middle > after)
+    else:
+        mask = (middle < before) & (middle < after)
+    indices = np.flatnonzero(mask) + 1
+    return list(zip(indices.tolist(), data[indices].tolist(), strict=True))
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CandleAnatomy:
+    """
+    Анатомия на всички свещи наведнъж (масиви с дължината на данните)
+
+    Колоните идват от каноничната OHLCV схема; body, shadows, wick ratios,
+    посоката на свещите и локалните пикове/дъна се споделят от всички
+    pattern детектори. ``volume`` е None при данни без обем.
+    """
+
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray | None
+    body: np.ndarray
+    upper_shadow: np.ndarray
+    lower_shadow: np.ndarray
+    upper_wick_ratio: np.ndarray
+    lower_wick_ratio: np.ndarray
+    bearish: np.ndarray
+    bullish: np.ndarray
+    peaks: list[tuple[int, float]]
+    troughs: list[tuple[int, float]]
+
+    def __len__(self) -> int:
+        return self.close.size
+
+
+def candle_anatomy(price_data: pd.DataFrame) -> CandleAnatomy:
+    """
+    Изчислява анатомията на всички свещи с едно векторно минаване
+
+    Args:
+        price_data: DataFrame с OHLC колони (канонични или с друг регистър)
+
+    Returns:
+        CandleAnatomy; wick ratio е 0 при нулево body
+    """
+    ohlcv = OHLCV.from_frame(price_data)
+    ohlcv.require("open", "high", "low", "close")
+    opens, highs, lows, closes = ohlcv.open, ohlcv.high, ohlcv.low, ohlcv.close
+
+    body = np.abs(closes - opens)
+    upper_shadow = highs - np.maximum(opens, closes)
+    lower_shadow = np.minimum(opens, closes) - lows
+    with np.errstate(divide="ignore", invalid="ignore"):
+        upper_wick_ratio = np.where(body > 0, upper_shadow / body, 0.0)
+        lower_wick_ratio = np.where(body > 0, lower_shadow / body, 0.0)
+
+    return CandleAnatomy(
+        open=opens,
+        high=highs,
+        low=lows,
+        close=closes,
+        volume=ohlcv.volume,
+        body=body,
+        upper_shadow=upper_shadow,
+        lower_shadow=lower_shadow,
+        upper_wick_ratio=upper_wick_ratio,
+        lower_wick_ratio=lower_wick_ratio,
+        bearish=closes < opens,
+        bullish=closes > opens,
+        peaks=_local_extrema(highs, "high"),
+        troughs=_local_extrema(lows, "low"),
+    )
+
+
 class PriceActionPatternsAnalyzer:
     """
     Advanced Price Action Pattern Recognition Engine for Technical Analysis
@@ -286,22 +371,27 @@ class PriceActionPatternsAnalyzer:
                 "overall_pattern": "NONE",
             }
 
+            # Анатомия и пикове/дъна веднъж за всички детектори
+            candles = candle_anatomy(price_data)
+
             # 1. Double Top Pattern
-            patterns["double_top"] = self._detect_double_top(price_data)
+            patterns["double_top"] = self._detect_double_top(price_data, candles)
 
             # 2. Double Bottom Pattern
-            patterns["double_bottom"] = self._detect_double_bottom(price_data)
+            patterns["double_bottom"] = self._detect_double_bottom(price_data, candles)
 
             # 3. Head & Shoulders Pattern
-            patterns["head_shoulders"] = self._detect_head_shoulders(price_data)
+            patterns["head_shoulders"] = self._detect_head_shoulders(
+                price_data, candles
+            )
 
             # 4. Inverse Head & Shoulders Pattern
             patterns["inverse_head_shoulders"] = self._detect_inverse_head_shoulders(
-                price_data
+                price_data, candles
             )
 
             # 5. Triangle Pattern
-            patterns["triangle"] = self._detect_triangle(price_data)
+            patterns["triangle"] = self._detect_triangle(price_data, candles)
 
             # 6. Wedge Pattern
             patterns["wedge"] = self._detect_wedge(price_data)
@@ -315,7 +405,9 @@ class PriceActionPatternsAnalyzer:
             logger.exception(f"Грешка при откриване на patterns: {e}")
             return {"error": f"Грешка: {e}"}
 
-    def _detect_double_top(self, price_data: pd.DataFrame) -> dict:
+    def _detect_double_top(
+        self, price_data: pd.DataFrame, candles: CandleAnatomy | None = None
+    ) -> dict:
         """Открива Double Top pattern (bearish reversal)"""
         try:
             if len(price_data) < 20:
@@ -325,24 +417,10 @@ class PriceActionPatternsAnalyzer:
                     "reason": "Недостатъчно данни",
                 }
 
-            highs = (
-                price_data["high"].values
-                if "high" in price_data.columns
-                else price_data["High"].values
-            )
-            lows = (  # noqa: F841
-                price_data["low"].values
-                if "low" in price_data.columns
-                else price_data["Low"].values
-            )
-            closes = (  # noqa: F841
-                price_data["close"].values
-                if "close" in price_data.columns
-                else price_data["Close"].values
-            )
+            candles = candles or candle_anatomy(price_data)
 
-            # Намираме пикове в high цените
-            peaks = self._find_peaks(highs, "high")
+            # Пикове в high цените
+            peaks = candles.peaks
 
             if len(peaks) < 2:
                 return {
@@ -366,19 +444,19 @@ class PriceActionPatternsAnalyzer:
                 and peak2_idx > peak1_idx
             ):  # Вторият пик е по-нов
                 # Проверяваме за neckline (support level между пикове)
-                neckline = self._find_neckline(price_data, peak1_idx, peak2_idx)
+                neckline = self._find_neckline(candles, peak1_idx, peak2_idx)
 
                 # Проверяваме за volume confirmation
                 volume_confirmed = False
-                if self.volume_confirmation and "volume" in price_data.columns:
+                if self.volume_confirmation and candles.volume is not None:
                     volume_confirmed = self._check_volume_confirmation(
-                        price_data, peak2_idx
+                        candles, peak2_idx
                     )
 
                 # Проверяваме за bearish candle confirmation
                 candle_confirmed = False
                 if self.candle_confirmation:
-                    candle_confirmed = self._check_bearish_candle(price_data, peak2_idx)
+                    candle_confirmed = self._check_bearish_candle(candles, peak2_idx)
 
                 # Изчисляваме confidence
                 confidence = 60  # Base confidence
@@ -417,7 +495,9 @@ class PriceActionPatternsAnalyzer:
             logger.exception(f"Грешка при откриване на double top: {e}")
             return {"detected": False, "confidence": 0, "reason": f"Грешка: {e}"}
 
-    def _detect_double_bottom(self, price_data: pd.DataFrame) -> dict:
+    def _detect_double_bottom(
+        self, price_data: pd.DataFrame, candles: CandleAnatomy | None = None
+    ) -> dict:
         """Открива Double Bottom pattern (bullish reversal)"""
         try:
             if len(price_data) < 20:
@@ -427,24 +507,10 @@ class PriceActionPatternsAnalyzer:
                     "reason": "Недостатъчно данни",
                 }
 
-            highs = (  # noqa: F841
-                price_data["high"].values
-                if "high" in price_data.columns
-                else price_data["High"].values
-            )
-            lows = (
-                price_data["low"].values
-                if "low" in price_data.columns
-                else price_data["Low"].values
-            )
-            closes = (  # noqa: F841
-                price_data["close"].values
-                if "close" in price_data.columns
-                else price_data["Close"].values
-            )
+            candles = candles or candle_anatomy(price_data)
 
-            # Намираме дъна в low цените
-            troughs = self._find_peaks(lows, "low")
+            # Дъна в low цените
+            troughs = candles.troughs
 
             if len(troughs) < 2:
                 return {
@@ -468,22 +534,20 @@ class PriceActionPatternsAnalyzer:
             ):  # Второто дъно е по-ново
                 # Проверяваме за neckline (resistance level между дъна)
                 neckline = self._find_neckline(
-                    price_data, trough1_idx, trough2_idx, is_resistance=True
+                    candles, trough1_idx, trough2_idx, is_resistance=True
                 )
 
                 # Проверяваме за volume confirmation
                 volume_confirmed = False
-                if self.volume_confirmation and "volume" in price_data.columns:
+                if self.volume_confirmation and candles.volume is not None:
                     volume_confirmed = self._check_volume_confirmation(
-                        price_data, trough2_idx
+                        candles, trough2_idx
                     )
 
                 # Проверяваме за bullish candle confirmation
                 candle_confirmed = False
                 if self.candle_confirmation:
-                    candle_confirmed = self._check_bullish_candle(
-                        price_data, trough2_idx
-                    )
+                    candle_confirmed = self._check_bullish_candle(candles, trough2_idx)
 
                 # Изчисляваме confidence
                 confidence = 60  # Base confidence
@@ -524,7 +588,9 @@ class PriceActionPatternsAnalyzer:
             logger.exception(f"Грешка при откриване на double bottom: {e}")
             return {"detected": False, "confidence": 0, "reason": f"Грешка: {e}"}
 
-    def _detect_head_shoulders(self, price_data: pd.DataFrame) -> dict:
+    def _detect_head_shoulders(
+        self, price_data: pd.DataFrame, candles: CandleAnatomy | None = None
+    ) -> dict:
         """Открива Head & Shoulders pattern (bearish reversal)"""
         try:
             if len(price_data) < 30:
@@ -534,14 +600,10 @@ class PriceActionPatternsAnalyzer:
                     "reason": "Недостатъчно данни за H&S",
                 }
 
-            highs = (
-                price_data["high"].values
-                if "high" in price_data.columns
-                else price_data["High"].values
-            )
+            candles = candles or candle_anatomy(price_data)
 
-            # Намираме пикове
-            peaks = self._find_peaks(highs, "high")
+            # Пикове от споделената анатомия
+            peaks = candles.peaks
 
             if len(peaks) < 3:
                 return {
@@ -566,7 +628,7 @@ class PriceActionPatternsAnalyzer:
             ):  # Раменете са близки
                 # Проверяваме за neckline
                 neckline = self._find_neckline(
-                    price_data, left_shoulder_idx, right_shoulder_idx
+                    candles, left_shoulder_idx, right_shoulder_idx
                 )
 
                 confidence = 70  # Base confidence за H&S
@@ -595,7 +657,9 @@ class PriceActionPatternsAnalyzer:
             logger.exception(f"Грешка при откриване на Head & Shoulders: {e}")
             return {"detected": False, "confidence": 0, "reason": f"Грешка: {e}"}
 
-    def _detect_inverse_head_shoulders(self, price_data: pd.DataFrame) -> dict:
+    def _detect_inverse_head_shoulders(
+        self, price_data: pd.DataFrame, candles: CandleAnatomy | None = None
+    ) -> dict:
         """Открива Inverse Head & Shoulders pattern (bullish reversal)"""
         try:
             if len(price_data) < 30:
@@ -605,14 +669,10 @@ class PriceActionPatternsAnalyzer:
                     "reason": "Недостатъчно данни за IH&S",
                 }
 
-            lows = (
-                price_data["low"].values
-                if "low" in price_data.columns
-                else price_data["Low"].values
-            )
+            candles = candles or candle_anatomy(price_data)
 
-            # Намираме дъна
-            troughs = self._find_peaks(lows, "low")
+            # Дъна от споделената анатомия
+            troughs = candles.troughs
 
             if len(troughs) < 3:
                 return {
@@ -637,7 +697,7 @@ class PriceActionPatternsAnalyzer:
             ):  # Раменете са близки
                 # Проверяваме за neckline
                 neckline = self._find_neckline(
-                    price_data,
+                    candles,
                     left_shoulder_idx,
                     right_shoulder_idx,
                     is_resistance=True,
@@ -669,7 +729,9 @@ class PriceActionPatternsAnalyzer:
             logger.exception(f"Грешка при откриване на Inverse Head & Shoulders: {e}")
             return {"detected": False, "confidence": 0, "reason": f"Грешка: {e}"}
 
-    def _detect_triangle(self, price_data: pd.DataFrame) -> dict:
+    def _detect_triangle(
+        self, price_data: pd.DataFrame, candles: CandleAnatomy | None = None
+    ) -> dict:
         """Открива Triangle pattern"""
         try:
             if len(price_data) < 20:
@@ -679,20 +741,10 @@ class PriceActionPatternsAnalyzer:
                     "reason": "Недостатъчно данни за triangle",
                 }
 
-            highs = (
-                price_data["high"].values
-                if "high" in price_data.columns
-                else price_data["High"].values
-            )
-            lows = (
-                price_data["low"].values
-                if "low" in price_data.columns
-                else price_data["Low"].values
-            )
+            candles = candles or candle_anatomy(price_data)
 
-            # Намираме пикове и дъна
-            peaks = self._find_peaks(highs, "high")
-            troughs = self._find_peaks(lows, "low")
+            # Пикове и дъна от споделената анатомия
+            peaks, troughs = candles.peaks, candles.troughs
 
             if len(peaks) < 2 or len(troughs) < 2:
                 return {
@@ -738,18 +790,7 @@ class PriceActionPatternsAnalyzer:
     def _find_peaks(self, data: np.ndarray, peak_type: str) -> list[tuple[int, float]]:
         """Намира пикове в данните"""
         try:
-            peaks = []
-
-            if peak_type == "high":
-                for i in range(1, len(data) - 1):
-                    if data[i] > data[i - 1] and data[i] > data[i + 1]:
-                        peaks.append((i, data[i]))
-            else:  # low
-                for i in range(1, len(data) - 1):
-                    if data[i] < data[i - 1] and data[i] < data[i + 1]:
-                        peaks.append((i, data[i]))
-
-            return peaks
+            return _local_extrema(data, peak_type)
 
         except Exception as e:
             logger.exception(f"Грешка при намиране на пикове: {e}")
@@ -757,7 +798,7 @@ class PriceActionPatternsAnalyzer:
 
     def _find_neckline(
         self,
-        price_data: pd.DataFrame,
+        candles: CandleAnatomy,
         idx1: int,
         idx2: int,
         is_resistance: bool = False,
@@ -767,31 +808,24 @@ class PriceActionPatternsAnalyzer:
             if idx1 >= idx2:
                 return 0.0
 
-            # Взимаме данните между двата пика/дъна
-            between_data = price_data.iloc[idx1 : idx2 + 1]
-
+            # За resistance neckline - най-високата точка, иначе най-ниската
             if is_resistance:
-                # За resistance neckline, търсим най-високата точка
-                high_col = "high" if "high" in between_data.columns else "High"
-                return float(between_data[high_col].max())
-            # За support neckline, търсим най-ниската точка
-            low_col = "low" if "low" in between_data.columns else "Low"
-            return float(between_data[low_col].min())
+                return float(np.nanmax(candles.high[idx1 : idx2 + 1]))
+            return float(np.nanmin(candles.low[idx1 : idx2 + 1]))
 
         except Exception as e:
             logger.exception(f"Грешка при намиране на neckline: {e}")
             return 0.0
 
     def _check_volume_confirmation(
-        self, price_data: pd.DataFrame, pattern_idx: int
+        self, candles: CandleAnatomy, pattern_idx: int
     ) -> bool:
         """Проверява volume confirmation за pattern"""
         try:
-            if "volume" not in price_data.columns:
+            volumes = candles.volume
+            if volumes is None:
                 return False
 
-            volumes = price_data["volume"].values
-
             if pattern_idx >= len(volumes):
                 return False
 
@@ -806,57 +840,31 @@ class PriceActionPatternsAnalyzer:
             logger.exception(f"Грешка при проверка на volume confirmation: {e}")
             return False
 
-    def _check_bearish_candle(self, price_data: pd.DataFrame, pattern_idx: int) -> bool:
-        """Проверява за bearish candle confirmation"""
+    def _check_bearish_candle(self, candles: CandleAnatomy, pattern_idx: int) -> bool:
+        """Проверява за bearish candle с long upper shadow (resistance)"""
         try:
-            if pattern_idx >= len(price_data):
+            if pattern_idx >= len(candles):
                 return False
 
-            candle = price_data.iloc[pattern_idx]
-            open_price = candle["open"] if "open" in candle.index else candle["Open"]
-            close_price = (
-                candle["close"] if "close" in candle.index else candle["Close"]
+            return bool(
+                candles.bearish[pattern_idx]
+                and candles.upper_shadow[pattern_idx] > candles.body[pattern_idx] * 0.5
             )
-            high_price = candle["high"] if "high" in candle.index else candle["High"]
-            candle["low"] if "low" in candle.index else candle["Low"]
-
-            # Bearish candle: close < open
-            if close_price < open_price:
-                # Проверяваме за long upper shadow (resistance)
-                upper_shadow = high_price - max(open_price, close_price)
-                body_size = abs(close_price - open_price)
-
-                return upper_shadow > body_size * 0.5
-
-            return False
 
         except Exception as e:
             logger.exception(f"Грешка при проверка на bearish candle: {e}")
             return False
 
-    def _check_bullish_candle(self, price_data: pd.DataFrame, pattern_idx: int) -> bool:
-        """Проверява за bullish candle confirmation"""
+    def _check_bullish_candle(self, candles: CandleAnatomy, pattern_idx: int) -> bool:
+        """Проверява за bullish candle с long lower shadow (support)"""
         try:
-            if pattern_idx >= len(price_data):
+            if pattern_idx >= len(candles):
                 return False
 
-            candle = price_data.iloc[pattern_idx]
-            open_price = candle["open"] if "open" in candle.index else candle["Open"]
-            close_price = (
-                candle["close"] if "close" in candle.index else candle["Close"]
+            return bool(
+                candles.bullish[pattern_idx]
+                and candles.lower_shadow[pattern_idx] > candles.body[pattern_idx] * 0.5
             )
-            candle["high"] if "high" in candle.index else candle["High"]
-            low_price = candle["low"] if "low" in candle.index else candle["Low"]
-
-            # Bullish candle: close > open
-            if close_price > open_price:
-                # Проверяваме за long lower shadow (support)
-                lower_shadow = min(open_price, close_price) - low_price
-                body_size = abs(close_price - open_price)
-
-                return lower_shadow > body_size * 0.5
-
-            return False
 
         except Exception as e:
             logger.exception(f"Грешка при проверка на bullish candle: {e}")
@@ -905,50 +913,22 @@ class PriceActionPatternsAnalyzer:
                     ),
                 }
 
-            # Анализираме всяка свещ за rejection patterns
-            rejection_signals = []
-
-            for idx in range(len(recent_data)):
-                candle = recent_data.iloc[idx]
-
-                # Извличаме OHLC данни
-                open_price = (
-                    candle["open"] if "open" in candle.index else candle["Open"]
-                )
-                close_price = (
-                    candle["close"] if "close" in candle.index else candle["Close"]
-                )
-                high_price = (
-                    candle["high"] if "high" in candle.index else candle["High"]
-                )
-                low_price = candle["low"] if "low" in candle.index else candle["Low"]
-
-                # Изчисляваме body и shadows
-                body_size = abs(close_price - open_price)
-                upper_shadow = high_price - max(open_price, close_price)
-                min(open_price, close_price) - low_price
-
-                # Проверяваме за bearish rejection (SHORT сигнал)
-                if (
-                    close_price < open_price and upper_shadow > 0
-                ):  # Bearish candle с upper shadow
-                    wick_ratio = upper_shadow / body_size if body_size > 0 else 0
-
-                    if wick_ratio >= wick_ratio_threshold:
-                        rejection_strength = min(wick_ratio / wick_ratio_threshold, 1.0)
-
-                        rejection_signals.append(
-                            {
-                                "index": idx,
-                                "date": recent_data.index[idx],
-                                "wick_ratio": wick_ratio,
-                                "strength": rejection_strength,
-                                "high": high_price,
-                                "close": close_price,
-                                "body_size": body_size,
-                                "upper_shadow": upper_shadow,
-                            }
-                        )
+            # Bearish свещи с upper shadow и wick ratio над прага (векторно)
+            candles = candle_anatomy(recent_data)
+            strength = self._rejection_strength(candles, wick_ratio_threshold)
+            rejection_signals = [
+                {
+                    "index": idx,
+                    "date": recent_data.index[idx],
+                    "wick_ratio": float(candles.upper_wick_ratio[idx]),
+                    "strength": float(strength[idx]),
+                    "high": float(candles.high[idx]),
+                    "close": float(candles.close[idx]),
+                    "body_size": float(candles.body[idx]),
+                    "upper_shadow": float(candles.upper_shadow[idx]),
+                }
+                for idx in np.flatnonzero(strength > 0).tolist()
+            ]
 
             # Оценяваме общия rejection сигнал
             if rejection_signals:
@@ -997,6 +977,65 @@ class PriceActionPatternsAnalyzer:
                 "error": str(e),
             }
 
+    @staticmethod
+    def _rejection_strength(
+        candles: CandleAnatomy, wick_ratio_threshold: float
+    ) -> np.ndarray:
+        """Rejection strength за всяка свещ (0 където няма bearish rejection)"""
+        rejection = (
+            candles.bearish
+            & (candles.upper_shadow > 0)
+            & (candles.upper_wick_ratio >= wick_ratio_threshold)
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            strength = np.minimum(candles.upper_wick_ratio / wick_ratio_threshold, 1.0)
+        return np.where(rejection, strength, 0.0)
+
+    def rejection_history(self, price_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Rejection анализ за всяка свещ наведнъж (batch версия)
+
+        За всяка свещ дава резултата, който ``analyze_rejection_patterns``
+        връща за данните до нея включително, без повторно обхождане.
+
+        Args:
+            price_data: DataFrame с OHLCV данни
+
+        Returns:
+            DataFrame (индекс като price_data) с wick_ratio и strength на
+            свещта, rejections (брой в прозореца), best_strength и
+            rejection_detected; NaN/False докато прозорецът не е пълен
+        """
+        config = self.config.get("short_signals", {})
+        wick_ratio_threshold = config.get("rejection_wick_ratio", 2.0)
+        lookback_periods = config.get("rejection_lookback_periods", 5)
+        strength_threshold = config.get("rejection_strength_threshold", 0.7)
+
+        candles = candle_anatomy(price_data)
+        strength = self._rejection_strength(candles, wick_ratio_threshold)
+        rolling = pd.Series(strength, index=price_data.index).rolling(lookback_periods)
+        best_strength = rolling.max().to_numpy()
+        rejections = (
+            pd.Series(strength > 0, index=price_data.index, dtype=float)
+            .rolling(lookback_periods)
+            .sum()
+            .to_numpy()
+        )
+
+        detected = (rejections > 0) & (best_strength >= strength_threshold)
+        if not config.get("price_action_rejection", True):
+            detected[:] = False
+        return pd.DataFrame(
+            {
+                "wick_ratio": candles.upper_wick_ratio,
+                "strength": strength,
+                "rejections": rejections,
+                "best_strength": best_strength,
+                "rejection_detected": detected,
+            },
+            index=price_data.index,
+        )
+
     def _determine_overall_pattern(self, patterns: dict) -> str:
         """Определя overall pattern от всички открити"""
         try:
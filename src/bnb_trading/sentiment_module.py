@@ -91,7 +91,7 @@ EXAMPLE USAGE:
     ...     print(f"Contrarian BUY opportunity detected - Fear & Greed: {fear_greed['score']}")
 
 DEPENDENCIES:
-    - requests: HTTP API communication for external data sources
+    - data.http: Shared pooled HTTP client (keep-alive, TTL cache)
     - datetime/timedelta: Date and time manipulation
     - json: JSON data parsing and formatting
     - re: Regular expressions for text analysis
@@ -136,10 +136,15 @@ DATE: 2024-01-01
 import logging
 from datetime import datetime, timedelta
 
-import requests
+from .core.exceptions import DataError, NetworkError
+from .data.http import get_http_client
+from .data.resample import CLOSE, KlineResampler
 
 logger = logging.getLogger(__name__)
 
+# Momentum timeframes -> брой свещи (една 1h заявка, 4h/1d се агрегират локално)
+MOMENTUM_TIMEFRAMES = {"1h": 24, "4h": 24, "1d": 24}
+
 
 class SentimentAnalyzer:
     """
@@ -250,22 +255,6 @@ class SentimentAnalyzer:
         self.base_url = base_url
         self.DEFAULT_TIMEOUT = 10  # Default timeout for all HTTP requests
 
-        # Configure session with retries
-        import requests
-        from requests.adapters import HTTPAdapter
-        from urllib3.util.retry import Retry
-
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[502, 503, 504],
-            raise_on_status=False,
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-
         # Fear & Greed thresholds
         self.fear_greed_levels = {
             "extreme_fear": (0, 20),
@@ -352,55 +341,53 @@ class SentimentAnalyzer:
 
         try:
             # Get market data to simulate Fear & Greed
-            response = self.session.get(
+            data = get_http_client().get_json(
                 f"{self.base_url}/ticker/24hr",
                 params={"symbol": "BNBUSDT"},
-                timeout=(2, 10),
+                timeout=self.DEFAULT_TIMEOUT,
             )
 
-            if response.status_code == 200:
-                data = response.json()
-                price_change = float(data["priceChangePercent"])
-                volume = float(data["volume"])
-
-                # Simulate Fear & Greed based on price action and volume
-                base_score = 50  # Neutral baseline
-
-                # Price influence (±30 points)
-                if price_change > 5:
-                    price_factor = min(30, price_change * 3)
-                elif price_change < -5:
-                    price_factor = max(-30, price_change * 3)
-                else:
-                    price_factor = price_change * 2
-
-                # Volume influence (±10 points)
-                volume_factor = (
-                    min(10, (volume - 400000) / 50000)
-                    if volume > 400000
-                    else max(-10, (volume - 400000) / 50000)
-                )
+            price_change = float(data["priceChangePercent"])
+            volume = float(data["volume"])
+
+            # Simulate Fear & Greed based on price action and volume
+            base_score = 50  # Neutral baseline
+
+            # Price influence (±30 points)
+            if price_change > 5:
+                price_factor = min(30, price_change * 3)
+            elif price_change < -5:
+                price_factor = max(-30, price_change * 3)
+            else:
+                price_factor = price_change * 2
 
-                # Calculate final score
-                fear_greed_score = int(base_score + price_factor + volume_factor)
-                fear_greed_score = max(0, min(100, fear_greed_score))  # Clamp to 0-100
-
-                # Determine level
-                level = self.get_fear_greed_level(fear_greed_score)
-
-                return {
-                    "score": fear_greed_score,
-                    "level": level,
-                    "timestamp": datetime.now(),
-                    "previous_score": fear_greed_score - 3,  # Simulated previous
-                    "change": 3,
-                    "factors": {
-                        "price_change": price_change,
-                        "volume": volume,
-                        "price_factor": round(price_factor, 1),
-                        "volume_factor": round(volume_factor, 1),
-                    },
-                }
+            # Volume influence (±10 points)
+            volume_factor = (
+                min(10, (volume - 400000) / 50000)
+                if volume > 400000
+                else max(-10, (volume - 400000) / 50000)
+            )
+
+            # Calculate final score
+            fear_greed_score = int(base_score + price_factor + volume_factor)
+            fear_greed_score = max(0, min(100, fear_greed_score))  # Clamp to 0-100
+
+            # Determine level
+            level = self.get_fear_greed_level(fear_greed_score)
+
+            return {
+                "score": fear_greed_score,
+                "level": level,
+                "timestamp": datetime.now(),
+                "previous_score": fear_greed_score - 3,  # Simulated previous
+                "change": 3,
+                "factors": {
+                    "price_change": price_change,
+                    "volume": volume,
+                    "price_factor": round(price_factor, 1),
+                    "volume_factor": round(volume_factor, 1),
+                },
+            }
         except Exception as e:
             print(f"Error getting Fear & Greed Index: {e}")
 
@@ -583,37 +570,31 @@ class SentimentAnalyzer:
     def get_market_momentum_indicators(self) -> dict:
         """Get momentum indicators that affect sentiment"""
         try:
-            # Get multiple timeframe data
-            intervals = ["1h", "4h", "1d"]
+            # Get multiple timeframe data from one request
             momentum_data = {}
-
-            for interval in intervals:
-                try:
-                    response = requests.get(
-                        f"{self.base_url}/klines",
-                        params={"symbol": "BNBUSDT", "interval": interval, "limit": 24},
-                        timeout=self.DEFAULT_TIMEOUT,
-                    )
-
-                    if response.status_code == 200:
-                        klines = response.json()
-                        closes = [float(k[4]) for k in klines]
-
-                        if len(closes) >= 2:
-                            price_change = (closes[-1] - closes[0]) / closes[0] * 100
-                            momentum_data[interval] = {
-                                "price_change": round(price_change, 2),
-                                "trend": (
-                                    "🟢 UP"
-                                    if price_change > 0
-                                    else "🔴 DOWN"
-                                    if price_change < 0
-                                    else "🟡 FLAT"
-                                ),
-                            }
-                except requests.exceptions.RequestException as e:
-                    logger.error(f"Request failed for {interval} klines: {e}")
-                    continue
+            try:
+                frames = KlineResampler(
+                    "BNBUSDT", self.base_url, self.DEFAULT_TIMEOUT
+                ).timeframes(MOMENTUM_TIMEFRAMES)
+            except (NetworkError, DataError) as e:
+                logger.error(f"Request failed for momentum klines: {e}")
+                frames = {}
+
+            for interval, candles in frames.items():
+                closes = candles[:, CLOSE]
+
+                if len(closes) >= 2:
+                    price_change = float((closes[-1] - closes[0]) / closes[0] * 100)
+                    momentum_data[interval] = {
+                        "price_change": round(price_change, 2),
+                        "trend": (
+                            "🟢 UP"
+                            if price_change > 0
+                            else "🔴 DOWN"
+                            if price_change < 0
+                            else "🟡 FLAT"
+                        ),
+                    }
 
             # Calculate overall momentum score
             momentum_score = 50  # Neutral baseline
@@ -727,47 +708,46 @@ class SentimentAnalyzer:
 
         # Get current price for calculations
         try:
-            response = requests.get(
+            ticker = get_http_client().get_json(
                 f"{self.base_url}/ticker/price",
                 params={"symbol": "BNBUSDT"},
                 timeout=self.DEFAULT_TIMEOUT,
             )
-            if response.status_code == 200:
-                current_price = float(response.json()["price"])
-
-                if action in ["STRONG_BUY", "BUY"]:
-                    signals["entry_zones"] = [
-                        f"Current: ${current_price:.2f}",
-                        f"Pullback: ${current_price * 0.98:.2f}",
-                        f"Strong dip: ${current_price * 0.95:.2f}",
-                    ]
-                    signals["targets"] = [
-                        f"Target 1: ${current_price * 1.03:.2f}",
-                        f"Target 2: ${current_price * 1.05:.2f}",
-                        f"Target 3: ${current_price * 1.08:.2f}",
-                    ]
-                    signals["stop_loss"] = f"${current_price * 0.93:.2f}"
-                    signals["position_size"] = "25%" if action == "BUY" else "40%"
-
-                elif action in ["STRONG_SELL", "SELL"]:
-                    signals["entry_zones"] = [
-                        f"Current: ${current_price:.2f}",
-                        f"Bounce: ${current_price * 1.02:.2f}",
-                        f"Strong bounce: ${current_price * 1.05:.2f}",
-                    ]
-                    signals["targets"] = [
-                        f"Target 1: ${current_price * 0.97:.2f}",
-                        f"Target 2: ${current_price * 0.95:.2f}",
-                        f"Target 3: ${current_price * 0.92:.2f}",
-                    ]
-                    signals["stop_loss"] = f"${current_price * 1.07:.2f}"
-                    signals["position_size"] = "20%" if action == "SELL" else "35%"
-
-                # Adjust risk level based on sentiment strength
-                if score > 75 or score < 25:
-                    signals["risk_level"] = "high"
-                elif 40 <= score <= 60:
-                    signals["risk_level"] = "low"
+            current_price = float(ticker["price"])
+
+            if action in ["STRONG_BUY", "BUY"]:
+                signals["entry_zones"] = [
+                    f"Current: ${current_price:.2f}",
+                    f"Pullback: ${current_price * 0.98:.2f}",
+                    f"Strong dip: ${current_price * 0.95:.2f}",
+                ]
+                signals["targets"] = [
+                    f"Target 1: ${current_price * 1.03:.2f}",
+                    f"Target 2: ${current_price * 1.05:.2f}",
+                    f"Target 3: ${current_price * 1.08:.2f}",
+                ]
+                signals["stop_loss"] = f"${current_price * 0.93:.2f}"
+                signals["position_size"] = "25%" if action == "BUY" else "40%"
+
+            elif action in ["STRONG_SELL", "SELL"]:
+                signals["entry_zones"] = [
+                    f"Current: ${current_price:.2f}",
+                    f"Bounce: ${current_price * 1.02:.2f}",
+                    f"Strong bounce: ${current_price * 1.05:.2f}",
+                ]
+                signals["targets"] = [
+                    f"Target 1: ${current_price * 0.97:.2f}",
+                    f"Target 2: ${current_price * 0.95:.2f}",
+                    f"Target 3: ${current_price * 0.92:.2f}",
+                ]
+                signals["stop_loss"] = f"${current_price * 1.07:.2f}"
+                signals["position_size"] = "20%" if action == "SELL" else "35%"
+
+            # Adjust risk level based on sentiment strength
+            if score > 75 or score < 25:
+                signals["risk_level"] = "high"
+            elif 40 <= score <= 60:
+                signals["risk_level"] = "low"
 
         except Exception as e:
             print(f"Error generating trading signals: {e}")
@@ -1,11 +1,13 @@
 """Signal generation modules for BNB Trading System."""
 
-from .combiners import combine_signals
-from .confidence import calculate_confidence
+from .combiners import combine_signal_matrix, combine_signals
+from .confidence import calculate_confidence, confidence_matrix
 from .generator import SignalGenerator
 
 __all__ = [
     "SignalGenerator",
     "calculate_confidence",
+    "combine_signal_matrix",
     "combine_signals",
+    "confidence_matrix",
 ]
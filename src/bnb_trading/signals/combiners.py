@@ -1,13 +1,20 @@
 """Signal combination logic for BNB Trading System."""
 
 import logging
+from collections.abc import Mapping, Sequence
 from typing import Any
 
+import numpy as np
+
 from bnb_trading.core.constants import SIGNAL_HOLD, SIGNAL_LONG, SIGNAL_SHORT
 from bnb_trading.core.exceptions import AnalysisError
 
 logger = logging.getLogger(__name__)
 
+# Числови кодове на сигналите за матричния combiner
+SIGNAL_CODES = {SIGNAL_LONG: 1, SIGNAL_SHORT: -1, SIGNAL_HOLD: 0}
+SIGNAL_NAMES = np.array([SIGNAL_HOLD, SIGNAL_LONG, SIGNAL_SHORT])  # по код 0, 1, -1
+
 
 def combine_signals(
     analyses: dict[str, Any],
@@ -41,38 +48,21 @@ def combine_signals(
 
         # Process each analysis result
         for analysis_name, analysis_result in analyses.items():
-            logger.info(
-                f"Processing analysis: {analysis_name}, result: {type(analysis_result)}"
-            )
             if analysis_result is None or not isinstance(analysis_result, dict):
-                logger.info(f"Skipping {analysis_name}: invalid result type")
+                logger.debug(f"Skipping {analysis_name}: invalid result type")
                 continue
 
             weight = weights.get(analysis_name, 0.0)
             if weight == 0.0:
-                logger.info(f"Skipping {analysis_name}: zero weight")
+                logger.debug(f"Skipping {analysis_name}: zero weight")
                 continue
-            logger.info(f"Using {analysis_name} with weight {weight}")
 
             signal = analysis_result.get("signal", SIGNAL_HOLD)
-            strength = analysis_result.get("strength", 0.0)
-            logger.info(
-                f"  {analysis_name}: signal={signal}, strength={strength} (type: {type(strength)})"
+            strength = _numeric_strength(analysis_result)
+            logger.debug(
+                f"  {analysis_name}: signal={signal}, strength={strength}, weight={weight}"
             )
 
-            # Ensure strength is numeric
-            if isinstance(strength, str):
-                # Try to extract numeric value from string or use confidence instead
-                confidence = analysis_result.get("confidence", 0.0)
-                if isinstance(confidence, (int, float)):
-                    strength = (
-                        float(confidence) / 100.0 if confidence > 1 else confidence
-                    )
-                else:
-                    strength = 0.0
-            elif not isinstance(strength, (int, float)):
-                strength = 0.0
-
             # Apply weighted scoring
             weighted_strength = strength * weight
 
@@ -99,15 +89,10 @@ def combine_signals(
             long_score, short_score, total_weight, confidence_threshold
         )
 
-        # Debug logging
-        logger.info(
-            f"Signal combination: LONG={long_score:.3f}, SHORT={short_score:.3f}, Total_weight={total_weight:.3f}"
-        )
         logger.info(
-            f"Normalized: LONG={long_score / total_weight if total_weight > 0 else 0:.3f}, threshold={confidence_threshold}"
-        )
-        logger.info(
-            f"Final signal: {final_signal['signal']} (strength: {final_signal['strength']:.3f})"
+            f"Signal combination: LONG={long_score:.3f}, SHORT={short_score:.3f}, "
+            f"Total_weight={total_weight:.3f} -> {final_signal['signal']} "
+            f"(strength: {final_signal['strength']:.3f})"
         )
 
         return {
@@ -151,3 +136,135 @@ def _determine_final_signal(
         "signal": SIGNAL_HOLD,
         "strength": max(normalized_long, normalized_short),
     }
+
+
+def _numeric_strength(analysis_result: dict[str, Any]) -> float:
+    """Strength на модул като число (string strength -> confidence)."""
+    strength = analysis_result.get("strength", 0.0)
+    if isinstance(strength, str):
+        # Try to extract numeric value from string or use confidence instead
+        confidence = analysis_result.get("confidence", 0.0)
+        if isinstance(confidence, (int, float)):
+            return float(confidence) / 100.0 if confidence > 1 else confidence
+        return 0.0
+    if not isinstance(strength, (int, float)):
+        return 0.0
+    return strength
+
+
+def encode_signals(signals: np.ndarray | Sequence) -> np.ndarray:
+    """
+    Кодира сигнали като int8: LONG=1, SHORT=-1, всичко друго (HOLD) = 0
+
+    Args:
+        signals: Масив от низове или вече кодирани числа
+
+    Returns:
+        int8 масив със същата форма
+    """
+    signals = np.asarray(signals)
+    if signals.dtype.kind in "iuf":
+        return np.sign(signals).astype(np.int8)
+    return (
+        (signals == SIGNAL_LONG).astype(np.int8) - (signals == SIGNAL_SHORT)
+    ).astype(np.int8)
+
+
+def decode_signals(codes: np.ndarray) -> np.ndarray:
+    """Кодове (1, -1, 0) обратно към "LONG"/"SHORT"/"HOLD" низове."""
+    return SIGNAL_NAMES[np.asarray(codes, dtype=np.int8)]
+
+
+def analyses_to_matrix(
+    analyses_series: Sequence[Mapping[str, Any]], modules: Sequence[str]
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Серия от ``analyses`` dict-ове като (time x module) матрици
+
+    Невалидни или липсващи резултати стават NaN strength (пропускат се
+    като в ``combine_signals``).
+
+    Args:
+        analyses_series: По един ``analyses`` dict на timestamp
+        modules: Колоните (имена на модули) в реда на weight вектора
+
+    Returns:
+        Tuple: (signals int8 (T, M), strengths float (T, M))
+    """
+    signals = np.zeros((len(analyses_series), len(modules)), dtype=np.int8)
+    strengths = np.full(signals.shape, np.nan)
+    for t, analyses in enumerate(analyses_series):
+        for m, module in enumerate(modules):
+            result = analyses.get(module)
+            if isinstance(result, dict):
+                signals[t, m] = SIGNAL_CODES.get(result.get("signal"), 0)
+                strengths[t, m] = _numeric_strength(result)
+    return signals, strengths
+
+
+def combine_signal_matrix(
+    signals: np.ndarray,
+    strengths: np.ndarray,
+    weights: np.ndarray | Sequence[float],
+    confidence_threshold: float = 0.3,
+) -> dict[str, np.ndarray]:
+    """
+    Batch ``combine_signals`` за всички timestamps (и weight вектори)
+
+    Същата логика като ``combine_signals``/``_determine_final_signal``,
+    но с матрична аритметика: NaN strength = липсващ модул (не влиза в
+    total weight). При weights с форма (K, M) резултатите са (K, T) -
+    цял weight sweep с едно извикване.
+
+    Args:
+        signals: (T, M) сигнали - низове или кодове от ``encode_signals``
+        strengths: (T, M) strengths, NaN за липсващ резултат
+        weights: (M,) weight вектор или (K, M) за weight sweep
+        confidence_threshold: Минимален нормализиран score за LONG/SHORT
+
+    Returns:
+        Dict с масиви (T,) или (K, T):
+            - signal: кодове (1 LONG, -1 SHORT, 0 HOLD)
+            - strength: нормализиран score на крайния сигнал
+            - long_score, short_score, total_weight: сумите преди нормализация
+    """
+    codes = encode_signals(signals)
+    strengths = np.asarray(strengths, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    matrix = np.atleast_2d(weights).T  # (M, K)
+
+    available = ~np.isnan(strengths)
+    values = np.where(available, strengths, 0.0)
+    long_score = np.where(codes == 1, values, 0.0) @ matrix
+    short_score = np.where(codes == -1, values, 0.0) @ matrix
+    total_weight = available.astype(float) @ matrix
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normalized_long = np.where(total_weight > 0, long_score / total_weight, 0.0)
+        normalized_short = np.where(total_weight > 0, short_score / total_weight, 0.0)
+
+    is_long = (normalized_long > normalized_short) & (
+        normalized_long > confidence_threshold
+    )
+    is_short = (normalized_short > normalized_long) & (
+        normalized_short > confidence_threshold
+    )
+    signal = is_long.astype(np.int8) - is_short.astype(np.int8)
+    strength = np.select(
+        [is_long, is_short],
+        [normalized_long, normalized_short],
+        np.maximum(normalized_long, normalized_short),
+    )
+
+    result = {
+        "signal": signal,
+        "strength": strength,
+        "long_score": long_score,
+        "short_score": short_score,
+        "total_weight": total_weight,
+    }
+    # (T, K) -> (K, T) за sweep, (T,) за един weight вектор
+    return {
+        name: array.T if weights.ndim > 1 else array[:, 0]
+        for name, array in result.items()
+    }
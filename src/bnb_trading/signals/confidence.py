@@ -1,12 +1,23 @@
 """Confidence calculation for trading signals."""
 
 import logging
+from collections.abc import Sequence
 from typing import Any
 
+import numpy as np
+
 from bnb_trading.core.exceptions import AnalysisError
 
+from .combiners import encode_signals
+
 logger = logging.getLogger(__name__)
 
+MIN_CONFIRMATIONS = 2
+CONFIRMATION_PENALTY = 0.1  # за всяко липсващо потвърждение
+FIB_TAILS_CONFLUENCE_BONUS = 0.15  # Fibonacci + Weekly Tails
+TREND_CONFLUENCE_BONUS = 0.10  # Trend + Fibonacci или Weekly Tails
+VOLUME_BONUS = {"STRONG": 0.05, "MODERATE": 0.03}
+
 
 def calculate_confidence(signal: dict[str, Any], analyses: dict[str, Any]) -> float:
     """
@@ -44,9 +55,10 @@ def calculate_confidence(signal: dict[str, Any], analyses: dict[str, Any]) -> fl
         )
 
         # Apply confirmation penalty if insufficient
-        min_confirmations = 2
-        if confirmations < min_confirmations:
-            confirmation_penalty = (min_confirmations - confirmations) * 0.1
+        if confirmations < MIN_CONFIRMATIONS:
+            confirmation_penalty = (
+                MIN_CONFIRMATIONS - confirmations
+            ) * CONFIRMATION_PENALTY
             total_confidence -= confirmation_penalty
 
         # Clamp between 0 and 1
@@ -82,11 +94,11 @@ def _calculate_confluence_bonus(analyses: dict[str, Any], target_signal: str) ->
 
     # Fibonacci + Weekly Tails = strong confluence
     if fibonacci_agrees and weekly_tails_agrees:
-        bonus += 0.15
+        bonus += FIB_TAILS_CONFLUENCE_BONUS
 
     # Trend + any other = trend confirmation
     if trend_agrees and (fibonacci_agrees or weekly_tails_agrees):
-        bonus += 0.10
+        bonus += TREND_CONFLUENCE_BONUS
 
     return bonus
 
@@ -98,13 +110,7 @@ def _calculate_volume_bonus(analyses: dict[str, Any]) -> float:
     if not isinstance(volume_analysis, dict):
         return 0.0
 
-    volume_signal = volume_analysis.get("volume_signal")
-    if volume_signal == "STRONG":
-        return 0.05
-    if volume_signal == "MODERATE":
-        return 0.03
-
-    return 0.0
+    return VOLUME_BONUS.get(volume_analysis.get("volume_signal"), 0.0)
 
 
 def _calculate_timeframe_bonus(analyses: dict[str, Any]) -> float:
@@ -117,9 +123,69 @@ def _calculate_timeframe_bonus(analyses: dict[str, Any]) -> float:
     alignment_score = float(multi_tf_analysis.get("alignment_score", 0.0))
 
     # Bonus based on alignment quality
-    if alignment_score > 0.8:
-        return 0.10
-    if alignment_score > 0.6:
-        return 0.05
+    return float(_timeframe_bonus_array(np.asarray(alignment_score)))
+
+
+def _timeframe_bonus_array(alignment_scores: np.ndarray) -> np.ndarray:
+    """Timeframe alignment bonus за масив от alignment scores."""
+    return np.select(
+        [alignment_scores > 0.8, alignment_scores > 0.6], [0.10, 0.05], 0.0
+    )
+
+
+def confidence_matrix(
+    final_signals: np.ndarray,
+    strengths: np.ndarray,
+    module_signals: np.ndarray,
+    modules: Sequence[str],
+    *,
+    volume_signals: np.ndarray | None = None,
+    alignment_scores: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Batch ``calculate_confidence`` за всички timestamps
+
+    Потвържденията, confluence, volume и timeframe бонусите и penalty-то
+    са същите като в скаларния път, но с масиви. ``final_signals`` може
+    да е (K, T) от weight sweep на ``combine_signal_matrix``.
+
+    Args:
+        final_signals: Крайни сигнали (T,) или (K, T) - кодове или низове
+        strengths: Strength на крайния сигнал, същата форма
+        module_signals: (T, M) сигнали на модулите
+        modules: Имената на колоните (за fibonacci/weekly_tails/trend)
+        volume_signals: (T,) ``volume_signal`` на indicators ("STRONG", ...)
+        alignment_scores: (T,) multi_timeframe ``alignment_score``
+
+    Returns:
+        Confidence 0.0-1.0 със формата на ``final_signals`` (0 за HOLD)
+    """
+    final = encode_signals(final_signals)
+    agrees = encode_signals(module_signals) == final[..., None]  # (..., T, M)
+    confirmations = agrees.sum(axis=-1)
+
+    def module_agrees(name: str) -> np.ndarray:
+        if name not in modules:
+            return np.zeros(final.shape, dtype=bool)
+        return agrees[..., list(modules).index(name)]
+
+    fibonacci, weekly_tails, trend = (
+        module_agrees(name) for name in ("fibonacci", "weekly_tails", "trend")
+    )
+    confidence = np.asarray(strengths, dtype=float).copy()
+    confidence += np.where(fibonacci & weekly_tails, FIB_TAILS_CONFLUENCE_BONUS, 0.0)
+    confidence += np.where(
+        trend & (fibonacci | weekly_tails), TREND_CONFLUENCE_BONUS, 0.0
+    )
+    if volume_signals is not None:
+        volume_signals = np.asarray(volume_signals)
+        confidence += sum(
+            np.where(volume_signals == level, bonus, 0.0)
+            for level, bonus in VOLUME_BONUS.items()
+        )
+    if alignment_scores is not None:
+        confidence += _timeframe_bonus_array(np.asarray(alignment_scores, dtype=float))
 
-    return 0.0
+    missing = np.maximum(MIN_CONFIRMATIONS - confirmations, 0)
+    confidence -= missing * CONFIRMATION_PENALTY
+    return np.where(final == 0, 0.0, np.clip(confidence, 0.0, 1.0))
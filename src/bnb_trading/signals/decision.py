@@ -9,7 +9,11 @@ from typing import Any
 import pandas as pd
 
 from bnb_trading.analysis.weekly_tails.analyzer import WeeklyTailsAnalyzer
+from bnb_trading.core.config import SignalSettings
 from bnb_trading.core.models import DecisionContext, DecisionResult
+from bnb_trading.core.registry import get_analyzer
+from bnb_trading.data.schema import OHLCV
+from bnb_trading.fibonacci import FibonacciAnalyzer
 
 logger = logging.getLogger(__name__)
 
@@ -32,16 +36,16 @@ def decide_long(ctx: DecisionContext) -> DecisionResult:
         if not _validate_no_lookahead(ctx):
             return _empty_decision("Look-ahead validation failed", ctx.timestamp)
 
-        # Initialize analyzers
-        tails_analyzer = WeeklyTailsAnalyzer(ctx.config)
+        # Shared analyzer for this config (built once, not per backtest week)
+        tails_analyzer = get_analyzer(WeeklyTailsAnalyzer, ctx.config)
 
-        # Component weights from config
-        weights = ctx.config.get("signals", {})
-        weekly_tails_weight = weights.get("weekly_tails_weight", 0.60)
-        fibonacci_weight = weights.get("fibonacci_weight", 0.20)
-        trend_weight = weights.get("trend_weight", 0.10)
-        volume_weight = weights.get("volume_weight", 0.10)
-        confidence_threshold = weights.get("confidence_threshold", 0.88)
+        # Component weights from config (precomputed for TradingConfig)
+        settings = SignalSettings.from_config(ctx.config)
+        weekly_tails_weight = settings.weekly_tails_weight
+        fibonacci_weight = settings.fibonacci_weight
+        trend_weight = settings.trend_weight
+        volume_weight = settings.volume_weight
+        confidence_threshold = settings.confidence_threshold
 
         # Core analysis: Weekly Tails (dominant)
         tails_result = tails_analyzer.calculate_tail_strength(ctx.closed_weekly_df)
@@ -52,13 +56,16 @@ def decide_long(ctx: DecisionContext) -> DecisionResult:
 
         # Calculate weighted confidence
         tail_confidence = tails_result.get("confidence", 0.0)
+        fibonacci_confidence = _get_fibonacci_confidence(ctx)
+        trend_confidence = _get_trend_confidence(ctx)
+        volume_confidence = _get_volume_confidence(ctx)
 
         # Simple confidence calculation (weekly tails dominant)
         weighted_confidence = (
             tail_confidence * weekly_tails_weight
-            + _get_fibonacci_confidence(ctx) * fibonacci_weight
-            + _get_trend_confidence(ctx) * trend_weight
-            + _get_volume_confidence(ctx) * volume_weight
+            + fibonacci_confidence * fibonacci_weight
+            + trend_confidence * trend_weight
+            + volume_confidence * volume_weight
         )
 
         # Decision logic
@@ -76,9 +83,9 @@ def decide_long(ctx: DecisionContext) -> DecisionResult:
                 "tail_strength": tails_result.get("strength", 0.0),
                 "tail_confidence": tail_confidence,
                 "weighted_confidence": weighted_confidence,
-                "fibonacci_confidence": _get_fibonacci_confidence(ctx),
-                "trend_confidence": _get_trend_confidence(ctx),
-                "volume_confidence": _get_volume_confidence(ctx),
+                "fibonacci_confidence": fibonacci_confidence,
+                "trend_confidence": trend_confidence,
+                "volume_confidence": volume_confidence,
                 "weights_used": {
                     "weekly_tails": weekly_tails_weight,
                     "fibonacci": fibonacci_weight,
@@ -159,11 +166,17 @@ def _pass_basic_filters(ctx: DecisionContext, tails_result: dict[str, Any]) -> b
 
 
 def _get_fibonacci_confidence(ctx: DecisionContext) -> float:
-    """Get Fibonacci analysis confidence - placeholder"""
+    """Get Fibonacci confidence: proximity of the last close to swing Fib levels"""
     try:
-        # TODO: Implement Fibonacci analysis integration
-        # For now, return neutral confidence
-        return 0.5
+        # Neutral when Fibonacci is not configured
+        if "fibonacci" not in ctx.config:
+            return 0.5
+
+        fib_analyzer = get_analyzer(FibonacciAnalyzer, ctx.config)
+        score = fib_analyzer.current_score(ctx.closed_daily_df)
+
+        # Swing below min_swing_size - no meaningful levels, stay neutral
+        return 0.5 if score is None else score
     except Exception as e:
         logger.exception(f"Error getting Fibonacci confidence: {e}")
         return 0.0
@@ -174,13 +187,10 @@ def _get_trend_confidence(ctx: DecisionContext) -> float:
     try:
         # Simple trend check: close > MA50
         if len(ctx.closed_daily_df) >= 50:
-            close_prices = ctx.closed_daily_df.get(
-                "close", ctx.closed_daily_df.get("Close")
-            )
-            if close_prices is not None and not close_prices.empty:
-                ma50 = close_prices.rolling(50).mean().iloc[-1]
-                current_price = close_prices.iloc[-1]
-                return 0.8 if current_price > ma50 else 0.2
+            close_prices = OHLCV.from_frame(ctx.closed_daily_df).close
+            if close_prices is not None:
+                ma50 = close_prices[-50:].mean()
+                return 0.8 if close_prices[-1] > ma50 else 0.2
 
         return 0.5
     except Exception as e:
@@ -193,13 +203,10 @@ def _get_volume_confidence(ctx: DecisionContext) -> float:
     try:
         # Simple volume check: current > MA20
         if len(ctx.closed_daily_df) >= 20:
-            volume = ctx.closed_daily_df.get(
-                "volume", ctx.closed_daily_df.get("Volume")
-            )
-            if volume is not None and not volume.empty:
-                ma20 = volume.rolling(20).mean().iloc[-1]
-                current_volume = volume.iloc[-1]
-                return 0.7 if current_volume > ma20 * 1.3 else 0.3
+            volume = OHLCV.from_frame(ctx.closed_daily_df).volume
+            if volume is not None:
+                ma20 = volume[-20:].mean()
+                return 0.7 if volume[-1] > ma20 * 1.3 else 0.3
 
         return 0.5
     except Exception as e:
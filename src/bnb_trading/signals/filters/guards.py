@@ -6,10 +6,36 @@ Simple but effective filters to improve LONG precision ≥85%
 import logging
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from bnb_trading.data.schema import OHLCV
+
 logger = logging.getLogger(__name__)
 
+VOLUME_MA_PERIOD = 20
+REQUIRED_VOLUME_RATIO = 1.3  # 30% above average
+ATR_PERIOD = 14
+MIN_ATR_PCT = 0.02  # Fixed 2% minimum volatility
+
+
+def _volume_multiplier(volume_ratio: np.ndarray | float) -> np.ndarray:
+    """Confidence multiplier for a volume ratio (max 30% boost, 0.7 penalty)."""
+    return np.where(
+        volume_ratio >= REQUIRED_VOLUME_RATIO,
+        1.0 + np.minimum((volume_ratio - 1.0) * 0.5, 0.3),
+        0.7,
+    )
+
+
+def _atr_multiplier(atr_pct: np.ndarray | float) -> np.ndarray:
+    """Confidence multiplier for ATR % (max 20% boost, 0.8 penalty)."""
+    return np.where(
+        atr_pct >= MIN_ATR_PCT,
+        1.0 + np.minimum((atr_pct - MIN_ATR_PCT) * 2.0, 0.2),
+        0.8,
+    )
+
 
 def volume_liquidity_filter(
     ctx_data: dict[str, Any], config: dict[str, Any]
@@ -26,7 +52,7 @@ def volume_liquidity_filter(
     """
     try:
         daily_df = ctx_data.get("closed_daily_df")
-        if daily_df is None or len(daily_df) < 20:
+        if daily_df is None or len(daily_df) < VOLUME_MA_PERIOD:
             return {
                 "passed": False,
                 "reason": "Insufficient daily data for volume filter",
@@ -34,19 +60,18 @@ def volume_liquidity_filter(
             }
 
         # Get volume data
-        volume_col = "volume" if "volume" in daily_df.columns else "Volume"
-        if volume_col not in daily_df.columns:
+        volume = OHLCV.from_frame(daily_df).volume
+        if volume is None:
             return {
                 "passed": False,
                 "reason": "No volume data available",
                 "confidence_multiplier": 0.0,
             }
 
-        volume = daily_df[volume_col]
-        current_volume = float(volume.iloc[-1])
+        current_volume = float(volume[-1])
 
         # Calculate volume MA20
-        volume_ma20 = float(volume.rolling(window=20).mean().iloc[-1])
+        volume_ma20 = float(volume[-VOLUME_MA_PERIOD:].mean())
 
         if volume_ma20 <= 0:
             return {
@@ -55,25 +80,22 @@ def volume_liquidity_filter(
                 "confidence_multiplier": 0.0,
             }
 
-        # Volume ratio threshold from config
-        config.get("signals", {}).get("volume_weight", 0.10)
-        required_ratio = 1.3  # 30% above average
-
+        required_ratio = REQUIRED_VOLUME_RATIO
         volume_ratio = current_volume / volume_ma20
+        multiplier = float(_volume_multiplier(volume_ratio))
 
-        # Filter logic
+        # Filter logic (penalty but not complete block below the ratio)
         if volume_ratio >= required_ratio:
-            confidence_boost = min((volume_ratio - 1.0) * 0.5, 0.3)  # Max 30% boost
             return {
                 "passed": True,
                 "reason": f"Volume {volume_ratio:.2f}x MA20 (≥{required_ratio:.1f}x)",
-                "confidence_multiplier": 1.0 + confidence_boost,
+                "confidence_multiplier": multiplier,
                 "volume_ratio": volume_ratio,
             }
         return {
             "passed": False,
             "reason": f"Volume {volume_ratio:.2f}x MA20 (<{required_ratio:.1f}x)",
-            "confidence_multiplier": 0.7,  # Penalty but not complete block
+            "confidence_multiplier": multiplier,
             "volume_ratio": volume_ratio,
         }
 
@@ -99,7 +121,7 @@ def atr_chop_guard(ctx_data: dict[str, Any], config: dict[str, Any]) -> dict[str
     """
     try:
         daily_df = ctx_data.get("closed_daily_df")
-        if daily_df is None or len(daily_df) < 14:
+        if daily_df is None or len(daily_df) < ATR_PERIOD:
             return {
                 "passed": False,
                 "reason": "Insufficient daily data for ATR filter",
@@ -107,7 +129,7 @@ def atr_chop_guard(ctx_data: dict[str, Any], config: dict[str, Any]) -> dict[str
             }
 
         # Calculate ATR(14)
-        atr = _calculate_atr(daily_df, 14)
+        atr = _calculate_atr(daily_df, ATR_PERIOD)
         if atr <= 0:
             return {
                 "passed": False,
@@ -116,31 +138,27 @@ def atr_chop_guard(ctx_data: dict[str, Any], config: dict[str, Any]) -> dict[str
             }
 
         # Get current price for percentage calculation
-        close_col = "close" if "close" in daily_df.columns else "Close"
-        current_price = float(daily_df[close_col].iloc[-1])
+        current_price = float(OHLCV.from_frame(daily_df).close[-1])
 
         # ATR as percentage of price
         atr_pct = atr / current_price
 
-        # Minimum volatility threshold (configurable)
-        min_atr_pct = (
-            config.get("weekly_tails", {}).get("atr_period", 14) * 0.001
-        )  # Default: 1.4%
-        min_atr_pct = 0.02  # Fixed 2% minimum volatility
+        # Minimum volatility threshold
+        min_atr_pct = MIN_ATR_PCT
+        multiplier = float(_atr_multiplier(atr_pct))
 
-        # Filter logic
+        # Filter logic (penalty for choppy markets below the threshold)
         if atr_pct >= min_atr_pct:
-            volatility_boost = min((atr_pct - min_atr_pct) * 2.0, 0.2)  # Max 20% boost
             return {
                 "passed": True,
                 "reason": f"ATR {atr_pct:.2%} ≥ {min_atr_pct:.2%} (good volatility)",
-                "confidence_multiplier": 1.0 + volatility_boost,
+                "confidence_multiplier": multiplier,
                 "atr_pct": atr_pct,
             }
         return {
             "passed": False,
             "reason": f"ATR {atr_pct:.2%} < {min_atr_pct:.2%} (low volatility)",
-            "confidence_multiplier": 0.8,  # Penalty for choppy markets
+            "confidence_multiplier": multiplier,
             "atr_pct": atr_pct,
         }
 
@@ -205,30 +223,130 @@ def apply_all_guards(
         }
 
 
+def volume_liquidity_mask(daily: pd.DataFrame | OHLCV) -> dict[str, np.ndarray]:
+    """
+    volume_liquidity_filter for every bar in one pass
+
+    Element ``t`` equals ``volume_liquidity_filter`` on the first ``t + 1``
+    daily bars, so backtests apply the guard elementwise and live mode
+    reads the last element.
+
+    Args:
+        daily: Daily OHLCV DataFrame or series (closed candles)
+
+    Returns:
+        Dict of (n,) arrays: passed, confidence_multiplier, volume_ratio
+    """
+    volume = OHLCV.from_frame(daily).volume
+    length = len(daily)
+    passed = np.zeros(length, dtype=bool)
+    multiplier = np.zeros(length)
+    volume_ratio = np.full(length, np.nan)
+    if volume is None or length < VOLUME_MA_PERIOD:
+        return {
+            "passed": passed,
+            "confidence_multiplier": multiplier,
+            "volume_ratio": volume_ratio,
+        }
+
+    ready = slice(VOLUME_MA_PERIOD - 1, None)
+    volume_ma = np.lib.stride_tricks.sliding_window_view(volume, VOLUME_MA_PERIOD).mean(
+        axis=1
+    )
+    valid = ~(volume_ma <= 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = volume[ready] / volume_ma
+
+    volume_ratio[ready] = np.where(valid, ratio, np.nan)
+    passed[ready] = valid & (ratio >= REQUIRED_VOLUME_RATIO)
+    multiplier[ready] = np.where(valid, _volume_multiplier(ratio), 0.0)
+    return {
+        "passed": passed,
+        "confidence_multiplier": multiplier,
+        "volume_ratio": volume_ratio,
+    }
+
+
+def atr_chop_mask(daily: pd.DataFrame | OHLCV) -> dict[str, np.ndarray]:
+    """
+    atr_chop_guard for every bar in one pass
+
+    Element ``t`` equals ``atr_chop_guard`` on the first ``t + 1`` daily
+    bars.
+
+    Args:
+        daily: Daily OHLCV DataFrame or series (closed candles)
+
+    Returns:
+        Dict of (n,) arrays: passed, confidence_multiplier, atr_pct
+    """
+    length = len(daily)
+    passed = np.zeros(length, dtype=bool)
+    multiplier = np.zeros(length)
+    atr_pct = np.full(length, np.nan)
+    if length < ATR_PERIOD:
+        return {
+            "passed": passed,
+            "confidence_multiplier": multiplier,
+            "atr_pct": atr_pct,
+        }
+
+    ohlcv = OHLCV.from_frame(daily)
+    ready = slice(ATR_PERIOD - 1, None)
+    atr = np.lib.stride_tricks.sliding_window_view(_true_range(ohlcv), ATR_PERIOD).mean(
+        axis=1
+    )
+    valid = atr > 0  # NaN ATR is invalid as in _calculate_atr
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = atr / ohlcv.close[ready]
+
+    atr_pct[ready] = np.where(valid, pct, np.nan)
+    passed[ready] = valid & (pct >= MIN_ATR_PCT)
+    multiplier[ready] = np.where(valid, _atr_multiplier(pct), 0.0)
+    return {"passed": passed, "confidence_multiplier": multiplier, "atr_pct": atr_pct}
+
+
+def guard_masks(daily: pd.DataFrame | OHLCV) -> dict[str, Any]:
+    """
+    apply_all_guards for every bar: combined masks and multiplier vectors
+
+    Args:
+        daily: Daily OHLCV DataFrame or series (closed candles)
+
+    Returns:
+        Dict with passed (n,) bool, confidence_multiplier (n,) float and
+        the per-filter masks under "filters"
+    """
+    volume = volume_liquidity_mask(daily)
+    atr = atr_chop_mask(daily)
+    return {
+        "passed": volume["passed"] & atr["passed"],
+        "confidence_multiplier": (
+            volume["confidence_multiplier"] * atr["confidence_multiplier"]
+        ),
+        "filters": {"volume": volume, "atr": atr},
+    }
+
+
+def _true_range(ohlcv: OHLCV) -> np.ndarray:
+    """True range per bar (first bar has no previous close: High - Low)."""
+    high, low, close = ohlcv.high, ohlcv.low, ohlcv.close
+    previous_close = np.r_[np.nan, close[:-1]]
+    return np.fmax(
+        high - low,
+        np.fmax(np.abs(high - previous_close), np.abs(low - previous_close)),
+    )
+
+
 def _calculate_atr(df: pd.DataFrame, period: int) -> float:
     """Calculate Average True Range"""
     try:
         if len(df) < period:
             return 0.0
 
-        # Get OHLC columns (handle different naming conventions)
-        high_col = "high" if "high" in df.columns else "High"
-        low_col = "low" if "low" in df.columns else "Low"
-        close_col = "close" if "close" in df.columns else "Close"
-
-        high = df[high_col]
-        low = df[low_col]
-        close = df[close_col]
-
-        # True Range calculation
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-
-        true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = true_range.rolling(window=period).mean().iloc[-1]
+        atr = _true_range(OHLCV.from_frame(df))[-period:].mean()
 
-        return float(atr) if not pd.isna(atr) else 0.0
+        return float(atr) if not np.isnan(atr) else 0.0
 
     except Exception as e:
         logger.exception(f"Error calculating ATR: {e}")
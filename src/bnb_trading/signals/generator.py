@@ -6,6 +6,7 @@ from typing import Any
 import pandas as pd
 
 from bnb_trading.core.exceptions import AnalysisError
+from bnb_trading.core.registry import get_analyzer
 from bnb_trading.core.types import SignalResult
 from bnb_trading.signals.combiners import combine_signals
 from bnb_trading.signals.confidence import calculate_confidence
@@ -135,7 +136,7 @@ class SignalGenerator:
             # 1. Fibonacci Analysis
             try:
                 if "fibonacci" in self.config and self.fibonacci_weight > 0:
-                    fib_analyzer = FibonacciAnalyzer(self.config)
+                    fib_analyzer = get_analyzer(FibonacciAnalyzer, self.config)
                     fib_result = fib_analyzer.analyze_fibonacci_trend(daily_df)
                     analyses["fibonacci"] = fib_result.get("fibonacci_signal", {})
                     logger.info(
@@ -160,7 +161,7 @@ class SignalGenerator:
                     and self.weekly_tails_weight > 0
                 ):
                     logger.info("Weekly tails analysis starting...")
-                    tails_analyzer = WeeklyTailsAnalyzer(self.config)
+                    tails_analyzer = get_analyzer(WeeklyTailsAnalyzer, self.config)
                     tails_result = tails_analyzer.analyze_weekly_tails_trend(weekly_df)
                     logger.info(
                         f"Tails result type: {type(tails_result)}, keys: {list(tails_result.keys()) if isinstance(tails_result, dict) else 'N/A'}"
@@ -184,7 +185,7 @@ class SignalGenerator:
             # 3. Technical Indicators Analysis
             try:
                 if any([self.rsi_weight > 0, self.macd_weight > 0, self.bb_weight > 0]):
-                    indicators = TechnicalIndicators(self.config)
+                    indicators = get_analyzer(TechnicalIndicators, self.config)
                     daily_with_indicators = indicators.calculate_indicators(
                         daily_df.copy()
                     )
@@ -278,7 +279,7 @@ class SignalGenerator:
                 if self.ma_weight > 0:
                     from bnb_trading.moving_averages import MovingAveragesAnalyzer
 
-                    ma_analyzer = MovingAveragesAnalyzer(self.config)
+                    ma_analyzer = get_analyzer(MovingAveragesAnalyzer, self.config)
                     # Use the available methods to build a simple MA analysis
                     ema_data = ma_analyzer.calculate_emas(daily_df)
                     ma_signals = ma_analyzer.get_ma_trading_signals(ema_data)
@@ -3,13 +3,23 @@
 import logging
 from typing import Any
 
+import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 from bnb_trading.core.exceptions import AnalysisError
 from bnb_trading.core.models import ShortSignalCandidate
+from bnb_trading.data.schema import OHLCV
 
 logger = logging.getLogger(__name__)
 
+MAX_ATH_DISTANCE_PCT = 40.0  # don't SHORT too far from ATH
+RSI_OVERBOUGHT = 70
+MIN_RISK_REWARD = 1.5
+SUPPORT_LOOKBACK = 20
+STOP_LOSS_PCT = 0.05  # Simple 5% stop loss
+MAX_CONFIDENCE = 0.85
+
 
 def validate_short_confluence(
     setup: dict[str, Any],
@@ -34,31 +44,36 @@ def validate_short_confluence(
         ath_price = daily_df["ATH"].max()
         ath_distance_pct = ((ath_price - current_price) / ath_price) * 100
 
-        if ath_distance_pct > 40.0:  # Simple check - don't SHORT too far from ATH
+        if ath_distance_pct > MAX_ATH_DISTANCE_PCT:
             return None
 
         reasons.append(f"ATH distance: {ath_distance_pct:.1f}%")
         confluence_score += 1
 
         # Layer 2: Basic Technical Check (RSI overbought only)
-        if "RSI" in daily_df.columns and daily_df["RSI"].iloc[setup["index"]] > 70:
+        if (
+            "RSI" in daily_df.columns
+            and daily_df["RSI"].iloc[setup["index"]] > RSI_OVERBOUGHT
+        ):
             reasons.append("RSI overbought")
             confluence_score += 1
 
         # Layer 3: Risk/Reward Assessment (minimum 1:1.5)
         risk_reward = _calculate_risk_reward(setup["price"], daily_df, setup["index"])
-        if risk_reward < 1.5:  # Minimum risk/reward
+        if risk_reward < MIN_RISK_REWARD:
             return None
 
         reasons.append(f"Risk/Reward: 1:{risk_reward:.1f}")
         confluence_score += 1
 
         # Simple confidence calculation (much more permissive)
-        confidence = min(0.85, confluence_score / 3.0 * market_regime["confidence"])
+        confidence = min(
+            MAX_CONFIDENCE, confluence_score / 3.0 * market_regime["confidence"]
+        )
 
         # Calculate stop loss and take profit
-        stop_loss_price = setup["price"] * 1.05  # Simple 5% stop loss
-        take_profit_price = setup["price"] * (1 - (risk_reward * 0.05))
+        stop_loss_price = setup["price"] * (1 + STOP_LOSS_PCT)
+        take_profit_price = setup["price"] * (1 - (risk_reward * STOP_LOSS_PCT))
 
         return ShortSignalCandidate(
             timestamp=setup["timestamp"],
@@ -78,6 +93,78 @@ def validate_short_confluence(
         raise AnalysisError(f"Short confluence validation failed: {e}") from e
 
 
+def short_confluence_history(
+    daily_df: pd.DataFrame, regime_confidence: float | np.ndarray
+) -> pd.DataFrame:
+    """
+    validate_short_confluence за всяка свещ наведнъж
+
+    Ред ``t`` съвпада с validate_short_confluence за setup на свещ ``t``
+    върху първите ``t + 1`` свещи: ATH е най-високата стойност до ``t``
+    (без поглед напред), support е минимумът на Low за последните 21 свещи.
+
+    Args:
+        daily_df: Daily OHLCV данни с ATH колона (RSI по избор)
+        regime_confidence: Confidence на пазарния режим (число или по свещ)
+
+    Returns:
+        DataFrame (индекс като daily_df) с price, ath_distance_pct,
+        rsi_overbought, risk_reward_ratio, confluence_score, valid,
+        confidence, stop_loss_price и take_profit_price
+
+    Raises:
+        AnalysisError: If the ATH column is missing
+    """
+    if "ATH" not in daily_df.columns:
+        raise AnalysisError("Short confluence history needs the ATH column")
+
+    ohlcv = OHLCV.from_frame(daily_df)
+    ohlcv.require("low", "close")
+    price = ohlcv.close
+
+    # Layer 1: ATH proximity (running ATH, NaN се пропуска като в .max())
+    ath_price = np.fmax.accumulate(daily_df["ATH"].to_numpy(dtype=float))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ath_distance_pct = (ath_price - price) / ath_price * 100
+
+    # Layer 2: RSI overbought
+    rsi_overbought = (
+        daily_df["RSI"].to_numpy(dtype=float) > RSI_OVERBOUGHT
+        if "RSI" in daily_df.columns
+        else np.zeros(len(price), dtype=bool)
+    )
+
+    # Layer 3: Risk/Reward до support (1.0 при по-малко от 20 предишни свещи)
+    risk_reward = np.ones(len(price))
+    if len(price) > SUPPORT_LOOKBACK:
+        support = np.fmin.reduce(
+            sliding_window_view(ohlcv.low, SUPPORT_LOOKBACK + 1), axis=1
+        )
+        ready = slice(SUPPORT_LOOKBACK, None)
+        risk_reward[ready] = (price[ready] - support) / price[ready] / STOP_LOSS_PCT
+
+    valid = ~(ath_distance_pct > MAX_ATH_DISTANCE_PCT) & ~(
+        risk_reward < MIN_RISK_REWARD
+    )
+    confluence_score = 2 + rsi_overbought.astype(int)
+    return pd.DataFrame(
+        {
+            "price": price,
+            "ath_distance_pct": ath_distance_pct,
+            "rsi_overbought": rsi_overbought,
+            "risk_reward_ratio": risk_reward,
+            "confluence_score": confluence_score,
+            "valid": valid,
+            "confidence": np.minimum(
+                MAX_CONFIDENCE, confluence_score / 3.0 * regime_confidence
+            ),
+            "stop_loss_price": price * (1 + STOP_LOSS_PCT),
+            "take_profit_price": price * (1 - risk_reward * STOP_LOSS_PCT),
+        },
+        index=daily_df.index,
+    )
+
+
 def check_volume_divergence(df: pd.DataFrame, index: int) -> bool:
     """Проверява за bearish volume divergence"""
     try:
@@ -87,21 +174,21 @@ def check_volume_divergence(df: pd.DataFrame, index: int) -> bool:
             return False
 
         # Check if volume column exists
-        if "Volume" not in df.columns and "volume" not in df.columns:
+        ohlcv = OHLCV.from_frame(df)
+        if ohlcv.volume is None:
             return False
 
-        volume_col = "Volume" if "Volume" in df.columns else "volume"
-        price_window = df["Close"].iloc[index - lookback : index + 1]
-        volume_window = df[volume_col].iloc[index - lookback : index + 1]
+        price_window = ohlcv.close[index - lookback : index + 1]
+        volume_window = ohlcv.volume[index - lookback : index + 1]
 
-        if len(price_window) < lookback or len(volume_window) < lookback:
+        if len(price_window) < lookback:
             return False
 
         # Look for price making higher highs while volume makes lower highs
-        price_trend = price_window.tail(5).mean() > price_window.head(5).mean()
-        volume_trend = volume_window.tail(5).mean() < volume_window.head(5).mean()
+        price_trend = price_window[-5:].mean() > price_window[:5].mean()
+        volume_trend = volume_window[-5:].mean() < volume_window[:5].mean()
 
-        return price_trend and volume_trend
+        return bool(price_trend and volume_trend)
 
     except Exception as e:
         logger.exception(f"Грешка при volume divergence check: {e}")
@@ -112,7 +199,7 @@ def _calculate_risk_reward(price: float, df: pd.DataFrame, index: int) -> float:
     """Изчислява risk/reward ratio за SHORT позиция"""
     try:
         # Simple support/resistance calculation
-        lookback = 20
+        lookback = SUPPORT_LOOKBACK
 
         if index < lookback:
             return 1.0
@@ -125,7 +212,7 @@ def _calculate_risk_reward(price: float, df: pd.DataFrame, index: int) -> float:
         potential_profit = (price - support_level) / price
 
         # Risk (5% stop loss)
-        risk = 0.05
+        risk = STOP_LOSS_PCT
 
         # Risk/reward ratio
         if risk == 0:
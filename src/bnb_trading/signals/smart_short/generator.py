@@ -7,12 +7,14 @@ import pandas as pd
 
 from bnb_trading.core.models import ShortSignalCandidate
 
-from .confluence import validate_short_confluence
-from .market_regime import MarketRegimeDetector
-from .risk_filters import apply_risk_filters
+from .confluence import short_confluence_history
+from .market_regime import DAILY_PERIOD, MarketRegimeDetector
+from .risk_filters import apply_risk_filters, risk_filter_mask
 
 logger = logging.getLogger(__name__)
 
+SETUP_LOOKBACK = 5  # SHORT setups в последните 5 дни
+
 
 class SmartShortSignalGenerator:
     """
@@ -156,6 +158,53 @@ class SmartShortSignalGenerator:
                 "error": True,
             }
 
+    def scan_short_history(
+        self, daily_df: pd.DataFrame, weekly_df: pd.DataFrame | None = None
+    ) -> pd.DataFrame:
+        """
+        SHORT setup, пазарен режим и risk филтри за всяка свещ наведнъж
+
+        Ред ``t`` оценява setup на свещ ``t`` само с данните до нея
+        (weekly свещите - само затворените към нея), така
+        SHORT логиката се backtest-ва върху цялата история с цената на
+        един vectorized pass (без избора на най-добър от последните 5 дни).
+
+        Args:
+            daily_df: Daily OHLCV данни с ATH колона
+            weekly_df: Weekly OHLCV данни (по подразбиране daily_df, като
+                generate_smart_short_signal)
+
+        Returns:
+            DataFrame (индекс като daily_df) с колоните на regime_history
+            (regime_confidence вместо confidence), short_confluence_history и
+            bool колона short_signal
+
+        Raises:
+            AnalysisError: If the regime or confluence scan fails
+        """
+        if weekly_df is None:
+            regime = self.market_detector.regime_history(
+                daily_df, daily_df, weekly_period=DAILY_PERIOD
+            )
+        else:
+            regime = self.market_detector.regime_history(daily_df, weekly_df)
+        setups = short_confluence_history(daily_df, regime["confidence"].to_numpy())
+        history = regime.drop(columns="ath_distance_pct").rename(
+            columns={"confidence": "regime_confidence"}
+        )
+        history = history.join(setups)
+
+        candidates = history["valid"] & (
+            history["confluence_score"] >= self.short_thresholds["min_confluence_score"]
+        )
+        history["short_signal"] = candidates & risk_filter_mask(
+            history["ath_distance_pct"].to_numpy(),
+            history["risk_reward_ratio"].to_numpy(),
+            history["short_signals_allowed"].to_numpy(),
+            self.config,
+        )
+        return history
+
     def _find_short_setups(
         self,
         daily_df: pd.DataFrame,
@@ -166,25 +215,38 @@ class SmartShortSignalGenerator:
         candidates = []
 
         try:
-            # Look for SHORT setups in last 5 days
-            for i in range(max(0, len(daily_df) - 5), len(daily_df)):
-                setup = {
-                    "index": i,
-                    "timestamp": daily_df.index[i],
-                    "price": daily_df["Close"].iloc[i],
-                }
-
-                # Validate confluence for this setup
-                candidate = validate_short_confluence(
-                    setup, daily_df, weekly_df, market_regime
-                )
-
-                if (
-                    candidate
-                    and candidate.confluence_score
+            # Look for SHORT setups in last 5 days (one vectorized pass)
+            recent = short_confluence_history(
+                daily_df, market_regime["confidence"]
+            ).tail(SETUP_LOOKBACK)
+            recent = recent[
+                recent["valid"]
+                & (
+                    recent["confluence_score"]
                     >= self.short_thresholds["min_confluence_score"]
-                ):
-                    candidates.append(candidate)
+                )
+            ]
+
+            for timestamp, setup in recent.iterrows():
+                reasons = [f"ATH distance: {setup['ath_distance_pct']:.1f}%"]
+                if setup["rsi_overbought"]:
+                    reasons.append("RSI overbought")
+                reasons.append(f"Risk/Reward: 1:{setup['risk_reward_ratio']:.1f}")
+
+                candidates.append(
+                    ShortSignalCandidate(
+                        timestamp=timestamp,
+                        price=setup["price"],
+                        confidence=setup["confidence"],
+                        reasons=reasons,
+                        confluence_score=int(setup["confluence_score"]),
+                        risk_reward_ratio=setup["risk_reward_ratio"],
+                        stop_loss_price=setup["stop_loss_price"],
+                        take_profit_price=setup["take_profit_price"],
+                        market_regime=market_regime["regime"],
+                        ath_distance_pct=setup["ath_distance_pct"],
+                    )
+                )
 
         except Exception as e:
             logger.exception(f"Грешка при търсене на SHORT setups: {e}")
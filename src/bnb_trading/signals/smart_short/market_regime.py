@@ -5,7 +5,14 @@ from typing import Any
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
+from bnb_trading.analysis.regime import (
+    bear_durations,
+    bull_durations,
+    bull_pivots,
+    drawdown_from_peak,
+)
 from bnb_trading.core.constants import (
     REGIME_BEAR,
     REGIME_MODERATE_BULL,
@@ -13,9 +20,130 @@ from bnb_trading.core.constants import (
     REGIME_STRONG_BULL,
 )
 from bnb_trading.core.exceptions import AnalysisError
+from bnb_trading.data.schema import OHLCV
 
 logger = logging.getLogger(__name__)
 
+DAILY_LOOKBACK = 20
+WEEKLY_LOOKBACK = 4
+MAX_TREND_STRENGTH = 3.0
+DAILY_PERIOD = pd.Timedelta(days=1)
+WEEKLY_PERIOD = pd.Timedelta(weeks=1)
+
+
+def rolling_trend_strength(prices: np.ndarray, lookback: int) -> np.ndarray:
+    """
+    Нормализиран наклон на линейна регресия за всяка свещ (от -3 до +3)
+
+    Closed form вместо np.polyfit на всеки прозорец: наклонът е
+    sum((x - x_mean) * y) / sum((x - x_mean) ** 2), т.е. едно матрично
+    умножение на всички прозорци, разделено на стандартното отклонение.
+
+    Args:
+        prices: Цени (напр. Close)
+        lookback: Брой свещи в регресията
+
+    Returns:
+        Масив като prices; 0.0 при недостатъчно данни, нулева волатилност
+        или NaN в прозореца
+    """
+    prices = np.asarray(prices, dtype=float)
+    strength = np.zeros(prices.size)
+    if lookback < 2 or prices.size < lookback:
+        return strength
+
+    windows = sliding_window_view(prices, lookback)
+    x = np.arange(lookback) - (lookback - 1) / 2
+    slope = windows @ x / (x @ x)
+    price_std = windows.std(axis=1, ddof=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normalized = np.clip(slope / price_std, -MAX_TREND_STRENGTH, MAX_TREND_STRENGTH)
+    strength[lookback - 1 :] = np.where(
+        (price_std != 0) & np.isfinite(normalized), normalized, 0.0
+    )
+    return strength
+
+
+def rolling_volume_trend(volumes: np.ndarray | None, lookback: int) -> np.ndarray:
+    """
+    Тренд на обема за всяка свещ: втората половина на прозореца спрямо първата
+
+    Args:
+        volumes: Обеми (None = няма Volume колона)
+        lookback: Брой свещи в прозореца
+
+    Returns:
+        Масив от етикети increasing/decreasing/stable ("unknown" при
+        недостатъчно данни)
+    """
+    size = 0 if volumes is None else len(volumes)
+    trend = np.full(size, "unknown", dtype=object)
+    if volumes is None or size < lookback:
+        return trend
+
+    windows = sliding_window_view(np.asarray(volumes, dtype=float), lookback)
+    first_half = windows[:, : lookback // 2].mean(axis=1)
+    second_half = windows[:, lookback // 2 :].mean(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(first_half > 0, second_half / first_half, 1.0)
+    trend[lookback - 1 :] = np.select(
+        [ratio > 1.2, ratio < 0.8], ["increasing", "decreasing"], default="stable"
+    )
+    return trend
+
+
+def classify_short_regimes(
+    daily_trend: np.ndarray,
+    weekly_trend: np.ndarray,
+    daily_volume_trend: np.ndarray,
+    ath_distance_pct: np.ndarray,
+) -> np.ndarray:
+    """
+    Пазарен режим за SHORT решения (елемент по елемент)
+
+    Args:
+        daily_trend: Daily trend strength
+        weekly_trend: Weekly trend strength
+        daily_volume_trend: Daily volume trend етикети
+        ath_distance_pct: Разстояние от ATH в %
+
+    Returns:
+        Масив от regime етикети
+    """
+    # Weighted trend score (weekly has more weight)
+    combined_trend = np.asarray(daily_trend) * 0.4 + np.asarray(weekly_trend) * 0.6
+    ath_distance_pct = np.asarray(ath_distance_pct, dtype=float)
+    strong_bull = (
+        (combined_trend > 1.5)
+        & (ath_distance_pct < 15)
+        & np.isin(daily_volume_trend, ["increasing", "stable"])
+    )
+    moderate_bull = (combined_trend > 0.5) & (ath_distance_pct < 30)
+    bear = combined_trend < -0.5
+    return np.select(
+        [strong_bull, moderate_bull, bear],
+        [REGIME_STRONG_BULL, REGIME_MODERATE_BULL, REGIME_BEAR],
+        default=REGIME_NEUTRAL,
+    ).astype(object)
+
+
+def short_signals_allowed(
+    regimes: np.ndarray, ath_distance_pct: np.ndarray
+) -> np.ndarray:
+    """SHORT позволен: не в strong bull, в moderate bull поне 10% под ATH"""
+    regimes = np.asarray(regimes, dtype=object)
+    return ~(
+        (regimes == REGIME_STRONG_BULL)
+        | ((regimes == REGIME_MODERATE_BULL) & (np.asarray(ath_distance_pct) < 10))
+    )
+
+
+def regime_confidence(daily_trend: np.ndarray, weekly_trend: np.ndarray) -> np.ndarray:
+    """Confidence на режима - по-висок, когато двата timeframe-а са съгласни"""
+    trend_agreement = np.abs(np.asarray(daily_trend) - np.asarray(weekly_trend))
+    # Max diff is 6 (-3 to +3)
+    return np.clip(1.0 - trend_agreement / 6.0, 0.0, 1.0)
+
 
 class MarketRegimeDetector:
     """
@@ -44,30 +172,25 @@ class MarketRegimeDetector:
 
         try:
             # Daily trend analysis
-            daily_trend = self._calculate_trend_strength(daily_df, "Close", 20)
-            daily_volume_trend = self._analyze_volume_trend(daily_df, 20)
+            daily_trend = self._calculate_trend_strength(
+                daily_df, "Close", DAILY_LOOKBACK
+            )
+            daily_volume_trend = self._analyze_volume_trend(daily_df, DAILY_LOOKBACK)
 
             # Weekly trend analysis
             weekly_trend = (
-                self._calculate_trend_strength(weekly_df, "Close", 4)
+                self._calculate_trend_strength(weekly_df, "Close", WEEKLY_LOOKBACK)
                 if weekly_df is not None
                 else 0
             )
             weekly_volume_trend = (
-                self._analyze_volume_trend(weekly_df, 4)
+                self._analyze_volume_trend(weekly_df, WEEKLY_LOOKBACK)
                 if weekly_df is not None
                 else "unknown"
             )
 
-            # ATH proximity
-            current_price = daily_df["Close"].iloc[-1]
-            ath_col = (
-                "ATH"
-                if "ATH" in daily_df.columns
-                else ("High" if "High" in daily_df.columns else "Close")
-            )
-            ath_price = daily_df[ath_col].max()
-            ath_distance_pct = ((ath_price - current_price) / ath_price) * 100
+            # ATH proximity (drawdown от running peak към последната свещ)
+            ath_distance_pct = self._ath_distance_pct(daily_df)[-1]
 
             # RSI levels
             rsi_current = daily_df["RSI"].iloc[-1] if "RSI" in daily_df.columns else 50
@@ -102,6 +225,124 @@ class MarketRegimeDetector:
             logger.exception(f"Грешка при market regime detection: {e}")
             raise AnalysisError(f"Market regime detection failed: {e}") from e
 
+    def drawdown_history(self, daily_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        ATH разстояние и bull/bear продължителност за всяка свещ наведнъж
+
+        Args:
+            daily_df: Daily OHLCV данни
+
+        Returns:
+            DataFrame (индекс като daily_df) с ath_distance_pct,
+            bull_duration_months и bear_duration_months
+        """
+        closes = daily_df["Close"].to_numpy(dtype=float)
+        return pd.DataFrame(
+            {
+                "ath_distance_pct": self._ath_distance_pct(daily_df),
+                "bull_duration_months": bull_durations(closes, bull_pivots(closes)),
+                "bear_duration_months": bear_durations(closes),
+            },
+            index=daily_df.index,
+        )
+
+    def regime_history(
+        self,
+        daily_df: pd.DataFrame,
+        weekly_df: pd.DataFrame | None,
+        weekly_period: pd.Timedelta = WEEKLY_PERIOD,
+    ) -> pd.DataFrame:
+        """
+        detect_market_regime за всяка daily свещ наведнъж
+
+        Ред ``t`` съвпада с detect_market_regime върху първите ``t + 1``
+        daily свещи и weekly свещите, затворени до затварянето на свещ
+        ``t``. Индексите са open time (Binance), така незавършената
+        седмица не носи бъдещи цени в реда.
+
+        Args:
+            daily_df: Daily OHLCV данни
+            weekly_df: Weekly OHLCV данни (None = без weekly тренд)
+            weekly_period: Продължителност на weekly_df свещите (1 ден,
+                когато daily данните заместват weekly)
+
+        Returns:
+            DataFrame (индекс като daily_df) с daily/weekly trend и volume
+            trend, ath_distance_pct, rsi_current, regime,
+            short_signals_allowed и confidence
+        """
+        try:
+            daily = OHLCV.from_frame(daily_df)
+            daily.require("close")
+            daily_trend = rolling_trend_strength(daily.close, DAILY_LOOKBACK)
+            daily_volume_trend = rolling_volume_trend(daily.volume, DAILY_LOOKBACK)
+
+            weekly_trend = np.zeros(len(daily))
+            weekly_volume_trend = np.full(len(daily), "unknown", dtype=object)
+            if weekly_df is not None:
+                weekly = OHLCV.from_frame(weekly_df)
+                weekly.require("close")
+                # Последната weekly свещ, затворена към затварянето на daily свещта
+                visible = (
+                    np.searchsorted(
+                        weekly.index + np.timedelta64(weekly_period),
+                        daily.index + np.timedelta64(DAILY_PERIOD),
+                        side="right",
+                    )
+                    - 1
+                )
+                known = visible >= 0
+                weekly_trend[known] = rolling_trend_strength(
+                    weekly.close, WEEKLY_LOOKBACK
+                )[visible[known]]
+                weekly_volume_trend[known] = rolling_volume_trend(
+                    weekly.volume, WEEKLY_LOOKBACK
+                )[visible[known]]
+
+            ath_distance_pct = self._ath_distance_pct(daily_df)
+            rsi_current = (
+                daily_df["RSI"].to_numpy(dtype=float)
+                if "RSI" in daily_df.columns
+                else np.full(len(daily), 50.0)
+            )
+            regimes = classify_short_regimes(
+                daily_trend, weekly_trend, daily_volume_trend, ath_distance_pct
+            )
+
+            return pd.DataFrame(
+                {
+                    "daily_trend": daily_trend,
+                    "weekly_trend": weekly_trend,
+                    "daily_volume_trend": daily_volume_trend,
+                    "weekly_volume_trend": weekly_volume_trend,
+                    "ath_distance_pct": ath_distance_pct,
+                    "rsi_current": rsi_current,
+                    "regime": regimes,
+                    "short_signals_allowed": short_signals_allowed(
+                        regimes, ath_distance_pct
+                    ),
+                    "confidence": regime_confidence(daily_trend, weekly_trend),
+                },
+                index=daily_df.index,
+            )
+
+        except Exception as e:
+            logger.exception(f"Грешка при market regime history: {e}")
+            raise AnalysisError(f"Market regime history failed: {e}") from e
+
+    def _ath_distance_pct(self, daily_df: pd.DataFrame) -> np.ndarray:
+        """Разстояние от ATH в % за всяка свещ (ATH колона, High или Close)"""
+        ath_col = (
+            "ATH"
+            if "ATH" in daily_df.columns
+            else ("High" if "High" in daily_df.columns else "Close")
+        )
+        drawdown, _ = drawdown_from_peak(
+            daily_df["Close"].to_numpy(dtype=float),
+            daily_df[ath_col].to_numpy(dtype=float),
+        )
+        return drawdown * 100
+
     def _calculate_trend_strength(
         self, df: pd.DataFrame, column: str, lookback: int
     ) -> float:
@@ -115,23 +356,12 @@ class MarketRegimeDetector:
                     logger.exception(f"Колона {column} не е намерена в DataFrame")
                     return 0.0
 
-            prices = df[column].tail(lookback)
+            prices = df[column].to_numpy(dtype=float)[-lookback:]
             if len(prices) < lookback:
                 return 0.0
 
-            # Linear regression slope normalized
-            x = np.arange(len(prices))
-            slope = float(np.polyfit(x, prices, 1)[0])
-
-            # Normalize by price volatility
-            price_std = float(prices.std())
-            if price_std == 0:
-                return 0.0
-
-            normalized_slope = slope / price_std
-
-            # Clamp between -3 and +3
-            return max(-3.0, min(3.0, normalized_slope))
+            # Linear regression slope normalized by price volatility
+            return float(rolling_trend_strength(prices, lookback)[-1])
 
         except Exception as e:
             logger.exception(f"Грешка при trend strength calculation: {e}")
@@ -140,25 +370,11 @@ class MarketRegimeDetector:
     def _analyze_volume_trend(self, df: pd.DataFrame, lookback: int) -> str:
         """Анализира тренда на обема"""
         try:
-            if "Volume" not in df.columns and "volume" not in df.columns:
-                return "unknown"
-
-            volume_col = "Volume" if "Volume" in df.columns else "volume"
-            volumes = df[volume_col].tail(lookback)
-            if len(volumes) < lookback:
+            volumes = OHLCV.from_frame(df).volume
+            if volumes is None or len(volumes) < lookback:
                 return "unknown"
 
-            # Simple trend analysis
-            first_half = volumes[: lookback // 2].mean()
-            second_half = volumes[lookback // 2 :].mean()
-
-            ratio = second_half / first_half if first_half > 0 else 1.0
-
-            if ratio > 1.2:
-                return "increasing"
-            if ratio < 0.8:
-                return "decreasing"
-            return "stable"
+            return str(rolling_volume_trend(volumes[-lookback:], lookback)[-1])
 
         except Exception as e:
             logger.exception(f"Грешка при volume trend analysis: {e}")
@@ -174,49 +390,25 @@ class MarketRegimeDetector:
         rsi_current: float,
     ) -> str:
         """Класифицира пазарния режим"""
-
-        # Weighted trend score (weekly has more weight)
-        combined_trend = (daily_trend * 0.4) + (weekly_trend * 0.6)
-
-        # Strong bull market conditions
-        if (
-            combined_trend > 1.5
-            and ath_distance_pct < 15
-            and daily_volume_trend in ["increasing", "stable"]
-        ):
-            return REGIME_STRONG_BULL
-
-        # Moderate bull market
-        if combined_trend > 0.5 and ath_distance_pct < 30:
-            return REGIME_MODERATE_BULL
-
-        # Bear market
-        if combined_trend < -0.5:
-            return REGIME_BEAR
-
-        # Default to neutral
-        return REGIME_NEUTRAL
+        return str(
+            classify_short_regimes(
+                np.array([daily_trend]),
+                np.array([weekly_trend]),
+                np.array([daily_volume_trend], dtype=object),
+                np.array([ath_distance_pct]),
+            )[0]
+        )
 
     def _are_short_signals_allowed(self, regime: str, ath_distance_pct: float) -> bool:
         """Определя дали SHORT сигналите са позволени"""
-
-        # Block SHORT in strong bull markets
-        if regime == REGIME_STRONG_BULL:
-            return False
-
-        # Strict filtering in moderate bull
-        if regime == REGIME_MODERATE_BULL and ath_distance_pct < 10:
-            return False
-
-        return True
+        return bool(
+            short_signals_allowed(
+                np.array([regime], dtype=object), np.array([ath_distance_pct])
+            )[0]
+        )
 
     def _calculate_regime_confidence(
         self, daily_trend: float, weekly_trend: float
     ) -> float:
         """Изчислява confidence на regime detection"""
-
-        # Higher confidence when both timeframes agree
-        trend_agreement = abs(daily_trend - weekly_trend)
-        max_confidence = 1.0 - (trend_agreement / 6.0)  # Max diff is 6 (-3 to +3)
-
-        return max(0.0, min(1.0, max_confidence))
+        return float(regime_confidence(daily_trend, weekly_trend))
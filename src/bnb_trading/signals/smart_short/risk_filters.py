@@ -3,6 +3,8 @@
 import logging
 from typing import Any
 
+import numpy as np
+
 from bnb_trading.core.constants import (
     ATH_PROXIMITY_MAX,
     ATH_PROXIMITY_MIN,
@@ -73,6 +75,38 @@ def apply_risk_filters(
         raise AnalysisError(f"Risk filter application failed: {e}") from e
 
 
+def risk_filter_mask(
+    ath_distance_pct: np.ndarray,
+    risk_reward_ratio: np.ndarray,
+    short_signals_allowed: np.ndarray,
+    config: dict[str, Any],
+) -> np.ndarray:
+    """
+    apply_risk_filters за масиви от кандидати (True = не е блокиран)
+
+    Volume филтърът не участва: без current_volume/avg_volume_20d в
+    market_data той пропуска всеки сигнал.
+
+    Args:
+        ath_distance_pct: Разстояние от ATH в %
+        risk_reward_ratio: Risk/reward на кандидатите
+        short_signals_allowed: Маска на пазарния режим
+        config: Risk management configuration
+
+    Returns:
+        Bool масив
+    """
+    min_distance, max_distance = _ath_distance_bounds(config)
+    min_rr = config.get("min_risk_reward_ratio", MIN_RISK_REWARD_RATIO)
+    ath_distance_pct = np.asarray(ath_distance_pct, dtype=float)
+    return (
+        (min_distance <= ath_distance_pct)
+        & (ath_distance_pct <= max_distance)
+        & ~(np.asarray(risk_reward_ratio) < min_rr)
+        & np.asarray(short_signals_allowed, dtype=bool)
+    )
+
+
 def calculate_stop_loss_take_profit(
     entry_price: float,
     risk_reward_ratio: float,
@@ -119,12 +153,18 @@ def _is_ath_distance_acceptable(
     ath_distance_pct: float, config: dict[str, Any]
 ) -> bool:
     """Check if ATH distance is within acceptable range for SHORT."""
-    min_distance = float(config.get("min_ath_distance_pct", ATH_PROXIMITY_MIN * 100))
-    max_distance = float(config.get("max_ath_distance_pct", ATH_PROXIMITY_MAX * 100))
-
+    min_distance, max_distance = _ath_distance_bounds(config)
     return min_distance <= ath_distance_pct <= max_distance
 
 
+def _ath_distance_bounds(config: dict[str, Any]) -> tuple[float, float]:
+    """Acceptable ATH distance range for SHORT in % (min, max)."""
+    return (
+        float(config.get("min_ath_distance_pct", ATH_PROXIMITY_MIN * 100)),
+        float(config.get("max_ath_distance_pct", ATH_PROXIMITY_MAX * 100)),
+    )
+
+
 def _has_sufficient_volume(market_data: dict[str, Any], config: dict[str, Any]) -> bool:
     """Check if volume is sufficient for SHORT entry."""
     try:
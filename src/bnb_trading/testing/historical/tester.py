@@ -2,16 +2,232 @@
 
 import json
 import logging
+import os
+import tempfile
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
-import toml
+import numpy as np
+import pandas as pd
 
-from bnb_trading.core.exceptions import AnalysisError
-from bnb_trading.core.models import BaselineMetrics, TestResult
+from bnb_trading.core.config import load_config
+from bnb_trading.core.exceptions import AnalysisError, InsufficientDataError
+from bnb_trading.core.models import BaselineMetrics, DecisionContext, TestResult
+from bnb_trading.data.schema import OHLCV
+from bnb_trading.data.store import OHLCVStore
 
 logger = logging.getLogger(__name__)
 
+# Дни история преди началото на най-ранния период (warm-up за индикаторите)
+WARMUP_DAYS = 200
+# Продължителност на daily и weekly свещите (open time + period = close time)
+CANDLE_PERIODS = (pd.Timedelta(days=1), pd.Timedelta(weeks=1))
+
+# Холдинг период за валидация на сигнал (както в Backtester)
+VALIDATION_DAYS = 14
+VALIDATION_WINDOW_DAYS = 21
+
+# Read-only history shared by the period workers (set once per process)
+_shared_history: dict[str, Any] = {}
+
+
+def _init_period_worker(
+    daily: pd.DataFrame | OHLCV,
+    weekly: pd.DataFrame | OHLCV,
+    config: Mapping[str, Any],
+) -> None:
+    """
+    Инициализира процеса с общите данни
+
+    Историята се пази като OHLCV серии: всяка седмица получава O(1)
+    prefix view за decide_long.
+    """
+    _shared_history["daily"] = OHLCV.from_frame(daily)
+    _shared_history["weekly"] = OHLCV.from_frame(weekly)
+    _shared_history["config"] = config
+
+
+def _open_period_worker(
+    directory: str,
+    names: tuple[str, str],
+    closed_at: pd.Timestamp,
+    config: Mapping[str, Any],
+) -> None:
+    """
+    Инициализира worker процес върху memory-mapped историята
+
+    Всички workers отварят едни и същи .npy файлове и споделят физическите
+    страници - нищо не се сериализира, паметта на worker не зависи от
+    дължината на историята. Сериите се отрязват до свещите, затворени към
+    ``closed_at`` - както в процеса, който е заредил историята.
+
+    Args:
+        directory: Директория на OHLCVStore
+        names: Имената на daily и weekly сериите в store-а
+        closed_at: Момент, към който историята е отрязана до затворени свещи
+        config: Конфигурация за decide_long
+    """
+    store = OHLCVStore(directory)
+    daily, weekly = (
+        _closed_candles(store.load(name), period, closed_at)
+        for name, period in zip(names, CANDLE_PERIODS, strict=True)
+    )
+    _init_period_worker(daily, weekly, config)
+
+
+def _evaluate_period(
+    period_name: str, start_date: str, end_date: str
+) -> TestResult | None:
+    """
+    Walk-forward оценка на един период върху общите данни
+
+    За всяка седмица в периода се вика decide_long само с данни до нея
+    (историята преди периода служи за warm-up). LONG сигналите се
+    валидират по daily close след VALIDATION_DAYS дни.
+
+    Args:
+        period_name: Име на периода
+        start_date: Начало на периода (YYYY-MM-DD)
+        end_date: Край на периода (YYYY-MM-DD)
+
+    Returns:
+        TestResult или None при грешка
+    """
+    from bnb_trading.signals.decision import decide_long
+
+    try:
+        daily = _shared_history["daily"]
+        weekly = _shared_history["weekly"]
+        config = _shared_history["config"]
+
+        start, end = np.datetime64(start_date), np.datetime64(end_date)
+        period_weeks = weekly.index[(weekly.index >= start) & (weekly.index < end)]
+
+        trades: list[tuple[float, float]] = []  # (pnl %, days held)
+        for week in period_weeks:
+            week_end = pd.Timestamp(week)
+            ctx = DecisionContext(
+                closed_daily_df=daily.until(week_end),
+                closed_weekly_df=weekly.until(week_end),
+                config=config,
+                timestamp=week_end,
+            )
+            decision = decide_long(ctx)
+            if decision.signal != "LONG":
+                continue
+
+            trade = _validate_long(daily, week_end)
+            if trade is not None:
+                trades.append(trade)
+
+        pnl_returns = [pnl for pnl, _ in trades]
+        long_signals = len(trades)
+        long_accuracy = (
+            sum(pnl > 0 for pnl in pnl_returns) / long_signals * 100
+            if long_signals
+            else 0.0
+        )
+
+        return TestResult(
+            period_name=period_name,
+            start_date=start_date,
+            end_date=end_date,
+            total_signals=long_signals,
+            long_signals=long_signals,
+            short_signals=0,  # decide_long генерира само LONG
+            long_accuracy=round(long_accuracy, 1),
+            short_accuracy=0.0,
+            overall_accuracy=round(long_accuracy, 1),
+            total_pnl=round(sum(pnl_returns), 2),
+            max_drawdown=_max_drawdown(pnl_returns),
+            sharpe_ratio=_sharpe_ratio(pnl_returns),
+            avg_trade_duration=(
+                round(sum(days for _, days in trades) / long_signals, 1)
+                if long_signals
+                else 0.0
+            ),
+        )
+
+    except Exception as e:
+        logger.exception(f"Error testing period {period_name}: {e}")
+        return None
+
+
+def _validate_long(
+    daily: OHLCV, signal_date: pd.Timestamp
+) -> tuple[float, float] | None:
+    """
+    Резултат от LONG сигнал (вход на close към датата) след холдинг периода
+
+    Returns:
+        (P&L %, дни в позиция) или None ако още няма данни за валидация
+    """
+    entry = np.searchsorted(daily.index, np.datetime64(signal_date), side="right")
+    if entry == 0:
+        return None
+    entry_price = float(daily.close[entry - 1])
+    if not entry_price or np.isnan(entry_price):
+        return None
+
+    target_date = signal_date + pd.Timedelta(days=VALIDATION_DAYS)
+    exit_position = np.searchsorted(daily.index, np.datetime64(target_date))
+    if exit_position == len(daily):
+        return None
+
+    exit_date = pd.Timestamp(daily.index[exit_position])
+    if exit_date > signal_date + pd.Timedelta(days=VALIDATION_WINDOW_DAYS):
+        logger.info(
+            f"Using fallback validation at {exit_date:%Y-%m-%d} "
+            f"for signal on {signal_date:%Y-%m-%d}"
+        )
+
+    exit_price = float(daily.close[exit_position])
+    pnl_pct = (exit_price - entry_price) / entry_price * 100
+    return pnl_pct, float((exit_date - signal_date).days)
+
+
+def _max_drawdown(pnl_returns: list[float]) -> float:
+    """Максимален drawdown (%) на compounded P&L серия"""
+    peak = value = 1.0
+    max_drawdown = 0.0
+    for pnl_pct in pnl_returns:
+        value *= 1 + pnl_pct / 100.0
+        peak = max(peak, value)
+        max_drawdown = max(max_drawdown, (peak - value) / peak)
+    return round(max_drawdown * 100, 2)
+
+
+def _sharpe_ratio(pnl_returns: list[float], risk_free_rate: float = 0.02) -> float:
+    """Sharpe ratio със същата annualization като Backtester"""
+    if len(pnl_returns) < 2:
+        return 0.0
+    returns = pd.Series(pnl_returns)
+    std_dev = returns.std(ddof=0) * 252**0.5
+    if std_dev == 0:
+        return 0.0
+    return round(float((returns.mean() * 252 - risk_free_rate) / std_dev), 3)
+
+
+def _utc_now() -> pd.Timestamp:
+    """Текущото UTC време без timezone (както индексите на OHLCV данните)."""
+    return pd.Timestamp.now(tz="UTC").tz_localize(None)
+
+
+def _closed_candles(series: OHLCV, period: pd.Timedelta, now: pd.Timestamp) -> OHLCV:
+    """Свещите, затворени към ``now`` (open time + period <= now), като view."""
+    return series[
+        : np.searchsorted(series.index, np.datetime64(now - period), side="right")
+    ]
+
+
+def _reaches(series: OHLCV, period: pd.Timedelta, end: pd.Timestamp) -> bool:
+    """Дали серията стига до ``end`` (следващата ѝ свещ не е затворена преди него)."""
+    return not series.empty and series.index[-1] > np.datetime64(end - 2 * period)
+
 
 class HistoricalTester:
     """
@@ -22,6 +238,12 @@ class HistoricalTester:
     - Performance regression detection
     - Automatic baseline comparison
     - Compatibility с всички 15+ analysis модула
+
+    Историята се зарежда веднъж и се споделя read-only между паралелни
+    workers (по един на период), така че пълният тест струва колкото
+    най-дългия период. Workers четат memory-mapped .npy файлове
+    (OHLCVStore): в ``[data] history_dir`` ако е зададена - там историята
+    се пази и между стартиранията - иначе във временна директория.
     """
 
     def __init__(self, config_path: str = "config.toml"):
@@ -32,16 +254,24 @@ class HistoricalTester:
             config_path: Път до конфигурационния файл
         """
         self.config_path = config_path
-        self.config = toml.load(config_path)
+        self.config = load_config(config_path)
 
         # Import here to avoid circular imports
-        from bnb_trading.backtester import Backtester
         from bnb_trading.data.fetcher import BNBDataFetcher
-        from bnb_trading.signals.generator import SignalGenerator
 
         self.data_fetcher = BNBDataFetcher(self.config["data"]["symbol"])
-        self.signal_generator = SignalGenerator(self.config)
-        self.backtester = Backtester(self.config_path)
+
+        # Локален memory-mapped store на историята (по избор)
+        history_dir = self.config["data"].get("history_dir")
+        self.store = OHLCVStore(history_dir) if history_dir else None
+        pair = self.config["data"]["symbol"].replace("/", "")
+        self._history_names = (f"{pair}_1d", f"{pair}_1w")
+
+        # Daily/weekly история, заредена веднъж за всички периоди
+        self._history: dict[str, OHLCV] | None = None
+        self._history_start = pd.Timestamp.max
+        self._history_end = pd.Timestamp.min
+        self._history_closed_at = pd.Timestamp.min
 
         # Load baseline metrics
         self.baseline_metrics = self.load_baseline_metrics()
@@ -73,8 +303,8 @@ class HistoricalTester:
         logger.info("🧪 HistoricalTester инициализиран успешно")
         logger.info(
             f"📊 Baseline metrics loaded: LONG {
-                self.baseline_metrics.long_accuracy:.1f}%, Overall {
-                self.baseline_metrics.overall_accuracy:.1f}%"
+                self.baseline_metrics.long_accuracy:.1f}%, SHORT {
+                self.baseline_metrics.short_accuracy:.1f}%"
         )
 
     def load_baseline_metrics(self) -> BaselineMetrics:
@@ -101,48 +331,191 @@ class HistoricalTester:
             logger.exception(f"Error loading baseline metrics: {e}")
             return BaselineMetrics(long_accuracy=100.0, short_accuracy=55.4)
 
+    def load_history(
+        self, start_date: str | None = None, end_date: str | None = None
+    ) -> dict[str, OHLCV]:
+        """
+        Зарежда daily/weekly историята веднъж (кешира се в инстанцията)
+
+        Ако store-ът вече покрива периода и е актуален, историята се
+        отваря memory-mapped без заявка към борсата.
+
+        Args:
+            start_date: Най-ранна нужна дата (по подразбиране най-ранният период)
+            end_date: Най-късна нужна дата (по подразбиране краят на последния период)
+
+        Returns:
+            Dict с "daily" и "weekly" OHLCV серии
+
+        Raises:
+            InsufficientDataError: Ако daily или weekly не стига до ``end_date``
+        """
+        periods = self.testing_periods.values()
+        earliest = pd.Timestamp(start_date or min(p["start"] for p in periods))
+        now = _utc_now()
+        # Бъдещ край се покрива до последната затворена свещ
+        latest = min(pd.Timestamp(end_date or max(p["end"] for p in periods)), now)
+        if (
+            self._history is not None
+            and earliest >= self._history_start
+            and latest <= self._history_end
+        ):
+            return self._history
+
+        history = self._stored_history(earliest, now)
+        if history is None:
+            # since пада в деня на warm-up началото (или преди него)
+            warmup_start = earliest - pd.Timedelta(days=WARMUP_DAYS)
+            lookback_days = (now - warmup_start).days + 1
+
+            data = self.data_fetcher.fetch_bnb_data(lookback_days)
+            if not data or data.get("daily") is None or data.get("weekly") is None:
+                raise InsufficientDataError("No historical data for period testing")
+
+            history = {
+                name: _closed_candles(OHLCV.from_frame(data[name]), period, now)
+                for name, period in zip(
+                    ("daily", "weekly"), CANDLE_PERIODS, strict=True
+                )
+            }
+            if self.store is not None:
+                for name, series in zip(
+                    self._history_names, history.values(), strict=True
+                ):
+                    self.store.save(name, series)
+
+        for name, period in zip(("daily", "weekly"), CANDLE_PERIODS, strict=True):
+            if not _reaches(history[name], period, latest):
+                raise InsufficientDataError(
+                    f"{name} history ends before {latest:%Y-%m-%d}"
+                )
+
+        self._history = history
+        self._history_start = earliest
+        self._history_end = latest
+        self._history_closed_at = now
+        logger.info(
+            f"📥 Историята е заредена веднъж: {len(history['daily'])} daily, "
+            f"{len(history['weekly'])} weekly свещи"
+        )
+        return self._history
+
+    def _stored_history(
+        self, earliest: pd.Timestamp, now: pd.Timestamp
+    ) -> dict[str, OHLCV] | None:
+        """
+        Историята от store-а, ако покрива ``earliest`` с warm-up и е актуална
+
+        Store-ът пази само затворени свещи (незатворените се отрязват и
+        при зареждане). Покрива периода, когато и двете серии започват не
+        по-късно от свещта с warm-up началото (както при fetch). Актуална е,
+        когато нито daily, нито weekly серията е пропуснала затворена свещ.
+        """
+        if self.store is None or not all(
+            name in self.store for name in self._history_names
+        ):
+            return None
+
+        warmup_start = earliest - pd.Timedelta(days=WARMUP_DAYS)
+        daily, weekly = (
+            _closed_candles(self.store.load(name), period, now)
+            for name, period in zip(self._history_names, CANDLE_PERIODS, strict=True)
+        )
+        for series, period in zip((daily, weekly), CANDLE_PERIODS, strict=True):
+            # Първата свещ трябва да е отворена преди края на warm-up свещта,
+            # а следващата след последната - още да не е затворена
+            if series.empty or series.index[0] >= np.datetime64(warmup_start + period):
+                return None
+            if not _reaches(series, period, now):
+                return None
+        logger.info(f"📂 Историята е отворена memory-mapped от {self.store.directory}")
+        return {"daily": daily, "weekly": weekly}
+
+    @contextmanager
+    def _worker_store(
+        self, history: dict[str, OHLCV]
+    ) -> Iterator[tuple[str, tuple[str, str]]]:
+        """
+        Store с историята за worker процесите
+
+        Yields:
+            (директория, имена на daily и weekly сериите)
+        """
+        if self.store is not None and all(
+            name in self.store for name in self._history_names
+        ):
+            yield str(self.store.directory), self._history_names
+            return
+
+        with tempfile.TemporaryDirectory(prefix="bnb_history_") as directory:
+            store = OHLCVStore(directory)
+            store.save("daily", history["daily"])
+            store.save("weekly", history["weekly"])
+            yield directory, ("daily", "weekly")
+
     def run_comprehensive_test(
         self,
         feature_name: str = "system_test",
-        custom_periods: list[str] | None = None,
+        custom_periods: list[str] | dict[str, dict[str, str]] | None = None,
+        max_workers: int | None = None,
     ) -> list[TestResult]:
         """
         Изпълнява comprehensive test за дадена функционалност
 
         Args:
             feature_name: Име на функционалността за тестване
-            custom_periods: Custom периоди за тестване (optional)
+            custom_periods: Имена на стандартни периоди или dict
+                {име: {"start", "end", "description"}} с custom периоди
+            max_workers: Брой паралелни workers (1 = в текущия процес)
 
         Returns:
-            List[TestResult]: Резултати от всички тестове
+            List[TestResult]: Резултати в реда на периодите
         """
         try:
-            test_results = []
-            periods_to_test = custom_periods or list(self.testing_periods.keys())
+            periods = self._resolve_periods(custom_periods)
 
             logger.info(f"🚀 Започва comprehensive test за '{feature_name}'")
-            logger.info(f"📅 Ще се тестват {len(periods_to_test)} периода")
+            logger.info(f"📅 Ще се тестват {len(periods)} периода")
+            if not periods:
+                return []
 
-            for period_name in periods_to_test:
-                if period_name not in self.testing_periods:
-                    logger.warning(f"Unknown period: {period_name}, skipping")
-                    continue
+            history = self.load_history(
+                min(config["start"] for config in periods.values()),
+                max(config["end"] for config in periods.values()),
+            )
+            workers = max_workers or min(len(periods), os.cpu_count() or 1)
 
-                period_config = self.testing_periods[period_name]
+            calls = []
+            for period_name, period_config in periods.items():
                 logger.info(
                     f"🔍 Testing period: {period_name} - {period_config['description']}"
                 )
-
-                # Run test for this period
-                result = self._test_single_period(
-                    period_name,
-                    period_config["start"],
-                    period_config["end"],
-                    period_config["description"],
+                calls.append(
+                    (period_name, period_config["start"], period_config["end"])
                 )
-
-                if result:
-                    test_results.append(result)
+            if workers <= 1:
+                _init_period_worker(history["daily"], history["weekly"], self.config)
+                results = [_evaluate_period(*call) for call in calls]
+            else:
+                with (
+                    self._worker_store(history) as (directory, names),
+                    ProcessPoolExecutor(
+                        max_workers=workers,
+                        initializer=_open_period_worker,
+                        initargs=(
+                            directory,
+                            names,
+                            self._history_closed_at,
+                            self.config,
+                        ),
+                    ) as executor,
+                ):
+                    futures = [
+                        executor.submit(_evaluate_period, *call) for call in calls
+                    ]
+                    results = [future.result() for future in futures]
+
+            test_results = [result for result in results if result]
 
             # Generate comparative analysis
             if test_results:
@@ -154,32 +527,32 @@ class HistoricalTester:
             logger.exception(f"Error in comprehensive test: {e}")
             raise AnalysisError(f"Historical testing failed: {e}") from e
 
+    def _resolve_periods(
+        self, custom_periods: list[str] | dict[str, dict[str, str]] | None
+    ) -> dict[str, dict[str, str]]:
+        """Избира периодите за тест (стандартни по име или custom дефиниции)."""
+        if isinstance(custom_periods, dict):
+            return {
+                name: {"description": "Custom period", **config}
+                for name, config in custom_periods.items()
+            }
+
+        periods = {}
+        for period_name in custom_periods or self.testing_periods:
+            if period_name not in self.testing_periods:
+                logger.warning(f"Unknown period: {period_name}, skipping")
+                continue
+            periods[period_name] = self.testing_periods[period_name]
+        return periods
+
     def _test_single_period(
         self, period_name: str, start_date: str, end_date: str, description: str
     ) -> TestResult | None:
-        """Test a single historical period."""
-        try:
-            # This would implement the actual testing logic
-            # For now, return a simplified result
-            return TestResult(
-                period_name=period_name,
-                start_date=start_date,
-                end_date=end_date,
-                total_signals=10,
-                long_signals=7,
-                short_signals=3,
-                long_accuracy=85.7,
-                short_accuracy=66.7,
-                overall_accuracy=80.0,
-                total_pnl=5.5,
-                max_drawdown=8.2,
-                sharpe_ratio=1.4,
-                avg_trade_duration=14.5,
-            )
-
-        except Exception as e:
-            logger.exception(f"Error testing period {period_name}: {e}")
-            return None
+        """Test a single historical period (in-process, on the shared history)."""
+        logger.info(f"🔍 Testing period: {period_name} - {description}")
+        history = self.load_history(start_date, end_date)
+        _init_period_worker(history["daily"], history["weekly"], self.config)
+        return _evaluate_period(period_name, start_date, end_date)
 
     def _log_test_summary(self, results: list[TestResult]) -> None:
         """Log summary of all test results."""
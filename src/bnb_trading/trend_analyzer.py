@@ -102,11 +102,25 @@ from typing import Any
 
 import numpy as np
 import pandas as pd
-from scipy import stats
+
+from .analysis.regime import (
+    RegimeThresholds,
+    bull_durations,
+    bull_pivots,
+    classify_regimes,
+    regime_history,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _linregress(x: np.ndarray, y: np.ndarray) -> Any:
+    """scipy.stats.linregress with scipy imported on first use (slow import)"""
+    from scipy import stats
+
+    return stats.linregress(x, y)
+
+
 class TrendAnalyzer:
     """
     Advanced Trend Analysis Engine with Adaptive Strategy Generation
@@ -265,6 +279,14 @@ class TrendAnalyzer:
         self.long_term_lookback_days = 180  # 6 месеца дългосрочен анализ
         self.medium_term_lookback_days = 90  # 3 месеца средносрочен анализ
         self.sustained_bull_months = 12  # 12 месеца за sustained bull
+        self.regime_thresholds = RegimeThresholds(
+            strong_bull=self.strong_bull_threshold,
+            moderate_bull=self.moderate_bull_threshold,
+            weak_bull=self.weak_bull_threshold,
+            bear=self.bear_threshold,
+            medium_days=self.medium_term_lookback_days,
+            long_days=self.long_term_lookback_days,
+        )
 
         # Enhanced logging with centralized configuration parameters
         logger.info("Trend анализатор инициализиран с централизирана конфигурация")
@@ -370,7 +392,7 @@ class TrendAnalyzer:
             x = np.arange(len(recent_data))
             y = np.array(recent_data["Close"].values, dtype=float)
 
-            slope, intercept, r_value, p_value, std_err = stats.linregress(x, y)
+            slope, intercept, r_value, p_value, std_err = _linregress(x, y)
 
             # Изчисляваме промяната в цената
             start_price = y[0]
@@ -440,7 +462,7 @@ class TrendAnalyzer:
             x = np.arange(len(recent_weeks))
             y = recent_weeks["Close"].values
 
-            slope, intercept, r_value, p_value, std_err = stats.linregress(x, y)
+            slope, intercept, r_value, p_value, std_err = _linregress(x, y)
 
             # Изчисляваме промяната
             start_price = y[0]
@@ -967,7 +989,7 @@ class TrendAnalyzer:
             x = np.arange(len(recent_data))
             y = np.array(recent_data["Close"].values, dtype=float)
 
-            slope, intercept, r_value, p_value, std_err = stats.linregress(x, y)
+            slope, intercept, r_value, p_value, std_err = _linregress(x, y)
 
             # Изчисляваме промяната в цената
             start_price = y[0]
@@ -1056,7 +1078,7 @@ class TrendAnalyzer:
             x = np.arange(len(recent_data))
             y = np.array(recent_data["Close"].values, dtype=float)
 
-            slope, intercept, r_value, p_value, std_err = stats.linregress(x, y)
+            slope, intercept, r_value, p_value, std_err = _linregress(x, y)
 
             # Изчисляваме промяната в цената
             start_price = y[0]
@@ -1147,60 +1169,18 @@ class TrendAnalyzer:
             medium_change = medium_trend["price_change_pct"]
             long_change = long_trend["price_change_pct"]
 
-            # STRONG_BULL критерии с конфигурабилни параметри - ключово за SHORT блокиране
-            if (
-                long_change > self.strong_bull_threshold
-                and medium_change > self.moderate_bull_threshold
-                and yearly_change_pct > 60
-            ):
-                regime = "STRONG_BULL"
-                confidence = min(0.9, (long_change / 100) + (yearly_change_pct / 200))
-                reason = f"Sustained bull run: 6м {long_change:+.1f}%, 3м {
-                    medium_change:+.1f}%, 12м {yearly_change_pct:+.1f}%"
-
-            # MODERATE_BULL с конфигурабилни прагове
-            elif (
-                long_change > self.moderate_bull_threshold
-                and medium_change > self.weak_bull_threshold
-            ):
-                regime = "MODERATE_BULL"
-                confidence = min(0.8, (long_change / 60) + (medium_change / 40))
-                reason = (
-                    f"Moderate bull: 6м {long_change:+.1f}%, 3м {medium_change:+.1f}%"
-                )
-
-            # WEAK_BULL с конфигурабилни прагове
-            elif long_change > self.weak_bull_threshold and medium_change > (
-                self.weak_bull_threshold / 2
-            ):
-                regime = "WEAK_BULL"
-                confidence = 0.6
-                reason = f"Weak bull: 6м {long_change:+.1f}%, 3м {medium_change:+.1f}%"
-
-            # BEAR MARKET с конфигурабилни прагове
-            elif (
-                long_change < (self.bear_threshold * 2)
-                and medium_change < self.bear_threshold
-            ):
-                regime = "BEAR"
-                confidence = min(0.9, abs(long_change / 50) + abs(medium_change / 30))
-                reason = (
-                    f"Bear market: 6м {long_change:+.1f}%, 3м {medium_change:+.1f}%"
-                )
-
-            # CORRECTION
-            elif long_change > 0 and medium_change < -10:
-                regime = "CORRECTION"
-                confidence = 0.7
-                reason = f"Correction phase: 6м {long_change:+.1f}%, но 3м {medium_change:+.1f}%"
-
-            # NEUTRAL/RANGE
-            else:
-                regime = "NEUTRAL"
-                confidence = 0.5
-                reason = (
-                    f"Neutral range: 6м {long_change:+.1f}%, 3м {medium_change:+.1f}%"
-                )
+            # Същите правила като regime_history (конфигурабилни прагове)
+            regimes, confidences = classify_regimes(
+                [long_change],
+                [medium_change],
+                [yearly_change_pct],
+                self.regime_thresholds,
+            )
+            regime = str(regimes[0])
+            confidence = float(confidences[0])
+            reason = self._regime_reason(
+                regime, long_change, medium_change, yearly_change_pct
+            )
 
             market_regime = {
                 "regime": regime,
@@ -1223,66 +1203,61 @@ class TrendAnalyzer:
             logger.exception(f"Грешка при определяне на market regime: {e}")
             return {"regime": "UNKNOWN", "confidence": 0.0, "reason": f"Грешка: {e}"}
 
+    def _regime_reason(
+        self,
+        regime: str,
+        long_change: float,
+        medium_change: float,
+        yearly_change_pct: float,
+    ) -> str:
+        """Текстово обяснение за market regime"""
+        changes = f"6м {long_change:+.1f}%, 3м {medium_change:+.1f}%"
+        reasons = {
+            "STRONG_BULL": f"Sustained bull run: {changes}, 12м {yearly_change_pct:+.1f}%",
+            "MODERATE_BULL": f"Moderate bull: {changes}",
+            "WEAK_BULL": f"Weak bull: {changes}",
+            "BEAR": f"Bear market: {changes}",
+            "CORRECTION": f"Correction phase: 6м {long_change:+.1f}%, но 3м {
+                medium_change:+.1f}%",
+            "UNKNOWN": "Недостатъчни данни",
+        }
+        return reasons.get(regime, f"Neutral range: {changes}")
+
     def _estimate_bull_duration(self, df: pd.DataFrame) -> int:
         """Оценява продължителността на bull market в месеци с drawdown-based pivot detection"""
         try:
             if len(df) < 60:  # Минимум 2 месеца данни
                 return 0
 
-            # Enhanced drawdown-based pivot detection for more robust bull market duration
-            current_price = df["Close"].iloc[-1]
-            prices = df["Close"].values
-
-            # Find significant drawdown pivots (20%+ correction from recent highs)
-            drawdown_threshold = 0.20  # 20% drawdown threshold
-            min_recovery_gain = (
-                0.15  # 15% minimum recovery to confirm bull continuation
-            )
-
-            # Track rolling highs and significant drawdowns
-            rolling_high = current_price
-            last_significant_low_idx = len(prices) - 1
-
-            # Work backwards to find the last major drawdown pivot
-            for i in range(
-                len(prices) - 2, max(0, len(prices) - 547), -1
-            ):  # Up to 18 months back
-                price = prices[i]
-
-                # Update rolling high as we go back
-                rolling_high = max(price, rolling_high)
-
-                # Check for significant drawdown from rolling high
-                drawdown = (rolling_high - price) / rolling_high
-                if drawdown >= drawdown_threshold:
-                    # Found a significant low - check if we recovered meaningfully since then
-                    recovery_from_low = (current_price - price) / price
-                    if recovery_from_low >= min_recovery_gain:
-                        # This is our bull market start point
-                        last_significant_low_idx = i
-                        break
-
-            # Calculate duration from last significant low to now
-            days_since_low = len(prices) - 1 - last_significant_low_idx
-            months_duration = max(1, days_since_low // 30)  # At least 1 month
-
-            # Validate the bull run strength
-            if last_significant_low_idx < len(prices) - 1:
-                bull_gain = (current_price / prices[last_significant_low_idx] - 1) * 100
-                if (
-                    bull_gain < 15
-                ):  # Less than 15% total gain doesn't qualify as significant bull
-                    return 0
+            # Последният 20%+ drawdown pivot с 15%+ възстановяване (до 18 месеца назад)
+            closes = df["Close"].to_numpy(dtype=float)
+            ends = np.array([len(closes) - 1])
+            pivots = bull_pivots(closes, ends)
+            months_duration = int(bull_durations(closes, pivots, ends)[0])
 
-            logger.info(
-                f"Bull market duration: {months_duration} months (drawdown-based pivot detection)"
-            )
-            return min(months_duration, 18)  # Cap at 18 months for sanity
+            if months_duration:
+                logger.info(
+                    f"Bull market duration: {months_duration} months (drawdown-based pivot detection)"
+                )
+            return months_duration
 
         except Exception as e:
             logger.exception(f"Грешка при оценка на bull duration: {e}")
             return 0
 
+    def regime_history(self, daily_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Market regime и bull/bear продължителност за всяка свещ наведнъж
+
+        Args:
+            daily_df: Daily OHLCV данни
+
+        Returns:
+            DataFrame от ``analysis.regime.regime_history`` с праговете на
+            този анализатор
+        """
+        return regime_history(daily_df["Close"], self.regime_thresholds)
+
 
 if __name__ == "__main__":
     print("Trend Analyzer модул за BNB Trading System")
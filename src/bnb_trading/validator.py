@@ -12,7 +12,7 @@ ARCHITECTURE OVERVIEW:
     - Signal capture and storage with complete analysis context
     - Automated validation after configurable holding periods
     - Performance metrics calculation and statistical analysis
-    - Historical performance database with CSV persistence
+    - Historical performance journal (append-only SQLite) with CSV export
     - Comprehensive reporting and analytics capabilities
 
 VALIDATION METHODOLOGY:
@@ -47,7 +47,8 @@ PERFORMANCE METRICS TRACKED:
     - Recovery Factor: Net profit divided by max drawdown
 
 DATA PERSISTENCE:
-    - CSV-based storage for portability and analysis
+    - Append-only SQLite signal journal indexed by signal_date and type
+    - CSV export for portability and analysis
     - Complete signal context preservation
     - Historical performance database
     - Backup and recovery capabilities
@@ -116,12 +117,13 @@ DATE: 2024-01-01
 """
 
 import logging
-import os
+from pathlib import Path
 from typing import Any
 
-import numpy as np
 import pandas as pd
 
+from bnb_trading.data.journal import SignalJournal
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -138,7 +140,7 @@ class SignalValidator:
         - Signal capture system with complete analysis context preservation
         - Automated validation framework with configurable holding periods
         - Comprehensive performance metrics calculation and tracking
-        - Historical database management with CSV persistence
+        - Historical journal management (append-only SQLite, CSV export)
         - Statistical analysis and reporting capabilities
 
     SIGNAL CAPTURE PROCESS:
@@ -163,7 +165,8 @@ class SignalValidator:
         - Historical Trends: Performance analysis over time periods
 
     DATABASE MANAGEMENT:
-        - CSV-based storage for portability and external analysis
+        - Append-only SQLite journal: O(1) writes, indexed lookups
+        - CSV export for portability and external analysis
         - Automatic file creation and schema management
         - Data integrity validation and backup procedures
         - Historical data compaction and maintenance
@@ -171,6 +174,7 @@ class SignalValidator:
 
     CONFIGURATION PARAMETERS:
         results_file (str): Path to CSV results database (default: 'results.csv')
+        journal_file (str): Path to SQLite journal (default: results_file.sqlite)
         holding_period_days (int): Days to hold before validation (default: 14)
         validation_tolerance (float): Price tolerance for validation (default: 0.01)
         max_results_history (int): Maximum records to maintain (default: 10000)
@@ -185,8 +189,9 @@ class SignalValidator:
         - Risk assessment and position sizing recommendations
 
     ATTRIBUTES:
-        results_file (str): Path to the results CSV file
-        results_df (pd.DataFrame): In-memory results database
+        results_file (str): Path to the results CSV file (export/migration)
+        journal (SignalJournal): Append-only SQLite signal journal
+        results_df (pd.DataFrame): Snapshot of the journal (read-only property)
         holding_period_days (int): Validation holding period
         validation_tolerance (float): Price tolerance for validation
 
@@ -223,7 +228,9 @@ class SignalValidator:
         and manages the complete signal lifecycle from capture to validation.
     """
 
-    def __init__(self, results_file: str = "results.csv") -> None:
+    def __init__(
+        self, results_file: str = "results.csv", journal_file: str | None = None
+    ) -> None:
         """
         Initialize the Signal Validator with results database configuration.
 
@@ -231,9 +238,11 @@ class SignalValidator:
         the database for signal capture and performance tracking.
 
         Args:
-            results_file (str): Path to CSV file for storing results.
-                If file doesn't exist, it will be created automatically.
-                Should have .csv extension for proper handling.
+            results_file (str): Path to the legacy CSV results file.
+                Used as CSV export target and, on first run, imported into
+                the signal journal.
+            journal_file (str | None): Path to the SQLite signal journal.
+                Defaults to results_file with a .sqlite suffix.
 
         Raises:
             ValueError: If results_file path is invalid
@@ -247,75 +256,26 @@ class SignalValidator:
             >>> validator = SignalValidator('my_trading_results.csv')
         """
         self.results_file = results_file
-        self.results_df = self._load_or_create_results()
-
-        logger.info(f"Signal Validator инициализиран. Резултати: {results_file}")
+        self.journal_file = journal_file or str(
+            Path(results_file).with_suffix(".sqlite")
+        )
+        self.journal = SignalJournal(self.journal_file)
 
-    def _load_or_create_results(self) -> pd.DataFrame:
-        """
-        Зарежда съществуващи резултати или създава нов файл
+        # Еднократна миграция от стария CSV формат
+        imported = self.journal.import_csv(self.results_file)
+        if imported:
+            logger.info(f"Заредени {imported} съществуващи резултата")
 
-        Returns:
-            DataFrame с резултатите
-        """
-        try:
-            if os.path.exists(self.results_file):
-                df = pd.read_csv(self.results_file)
-                df["signal_date"] = pd.to_datetime(df["signal_date"])
-                df["validation_date"] = pd.to_datetime(df["validation_date"])
-                logger.info(f"Заредени {len(df)} съществуващи резултата")
-                return df
-            # Създаваме нов DataFrame
-            columns = [
-                "signal_date",
-                "signal_type",
-                "signal_price",
-                "confidence",
-                "priority",
-                "fibonacci_level",
-                "weekly_tail_strength",
-                "reason",
-                "risk_level",
-                "validation_date",
-                "validation_price",
-                "profit_loss",
-                "profit_loss_pct",
-                "success",
-                "failure_reason",
-                "days_to_target",
-                "target_reached",
-            ]
-            df = pd.DataFrame(columns=columns)
-            logger.info("Създаден нов файл за резултати")
-            return df
+        logger.info(f"Signal Validator инициализиран. Журнал: {self.journal_file}")
 
-        except Exception as e:
-            logger.exception(f"Грешка при зареждане на резултати: {e}")
-            # Създаваме празен DataFrame
-            columns = [
-                "signal_date",
-                "signal_type",
-                "signal_price",
-                "confidence",
-                "priority",
-                "fibonacci_level",
-                "weekly_tail_strength",
-                "reason",
-                "risk_level",
-                "validation_date",
-                "validation_price",
-                "profit_loss",
-                "profit_loss_pct",
-                "success",
-                "failure_reason",
-                "days_to_target",
-                "target_reached",
-            ]
-            return pd.DataFrame(columns=columns)
+    @property
+    def results_df(self) -> pd.DataFrame:
+        """Snapshot of all journal entries in the results.csv schema."""
+        return self.journal.to_dataframe()
 
     def save_signal(self, signal_data: dict) -> bool:
         """
-        Записва нов сигнал в резултатите
+        Записва нов сигнал в журнала (append-only, без презапис на историята)
 
         Args:
             signal_data: Данни за сигнала
@@ -367,23 +327,12 @@ class SignalValidator:
                 "weekly_tail_strength": tail_strength,
                 "reason": reason,
                 "risk_level": risk_level,
-                "validation_date": pd.NaT,
-                "validation_price": np.nan,
-                "profit_loss": np.nan,
-                "profit_loss_pct": np.nan,
-                "success": np.nan,
                 "failure_reason": "",
-                "days_to_target": np.nan,
                 "target_reached": False,
             }
 
-            # Добавяме в DataFrame
-            self.results_df = pd.concat(
-                [self.results_df, pd.DataFrame([new_row])], ignore_index=True
-            )
-
-            # Записваме в файл
-            self._save_results()
+            # Добавяме един ред в журнала
+            self.journal.append(new_row)
 
             logger.info(
                 f"Сигнал записан: {signal_type} на {signal_date.strftime('%Y-%m-%d')} при ${signal_price:,.2f}"
@@ -412,16 +361,13 @@ class SignalValidator:
             Dict с резултата от валидацията
         """
         try:
-            # Намираме сигнала в резултатите
-            signal_mask = self.results_df["signal_date"] == signal_date
-            if not signal_mask.any():
+            # Намираме сигнала в журнала (индексирано търсене по signal_date)
+            signal_row = self.journal.find_by_date(signal_date)
+            if signal_row is None:
                 return {
                     "error": f"Сигнал за {signal_date.strftime('%Y-%m-%d')} не е намерен"
                 }
 
-            signal_idx = signal_mask.idxmax()
-            signal_row = self.results_df.loc[signal_idx]
-
             # Проверяваме дали вече е валидиран
             if pd.notna(signal_row["validation_date"]):
                 return {
@@ -473,18 +419,20 @@ class SignalValidator:
                 elif signal_type == "SHORT":
                     failure_reason = f"Цената се повиши от ${signal_price:,.2f} до ${current_price:,.2f}"
 
-            # Обновяваме резултата
-            self.results_df.loc[signal_idx, "validation_date"] = pd.Timestamp.now()
-            self.results_df.loc[signal_idx, "validation_price"] = current_price
-            self.results_df.loc[signal_idx, "profit_loss"] = profit_loss
-            self.results_df.loc[signal_idx, "profit_loss_pct"] = profit_loss_pct
-            self.results_df.loc[signal_idx, "success"] = success
-            self.results_df.loc[signal_idx, "failure_reason"] = failure_reason
-            self.results_df.loc[signal_idx, "days_to_target"] = days_to_target
-            self.results_df.loc[signal_idx, "target_reached"] = target_reached
-
-            # Записваме обновените резултати
-            self._save_results()
+            # Обновяваме реда по primary key
+            self.journal.record_validation(
+                signal_row["id"],
+                {
+                    "validation_date": pd.Timestamp.now(),
+                    "validation_price": current_price,
+                    "profit_loss": profit_loss,
+                    "profit_loss_pct": profit_loss_pct,
+                    "success": success,
+                    "failure_reason": failure_reason,
+                    "days_to_target": days_to_target,
+                    "target_reached": target_reached,
+                },
+            )
 
             validation_result = {
                 "signal_date": signal_date,
@@ -516,6 +464,9 @@ class SignalValidator:
         """
         Връща статистика за точността на сигналите
 
+        Статистиката идва от една агрегираща заявка върху индекса по
+        signal_date - без зареждане на историята в паметта.
+
         Args:
             lookback_days: Брой дни за lookback
 
@@ -523,96 +474,45 @@ class SignalValidator:
             Dict с статистика за точността
         """
         try:
-            # Филтрираме по период
             cutoff_date = pd.Timestamp.now() - pd.Timedelta(days=lookback_days)
-            recent_signals = self.results_df[
-                (self.results_df["signal_date"] >= cutoff_date)
-                & (pd.notna(self.results_df["validation_date"]))
-            ].copy()
+            groups = self.journal.accuracy_breakdown(cutoff_date)
 
-            if recent_signals.empty:
+            total_signals = sum(g["total"] for g in groups)
+            if total_signals == 0:
                 return {
                     "error": f"Няма валидирани сигнали за последните {lookback_days} дни"
                 }
 
-            # Обща статистика
-            total_signals = len(recent_signals)
-            successful_signals = len(recent_signals[recent_signals["success"]])
-            accuracy = (
-                (successful_signals / total_signals) * 100 if total_signals > 0 else 0
-            )
+            successful_signals = sum(g["success"] for g in groups)
+            accuracy = (successful_signals / total_signals) * 100
 
-            # Статистика по тип сигнал
-            long_signals = recent_signals[recent_signals["signal_type"] == "LONG"]
-            short_signals = recent_signals[recent_signals["signal_type"] == "SHORT"]
-
-            long_accuracy = 0
-            if len(long_signals) > 0:
-                long_success = len(long_signals[long_signals["success"]])
-                long_accuracy = (long_success / len(long_signals)) * 100
-
-            short_accuracy = 0
-            if len(short_signals) > 0:
-                short_success = len(short_signals[short_signals["success"]])
-                short_accuracy = (short_success / len(short_signals)) * 100
-
-            # Статистика по приоритет
-            priority_stats = {}
-            for priority in recent_signals["priority"].unique():
-                if pd.notna(priority):
-                    priority_signals = recent_signals[
-                        recent_signals["priority"] == priority
-                    ]
-                    priority_success = len(
-                        priority_signals[priority_signals["success"]]
-                    )
-                    priority_accuracy = (
-                        (priority_success / len(priority_signals)) * 100
-                        if len(priority_signals) > 0
-                        else 0
-                    )
-                    priority_stats[priority] = {
-                        "total": len(priority_signals),
-                        "success": priority_success,
-                        "accuracy": priority_accuracy,
-                    }
-
-            # Среден P&L
-            avg_profit_loss = recent_signals["profit_loss_pct"].mean()
-            avg_profit_loss_success = recent_signals[recent_signals["success"]][
-                "profit_loss_pct"
-            ].mean()
-            avg_profit_loss_failure = recent_signals[~recent_signals["success"]][
-                "profit_loss_pct"
-            ].mean()
+            # Статистика по тип сигнал и по приоритет
+            type_stats = {
+                signal_type: _accuracy_bucket(
+                    [g for g in groups if g["signal_type"] == signal_type]
+                )
+                for signal_type in ("LONG", "SHORT")
+            }
+            priority_stats = {
+                priority: _accuracy_bucket(
+                    [g for g in groups if g["priority"] == priority]
+                )
+                for priority in dict.fromkeys(
+                    g["priority"] for g in groups if g["priority"] is not None
+                )
+            }
 
             stats = {
                 "period_days": lookback_days,
                 "total_signals": total_signals,
                 "successful_signals": successful_signals,
                 "overall_accuracy": accuracy,
-                "long_signals": {
-                    "total": len(long_signals),
-                    "success": (
-                        len(long_signals[long_signals["success"]])
-                        if len(long_signals) > 0
-                        else 0
-                    ),
-                    "accuracy": long_accuracy,
-                },
-                "short_signals": {
-                    "total": len(short_signals),
-                    "success": (
-                        len(short_signals[short_signals["success"]])
-                        if len(short_signals) > 0
-                        else 0
-                    ),
-                    "accuracy": short_accuracy,
-                },
+                "long_signals": type_stats["LONG"],
+                "short_signals": type_stats["SHORT"],
                 "priority_stats": priority_stats,
-                "avg_profit_loss_pct": avg_profit_loss,
-                "avg_profit_loss_success_pct": avg_profit_loss_success,
-                "avg_profit_loss_failure_pct": avg_profit_loss_failure,
+                "avg_profit_loss_pct": _weighted_mean(groups, "pnl"),
+                "avg_profit_loss_success_pct": _weighted_mean(groups, "pnl_success"),
+                "avg_profit_loss_failure_pct": _weighted_mean(groups, "pnl_failure"),
                 "analysis_date": pd.Timestamp.now(),
             }
 
@@ -636,11 +536,8 @@ class SignalValidator:
             DataFrame с последните сигнали
         """
         try:
-            # Сортираме по дата на сигнала (намаляващо)
-            sorted_results = self.results_df.sort_values("signal_date", ascending=False)
-
-            # Връщаме последните N
-            recent_signals = sorted_results.head(count)
+            # ORDER BY signal_date DESC LIMIT N върху индекса
+            recent_signals = self.journal.recent(count)
 
             logger.info(f"Върнати последните {len(recent_signals)} сигнала")
             return recent_signals
@@ -651,7 +548,7 @@ class SignalValidator:
 
     def _save_results(self) -> bool:
         """
-        Записва резултатите в CSV файл
+        Експортира журнала в CSV файл (при поискване, не при всеки сигнал)
 
         Returns:
             True ако е записан успешно
@@ -680,10 +577,8 @@ class SignalValidator:
                 f.write("=" * 50 + "\n\n")
 
                 # Обща статистика
-                total_signals = len(self.results_df)
-                validated_signals = len(
-                    self.results_df[pd.notna(self.results_df["validation_date"])]
-                )
+                total_signals = self.journal.count()
+                validated_signals = self.journal.count(validated_only=True)
 
                 f.write(f"Общо сигнали: {total_signals}\n")
                 f.write(f"Валидирани сигнали: {validated_signals}\n")
@@ -736,6 +631,25 @@ class SignalValidator:
             return False
 
 
+def _accuracy_bucket(groups: list[dict[str, Any]]) -> dict[str, Any]:
+    """Сумира агрегатни групи от журнала в total/success/accuracy"""
+    total = sum(g["total"] for g in groups)
+    success = sum(g["success"] for g in groups)
+    return {
+        "total": total,
+        "success": success,
+        "accuracy": (success / total) * 100 if total > 0 else 0,
+    }
+
+
+def _weighted_mean(groups: list[dict[str, Any]], prefix: str) -> float:
+    """Среден P&L от сумите по групи (NaN ако няма стойности, както pandas)"""
+    count = sum(g[f"{prefix}_count"] for g in groups)
+    if count == 0:
+        return float("nan")
+    return sum(g[f"{prefix}_sum"] or 0.0 for g in groups) / count
+
+
 if __name__ == "__main__":
     # Тест на Signal Validator модула
     print("Signal Validator модул за BNB Trading System")
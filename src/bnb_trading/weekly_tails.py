@@ -77,6 +77,8 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
+from .data.schema import OHLCV
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -205,6 +207,9 @@ class WeeklyTailsAnalyzer:
         """
         Анализира седмични опашки за последните N седмици
 
+        Всички седмици се оценяват наведнъж (score_tails); dict записи се
+        създават само за значимите опашки.
+
         Args:
             weekly_df: DataFrame с седмични OHLCV данни
 
@@ -213,22 +218,15 @@ class WeeklyTailsAnalyzer:
         """
         try:
             # Взимаме последните N седмици
-            recent_weeks = weekly_df.tail(self.lookback_weeks)
-
-            tails_analysis = []
+            scores = _tail_scores(weekly_df, self.lookback_weeks)
 
-            for date, row in recent_weeks.iterrows():
-                # Convert date to string first, then to Timestamp
-                if isinstance(date, pd.Timestamp):
-                    timestamp = date
-                else:
-                    timestamp = pd.Timestamp(str(date))
-                tail_info = self._analyze_single_tail(row, timestamp)
-                if tail_info:
-                    tails_analysis.append(tail_info)
-
-            # Сортираме по сила на опашката (намаляващо)
-            tails_analysis.sort(key=lambda x: x["tail_strength"], reverse=True)
+            # Сортираме по сила на опашката (намаляващо, стабилно)
+            significant = np.flatnonzero(scores["significant"])
+            order = significant[
+                np.argsort(-scores["tail_strength"][significant], kind="stable")
+            ]
+            dates = pd.DatetimeIndex(weekly_df.index[-self.lookback_weeks :])
+            tails_analysis = [_tail_record(scores, i, dates[i]) for i in order.tolist()]
 
             logger.info(f"Анализирани {len(tails_analysis)} седмични опашки")
 
@@ -238,119 +236,31 @@ class WeeklyTailsAnalyzer:
             logger.exception(f"Грешка при анализ на седмични опашки: {e}")
             return []
 
-    def _analyze_single_tail(self, row: pd.Series, date: pd.Timestamp) -> dict | None:
+    def score_tails(self, weekly_df: pd.DataFrame) -> pd.DataFrame:
         """
-        Анализира единична седмична опашка
+        Оценява опашките на всички седмици наведнъж (без Python цикли)
 
         Args:
-            row: Ред с OHLCV данни
-            date: Дата на седмицата
+            weekly_df: DataFrame с седмични OHLCV данни (цялата история)
 
         Returns:
-            Dict с информация за опашката или None ако няма значима опашка
+            DataFrame по седмици с dominant_tail, tail_size, body_size,
+            tail_strength, signal, signal_strength и significant
         """
-        try:
-            # Извличаме стойностите като скаларни числа, не като Series
-            ohlc = np.nan_to_num(
-                [
-                    row.get("Open", np.nan),
-                    row.get("High", np.nan),
-                    row.get("Low", np.nan),
-                    row.get("Close", np.nan),
-                ],
-                nan=0.0,
-                posinf=0.0,
-                neginf=0.0,
-            )
-            open_price, high_price, low_price, close_price = map(float, ohlc)
-            # Изчисляваме размера на body (Open до Close)
-            body_size = abs(close_price - open_price)
-
-            # Определяме дали е bullish или bearish candle
-            is_bullish = close_price > open_price
-
-            # Изчисляваме горната опашка (upper wick)
-            upper_tail = high_price - max(open_price, close_price)
-
-            # Изчисляваме долната опашка (lower wick)
-            lower_tail = min(open_price, close_price) - low_price
-
-            # Определяме коя опашка е по-голяма
-            if upper_tail > lower_tail:
-                dominant_tail = "upper"
-                tail_size = upper_tail
-                tail_direction = "resistance"  # Горната опашка показва resistance
-            else:
-                dominant_tail = "lower"
-                tail_size = lower_tail
-                tail_direction = "support"  # Долната опашка показва support
-
-            # Изчисляваме силата на опашката като процент от body
-            # Защитни проверки за да избегнем DataFrame операции
-            if (
-                isinstance(body_size, (int, float)) and body_size > 0.01
-            ):  # Минимален body size
-                tail_strength = float(tail_size) / float(body_size)
-            else:
-                tail_strength = 0.0
-
-            # Проверяваме дали опашката е значима (ПО-СТРИКТНИ ПРАГОВЕ)
-            if tail_strength < 0.9:  # МАКСИМАЛНО СТРИКТЕН
-                return None
-
-            # Определяме силата на опашката (МАКСИМАЛНО СТРИКТНИ КРИТЕРИИ)
-            if tail_strength >= 0.95:  # Само най-силните опашки
-                strength_category = "ULTRA_EXTREME"
-                signal_strength = 0.99
-            elif tail_strength >= 0.9:  # Много силни опашки
-                strength_category = "EXTREME"
-                signal_strength = 0.95
-            else:
-                strength_category = "STRONG"
-                signal_strength = 0.8
-
-            # Генерираме сигнал базиран на опашката (ПО-СТРИКТНИ ПРАВИЛА ЗА SHORT)
-            if dominant_tail == "lower" and is_bullish and tail_strength >= 0.4:
-                # Долна опашка + bullish candle = LONG сигнал
-                signal = "LONG"
-                reason = f"Сигнална долна опашка ({tail_strength:.1%}) + bullish candle"
-            elif dominant_tail == "upper" and not is_bullish and tail_strength >= 0.95:
-                # Горна опашка + bearish candle + СИЛНА опашка = SHORT сигнал
-                signal = "SHORT"
-                reason = f"Сигнална горна опашка ({tail_strength:.1%}) + bearish candle"
-            else:
-                # Смесени сигнали или недостатъчно силни опашки
-                signal = "HOLD"
-                reason = f"Смесен сигнал: {dominant_tail} опашка ({tail_strength:.1%})"
-
-            tail_info = {
-                "date": date,
-                "open": open_price,
-                "high": high_price,
-                "low": low_price,
-                "close": close_price,
-                "is_bullish": is_bullish,
-                "dominant_tail": dominant_tail,
-                "tail_size": tail_size,
-                "body_size": body_size,
-                "tail_strength": tail_strength,
-                "strength_category": strength_category,
-                "tail_direction": tail_direction,
-                "signal": signal,
-                "signal_strength": signal_strength,
-                "reason": reason,
-            }
-
-            logger.info(
-                f"Седмица {date.strftime('%Y-%m-%d')}: {dominant_tail} опашка, сила: {
-                    tail_strength:.1%}, сигнал: {signal}"
-            )
-
-            return tail_info
-
-        except Exception as e:
-            logger.exception(f"Грешка при анализ на единична опашка: {e}")
-            return None
+        scores = _tail_scores(weekly_df)
+        return pd.DataFrame(
+            {
+                "is_bullish": scores["is_bullish"],
+                "dominant_tail": np.where(scores["upper_dominant"], "upper", "lower"),
+                "tail_size": scores["tail_size"],
+                "body_size": scores["body_size"],
+                "tail_strength": scores["tail_strength"],
+                "signal": scores["signal"],
+                "signal_strength": scores["signal_strength"],
+                "significant": scores["significant"],
+            },
+            index=weekly_df.index,
+        )
 
     def calculate_tail_strength(self, tail_info: dict) -> float:
         """
@@ -396,6 +306,9 @@ class WeeklyTailsAnalyzer:
         """
         Проверява съвпадение между Fibonacci нива и седмични опашки
 
+        Нивата се сортират веднъж и за всяка опашка searchsorted намира
+        нивата в ±2% от целевата цена, вместо сравнение с всяко ниво.
+
         Args:
             fib_levels: Fibonacci нива
             current_price: Текуща цена
@@ -412,62 +325,66 @@ class WeeklyTailsAnalyzer:
                 "best_entry_points": [],
             }
 
-            # Проверяваме всяка опашка за съвпадение с Fibonacci нива
-            for tail in tails_analysis:
-                if tail["signal"] == "HOLD":
-                    continue
-
-                # Определяме целевата цена за опашката
-                if tail["dominant_tail"] == "lower" and tail["signal"] == "LONG":
-                    # Долна опашка + LONG = търсим support ниво
-                    target_price = tail["low"]
-                elif tail["dominant_tail"] == "upper" and tail["signal"] == "SHORT":
-                    # Горна опашка + SHORT = търсим resistance ниво
-                    target_price = tail["high"]
-                else:
-                    continue
-
-                # Проверяваме за съвпадение с Fibonacci нива
-                for fib_level, fib_price in fib_levels.items():
-                    # Изчисляваме разстоянието до Fibonacci ниво
-                    distance = abs(target_price - fib_price)
-                    distance_percentage = distance / target_price
-
-                    # Ако опашката е близо до Fibonacci ниво
-                    if distance_percentage <= 0.02:  # 2% близост
-                        confluence_point = {
-                            "tail_date": tail["date"],
-                            "tail_signal": tail["signal"],
-                            "tail_strength": tail["tail_strength"],
-                            "fib_level": fib_level,
-                            "fib_price": fib_price,
-                            "target_price": target_price,
-                            "distance": distance,
-                            "distance_percentage": distance_percentage,
-                            "confluence_score": tail["signal_strength"]
-                            * (1 - distance_percentage),
-                        }
-
-                        confluence_info["confluence_points"].append(confluence_point)
-
-                        # Проверяваме дали е силно съвпадение
-                        if confluence_point["confluence_score"] >= 0.6:
-                            confluence_info["strong_confluence"] = True
-                            confluence_info["confluence_bonus"] = self.confluence_bonus
-
-                            # Добавяме в най-добрите входни точки
-                            entry_point = {
-                                "type": (
-                                    f"Fib {fib_level * 100:.1f}% + {tail['strength_category']} опашка"
-                                ),
-                                "price": fib_price,
-                                "signal": tail["signal"],
-                                "strength": confluence_point["confluence_score"],
-                                "reason": (
-                                    f"Съвпадение: Fibonacci {fib_level * 100:.1f}% + {tail['dominant_tail']} опашка от {tail['date'].strftime('%Y-%m-%d')}"
-                                ),
-                            }
-                            confluence_info["best_entry_points"].append(entry_point)
+            # Долна опашка + LONG = support (low); горна + SHORT = resistance (high)
+            candidates = [
+                (tail, tail["low"] if tail["signal"] == "LONG" else tail["high"])
+                for tail in tails_analysis
+                if (tail["dominant_tail"], tail["signal"])
+                in (("lower", "LONG"), ("upper", "SHORT"))
+            ]
+            if not candidates or not fib_levels:
+                return confluence_info
+
+            target_prices = np.array([price for _, price in candidates], dtype=float)
+            tail_idx, level_pos, level_prices = _match_levels(
+                fib_levels, target_prices, 0.02
+            )
+            level_keys = list(fib_levels)
+
+            for t, pos, fib_price in zip(
+                tail_idx.tolist(),
+                level_pos.tolist(),
+                level_prices.tolist(),
+                strict=True,
+            ):
+                tail, target_price = candidates[t]
+                fib_level = level_keys[pos]
+                distance = abs(target_price - fib_price)
+                distance_percentage = distance / target_price
+
+                confluence_point = {
+                    "tail_date": tail["date"],
+                    "tail_signal": tail["signal"],
+                    "tail_strength": tail["tail_strength"],
+                    "fib_level": fib_level,
+                    "fib_price": fib_price,
+                    "target_price": target_price,
+                    "distance": distance,
+                    "distance_percentage": distance_percentage,
+                    "confluence_score": tail["signal_strength"]
+                    * (1 - distance_percentage),
+                }
+
+                confluence_info["confluence_points"].append(confluence_point)
+
+                # Проверяваме дали е силно съвпадение
+                if confluence_point["confluence_score"] >= 0.6:
+                    confluence_info["strong_confluence"] = True
+                    confluence_info["confluence_bonus"] = self.confluence_bonus
+
+                    # Добавяме в най-добрите входни точки
+                    entry_point = {
+                        "type": (
+                            f"Fib {fib_level * 100:.1f}% + {tail['strength_category']} опашка"
+                        ),
+                        "price": fib_price,
+                        "signal": tail["signal"],
+                        "strength": confluence_point["confluence_score"],
+                        "reason": (
+                            f"Съвпадение: Fibonacci {fib_level * 100:.1f}% + {tail['dominant_tail']} опашка от {tail['date'].strftime('%Y-%m-%d')}"
+                        ),
+                    }
+                    confluence_info["best_entry_points"].append(entry_point)
 
             # Сортираме по сила на съвпадението
             confluence_info["confluence_points"].sort(
@@ -614,38 +531,25 @@ class WeeklyTailsAnalyzer:
                 logger.warning("Няма Fibonacci нива за проверка")
                 return False
 
-            # Resistance нива са тези над текущата цена
-            resistance_levels = [
-                price for level, price in fib_levels.items() if price > tail_price
-            ]
+            near, nearest = tails_near_fib_resistance(
+                np.array([tail_price], dtype=float), fib_levels, proximity_threshold
+            )
 
-            if not resistance_levels:
+            if np.isnan(nearest[0]):
                 logger.info(
                     f"Няма resistance нива над опашката (tail_price: {tail_price:.2f})"
                 )
                 return False
 
-            # Проверяваме дали опашката е близо до някое resistance ниво
-            for resistance_price in resistance_levels:
-                price_distance_pct = (
-                    abs(tail_price - resistance_price) / resistance_price
+            if near[0]:
+                logger.info(
+                    f"Опашка е близо до resistance ниво: {nearest[0]:.2f} "
+                    f"(разстояние: {(nearest[0] - tail_price) / nearest[0]:.2f}%)"
                 )
-
-                if price_distance_pct <= proximity_threshold:
-                    logger.info(
-                        f"Опашка е близо до resistance ниво: {resistance_price:.2f} "
-                        f"(разстояние: {price_distance_pct:.2f}%)"
-                    )
-                    return True
-
-            # Ако няма близко resistance ниво, проверяваме дали опашката е над някое ниво
-            min_resistance = min(resistance_levels)
-            if tail_price > min_resistance:
-                logger.info(f"Опашка е над resistance ниво: {min_resistance:.2f}")
                 return True
 
             logger.info(
-                f"Опашка не е близо до resistance нива (най-близко: {min(resistance_levels):.2f})"
+                f"Опашка не е близо до resistance нива (най-близко: {nearest[0]:.2f})"
             )
             return False
 
@@ -734,13 +638,11 @@ class WeeklyTailsAnalyzer:
             if len(weekly_df) < self.lookback_weeks:
                 return "NEUTRAL"
 
-            close_col = "close" if "close" in weekly_df.columns else "Close"
-            recent_weeks = weekly_df[close_col].tail(self.lookback_weeks)
+            closes = OHLCV.from_frame(weekly_df).close
+            first_close = closes[-self.lookback_weeks]
 
             # Calculate trend strength over lookback period
-            trend_change = (
-                recent_weeks.iloc[-1] - recent_weeks.iloc[0]
-            ) / recent_weeks.iloc[0]
+            trend_change = (closes[-1] - first_close) / first_close
 
             # Determine trend classification
             if trend_change >= self.bull_market_threshold:
@@ -860,6 +762,168 @@ class WeeklyTailsAnalyzer:
         return "WEAK"
 
 
+def _tail_scores(
+    weekly_df: pd.DataFrame, last: int | None = None
+) -> dict[str, np.ndarray]:
+    """
+    Векторизирана оценка на опашките за всички (или последните N) седмици
+
+    Същите правила като досегашния анализ ред по ред: доминантна опашка,
+    сила = опашка / body, праг 0.9 за значимост, категория и сигнал.
+    """
+    rows = slice(-last, None) if last else slice(None)
+    n = len(weekly_df.index[rows])
+    nan = np.full(n, np.nan)
+    open_, high, low, close = (
+        np.nan_to_num(
+            weekly_df[name].to_numpy(dtype=float)[rows] if name in weekly_df else nan,
+            nan=0.0,
+            posinf=0.0,
+            neginf=0.0,
+        )
+        for name in ("Open", "High", "Low", "Close")
+    )
+
+    body_size = np.abs(close - open_)
+    is_bullish = close > open_
+    upper_tail = high - np.maximum(open_, close)
+    lower_tail = np.minimum(open_, close) - low
+    upper_dominant = upper_tail > lower_tail
+    tail_size = np.where(upper_dominant, upper_tail, lower_tail)
+
+    # Минимален body size 0.01
+    tail_strength = np.divide(
+        tail_size, body_size, out=np.zeros(n), where=body_size > 0.01
+    )
+    significant = tail_strength >= 0.9  # МАКСИМАЛНО СТРИКТЕН
+
+    ultra = tail_strength >= 0.95
+    long_signal = ~upper_dominant & is_bullish & (tail_strength >= 0.4)
+    short_signal = upper_dominant & ~is_bullish & (tail_strength >= 0.95)
+
+    return {
+        "open": open_,
+        "high": high,
+        "low": low,
+        "close": close,
+        "is_bullish": is_bullish,
+        "upper_dominant": upper_dominant,
+        "tail_size": tail_size,
+        "body_size": body_size,
+        "tail_strength": tail_strength,
+        "significant": significant,
+        "strength_category": np.where(ultra, "ULTRA_EXTREME", "EXTREME"),
+        "signal_strength": np.where(ultra, 0.99, 0.95),
+        "signal": np.where(
+            long_signal, "LONG", np.where(short_signal, "SHORT", "HOLD")
+        ),
+    }
+
+
+def _tail_record(
+    scores: dict[str, np.ndarray], i: int, date: pd.Timestamp
+) -> dict[str, Any]:
+    """Dict запис за една значима опашка (формат на analyze_weekly_tails)."""
+    dominant_tail = "upper" if scores["upper_dominant"][i] else "lower"
+    tail_strength = float(scores["tail_strength"][i])
+    signal = str(scores["signal"][i])
+
+    if signal == "LONG":
+        reason = f"Сигнална долна опашка ({tail_strength:.1%}) + bullish candle"
+    elif signal == "SHORT":
+        reason = f"Сигнална горна опашка ({tail_strength:.1%}) + bearish candle"
+    else:
+        reason = f"Смесен сигнал: {dominant_tail} опашка ({tail_strength:.1%})"
+
+    return {
+        "date": date,
+        "open": float(scores["open"][i]),
+        "high": float(scores["high"][i]),
+        "low": float(scores["low"][i]),
+        "close": float(scores["close"][i]),
+        "is_bullish": bool(scores["is_bullish"][i]),
+        "dominant_tail": dominant_tail,
+        "tail_size": float(scores["tail_size"][i]),
+        "body_size": float(scores["body_size"][i]),
+        "tail_strength": tail_strength,
+        "strength_category": str(scores["strength_category"][i]),
+        "tail_direction": "resistance" if dominant_tail == "upper" else "support",
+        "signal": signal,
+        "signal_strength": float(scores["signal_strength"][i]),
+        "reason": reason,
+    }
+
+
+def _sorted_levels(fib_levels: dict[float, float]) -> tuple[np.ndarray, np.ndarray]:
+    """Fibonacci цени сортирани възходящо + позицията им в оригиналния dict."""
+    prices = np.fromiter(fib_levels.values(), dtype=float, count=len(fib_levels))
+    order = np.argsort(prices, kind="stable")
+    return prices[order], order
+
+
+def _match_levels(
+    fib_levels: dict[float, float], target_prices: np.ndarray, proximity: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Всички двойки (цел, ниво) с |цел - ниво| / цел <= proximity
+
+    Returns:
+        (индекс на целта, позиция на нивото в fib_levels, цена на нивото),
+        подредени по цел и после по реда на fib_levels
+    """
+    prices, order = _sorted_levels(fib_levels)
+    band = np.abs(target_prices) * proximity
+    lo = np.searchsorted(prices, target_prices - band, side="left")
+    hi = np.searchsorted(prices, target_prices + band, side="right")
+
+    # Разгъваме [lo, hi) диапазоните до плоски двойки без Python цикъл
+    counts = hi - lo
+    tail_idx = np.repeat(np.arange(len(target_prices)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    sorted_idx = lo[tail_idx] + offsets
+
+    level_prices = prices[sorted_idx]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        distance_pct = (
+            np.abs(target_prices[tail_idx] - level_prices) / (target_prices[tail_idx])
+        )
+    keep = distance_pct <= proximity  # точната проверка при граничните цени
+
+    tail_idx, level_pos = tail_idx[keep], order[sorted_idx[keep]]
+    pair_order = np.lexsort((level_pos, tail_idx))
+    return tail_idx[pair_order], level_pos[pair_order], level_prices[keep][pair_order]
+
+
+def tails_near_fib_resistance(
+    tail_prices: np.ndarray,
+    fib_levels: dict[float, float],
+    proximity_threshold: float = 0.02,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Кои опашки са в proximity_threshold под най-близкото resistance ниво
+
+    Resistance = Fibonacci ниво над цената на опашката; най-близкото е
+    първото по-високо ниво (searchsorted), то има и най-малко разстояние.
+
+    Args:
+        tail_prices: Цени на опашките
+        fib_levels: Fibonacci нива
+        proximity_threshold: Максимално относително разстояние
+
+    Returns:
+        (bool маска за близост, най-близко resistance ниво или NaN)
+    """
+    prices, _ = _sorted_levels(fib_levels)
+    idx = np.searchsorted(prices, tail_prices, side="right")
+    has_resistance = idx < len(prices)
+    nearest = np.where(has_resistance, prices[np.minimum(idx, len(prices) - 1)], np.nan)
+    with np.errstate(invalid="ignore"):
+        near = has_resistance & (
+            np.abs(tail_prices - nearest) / nearest <= proximity_threshold
+        )
+    return near, nearest
+
+
 if __name__ == "__main__":
     # Тест на Weekly Tails модула с trend-based weighting
     print(
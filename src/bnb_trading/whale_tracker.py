@@ -71,7 +71,7 @@ EXAMPLE USAGE:
     ...         print(f"Alert: {alert['type']} - {alert['message']}")
 
 DEPENDENCIES:
-    - requests: HTTP API communication with Binance and BSCScan
+    - data.http: Shared pooled HTTP client for Binance and BSCScan
     - datetime/timedelta: Date and time manipulation
     - json: JSON data parsing and formatting
     - typing: Type hints for better code documentation
@@ -116,11 +116,48 @@ DATE: 2024-01-01
 import logging
 from datetime import datetime, timedelta
 
-import requests
+import numpy as np
+
+from .analysis.orderbook import MAX_DEPTH_LIMIT, OrderBook
+from .core.exceptions import DataError, NetworkError
+from .data.http import get_http_client
+from .data.resample import (
+    CLOSE,
+    MAX_KLINES_LIMIT,
+    OPEN,
+    OPEN_TIME,
+    VOLUME,
+    decode_klines,
+    derive_timeframes,
+    kline_plan,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def classify_whale_signals(
+    volume_ratio: np.ndarray, price_change: np.ndarray
+) -> np.ndarray:
+    """Векторна версия на ``WhaleTracker.classify_whale_signal``"""
+    volume_ratio = np.asarray(volume_ratio, dtype=float)
+    price_change = np.asarray(price_change, dtype=float)
+    conditions, labels = [], []
+    # (минимален volume ratio, праг за price change, етикет)
+    for min_ratio, move, label in (
+        (5, 2, "🐋 MEGA WHALE"),
+        (3, 1, "🐳 WHALE"),
+        (2, 0.5, "🦈 LARGE"),
+    ):
+        tier = volume_ratio >= min_ratio
+        conditions += [
+            tier & (price_change > move),
+            tier & (price_change < -move),
+            tier,
+        ]
+        labels += [f"{label} BUY", f"{label} SELL", f"{label} ACTIVITY"]
+    return np.select(conditions, labels, default="📊 VOLUME SPIKE").astype(object)
+
+
 class WhaleTracker:
     """
     Advanced Whale Tracking Engine for Institutional Activity Monitoring
@@ -254,169 +291,181 @@ class WhaleTracker:
         """Get current BNB price and volume data"""
         try:
             # 24h ticker
-            ticker_response = requests.get(
+            ticker_data = get_http_client().get_json(
                 f"{self.base_url}/ticker/24hr", params={"symbol": "BNBUSDT"}, timeout=10
             )
 
-            if ticker_response.status_code == 200:
-                ticker_data = ticker_response.json()
-
-                return {
-                    "price": float(ticker_data["lastPrice"]),
-                    "price_change_24h": float(ticker_data["priceChangePercent"]),
-                    "volume_24h": float(ticker_data["volume"]),
-                    "volume_usdt_24h": float(ticker_data["quoteVolume"]),
-                    "high_24h": float(ticker_data["highPrice"]),
-                    "low_24h": float(ticker_data["lowPrice"]),
-                    "trades_count": int(ticker_data["count"]),
-                }
+            return {
+                "price": float(ticker_data["lastPrice"]),
+                "price_change_24h": float(ticker_data["priceChangePercent"]),
+                "volume_24h": float(ticker_data["volume"]),
+                "volume_usdt_24h": float(ticker_data["quoteVolume"]),
+                "high_24h": float(ticker_data["highPrice"]),
+                "low_24h": float(ticker_data["lowPrice"]),
+                "trades_count": int(ticker_data["count"]),
+            }
         except Exception as e:
             print(f"Error fetching price data: {e}")
 
         return {}
 
+    @staticmethod
+    def _period_interval(days_back: int) -> tuple[str, int]:
+        """Interval и брой свещи за периода (както при отделна заявка)"""
+        if days_back <= 1:
+            return "15m", min(96, days_back * 96)  # 96 x 15min = 24h
+        if days_back <= 3:
+            return "1h", min(72, days_back * 24)  # 24h x days
+        return "4h", min(42, days_back * 6)  # 6 x 4h = 24h x days
+
+    def _fetch_klines(self, interval: str, limit: int) -> np.ndarray | None:
+        """Една /klines заявка, декодирана в масив (None при грешка)"""
+        try:
+            klines = get_http_client().get_json(
+                f"{self.base_url}/klines",
+                params={"symbol": "BNBUSDT", "interval": interval, "limit": limit},
+                timeout=10,
+            )
+        except DataError as e:
+            logger.error(f"Failed to parse JSON response from /klines: {e}")
+            return None
+        except NetworkError as e:
+            logger.error(f"Request failed for /klines: {e}")
+            return None
+
+        return decode_klines(klines)
+
     def get_whale_activity_summary(self, days_back: int = 1) -> dict:
         """Get whale activity summary using klines data (much more efficient)"""
         try:
-            # Determine appropriate interval based on period
-            if days_back <= 1:
-                interval = "15m"
-                limit = min(96, days_back * 96)  # 96 x 15min = 24h
-            elif days_back <= 3:
-                interval = "1h"
-                limit = min(72, days_back * 24)  # 24h x days
-            else:
-                interval = "4h"
-                limit = min(42, days_back * 6)  # 6 x 4h = 24h x days
-
-            # Get klines data
-            try:
-                response = requests.get(
-                    f"{self.base_url}/klines",
-                    params={"symbol": "BNBUSDT", "interval": interval, "limit": limit},
-                    timeout=10,
-                )
-                response.raise_for_status()
-
-                try:
-                    klines = response.json()
-                except (ValueError, requests.exceptions.JSONDecodeError) as e:
-                    logger.error(f"Failed to parse JSON response from /klines: {e}")
-                    return {}
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Request failed for /klines: {e}")
+            interval, limit = self._period_interval(days_back)
+            candles = self._fetch_klines(interval, limit)
+            if candles is None:
                 return {}
+            return self._summarize_klines(candles, days_back, interval)
 
-            if klines:
-                whale_activity = {
-                    "period": f"{days_back} days",
-                    "interval": interval,
-                    "total_candles": len(klines),
-                    "high_volume_periods": [],
-                    "price_movements": [],
-                    "volume_analysis": {},
-                    "whale_signals": [],
-                }
-
-                # Analyze each candle for whale activity
-                volumes = []
-                for i, kline in enumerate(klines):
-                    timestamp = datetime.fromtimestamp(kline[0] / 1000)
-                    open_price = float(kline[1])
-                    high_price = float(kline[2])
-                    low_price = float(kline[3])
-                    close_price = float(kline[4])
-                    volume = float(kline[5])
-
-                    volumes.append(volume)
-
-                    # Calculate price change
-                    price_change = ((close_price - open_price) / open_price) * 100
-
-                    # Store period data
-                    period_data = {
-                        "timestamp": timestamp,
-                        "open": open_price,
-                        "high": high_price,
-                        "low": low_price,
-                        "close": close_price,
-                        "volume": volume,
-                        "price_change": price_change,
-                    }
-
-                    whale_activity["price_movements"].append(period_data)
+        except (ValueError, KeyError) as e:
+            logger.error(f"Data processing error in whale summary: {e}")
+            return {}
+        except Exception as e:
+            logger.exception(f"Unexpected error fetching whale summary: {e}")
+            return {}
 
-                # Calculate volume statistics
-                if volumes:
-                    avg_volume = sum(volumes) / len(volumes)
-                    max_volume = max(volumes)
+    def whale_activity_summaries(self, periods: list[int]) -> dict[int, dict]:
+        """
+        Whale activity summaries за няколко периода с една /klines заявка
 
-                    whale_activity["volume_analysis"] = {
-                        "average_volume": avg_volume,
-                        "max_volume": max_volume,
-                        "volume_spike_threshold": avg_volume * 2,
-                    }
+        Взима най-краткия нужен interval веднъж (покриващ най-дългия период)
+        и извежда по-дългите interval-и локално (``data.resample``).
 
-                    # Find high volume periods (potential whale activity)
-                    spike_threshold = avg_volume * 2
-                    for period in whale_activity["price_movements"]:
-                        if period["volume"] > spike_threshold:
-                            whale_activity["high_volume_periods"].append(
-                                {
-                                    "timestamp": period["timestamp"],
-                                    "volume": period["volume"],
-                                    "volume_ratio": period["volume"] / avg_volume,
-                                    "price_change": period["price_change"],
-                                    "whale_signal": self.classify_whale_signal(
-                                        period["volume"],
-                                        period["price_change"],
-                                        avg_volume,
-                                    ),
-                                }
-                            )
-
-                    # Sort by volume descending
-                    whale_activity["high_volume_periods"].sort(
-                        key=lambda x: x["volume"], reverse=True
-                    )
+        Args:
+            periods: Периоди в дни (напр. [1, 3, 7])
 
-                return whale_activity
+        Returns:
+            Dict: дни -> резултат като ``get_whale_activity_summary``
+        """
+        try:
+            plans = {days: self._period_interval(days) for days in periods}
+            timeframes: dict[str, int] = {}
+            for interval, limit in plans.values():
+                timeframes[interval] = max(timeframes.get(interval, 0), limit)
+            base_interval, fetch_limit = kline_plan(timeframes)
+            candles = self._fetch_klines(
+                base_interval, min(fetch_limit, MAX_KLINES_LIMIT)
+            )
+            if candles is None:
+                return {days: {} for days in periods}
+
+            frames = derive_timeframes(candles, base_interval, timeframes)
+            summaries = {}
+            for days, (interval, limit) in plans.items():
+                summaries[days] = self._summarize_klines(
+                    frames[interval][-limit:], days, interval
+                )
+            return summaries
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Network error fetching whale summary: {e}")
-            return {}
         except (ValueError, KeyError) as e:
-            logger.error(f"Data processing error in whale summary: {e}")
-            return {}
-        except Exception as e:
-            logger.exception(f"Unexpected error fetching whale summary: {e}")
+            logger.error(f"Data processing error in whale summaries: {e}")
+            return {days: {} for days in periods}
+
+    def _summarize_klines(
+        self, candles: np.ndarray, days_back: int, interval: str
+    ) -> dict:
+        """Whale activity от декодирани klines (векторни spike маски)"""
+        if len(candles) == 0:
             return {}
 
+        whale_activity = {
+            "period": f"{days_back} days",
+            "interval": interval,
+            "total_candles": len(candles),
+            "high_volume_periods": [],
+            "price_movements": [],
+            "volume_analysis": {},
+            "whale_signals": [],
+        }
+
+        opens, closes = candles[:, OPEN], candles[:, CLOSE]
+        volumes = candles[:, VOLUME]
+        price_changes = (closes - opens) / opens * 100
+        timestamps = [
+            datetime.fromtimestamp(open_time / 1000)
+            for open_time in candles[:, OPEN_TIME].tolist()
+        ]
+
+        fields = ("open", "high", "low", "close", "volume")
+        whale_activity["price_movements"] = [
+            {
+                "timestamp": timestamp,
+                **dict(zip(fields, row, strict=True)),
+                "price_change": price_change,
+            }
+            for timestamp, row, price_change in zip(
+                timestamps,
+                candles[:, OPEN:].tolist(),
+                price_changes.tolist(),
+                strict=True,
+            )
+        ]
+
+        # Volume статистики и spike маска (потенциална whale активност)
+        avg_volume = float(volumes.mean())
+        spike_threshold = avg_volume * 2
+        whale_activity["volume_analysis"] = {
+            "average_volume": avg_volume,
+            "max_volume": float(volumes.max()),
+            "volume_spike_threshold": spike_threshold,
+        }
+
+        spikes = np.flatnonzero(volumes > spike_threshold)
+        spikes = spikes[np.argsort(-volumes[spikes], kind="stable")]  # по обем
+        volume_ratios = volumes[spikes] / avg_volume
+        signals = classify_whale_signals(volume_ratios, price_changes[spikes])
+
+        whale_activity["high_volume_periods"] = [
+            {
+                "timestamp": timestamps[idx],
+                "volume": volume,
+                "volume_ratio": volume_ratio,
+                "price_change": price_change,
+                "whale_signal": signal,
+            }
+            for idx, volume, volume_ratio, price_change, signal in zip(
+                spikes.tolist(),
+                volumes[spikes].tolist(),
+                volume_ratios.tolist(),
+                price_changes[spikes].tolist(),
+                signals.tolist(),
+                strict=True,
+            )
+        ]
+        return whale_activity
+
     def classify_whale_signal(
         self, volume: float, price_change: float, avg_volume: float
     ) -> str:
         """Classify whale signal based on volume and price action"""
-        volume_ratio = volume / avg_volume
-
-        if volume_ratio >= 5:
-            if price_change > 2:
-                return "🐋 MEGA WHALE BUY"
-            if price_change < -2:
-                return "🐋 MEGA WHALE SELL"
-            return "🐋 MEGA WHALE ACTIVITY"
-        if volume_ratio >= 3:
-            if price_change > 1:
-                return "🐳 WHALE BUY"
-            if price_change < -1:
-                return "🐳 WHALE SELL"
-            return "🐳 WHALE ACTIVITY"
-        if volume_ratio >= 2:
-            if price_change > 0.5:
-                return "🦈 LARGE BUY"
-            if price_change < -0.5:
-                return "🦈 LARGE SELL"
-            return "🦈 LARGE ACTIVITY"
-        return "📊 VOLUME SPIKE"
+        return classify_whale_signals(volume / avg_volume, price_change).item()
 
     def categorize_whale(self, quantity: float) -> str:
         """Categorize whale based on transaction size"""
@@ -430,71 +479,74 @@ class WhaleTracker:
             return "🐟 MEDIUM HOLDER"
         return "🐠 SMALL HOLDER"
 
-    def analyze_order_book_whales(self) -> dict:
-        """Analyze order book for whale walls"""
+    def fetch_order_book(self, limit: int = 100) -> OrderBook | None:
+        """Fetch a /depth snapshot as NumPy ladders (None on failure)"""
+        limit = min(limit, MAX_DEPTH_LIMIT)
         try:
-            try:
-                orderbook_response = requests.get(
-                    f"{self.base_url}/depth",
-                    params={"symbol": "BNBUSDT", "limit": 100},
-                    timeout=10,
-                )
-                orderbook_response.raise_for_status()
-
-                try:
-                    data = orderbook_response.json()
-                except (ValueError, requests.exceptions.JSONDecodeError) as e:
-                    logger.error(f"Failed to parse JSON response from /depth: {e}")
-                    return {}
-            except requests.exceptions.RequestException as e:
-                logger.error(
-                    f"Request failed for /depth - URL: {self.base_url}/depth, params: {{'symbol': 'BNBUSDT', 'limit': 100}}, timeout: 5, error: {e}"
-                )
+            data = get_http_client().get_json(
+                f"{self.base_url}/depth",
+                params={"symbol": "BNBUSDT", "limit": limit},
+                timeout=10,
+            )
+        except DataError as e:
+            logger.error(f"Failed to parse JSON response from /depth: {e}")
+            return None
+        except NetworkError as e:
+            logger.error(
+                f"Request failed for /depth - URL: {self.base_url}/depth, params: {{'symbol': 'BNBUSDT', 'limit': {limit}}}, timeout: 10, error: {e}"
+            )
+            return None
+
+        return OrderBook.from_depth(data) if data else None
+
+    def analyze_order_book_whales(
+        self, limit: int = 100, book: OrderBook | None = None
+    ) -> dict:
+        """
+        Analyze order book for whale walls
+
+        Args:
+            limit: Depth levels per side to fetch (up to 5000)
+            book: Snapshot to analyze instead of fetching (e.g. from
+                ``OrderBook.from_file`` for offline analysis)
+        """
+        try:
+            book = book or self.fetch_order_book(limit)
+            if book is None:
                 return {}
 
-            if data:
-                # Analyze bids (buy orders)
-                bids = [(float(price), float(qty)) for price, qty in data["bids"]]
-                asks = [(float(price), float(qty)) for price, qty in data["asks"]]
-
-                # Find whale walls
-                whale_bids = [
-                    (price, qty)
-                    for price, qty in bids
-                    if qty >= self.whale_thresholds["large_holder"]
-                ]
-                whale_asks = [
-                    (price, qty)
-                    for price, qty in asks
-                    if qty >= self.whale_thresholds["large_holder"]
-                ]
-
-                # Calculate total whale support/resistance
-                total_whale_support = sum(price * qty for price, qty in whale_bids)
-                total_whale_resistance = sum(price * qty for price, qty in whale_asks)
-
-                # Find largest walls
-                largest_bid_wall = (
-                    max(whale_bids, key=lambda x: x[1]) if whale_bids else None
-                )
-                largest_ask_wall = (
-                    max(whale_asks, key=lambda x: x[1]) if whale_asks else None
-                )
+            # Find whale walls (vectorized masks over the ladders)
+            bid_walls, ask_walls = book.walls(self.whale_thresholds["large_holder"])
+            bid_prices, bid_qty = (
+                book.bid_prices[bid_walls],
+                book.bid_quantities[bid_walls],
+            )
+            ask_prices, ask_qty = (
+                book.ask_prices[ask_walls],
+                book.ask_quantities[ask_walls],
+            )
+            whale_bids = list(zip(bid_prices.tolist(), bid_qty.tolist(), strict=True))
+            whale_asks = list(zip(ask_prices.tolist(), ask_qty.tolist(), strict=True))
 
-                return {
-                    "whale_bids": whale_bids,
-                    "whale_asks": whale_asks,
-                    "total_whale_support": total_whale_support,
-                    "total_whale_resistance": total_whale_resistance,
-                    "largest_bid_wall": largest_bid_wall,
-                    "largest_ask_wall": largest_ask_wall,
-                    "whale_bid_count": len(whale_bids),
-                    "whale_ask_count": len(whale_asks),
-                }
+            return {
+                "whale_bids": whale_bids,
+                "whale_asks": whale_asks,
+                # Total whale support/resistance in USDT
+                "total_whale_support": float(bid_prices @ bid_qty),
+                "total_whale_resistance": float(ask_prices @ ask_qty),
+                # Largest walls (first of equal size, as before)
+                "largest_bid_wall": (
+                    whale_bids[int(bid_qty.argmax())] if whale_bids else None
+                ),
+                "largest_ask_wall": (
+                    whale_asks[int(ask_qty.argmax())] if whale_asks else None
+                ),
+                "whale_bid_count": len(whale_bids),
+                "whale_ask_count": len(whale_asks),
+                "imbalance": book.imbalance(),
+            }
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Network error in order book analysis: {e}")
-        except (ValueError, KeyError) as e:
+        except DataError as e:
             logger.error(f"Data processing error in order book analysis: {e}")
         except Exception as e:
             logger.exception(f"Unexpected error in order book analysis: {e}")
@@ -678,13 +730,15 @@ class WhaleTracker:
 
         results = {}
 
+        # One klines request for all periods (longer intervals resampled locally)
+        summaries = self.whale_activity_summaries([days for days, _ in periods])
+
         for days, period_name in periods:
             print(f"\n📊 {period_name.upper()}:")
             print("-" * 40)
 
             try:
-                # Get whale activity summary for this period
-                whale_summary = self.get_whale_activity_summary(days_back=days)
+                whale_summary = summaries.get(days, {})
 
                 if whale_summary and whale_summary.get("high_volume_periods"):
                     high_vol_periods = whale_summary["high_volume_periods"]
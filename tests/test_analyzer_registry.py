@@ -0,0 +1,65 @@
+"""
+Tests for analyzer pooling per config hash.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from bnb_trading.analysis.weekly_tails.analyzer import WeeklyTailsAnalyzer
+from bnb_trading.core.config import TradingConfig
+from bnb_trading.core.models import DecisionContext
+from bnb_trading.core.registry import clear_analyzers, get_analyzer
+from bnb_trading.signals.decision import decide_long
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    """Each test starts with an empty registry."""
+    clear_analyzers()
+    yield
+    clear_analyzers()
+
+
+def test_same_config_same_instance(test_config):
+    """Equal config content reuses one analyzer; different content does not."""
+    analyzer = get_analyzer(WeeklyTailsAnalyzer, test_config)
+
+    assert get_analyzer(WeeklyTailsAnalyzer, dict(test_config)) is analyzer
+    assert get_analyzer(WeeklyTailsAnalyzer, TradingConfig(test_config)) is analyzer
+
+    other = TradingConfig(test_config).with_overrides(weekly_tails={"atr_period": 7})
+    assert get_analyzer(WeeklyTailsAnalyzer, other) is not analyzer
+
+
+def test_concurrent_lookup_builds_once(test_config):
+    """Threads racing on an empty registry share one instance."""
+    config = TradingConfig(test_config)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        analyzers = list(
+            executor.map(lambda _: get_analyzer(WeeklyTailsAnalyzer, config), range(32))
+        )
+
+    assert len({id(a) for a in analyzers}) == 1
+
+
+def test_decide_long_reuses_analyzer(
+    test_config, sample_daily_data, sample_weekly_data
+):
+    """decide_long constructs the tails analyzer once across calls."""
+    ctx = DecisionContext(
+        closed_daily_df=sample_daily_data,
+        closed_weekly_df=sample_weekly_data,
+        config=TradingConfig(test_config),
+        timestamp=sample_daily_data.index[-1],
+    )
+
+    with patch("bnb_trading.signals.decision.WeeklyTailsAnalyzer") as mock_tails:
+        mock_tails.return_value.calculate_tail_strength.return_value = {
+            "signal": "HOLD"
+        }
+        for _ in range(5):
+            decide_long(ctx)
+
+    assert mock_tails.call_count == 1
@@ -0,0 +1,104 @@
+"""
+Tests for the typed, frozen, cached configuration object.
+"""
+
+import os
+import pickle
+
+import pytest
+
+from bnb_trading.core.config import (
+    SignalSettings,
+    TradingConfig,
+    WeeklyTailsSettings,
+    config_hash,
+    load_config,
+)
+from bnb_trading.core.exceptions import ConfigurationError
+
+CONFIG_TOML = """
+[data]
+symbol = "BNB/USDT"
+
+[signals]
+weekly_tails_weight = 0.5
+confidence_threshold = 0.3
+
+[fibonacci]
+key_levels = [0.382, 0.618]
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Small config.toml on disk."""
+    path = tmp_path / "config.toml"
+    path.write_text(CONFIG_TOML, encoding="utf-8")
+    return path
+
+
+def test_load_config_cached_by_mtime(config_file):
+    """Same file version is parsed once; a modified file is re-parsed."""
+    first = load_config(config_file)
+    assert load_config(str(config_file)) is first
+
+    config_file.write_text(CONFIG_TOML.replace("0.5", "0.4"), encoding="utf-8")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = load_config(config_file)
+    assert reloaded is not first
+    assert reloaded.signal_settings.weekly_tails_weight == 0.4
+    assert reloaded.content_hash != first.content_hash
+
+
+def test_typed_settings_resolve_defaults(config_file):
+    """Attribute access with defaults filled in at load time."""
+    config = load_config(config_file)
+
+    assert config.signal_settings.weekly_tails_weight == 0.5
+    assert config.signal_settings.fibonacci_weight == 0.20  # default
+    assert config.weekly_tails_settings == WeeklyTailsSettings()
+    assert config.data.symbol == "BNB/USDT"
+    assert config["fibonacci"]["key_levels"] == (0.382, 0.618)
+    assert config.get("missing", {}).get("x", 1) == 1
+
+
+def test_config_is_frozen(config_file):
+    """Neither the config nor its sections can be mutated."""
+    config = load_config(config_file)
+
+    with pytest.raises(TypeError):
+        config["signals"] = {}
+    with pytest.raises(TypeError):
+        config.signals.weekly_tails_weight = 1.0
+
+    overridden = config.with_overrides(sentiment={"enabled": False})
+    assert overridden["sentiment"]["enabled"] is False
+    assert "sentiment" not in config
+
+
+def test_content_hash_stable(config_file):
+    """Hash depends on content only and survives pickling."""
+    config = load_config(config_file)
+    raw = config.to_dict()
+
+    assert config_hash(raw) == config.content_hash
+    assert TradingConfig(raw).content_hash == config.content_hash
+    assert pickle.loads(pickle.dumps(config)).content_hash == config.content_hash
+
+
+def test_invalid_values_rejected():
+    """Out-of-range values raise ConfigurationError."""
+    with pytest.raises(ConfigurationError):
+        TradingConfig({"signals": {"trend_weight": 1.5}})
+    with pytest.raises(ConfigurationError):
+        TradingConfig({"weekly_tails": {"lookback_weeks": "many"}})
+
+
+def test_plain_dict_configs_still_supported():
+    """Raw dicts (tests, scripts) resolve to the same typed settings."""
+    settings = SignalSettings.from_config({"signals": {"trend_weight": 0.3}})
+
+    assert settings.trend_weight == 0.3
+    assert settings.confidence_threshold == 0.88
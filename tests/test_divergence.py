@@ -0,0 +1,33 @@
+"""
+Focused DivergenceDetector tests for KISS testing strategy.
+"""
+
+import numpy as np
+import pandas as pd
+
+from bnb_trading.divergence_detector import DivergenceDetector
+
+
+def test_tracker_matches_detect_all_divergences():
+    """Streaming tracker equals the DataFrame analysis on every prefix."""
+    bars = np.arange(80)
+    closes = 500 + bars + 20 * np.sin(bars / 1.2)
+    rsi = 60 - bars / 4 + 15 * np.sin(bars / 1.2)
+    daily = pd.DataFrame(
+        {"close": closes, "volume": 1000 + 100 * np.cos(bars / 2)},
+        index=pd.date_range("2024-01-01", periods=80, freq="D"),
+    )
+    detector = DivergenceDetector({"divergence": {"trend_filter_enabled": False}})
+    tracker = detector.tracker()
+
+    bearish = 0
+    for end in range(1, len(daily) + 1):
+        expected = detector.detect_all_divergences(
+            daily.iloc[:end], {"rsi": {"rsi_values": list(rsi[:end])}}
+        )
+        result = tracker.update(
+            closes[end - 1], rsi=rsi[end - 1], volume=daily["volume"].iloc[end - 1]
+        )
+        assert result == expected
+        bearish += result["rsi_divergence"]["type"] == "BEARISH"
+    assert bearish > 0  # higher price peaks, lower RSI peaks
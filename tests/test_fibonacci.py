@@ -3,6 +3,7 @@ Focused FibonacciAnalyzer tests for KISS testing strategy.
 Direct unit tests for core Fibonacci functionality - simple and effective.
 """
 
+import numpy as np
 import pandas as pd
 
 from bnb_trading.fibonacci import FibonacciAnalyzer
@@ -217,3 +218,79 @@ def test_error_handling_invalid_data(test_config):
     # Should handle gracefully
     assert "error" in result
     assert isinstance(result["error"], str)
+
+
+def test_swing_tracker_and_history_match_find_swing_points(test_config):
+    """Streaming tracker and batch history agree with per-prefix swing search."""
+    config = test_config.copy()
+    config["fibonacci"] = {**test_config["fibonacci"], "swing_lookback": 20}
+    analyzer = FibonacciAnalyzer(config)
+    df = create_swing_data(high_price=600.0, low_price=400.0, periods=60)
+
+    history = analyzer.swing_history(df)
+    tracker = analyzer.swing_tracker()
+
+    for i in range(len(df)):
+        expected = analyzer.find_swing_points(df.iloc[: i + 1])
+        streamed = tracker.update(df["High"].iloc[i], df["Low"].iloc[i])
+        row = history.iloc[i]
+        if expected[0] is None:
+            assert not row["valid"]
+            continue
+        assert streamed == expected
+        assert (row["swing_high"], row["swing_low"]) == expected[:2]
+        assert (row["high_pos"], row["low_pos"]) == expected[2:]
+        assert (
+            row["fib_0.618"]
+            == analyzer.calculate_fibonacci_levels(*expected[:2])[0.618]
+        )
+
+
+def test_decide_long_uses_fibonacci_score(test_config):
+    """decide_long Fibonacci component comes from the analyzer score."""
+    from bnb_trading.core.models import DecisionContext
+    from bnb_trading.signals.decision import _get_fibonacci_confidence
+
+    daily_df = create_swing_data(high_price=600.0, low_price=400.0, current_price=476.0)
+    ctx = DecisionContext(
+        closed_daily_df=daily_df,
+        closed_weekly_df=pd.DataFrame(),
+        config=test_config,
+        timestamp=daily_df.index[-1],
+    )
+
+    # Close at the 38.2% key level (within 1%)
+    assert _get_fibonacci_confidence(ctx) == 0.8
+    assert FibonacciAnalyzer(test_config).current_score(daily_df) == 0.8
+
+
+def test_proximity_matrix_many_prices(test_config):
+    """Matrix proximity matches per-price check_fib_proximity."""
+    analyzer = FibonacciAnalyzer(test_config)
+    fib_levels = analyzer.calculate_fibonacci_levels(600.0, 400.0)
+    prices = np.array([525.0, 430.0, 476.0])
+
+    proximity = analyzer.proximity_matrix(prices, list(fib_levels.values()))
+
+    for i, price in enumerate(prices):
+        expected = analyzer.check_fib_proximity(price, fib_levels)
+        assert proximity["nearest_level"][i] == expected["nearest_level"]
+        assert proximity["active"][i].sum() == len(expected["active_levels"])
+    assert proximity["closest_active_level"][0] == 0.618
+    assert np.isnan(proximity["closest_active_level"][1])
+
+
+def test_proximity_history_scores_match_analyze(test_config):
+    """Historical scores equal analyze() on each prefix (NaN = no swing)."""
+    analyzer = FibonacciAnalyzer(test_config)
+    df = create_swing_data(high_price=600.0, low_price=400.0, current_price=476.0)
+
+    history = analyzer.proximity_history(df)
+
+    for i in (10, 40, 95, len(df) - 1):
+        result = analyzer.analyze(df.iloc[: i + 1], pd.DataFrame())
+        if result.status == "OK":
+            assert history["score"].iloc[i] == result.score
+        else:
+            assert np.isnan(history["score"].iloc[i])
+    assert history["score"].iloc[-1] == 0.8
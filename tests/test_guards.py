@@ -0,0 +1,39 @@
+"""
+Time-series guard mask tests for KISS testing strategy.
+"""
+
+import numpy as np
+import pandas as pd
+
+from bnb_trading.signals.filters.guards import apply_all_guards, guard_masks
+
+
+def _daily(rows: int = 80) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    close = 600 * np.exp(np.cumsum(rng.normal(0, 0.015, rows)))
+    spread = rng.uniform(0.005, 0.04, rows)
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * (1 + spread),
+            "Low": close * (1 - spread),
+            "Close": close,
+            "Volume": rng.uniform(500, 2000, rows),
+        },
+        index=pd.date_range("2024-01-01", periods=rows, freq="D"),
+    )
+
+
+def test_guard_masks_match_scalar_guards_on_every_prefix():
+    """Element t of the masks equals apply_all_guards on the first t + 1 bars."""
+    df = _daily()
+    masks = guard_masks(df)
+
+    for t in range(len(df)):
+        scalar = apply_all_guards({"closed_daily_df": df.iloc[: t + 1]}, {})
+        assert masks["passed"][t] == scalar["passed"]
+        assert np.isclose(
+            masks["confidence_multiplier"][t], scalar["confidence_multiplier"]
+        )
+    assert masks["passed"].any()
+    assert not masks["passed"][:19].any()
@@ -0,0 +1,180 @@
+"""
+Tests for the parallel multi-period HistoricalTester.
+History is fetched once and shared by all period workers.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bnb_trading.core.exceptions import InsufficientDataError
+from bnb_trading.data.fetcher import DAY_MS
+from bnb_trading.data.store import OHLCVStore
+from bnb_trading.testing.historical.tester import (
+    WARMUP_DAYS,
+    HistoricalTester,
+    _open_period_worker,
+    _shared_history,
+)
+
+PERIODS = {
+    "first_half": {"start": "2024-01-01", "end": "2024-07-01"},
+    "second_half": {"start": "2024-07-01", "end": "2025-01-01"},
+}
+
+
+class CappedExchange:
+    """Binance-like stand-in: at most 1000 candles per call, up to the real clock."""
+
+    def __init__(self, days: int = 1500):
+        self.clock = int(pd.Timestamp.now(tz="UTC").timestamp() * 1000)
+        today = self.clock - self.clock % DAY_MS
+        monday = today - (today // DAY_MS + 3) % 7 * DAY_MS  # 1970-01-01 is Thursday
+        self.opens = {
+            "1d": range(today - (days - 1) * DAY_MS, today + 1, DAY_MS),
+            "1w": range(monday - (days // 7) * 7 * DAY_MS, monday + 1, 7 * DAY_MS),
+        }
+
+    def milliseconds(self):
+        return self.clock
+
+    def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        opens = [t for t in self.opens[timeframe] if t >= since]
+        return [
+            [t, 100.0, 101.0, 99.0, 100.0, 1000.0] for t in opens[: min(limit, 1000)]
+        ]
+
+
+@pytest.fixture
+def history() -> dict[str, pd.DataFrame]:
+    """Two years of deterministic random-walk OHLCV data."""
+    rng = np.random.default_rng(7)
+    dates = pd.date_range("2023-06-01", "2025-03-01", freq="D")
+    close = 300 * np.exp(np.cumsum(rng.normal(0, 0.02, len(dates))))
+    daily = pd.DataFrame(
+        {
+            "Open": close * (1 + rng.normal(0, 0.005, len(dates))),
+            "High": close * 1.03,
+            "Low": close * (0.90 + rng.random(len(dates)) * 0.08),
+            "Close": close,
+            "Volume": rng.integers(1_000, 5_000, len(dates)).astype(float),
+        },
+        index=dates,
+    )
+    weekly = daily.resample("W").agg(
+        {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"}
+    )
+    return {"daily": daily, "weekly": weekly}
+
+
+@pytest.fixture
+def tester(history) -> HistoricalTester:
+    """HistoricalTester with the exchange fetch replaced by fixture data."""
+    tester = HistoricalTester("config.toml")
+    tester.data_fetcher.fetch_bnb_data = lambda *_: history
+    return tester
+
+
+def test_history_fetched_once_for_all_periods(tester, history):
+    """All periods run on one fetch, results keep period order."""
+    with patch.object(
+        tester.data_fetcher, "fetch_bnb_data", return_value=history
+    ) as mock_fetch:
+        results = tester.run_comprehensive_test(custom_periods=PERIODS, max_workers=1)
+        tester.run_comprehensive_test(custom_periods=PERIODS, max_workers=1)
+
+    assert mock_fetch.call_count == 1
+    assert [r.period_name for r in results] == ["first_half", "second_half"]
+    for result in results:
+        assert result.total_signals == result.long_signals
+        assert 0.0 <= result.overall_accuracy <= 100.0
+
+
+def test_parallel_workers_match_sequential(tester):
+    """Process pool results are identical to the in-process run."""
+    sequential = tester.run_comprehensive_test(custom_periods=PERIODS, max_workers=1)
+    parallel = tester.run_comprehensive_test(custom_periods=PERIODS, max_workers=2)
+
+    assert parallel == sequential
+
+
+def test_unknown_named_period_skipped(tester):
+    """Named periods are resolved against testing_periods."""
+    tester.testing_periods = {"h1": PERIODS["first_half"] | {"description": "H1"}}
+
+    results = tester.run_comprehensive_test(
+        custom_periods=["h1", "missing"], max_workers=1
+    )
+
+    assert [r.period_name for r in results] == ["h1"]
+
+
+def test_workers_read_memory_mapped_store(tester, history, tmp_path):
+    """Fetched history lands in the store; workers map it instead of unpickling."""
+    tester.store = OHLCVStore(tmp_path)
+    sequential = tester.run_comprehensive_test(custom_periods=PERIODS, max_workers=1)
+
+    daily = tester.store.load(tester._history_names[0])
+    assert isinstance(daily.values, np.memmap)
+    np.testing.assert_array_equal(daily.close, history["daily"]["Close"])
+    assert (
+        tester.run_comprehensive_test(custom_periods=PERIODS, max_workers=2)
+        == sequential
+    )
+
+
+def test_store_keeps_closed_candles_and_rejects_stale_weekly(tester, tmp_path):
+    """The forming bar is dropped (workers too); short warm-up or stale weekly refetch."""
+    now = pd.Timestamp.now(tz="UTC").tz_localize(None)
+    today = now.normalize()
+    monday = today - pd.Timedelta(days=today.dayofweek)
+    columns = dict.fromkeys(("Open", "High", "Low", "Close", "Volume"), 100.0)
+    daily = pd.DataFrame(columns, pd.date_range(end=today, periods=400, freq="D"))
+    weekly = pd.DataFrame(columns, pd.date_range(end=monday, periods=60, freq="7D"))
+    tester.store = OHLCVStore(tmp_path)
+    earliest = daily.index[0] + pd.Timedelta(days=WARMUP_DAYS)
+
+    for name, data in zip(tester._history_names, (daily, weekly), strict=True):
+        tester.store.save(name, data)
+    stored = tester._stored_history(earliest, now)
+    assert stored is not None
+    assert stored["daily"].index[-1] == np.datetime64(today - pd.Timedelta(days=1))
+    assert stored["weekly"].index[-1] == np.datetime64(monday - pd.Timedelta(weeks=1))
+
+    _open_period_worker(str(tmp_path), tester._history_names, now, tester.config)
+    assert _shared_history["daily"].index[-1] == stored["daily"].index[-1]
+    assert _shared_history["weekly"].index[-1] == stored["weekly"].index[-1]
+
+    # Periods starting earlier would run with less warm-up than a fresh fetch
+    assert tester._stored_history(earliest - pd.Timedelta(days=1), now) is None
+    tester.store.save(tester._history_names[1], weekly.iloc[8:])
+    assert tester._stored_history(earliest, now) is None
+
+    tester.store.save(tester._history_names[1], weekly.iloc[:-3])
+    assert tester._stored_history(earliest, now) is None
+
+
+def test_history_pages_past_exchange_candle_limit(tmp_path):
+    """Over 1000 days of history is fetched in pages and reaches the last period."""
+    tester = HistoricalTester("config.toml")
+    tester.store = OHLCVStore(tmp_path)
+    tester.data_fetcher.exchange = CappedExchange()
+    today = pd.Timestamp.now(tz="UTC").tz_localize(None).normalize()
+    monday = today - pd.Timedelta(days=today.dayofweek)
+
+    history = tester.load_history("2024-01-01", f"{today:%Y-%m-%d}")
+
+    assert len(history["daily"]) > 1000
+    assert history["daily"].index[-1] == np.datetime64(today - pd.Timedelta(days=1))
+    assert history["weekly"].index[-1] == np.datetime64(monday - pd.Timedelta(weeks=1))
+    # The fetched store gives the same periods full warm-up on the next run
+    now = pd.Timestamp.now(tz="UTC").tz_localize(None)
+    assert tester._stored_history(pd.Timestamp("2024-01-01"), now) is not None
+
+
+def test_history_ending_before_last_period_raises(tester):
+    """History that stops before a period's end is rejected, not walked stale."""
+    with pytest.raises(InsufficientDataError, match="daily"):
+        tester.load_history("2024-01-01", "2025-06-01")
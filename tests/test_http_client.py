@@ -0,0 +1,82 @@
+"""
+Focused shared HTTP client tests for KISS testing strategy.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from bnb_trading.data.http import (
+    FileTransport,
+    HttpClient,
+    get_http_client,
+    set_http_client,
+)
+from bnb_trading.ichimoku_module import IchimokuAnalyzer
+
+
+def test_file_transport_replaces_binance(tmp_path):
+    """Analyzers read stand-in responses through the shared client."""
+    (tmp_path / "api_v3_ticker_price.json").write_text(
+        json.dumps({"symbol": "BNBUSDT", "price": "612.5"})
+    )
+    previous = set_http_client(HttpClient(FileTransport(tmp_path)))
+    try:
+        assert IchimokuAnalyzer().get_current_price() == 612.5
+        assert IchimokuAnalyzer().get_current_price() == 612.5
+        assert get_http_client().stats["requests"] == 1  # second call cached
+    finally:
+        set_http_client(previous)
+
+
+def test_concurrent_requests_are_coalesced():
+    """Identical in-flight requests share one transport call."""
+    calls = []
+
+    def slow_transport(url, params, timeout):
+        calls.append(url)
+        time.sleep(0.05)
+        return {"price": "600"}
+
+    client = HttpClient(slow_transport)
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                client.get_json("https://x/api/v3/ticker/price", ttl=0)
+            )
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["https://x/api/v3/ticker/price"]
+    assert results == [{"price": "600"}] * 4
+    assert client.stats["coalesced"] == 3
+
+
+def test_interrupted_request_releases_key_and_expired_entries_drop():
+    """A BaseException from the transport does not leave the key in flight."""
+    responses = iter([KeyboardInterrupt(), {"price": "600"}, {"price": "601"}])
+
+    def transport(url, params, timeout):
+        response = next(responses)
+        if isinstance(response, BaseException):
+            raise response
+        return response
+
+    client = HttpClient(transport)
+    url = "https://x/api/v3/ticker/price"
+    with pytest.raises(KeyboardInterrupt):
+        client.get_json(url)
+
+    assert client.get_json(url, ttl=0.01) == {"price": "600"}
+    assert not client._in_flight
+    time.sleep(0.02)
+    assert client.get_json(url, ttl=0) == {"price": "601"}
+    assert not client._cache
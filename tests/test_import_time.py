@@ -0,0 +1,77 @@
+"""
+Import-time regression test for the lazy package layer.
+Cold `import bnb_trading` must stay free of heavy dependencies.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+HEAVY_MODULES = ["pandas", "numpy", "scipy", "talib", "ccxt", "tqdm", "requests"]
+
+# Generous budget: the lazy import takes a few ms, the old eager one ~2s
+COLD_IMPORT_BUDGET_SECONDS = 0.5
+
+
+def _run_cold(code: str) -> dict:
+    """Run code in a fresh interpreter and return its JSON output."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=SRC_DIR,
+        env={"PYTHONPATH": str(SRC_DIR), "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_cold_import_skips_heavy_dependencies():
+    """Getting the version string must not import any heavy dependency."""
+    code = (
+        "import json, sys, time\n"
+        "t = time.perf_counter()\n"
+        "import bnb_trading\n"
+        "version = bnb_trading.__version__\n"
+        "elapsed = time.perf_counter() - t\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'elapsed': elapsed, 'heavy': heavy, 'version': version}))"
+    )
+    report = _run_cold(code)
+
+    assert report["heavy"] == []
+    assert report["version"]
+    assert report["elapsed"] < COLD_IMPORT_BUDGET_SECONDS
+
+
+def test_core_models_import_without_pandas():
+    """DecisionContext and friends are importable without pandas."""
+    code = (
+        "import json, sys\n"
+        "from bnb_trading.core.models import DecisionContext, DecisionResult\n"
+        "print(json.dumps({'pandas': 'pandas' in sys.modules}))"
+    )
+    assert _run_cold(code) == {"pandas": False}
+
+
+def test_lazy_export_resolves_on_first_access():
+    """Exports resolve to the real classes and are cached on the package."""
+    import bnb_trading
+    from bnb_trading.fibonacci import FibonacciAnalyzer
+
+    assert bnb_trading.FibonacciAnalyzer is FibonacciAnalyzer
+    assert "FibonacciAnalyzer" in vars(bnb_trading)
+    assert "FibonacciAnalyzer" in bnb_trading.__all__
+
+
+def test_unknown_attribute_raises():
+    """Unknown names still raise AttributeError."""
+    import bnb_trading
+
+    with pytest.raises(AttributeError):
+        _ = bnb_trading.NotAnExport
@@ -0,0 +1,81 @@
+"""
+Tests for the array-based legacy weekly_tails.WeeklyTailsAnalyzer.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bnb_trading.weekly_tails import WeeklyTailsAnalyzer, tails_near_fib_resistance
+
+
+@pytest.fixture
+def legacy_config() -> dict:
+    """Legacy analyzer needs the size/bonus keys from config.toml."""
+    return {
+        "weekly_tails": {
+            "lookback_weeks": 4,
+            "min_tail_size": 0.02,
+            "strong_tail_size": 0.05,
+            "confluence_bonus": 1.5,
+        }
+    }
+
+
+@pytest.fixture
+def weekly_df() -> pd.DataFrame:
+    """Four weeks: LONG tail, SHORT tail, doji-ish HOLD, no tail."""
+    return pd.DataFrame(
+        {
+            "Open": [500.0, 520.0, 500.0, 500.0],
+            "High": [512.0, 560.0, 520.0, 511.0],
+            "Low": [470.0, 515.0, 499.0, 499.0],
+            "Close": [510.0, 510.0, 501.0, 510.0],
+            "Volume": [1.0] * 4,
+        },
+        index=pd.date_range("2024-01-07", periods=4, freq="W"),
+    )
+
+
+def test_analyze_weekly_tails_scores_all_weeks(legacy_config, weekly_df):
+    """Significant tails are returned strongest first with the legacy fields."""
+    analyzer = WeeklyTailsAnalyzer(legacy_config)
+
+    tails = analyzer.analyze_weekly_tails(weekly_df)
+    scores = analyzer.score_tails(weekly_df)
+
+    assert [t["signal"] for t in tails] == ["HOLD", "SHORT", "LONG"]
+    assert [t["date"] for t in tails] == list(
+        scores.index[scores["significant"]][[2, 1, 0]]
+    )
+    long_tail = tails[-1]
+    assert long_tail["dominant_tail"] == "lower"
+    assert long_tail["tail_strength"] == pytest.approx(30.0 / 10.0)
+    assert long_tail["strength_category"] == "ULTRA_EXTREME"
+
+
+def test_fib_confluence_uses_nearby_levels_only(legacy_config, weekly_df):
+    """Only levels within 2% of the tail price produce confluence points."""
+    analyzer = WeeklyTailsAnalyzer(legacy_config)
+    tails = analyzer.analyze_weekly_tails(weekly_df)
+    fib_levels = {0.236: 600.0, 0.382: 475.0, 0.5: 469.0, 0.618: 400.0}
+
+    confluence = analyzer.check_fib_tail_confluence(fib_levels, 510.0, tails)
+
+    points = confluence["confluence_points"]
+    assert {p["fib_level"] for p in points} == {0.382, 0.5}
+    assert all(p["tail_signal"] == "LONG" for p in points)
+    assert points[0]["fib_level"] == 0.5  # closest level scores highest
+    assert confluence["strong_confluence"] is True
+
+
+def test_tails_near_fib_resistance_vectorized():
+    """Nearest level above each price decides proximity."""
+    fib_levels = {0.382: 500.0, 0.618: 550.0, 0.786: 450.0}
+    prices = np.array([495.0, 520.0, 560.0])
+
+    near, nearest = tails_near_fib_resistance(prices, fib_levels, 0.02)
+
+    assert near.tolist() == [True, False, False]
+    assert nearest[:2].tolist() == [500.0, 550.0]
+    assert np.isnan(nearest[2])
@@ -0,0 +1,69 @@
+"""
+Incremental live data update tests for KISS testing strategy.
+"""
+
+import numpy as np
+import pandas as pd
+
+from bnb_trading.data.fetcher import DAY_MS, ohlcv_to_dataframe
+from bnb_trading.data.validators import add_ath_analysis
+from bnb_trading.pipeline.orchestrator import TradingPipeline
+
+START_MS = 1_699_833_600_000  # Monday 2023-11-13 00:00 UTC
+
+
+class FakeExchange:
+    """Sync ccxt stand-in: random-walk candles up to a clock the test moves."""
+
+    def __init__(self, days: int = 700):
+        rng = np.random.default_rng(11)
+        close = 300 * np.exp(np.cumsum(rng.normal(0, 0.02, days)))
+        self.candles = {
+            "1d": [
+                [START_MS + i * DAY_MS, c, c * 1.02, c * 0.98, c, 1000.0]
+                for i, c in enumerate(close)
+            ]
+        }
+        self.candles["1w"] = [
+            [
+                week[0][0],
+                week[0][1],
+                max(row[2] for row in week),
+                min(row[3] for row in week),
+                week[-1][4],
+                sum(row[5] for row in week),
+            ]
+            for week in (self.candles["1d"][i : i + 7] for i in range(0, days, 7))
+        ]
+        self.clock = START_MS + 600 * DAY_MS
+        self.calls = []
+
+    def milliseconds(self):
+        return self.clock
+
+    def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        self.calls.append((timeframe, since, limit))
+        rows = [row for row in self.candles[timeframe] if since <= row[0] <= self.clock]
+        return rows[:limit] if limit else rows
+
+
+def test_live_runs_append_only_new_candles():
+    """Second run fetches from the open candle on and equals a full recompute."""
+    pipeline = TradingPipeline("config.toml")
+    exchange = pipeline.data_fetcher.exchange = FakeExchange()
+    first = pipeline.load_market_data()
+    since = exchange.calls[0][1]
+
+    exchange.clock += 3 * DAY_MS
+    exchange.calls.clear()
+    updated = pipeline.load_market_data()
+
+    assert [call[1] for call in exchange.calls] == [
+        int(first["daily"].index[-1].timestamp() * 1000),
+        int(first["weekly"].index[-1].timestamp() * 1000),
+    ]
+    expected = add_ath_analysis(
+        ohlcv_to_dataframe(exchange.fetch_ohlcv("BNB/USDT", "1d", since), "1d")
+    )
+    pd.testing.assert_frame_equal(updated["daily"], expected)
+    assert updated["weekly"].index[-1] > first["weekly"].index[-1]
@@ -0,0 +1,80 @@
+"""
+Focused MarketRegimeDetector tests for KISS testing strategy.
+"""
+
+import numpy as np
+import pandas as pd
+
+from bnb_trading.signals.smart_short.market_regime import MarketRegimeDetector
+
+
+def test_drawdown_history_matches_detect_market_regime():
+    """Per-bar ATH distance ends at the detect_market_regime value."""
+    closes = np.concatenate([np.linspace(400.0, 600.0, 60), np.linspace(600, 450, 40)])
+    daily_df = pd.DataFrame(
+        {"High": closes * 1.01, "Close": closes, "Volume": 1000.0},
+        index=pd.date_range("2024-01-01", periods=100, freq="D"),
+    )
+    detector = MarketRegimeDetector()
+
+    history = detector.drawdown_history(daily_df)
+    regime = detector.detect_market_regime(daily_df, None)
+
+    assert history["ath_distance_pct"].iloc[-1] == regime["ath_distance_pct"]
+    assert history["ath_distance_pct"].iloc[59] == (606.0 - 600.0) / 606.0 * 100
+    assert history["bear_duration_months"].iloc[-1] == 1  # 25% off the top
+
+
+def _random_walk(rows: int = 200) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Daily bars and Monday-open weekly bars (Binance 1w labelling)."""
+    rng = np.random.default_rng(3)
+    closes = 500 * np.exp(np.cumsum(rng.normal(0, 0.02, rows)))
+    daily_df = pd.DataFrame(
+        {
+            "High": closes * 1.02,
+            "Close": closes,
+            "Volume": rng.uniform(500, 2000, rows),
+        },
+        index=pd.date_range("2024-01-01", periods=rows, freq="D"),
+    )
+    weekly_df = daily_df.resample("W-MON", label="left", closed="left").agg(
+        {"High": "max", "Close": "last", "Volume": "sum"}
+    )
+    return daily_df, weekly_df
+
+
+def test_regime_history_matches_detect_market_regime_per_prefix():
+    """Row t equals detect_market_regime on daily[:t + 1] and the closed weeks."""
+    daily_df, weekly_df = _random_walk()
+    detector = MarketRegimeDetector()
+
+    history = detector.regime_history(daily_df, weekly_df)
+
+    for t in (10, 60, 120, 199):
+        close_time = daily_df.index[t] + pd.Timedelta(days=1)
+        closed_weeks = weekly_df[weekly_df.index + pd.Timedelta(weeks=1) <= close_time]
+        regime = detector.detect_market_regime(daily_df.iloc[: t + 1], closed_weeks)
+        row = history.iloc[t]
+        assert row["regime"] == regime["regime"]
+        assert row["daily_volume_trend"] == regime["daily_volume_trend"]
+        assert np.isclose(row["daily_trend"], regime["daily_trend"])
+        assert np.isclose(row["weekly_trend"], regime["weekly_trend"])
+        assert np.isclose(row["confidence"], regime["confidence"])
+
+
+def test_regime_history_ignores_future_prices():
+    """Raising only the closes after a midweek bar leaves its row unchanged."""
+    daily_df, _ = _random_walk()
+    t = 100  # Wednesday
+    assert daily_df.index[t].dayofweek == 2
+    future = daily_df.copy()
+    future.iloc[t + 1 :, future.columns.get_loc("Close")] *= 1.5
+
+    rows = []
+    for frame in (daily_df, future):
+        weekly_df = frame.resample("W-MON", label="left", closed="left").agg(
+            {"High": "max", "Close": "last", "Volume": "sum"}
+        )
+        rows.append(MarketRegimeDetector().regime_history(frame, weekly_df).iloc[t])
+
+    pd.testing.assert_series_equal(rows[0], rows[1])
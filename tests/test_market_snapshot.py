@@ -0,0 +1,121 @@
+"""
+Focused async market snapshot tests for KISS testing strategy.
+"""
+
+import asyncio
+import json
+import time
+
+import pandas as pd
+import pytest
+
+from bnb_trading.core.exceptions import NetworkError
+from bnb_trading.data.fetcher import DAY_MS, ohlcv_since, ohlcv_to_dataframe
+from bnb_trading.data.gather import ThreadTransport, gather_market_snapshot
+from bnb_trading.data.http import FileTransport, HttpClient, set_http_client
+from bnb_trading.data.validators import add_ath_analysis
+from bnb_trading.whale_tracker import WhaleTracker
+
+
+class FakeExchange:
+    """Async ccxt stand-in: synthetic candles up to ``clock`` after a delay."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.clock = int(time.time() * 1000)
+        self.calls = []
+
+    async def fetch_ohlcv(self, symbol, timeframe, since, limit=None):
+        self.calls.append((timeframe, since, limit))
+        await asyncio.sleep(self.delay)
+        step = DAY_MS if timeframe == "1d" else 7 * DAY_MS
+        return [
+            [t, 100.0 + t % 7, 105.0 + t % 7, 95.0, 101.0 + t % 5, 1000.0]
+            for t in range(since, self.clock + 1, step)[:limit]
+        ]
+
+
+def test_snapshot_gathers_and_primes_http_cache(tmp_path):
+    """OHLCV + whale klines arrive together; the tracker then reads the cache."""
+    start = 1_700_000_000_000
+    (tmp_path / "api_v3_klines.json").write_text(
+        json.dumps(
+            [
+                [start + i * 14_400_000, "600", "605", "595", "601", "1000"]
+                for i in range(42)
+            ]
+        )
+    )
+    client = HttpClient(FileTransport(tmp_path))
+
+    snapshot = asyncio.run(
+        gather_market_snapshot(
+            lookback_days=70,
+            exchange=FakeExchange(),
+            transport=ThreadTransport(client.transport),
+            client=client,
+        )
+    )
+
+    assert len(snapshot.daily) == 70
+    assert len(snapshot.weekly) == 10
+    assert snapshot.complete
+    assert len(snapshot.responses["whale_klines"]) == 42
+    previous = set_http_client(client)
+    try:
+        assert WhaleTracker().get_whale_activity_summary(7)
+    finally:
+        set_http_client(previous)
+    assert client.stats == {"requests": 0, "cache_hits": 1, "coalesced": 0}
+
+
+def test_snapshot_enforces_global_deadline(tmp_path):
+    """Reads run concurrently and stragglers are cancelled at the deadline."""
+    started = time.monotonic()
+    with pytest.raises(NetworkError, match="deadline"):
+        asyncio.run(
+            gather_market_snapshot(
+                deadline=0.2,
+                exchange=FakeExchange(delay=5.0),
+                transport=ThreadTransport(FileTransport(tmp_path)),
+                client=HttpClient(FileTransport(tmp_path)),
+            )
+        )
+    assert time.monotonic() - started < 1.0
+
+
+def test_live_snapshot_fetches_new_candles_under_deadline(tmp_path):
+    """After the first run only new candles are read, inside the async stage."""
+    exchange = FakeExchange()
+
+    def gather(previous=None, deadline=5.0):
+        return asyncio.run(
+            gather_market_snapshot(
+                lookback_days=70,
+                deadline=deadline,
+                exchange=exchange,
+                transport=ThreadTransport(FileTransport(tmp_path)),
+                client=HttpClient(FileTransport(tmp_path)),
+                previous=previous,
+            )
+        )
+
+    first = gather()
+    exchange.clock += 3 * DAY_MS
+    exchange.calls.clear()
+    updated = gather({"daily": first.daily, "weekly": first.weekly})
+
+    assert exchange.calls == [
+        ("1d", ohlcv_since(first.daily), None),
+        ("1w", ohlcv_since(first.weekly), None),
+    ]
+    full = asyncio.run(
+        exchange.fetch_ohlcv("BNB/USDT", "1d", ohlcv_since(first.daily[:1]))
+    )
+    pd.testing.assert_frame_equal(
+        updated.daily, add_ath_analysis(ohlcv_to_dataframe(full, "1d"))
+    )
+
+    exchange.delay = 5.0
+    with pytest.raises(NetworkError, match="deadline"):
+        gather({"daily": updated.daily, "weekly": updated.weekly}, deadline=0.2)
@@ -0,0 +1,75 @@
+"""
+Canonical OHLCV schema tests for KISS testing strategy.
+"""
+
+import numpy as np
+import pandas as pd
+
+from bnb_trading.core.models import DecisionContext
+from bnb_trading.data.schema import OHLCV, SCHEMA_ATTR, normalize_ohlcv
+from bnb_trading.price_action_patterns import candle_anatomy
+from bnb_trading.signals.decision import decide_long
+
+
+def _lowercase_frame(rows: int = 40) -> pd.DataFrame:
+    prices = 600 + np.sin(np.arange(rows)) * 10
+    return pd.DataFrame(
+        {
+            "open": prices,
+            "high": prices + 5,
+            "low": prices - 5,
+            "close": prices + 1,
+            "volume": np.arange(rows) + 1000,  # int64 on purpose
+        },
+        index=pd.date_range("2024-01-01", periods=rows, freq="D"),
+    )
+
+
+def test_normalize_ohlcv_renames_and_casts_once():
+    """Lowercase int/float columns become canonical contiguous float64 arrays."""
+    df = normalize_ohlcv(_lowercase_frame())
+
+    assert list(df.columns) == ["Open", "High", "Low", "Close", "Volume"]
+    assert df.attrs[SCHEMA_ATTR] is True
+    assert normalize_ohlcv(df) is df
+
+    ohlcv = OHLCV.from_frame(df)
+    assert ohlcv.volume.dtype == np.float64
+    assert ohlcv.close.flags["C_CONTIGUOUS"]
+
+
+def test_candle_anatomy_agrees_on_lowercase_and_canonical_frames():
+    """Analyzers read the same arrays whatever the column casing was."""
+    lowercase = candle_anatomy(_lowercase_frame())
+    canonical = candle_anatomy(normalize_ohlcv(_lowercase_frame()))
+
+    np.testing.assert_array_equal(lowercase.body, canonical.body)
+    np.testing.assert_array_equal(lowercase.volume, canonical.volume)
+
+
+def test_series_views_share_block_and_match_frame_decisions(
+    test_config, sample_daily_data, sample_weekly_data
+):
+    """decide_long gives the same result for O(1) views and DataFrame prefixes."""
+    daily = OHLCV.from_frame(sample_daily_data)
+    weekly = OHLCV.from_frame(sample_weekly_data)
+    date = sample_weekly_data.index[-3]
+
+    view = daily.until(date)
+    assert np.shares_memory(view.values, daily.values)
+    assert len(view) == len(sample_daily_data.loc[:date])
+    assert OHLCV.from_frame(daily, dtype=np.float32).close.dtype == np.float32
+
+    from_views = decide_long(
+        DecisionContext(daily.until(date), weekly.until(date), test_config, date)
+    )
+    from_frames = decide_long(
+        DecisionContext(
+            sample_daily_data.loc[:date],
+            sample_weekly_data.loc[:date],
+            test_config,
+            date,
+        )
+    )
+    assert from_views.signal == from_frames.signal
+    assert from_views.confidence == from_frames.confidence
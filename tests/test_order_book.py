@@ -0,0 +1,38 @@
+"""
+Focused OrderBook tests for KISS testing strategy.
+"""
+
+import numpy as np
+
+from bnb_trading.analysis.orderbook import OrderBook
+from bnb_trading.whale_tracker import WhaleTracker
+
+SNAPSHOT = {
+    "lastUpdateId": 42,
+    "bids": [["600.00", "10.0"], ["599.00", "20000.0"], ["598.00", "30.0"]],
+    "asks": [["601.00", "5.0"], ["602.00", "15.0"], ["603.00", "12000.0"]],
+}
+
+
+def test_price_impact_walks_the_ladder():
+    """Average fill price comes from cumulative depth, NaN past the book."""
+    book = OrderBook.from_depth(SNAPSHOT)
+
+    impact = book.price_impact([5, 10, 20000], side="asks")
+
+    np.testing.assert_allclose(impact["average_price"][:2], [601.0, 601.5])
+    np.testing.assert_array_equal(impact["worst_price"][:2], [601.0, 602.0])
+    assert np.isnan(impact["average_price"][2])
+    assert book.imbalance(depth_pct=0.2) == (10 - 5) / (10 + 5)  # best levels only
+
+
+def test_offline_snapshot_whale_walls(tmp_path):
+    """Snapshots round-trip through a file and feed the whale wall analysis."""
+    path = tmp_path / "depth.json"
+    OrderBook.from_depth(SNAPSHOT).save(path)
+
+    result = WhaleTracker().analyze_order_book_whales(book=OrderBook.from_file(path))
+
+    assert result["largest_bid_wall"] == (599.0, 20000.0)
+    assert result["whale_ask_count"] == 1
+    assert result["total_whale_resistance"] == 603.0 * 12000.0
@@ -0,0 +1,74 @@
+"""
+Focused PatternTrendAnalyzer tests for KISS testing strategy.
+"""
+
+import numpy as np
+import pandas as pd
+
+from bnb_trading.analysis.trend import PatternTrendAnalyzer
+from bnb_trading.analysis.trend.streaks import max_streaks
+
+
+def create_zigzag_data(periods: int = 260) -> pd.DataFrame:
+    """Uptrend with a periodic pullback so streaks break and restart."""
+    steps = np.where(np.arange(periods) % 7 < 5, 1.0, -2.0)
+    closes = 400.0 + np.cumsum(steps)
+    return pd.DataFrame(
+        {"High": closes + 2.0, "Low": closes - 2.0, "Close": closes},
+        index=pd.date_range("2024-01-01", periods=periods, freq="D"),
+    )
+
+
+def test_max_streaks_counts_consecutive_patterns():
+    """RLE streaks match a hand-counted series."""
+    highs = np.array([1.0, 2.0, 3.0, 4.0, 3.0, 2.0, 3.0])
+    lows = highs - 0.5
+
+    assert max_streaks(highs, lows, 1) == (3, 3, 2, 2)
+
+
+def test_streak_tracker_and_history_match_analyze(test_config):
+    """Incremental streaks and batch history equal per-prefix analyze()."""
+    analyzer = PatternTrendAnalyzer(test_config)
+    df = create_zigzag_data()
+
+    history = analyzer.history(df)
+    tracker = analyzer.streak_tracker()
+
+    for i in range(len(df)):
+        streaks = tracker.update(df["High"].iloc[i], df["Low"].iloc[i])
+        window = df.iloc[: i + 1].tail(analyzer.lookback_days)
+        assert streaks == max_streaks(
+            window["High"].to_numpy(), window["Low"].to_numpy(), analyzer.window_size
+        )
+
+    for i in (10, 69, 150, 199, len(df) - 1):
+        result = analyzer.analyze(df.iloc[: i + 1])
+        row = history.iloc[i]
+        assert (row["status"], row["state"], row["score"]) == (
+            result.status,
+            result.state,
+            result.score,
+        )
+    assert history["state"].iloc[-1] == "UP"
+
+
+def test_history_masks_invalid_bars_like_analyze(test_config):
+    """NaN/zero bars are dropped per window exactly as analyze() drops them."""
+    analyzer = PatternTrendAnalyzer(test_config)
+    df = create_zigzag_data()
+    df.iloc[[75, 120, 121, 230], 0] = np.nan  # High
+    df.iloc[[90, 231], 1] = 0.0  # Low
+    df.iloc[[150, 255], 2] = np.nan  # Close
+
+    history = analyzer.history(df)
+
+    for i in range(69, len(df)):
+        result = analyzer.analyze(df.iloc[: i + 1])
+        row = history.iloc[i]
+        assert (row["state"], row["score"], row["hh_hl_state"], row["ema_state"]) == (
+            result.state,
+            result.score,
+            result.meta["hh_hl_state"],
+            result.meta["ema_state"],
+        )
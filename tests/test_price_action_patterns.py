@@ -0,0 +1,51 @@
+"""
+Focused PriceActionPatternsAnalyzer tests for KISS testing strategy.
+"""
+
+import numpy as np
+import pandas as pd
+
+from bnb_trading.price_action_patterns import (
+    PriceActionPatternsAnalyzer,
+    candle_anatomy,
+)
+
+
+def test_candle_anatomy_handles_both_column_casings():
+    """Body, shadows and wick ratios are computed once for all candles."""
+    lower = pd.DataFrame(
+        {
+            "open": [100.0, 100.0, 100.0],
+            "high": [130.0, 105.0, 101.0],
+            "low": [85.0, 80.0, 99.0],
+            "close": [90.0, 104.0, 100.0],
+        }
+    )
+    candles = candle_anatomy(lower)
+    upper = candle_anatomy(lower.rename(columns=str.capitalize))
+
+    np.testing.assert_array_equal(candles.body, [10.0, 4.0, 0.0])
+    np.testing.assert_array_equal(candles.upper_shadow, [30.0, 1.0, 1.0])
+    np.testing.assert_array_equal(candles.lower_shadow, [5.0, 20.0, 1.0])
+    np.testing.assert_array_equal(candles.upper_wick_ratio, [3.0, 0.25, 0.0])
+    np.testing.assert_array_equal(candles.bearish, [True, False, False])
+    np.testing.assert_array_equal(upper.lower_wick_ratio, candles.lower_wick_ratio)
+    assert candles.troughs == [(1, 80.0)]
+
+
+def test_rejection_history_matches_analyze_rejection_patterns(sample_daily_data):
+    """Batch rejection scan equals the per-call analysis on every prefix."""
+    daily = sample_daily_data.copy()
+    daily.iloc[30, daily.columns.get_loc("Close")] = 495.0  # bearish, wick 3x body
+    daily.iloc[60, daily.columns.get_loc("Close")] = 498.0  # wick 6x body / 2.0 -> 1.0
+    analyzer = PriceActionPatternsAnalyzer({})
+
+    history = analyzer.rejection_history(daily)
+
+    for end in range(5, len(daily) + 1):
+        result = analyzer.analyze_rejection_patterns(daily.iloc[:end])
+        row = history.iloc[end - 1]
+        assert bool(row["rejection_detected"]) == result["rejection_detected"]
+        if "strength" in result:
+            assert row["best_strength"] == result["strength"]
+    assert history["rejections"].iloc[32] == 1
@@ -0,0 +1,70 @@
+"""
+Focused kline resampling tests for KISS testing strategy.
+"""
+
+import numpy as np
+import pandas as pd
+
+from bnb_trading.data.http import HttpClient, set_http_client
+from bnb_trading.data.resample import candles_from_frame, resample_klines
+from bnb_trading.sentiment_module import MOMENTUM_TIMEFRAMES, SentimentAnalyzer
+
+
+def _hourly_frame(hours: int) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    closes = 600 + rng.normal(0, 2, hours).cumsum()
+    return pd.DataFrame(
+        {
+            "Open": closes - 1,
+            "High": closes + rng.uniform(0, 3, hours),
+            "Low": closes - 1 - rng.uniform(0, 3, hours),
+            "Close": closes,
+            "Volume": rng.uniform(100, 200, hours),
+        },
+        index=pd.date_range("2024-01-03 05:00", periods=hours, freq="h"),
+    )
+
+
+def test_resample_matches_calendar_aggregation():
+    """1d / Monday-aligned 1w / calendar 1M match pandas OHLCV aggregation."""
+    hourly = _hourly_frame(24 * 200)
+    candles = candles_from_frame(hourly)
+    aggregation = {
+        "Open": "first",
+        "High": "max",
+        "Low": "min",
+        "Close": "last",
+        "Volume": "sum",
+    }
+
+    for interval, rule in (("1d", "D"), ("1w", "W-MON"), ("1M", "MS")):
+        expected = (
+            hourly.resample(rule, closed="left", label="left").agg(aggregation).dropna()
+        )
+        resampled = resample_klines(candles, interval)
+        np.testing.assert_array_equal(
+            resampled[:, 0], expected.index.to_numpy(dtype="datetime64[ms]").astype(int)
+        )
+        np.testing.assert_allclose(resampled[:, 1:], expected.to_numpy())
+
+
+def test_momentum_timeframes_use_one_request():
+    """Sentiment momentum fetches 1h once and derives 4h / 1d locally."""
+    hourly = candles_from_frame(_hourly_frame(1000)).tolist()
+    calls = []
+
+    def transport(url, params, timeout):
+        calls.append(dict(params))
+        return hourly[-params["limit"] :]
+
+    previous = set_http_client(HttpClient(transport))
+    try:
+        momentum = SentimentAnalyzer().get_market_momentum_indicators()
+    finally:
+        set_http_client(previous)
+
+    assert calls == [{"symbol": "BNBUSDT", "interval": "1h", "limit": 599}]
+    assert set(momentum["timeframe_data"]) == set(MOMENTUM_TIMEFRAMES)
+    daily_closes = resample_klines(np.array(hourly), "1d")[-24:, 4]
+    expected = (daily_closes[-1] - daily_closes[0]) / daily_closes[0] * 100
+    assert momentum["timeframe_data"]["1d"]["price_change"] == round(expected, 2)
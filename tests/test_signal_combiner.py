@@ -0,0 +1,62 @@
+"""
+Batch signal combiner tests for KISS testing strategy.
+"""
+
+import numpy as np
+
+from bnb_trading.signals.combiners import (
+    analyses_to_matrix,
+    combine_signal_matrix,
+    combine_signals,
+    decode_signals,
+)
+from bnb_trading.signals.confidence import calculate_confidence, confidence_matrix
+
+MODULES = ["fibonacci", "weekly_tails", "trend", "indicators"]
+WEIGHTS = {"fibonacci": 0.3, "weekly_tails": 0.4, "trend": 0.2, "indicators": 0.1}
+
+
+def _analyses_series(count: int = 200) -> list[dict]:
+    rng = np.random.default_rng(3)
+    return [
+        {
+            module: {
+                "signal": str(rng.choice(["LONG", "SHORT", "HOLD"])),
+                "strength": float(rng.random()),
+            }
+            for module in MODULES
+            if rng.random() > 0.1  # some modules missing per timestamp
+        }
+        for _ in range(count)
+    ]
+
+
+def test_matrix_combiner_matches_scalar_path():
+    """Signals, strengths and confidences equal the per-timestamp functions."""
+    series = _analyses_series()
+    signals, strengths = analyses_to_matrix(series, MODULES)
+
+    combined = combine_signal_matrix(
+        signals, strengths, [WEIGHTS[m] for m in MODULES], 0.3
+    )
+    confidence = confidence_matrix(
+        combined["signal"], combined["strength"], signals, MODULES
+    )
+
+    for t, analyses in enumerate(series):
+        expected = combine_signals(analyses, WEIGHTS, 0.3)
+        assert decode_signals(combined["signal"])[t] == expected["signal"]
+        assert np.isclose(combined["strength"][t], expected["strength"])
+        assert np.isclose(confidence[t], calculate_confidence(expected, analyses))
+
+
+def test_weight_sweep_in_one_call():
+    """A (K, M) weight matrix yields (K, T) results, one row per weight vector."""
+    signals, strengths = analyses_to_matrix(_analyses_series(), MODULES)
+    sweep = np.array([[1, 0, 0, 0], [0.3, 0.4, 0.2, 0.1]])
+
+    combined = combine_signal_matrix(signals, strengths, sweep)
+
+    assert combined["signal"].shape == (2, len(signals))
+    single = combine_signal_matrix(signals, strengths, sweep[1])
+    np.testing.assert_array_equal(combined["signal"][1], single["signal"])
@@ -0,0 +1,120 @@
+"""
+SignalJournal / SignalValidator tests for KISS testing strategy.
+Append-only journal with indexed lookups and aggregate accuracy stats.
+"""
+
+import pandas as pd
+
+from bnb_trading.data.journal import SignalJournal
+from bnb_trading.validator import SignalValidator
+
+
+def make_signal(signal_type="LONG", price=500.0, days_ago=5, priority="HIGH"):
+    """Create signal data in the validator input format."""
+    return {
+        "signal": signal_type,
+        "confidence": 0.9,
+        "priority": priority,
+        "analysis_date": pd.Timestamp.now().normalize() - pd.Timedelta(days=days_ago),
+        "fibonacci_analysis": {"current_price": price},
+        "reason": "test",
+    }
+
+
+def test_save_signal_appends_without_rewrite(tmp_path):
+    """Saving signals appends rows and does not touch the CSV file."""
+    results_file = tmp_path / "results.csv"
+    validator = SignalValidator(str(results_file))
+
+    assert validator.save_signal(make_signal(days_ago=3))
+    assert validator.save_signal(make_signal("SHORT", days_ago=2))
+
+    assert validator.journal.count() == 2
+    assert not results_file.exists()
+    assert list(validator.results_df["signal_type"]) == ["LONG", "SHORT"]
+
+
+def test_check_signal_result_indexed_lookup(tmp_path):
+    """Validation finds the signal by date and persists the outcome."""
+    validator = SignalValidator(str(tmp_path / "results.csv"))
+    signal = make_signal(price=500.0, days_ago=14)
+    validator.save_signal(signal)
+
+    result = validator.check_signal_result(signal["analysis_date"], 550.0)
+
+    assert result["success"] is True
+    assert result["profit_loss_pct"] == 10.0
+    row = validator.journal.find_by_date(signal["analysis_date"])
+    assert row["success"] is True
+    assert pd.notna(row["validation_date"])
+
+    # Second validation is rejected
+    again = validator.check_signal_result(signal["analysis_date"], 560.0)
+    assert "error" in again
+
+
+def test_check_signal_result_missing_signal(tmp_path):
+    """Unknown dates return an error dict."""
+    validator = SignalValidator(str(tmp_path / "results.csv"))
+
+    result = validator.check_signal_result(pd.Timestamp("2020-01-01"), 500.0)
+
+    assert "error" in result
+
+
+def test_get_accuracy_stats_aggregates(tmp_path):
+    """Accuracy stats match the legacy DataFrame semantics."""
+    validator = SignalValidator(str(tmp_path / "results.csv"))
+    scenarios = [
+        ("LONG", 500.0, 10, 550.0, "HIGH"),  # +10%
+        ("LONG", 500.0, 9, 450.0, "LOW"),  # -10%
+        ("SHORT", 500.0, 8, 400.0, "HIGH"),  # +20%
+    ]
+    for signal_type, price, days_ago, exit_price, priority in scenarios:
+        signal = make_signal(signal_type, price, days_ago, priority)
+        validator.save_signal(signal)
+        validator.check_signal_result(signal["analysis_date"], exit_price)
+    validator.save_signal(make_signal(days_ago=1))  # pending, excluded
+
+    stats = validator.get_accuracy_stats(30)
+
+    assert stats["total_signals"] == 3
+    assert stats["successful_signals"] == 2
+    assert stats["long_signals"] == {"total": 2, "success": 1, "accuracy": 50.0}
+    assert stats["short_signals"]["accuracy"] == 100.0
+    assert stats["priority_stats"]["HIGH"]["total"] == 2
+    assert abs(stats["avg_profit_loss_pct"] - 20.0 / 3) < 1e-9
+    assert abs(stats["avg_profit_loss_success_pct"] - 15.0) < 1e-9
+    assert abs(stats["avg_profit_loss_failure_pct"] + 10.0) < 1e-9
+
+
+def test_legacy_csv_is_imported_once(tmp_path):
+    """Existing results.csv is migrated into an empty journal."""
+    results_file = tmp_path / "results.csv"
+    first = SignalValidator(str(results_file))
+    first.save_signal(make_signal(days_ago=4))
+    first._save_results()
+    first.journal.close()
+
+    # Fresh journal next to the exported CSV
+    journal_file = tmp_path / "migrated.sqlite"
+    migrated = SignalValidator(str(results_file), journal_file=str(journal_file))
+    assert migrated.journal.count() == 1
+
+    migrated.journal.close()
+    reopened = SignalValidator(str(results_file), journal_file=str(journal_file))
+    assert reopened.journal.count() == 1
+
+
+def test_recent_returns_newest_first():
+    """recent() orders by signal_date descending."""
+    journal = SignalJournal(":memory:")
+    for day in ["2024-01-03", "2024-01-01", "2024-01-02"]:
+        journal.append({"signal_date": pd.Timestamp(day), "signal_type": "LONG"})
+
+    recent = journal.recent(2)
+
+    assert list(recent["signal_date"]) == [
+        pd.Timestamp("2024-01-03"),
+        pd.Timestamp("2024-01-02"),
+    ]
@@ -0,0 +1,69 @@
+"""
+Batch SHORT-setup scanner tests for KISS testing strategy.
+"""
+
+import numpy as np
+import pandas as pd
+
+from bnb_trading.signals.smart_short.confluence import (
+    short_confluence_history,
+    validate_short_confluence,
+)
+from bnb_trading.signals.smart_short.generator import SmartShortSignalGenerator
+
+
+def _daily(rows: int = 150) -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    close = 500 * np.exp(np.cumsum(rng.normal(0, 0.025, rows)))
+    df = pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * 1.02,
+            "Low": close * 0.95,
+            "Close": close,
+            "Volume": rng.uniform(500, 2000, rows),
+            "RSI": rng.uniform(30, 90, rows),
+        },
+        index=pd.date_range("2024-01-01", periods=rows, freq="D"),
+    )
+    df["ATH"] = df["High"].cummax()
+    return df
+
+
+def test_confluence_history_matches_per_setup_validation():
+    """Row t equals validate_short_confluence for bar t on daily[:t + 1]."""
+    df = _daily()
+    regime = {"confidence": 0.7, "regime": "NEUTRAL"}
+
+    history = short_confluence_history(df, regime["confidence"])
+
+    assert history["valid"].any()
+    for t in range(len(df)):
+        setup = {"index": t, "timestamp": df.index[t], "price": df["Close"].iloc[t]}
+        candidate = validate_short_confluence(setup, df.iloc[: t + 1], None, regime)
+        row = history.iloc[t]
+        assert (candidate is not None) == row["valid"]
+        if candidate is not None:
+            assert candidate.confluence_score == row["confluence_score"]
+            assert np.isclose(candidate.confidence, row["confidence"])
+            assert np.isclose(candidate.take_profit_price, row["take_profit_price"])
+
+
+def test_scan_short_history_agrees_with_live_generator():
+    """A flagged bar that is the only recent candidate gives a live SHORT."""
+    df = _daily()
+    generator = SmartShortSignalGenerator({"smart_short": {}})
+
+    history = generator.scan_short_history(df)
+
+    candidates = (history["valid"] & (history["confluence_score"] >= 3)).to_numpy()
+    lone = [
+        t
+        for t in np.flatnonzero(history["short_signal"].to_numpy())
+        if not candidates[max(t - 4, 0) : t].any()
+    ]
+    assert lone
+    for t in lone:
+        live = generator.generate_smart_short_signal(df.iloc[: t + 1])
+        assert live["signal"] == "SHORT"
+        assert np.isclose(live["confidence"], history["confidence"].iloc[t])
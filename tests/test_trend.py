@@ -237,3 +237,40 @@ def test_error_handling_invalid_data(test_config):
     # Should handle errors gracefully
     assert isinstance(result, dict)
     # May contain errors in sub-components but shouldn't crash
+
+
+def create_bull_after_crash_data(periods: int = 400) -> pd.DataFrame:
+    """Rally to 600, 35% crash, then a recovery rally to new highs."""
+    prices = np.concatenate(
+        [
+            np.linspace(400.0, 600.0, 120),
+            np.linspace(600.0, 390.0, 80),
+            np.linspace(390.0, 700.0, periods - 200),
+        ]
+    )
+    dates = pd.date_range("2023-01-01", periods=periods, freq="D")
+    return pd.DataFrame({"Close": prices}, index=dates)
+
+
+def test_regime_history_matches_single_bar_analysis(test_config):
+    """Batch regime/bull duration equals the per-bar TrendAnalyzer results."""
+    analyzer = TrendAnalyzer(test_config)
+    df = create_bull_after_crash_data()
+
+    history = analyzer.regime_history(df)
+
+    for end in (59, 150, 250, 320, len(df) - 1):
+        prefix = df.iloc[: end + 1]
+        medium = analyzer._analyze_medium_term_trend(prefix)
+        long_term = analyzer._analyze_long_term_trend(prefix)
+        regime = analyzer._detect_market_regime(prefix, medium, long_term)
+
+        assert history["regime"].iloc[end] == regime["regime"]
+        assert history["confidence"].iloc[end] == regime["confidence"]
+        assert history["bull_duration_months"].iloc[
+            end
+        ] == analyzer._estimate_bull_duration(prefix)
+
+    # Crash low is 80 bars (2 months) after the 600 peak
+    assert history["bear_duration_months"].iloc[199] == 2
+    assert history["bear_duration_months"].iloc[-1] == 0
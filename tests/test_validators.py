@@ -0,0 +1,50 @@
+"""
+Incremental ATH and data-quality tests for KISS testing strategy.
+"""
+
+import numpy as np
+import pandas as pd
+
+from bnb_trading.data.validators import (
+    add_ath_analysis,
+    append_ath_analysis,
+    detect_data_issues,
+)
+
+
+def _daily(rows: int = 400) -> pd.DataFrame:
+    rng = np.random.default_rng(1)
+    close = 300 * np.exp(np.cumsum(rng.normal(0, 0.02, rows)))
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * 1.02,
+            "Low": close * 0.98,
+            "Close": close,
+            "Volume": 1000.0,
+        },
+        index=pd.date_range("2023-01-01", periods=rows, freq="D"),
+    )
+
+
+def test_append_ath_matches_full_recompute():
+    """Appending candles (replacing the open one) equals a full ATH pass."""
+    df = _daily()
+    df.iloc[50, 1] = np.nan  # missing High inside the rolling window
+
+    updated = append_ath_analysis(add_ath_analysis(df.iloc[:300]), df.iloc[299:])
+
+    pd.testing.assert_frame_equal(updated, add_ath_analysis(df))
+
+
+def test_detect_data_issues_reports_positions():
+    """Gaps, invalid bars and outliers come back as row positions."""
+    df = _daily().drop(pd.date_range("2023-04-11", periods=3, freq="D"))
+    df.iloc[200, 3] *= 3  # close spike above High
+
+    issues = detect_data_issues(df)
+
+    np.testing.assert_array_equal(issues["gaps"], [100])
+    np.testing.assert_array_equal(issues["invalid"], [200])
+    assert 200 in issues["outliers"]
+    assert detect_data_issues(df, start=300)["outliers"].size == 0
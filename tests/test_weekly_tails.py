@@ -6,6 +6,7 @@ Direct unit tests for core functionality - no complex mocking.
 import copy
 
 import pandas as pd
+import pytest
 
 from bnb_trading.analysis.weekly_tails.analyzer import WeeklyTailsAnalyzer
 
@@ -241,3 +242,19 @@ def test_regression_accuracy_protection(test_config):
     assert 0.0 <= result["confidence"] <= 1.0  # Valid confidence range
     assert isinstance(result["reason"], str)
     assert len(result["reason"]) > 0  # Non-empty reason
+
+
+def test_tail_strength_history_matches_single_calls(test_config):
+    """Batch history equals calling calculate_tail_strength week by week."""
+    analyzer = WeeklyTailsAnalyzer(test_config)
+    df = create_weekly_data_with_tail(weeks=12)
+    df.loc[df.index[9], ["Low", "Volume"]] = [440.0, 3000000]
+
+    history = analyzer.tail_strength_history(df)
+
+    assert len(history) == len(df) - analyzer.lookback_weeks + 1
+    for date, row in history.iterrows():
+        single = analyzer.calculate_tail_strength(df.loc[:date])
+        assert row["signal"] == single["signal"]
+        assert row["strength"] == pytest.approx(single["strength"])
+        assert row["price_level"] == pytest.approx(single["price_level"])
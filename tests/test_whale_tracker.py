@@ -0,0 +1,47 @@
+"""
+Focused WhaleTracker tests for KISS testing strategy.
+"""
+
+import numpy as np
+
+from bnb_trading.data.resample import decode_klines, resample_klines
+from bnb_trading.whale_tracker import WhaleTracker
+
+HOUR_MS = 60 * 60 * 1000
+
+
+def _klines(count: int) -> list[list]:
+    """Aligned 15m klines as Binance returns them (numbers as strings)."""
+    volumes = np.full(count, 100.0)
+    volumes[-3] = 700.0  # one whale candle inside the last day
+    return [
+        [i * HOUR_MS // 4, "600.0", f"{601 + i % 4}", "599.0", "600.5", f"{vol}"]
+        for i, vol in enumerate(volumes)
+    ]
+
+
+def test_resample_klines_aggregates_ohlcv():
+    """Four 15m candles collapse into one 1h candle."""
+    hourly = resample_klines(decode_klines(_klines(8)), HOUR_MS)
+
+    np.testing.assert_array_equal(hourly[:, 0], [0, HOUR_MS])
+    np.testing.assert_array_equal(hourly[:, 2], [604.0, 604.0])  # max high
+    np.testing.assert_array_equal(hourly[:, 5], [400.0, 1000.0])  # summed volume
+
+
+def test_whale_activity_summaries_use_one_request(monkeypatch):
+    """All periods come from a single 15m fetch, resampled locally."""
+    tracker = WhaleTracker()
+    requests = []
+
+    def fake_fetch(interval, limit):
+        requests.append((interval, limit))
+        return decode_klines(_klines(limit))
+
+    monkeypatch.setattr(tracker, "_fetch_klines", fake_fetch)
+    summaries = tracker.whale_activity_summaries([1, 3, 7])
+
+    assert requests == [("15m", 687)]
+    assert summaries[3]["interval"] == "1h"
+    assert summaries[7]["total_candles"] == 42
+    assert summaries[1]["high_volume_periods"][0]["volume"] == 700.0